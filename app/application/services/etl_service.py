@@ -131,11 +131,9 @@ class ETLService(BaseService):
                     await cache.set(cache_key, job_config_data, ttl=3600)  # 1 hour TTL
                     self.logger.debug(f"Cached job config with key: {cache_key}")
 
-                    # Also invalidate jobs list cache
-                    keys = await cache.scan_keys("jobs:*")
-                    if keys:
-                        await cache.delete(*keys)
-                        self.logger.debug("Invalidated jobs:* cache keys")
+                    # Also invalidate jobs status cache (tag index, no keyspace scan)
+                    deleted = await cache.delete_by_tags("jobs")
+                    self.logger.debug(f"Invalidated {deleted} jobs:* cache keys")
             except Exception as cache_error:
                 self.logger.warning(
                     f"Failed to update cache after job creation: {str(cache_error)}"
@@ -536,7 +534,7 @@ class ETLService(BaseService):
             # Cache result (5 minutes TTL)
             if cache:
                 try:
-                    await cache.set(cache_key, result, ttl=300)
+                    await cache.set(cache_key, result, ttl=300, tags=["jobs"])
                 except Exception as cache_error:
                     self.logger.warning(f"Cache set error: {str(cache_error)}")
             
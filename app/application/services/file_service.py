@@ -35,6 +35,7 @@ from app.schemas.upload_session import (
 from app.core.exceptions import FileError, ServiceError, AppException
 from app.core.enums import ProcessingStatus, FileTypeEnum
 from app.core.config import get_settings
+from app.core.executors import run_blocking
 from app.utils.file_utils import get_file_type, calculate_file_hash, validate_file_size, validate_file_content
 from app.utils.security import sanitize_filename_for_security
 from app.utils.date_utils import get_current_timestamp
@@ -108,8 +109,8 @@ class FileService(BaseService):
             # SECURITY: validate REAL file content (magic bytes), not the
             # client-declared Content-Type. Rejects executable/script payloads
             # disguised as CSV/JSON/XML (Content-Type Spoofing mitigation).
-            content_ok, content_detail = validate_file_content(
-                file_path, Path(file.filename).suffix.lower()
+            content_ok, content_detail = await run_blocking(
+                validate_file_content, file_path, Path(file.filename).suffix.lower()
             )
             if not content_ok:
                 if file_path.exists():
@@ -117,7 +118,7 @@ class FileService(BaseService):
                 raise FileError(content_detail)
 
             # Validate file size
-            validate_file_size(file_path)
+            await run_blocking(validate_file_size, file_path)
             
             # Parse metadata
             parsed_metadata = {}
@@ -555,14 +556,19 @@ class FileService(BaseService):
     async def _save_uploaded_file(self, file: UploadFile, file_path: Path) -> int:
         """Save uploaded file to storage."""
         try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            return file_path.stat().st_size
+            return await run_blocking(self._copy_upload, file.file, file_path)
         except Exception as e:
             if file_path.exists():
                 file_path.unlink()
             raise FileError(f"Failed to save file: {str(e)}")
     
+    @staticmethod
+    def _copy_upload(source, file_path: Path) -> int:
+        """Copy the spooled upload to its storage path and return its size."""
+        with open(file_path, "wb") as buffer:
+            shutil.copyfileobj(source, buffer)
+        return file_path.stat().st_size
+    
     def _get_processor(self, file_type: str):
         """Get appropriate processor based on file type."""
         # Deferred imports: these processor subclasses inherit from BaseProcessor
@@ -718,7 +724,7 @@ class FileService(BaseService):
                 )
 
             # Write chunk to storage
-            self.storage.write_chunk(str(session_id), chunk_data, start)
+            await run_blocking(self.storage.write_chunk, str(session_id), chunk_data, start)
 
             # Update session chunk tracking
             chunk_map = session.chunk_map or {}
@@ -810,7 +816,8 @@ class FileService(BaseService):
 
         try:
             # Assemble chunks into final file
-            file_info = self.storage.assemble_chunks(
+            file_info = await run_blocking(
+                self.storage.assemble_chunks,
                 session_id=str(session.id),
                 output_filename=session.file_name,
                 subfolder=None,
@@ -820,8 +827,8 @@ class FileService(BaseService):
             # file. Chunked uploads carry the type in the request body, which is
             # client-controlled, so we must verify the actual bytes (Content-Type
             # Spoofing mitigation for the chunked path).
-            content_ok, content_detail = validate_file_content(
-                file_info.file_path, Path(session.file_name).suffix.lower()
+            content_ok, content_detail = await run_blocking(
+                validate_file_content, file_info.file_path, Path(session.file_name).suffix.lower()
             )
             if not content_ok:
                 self.storage.cleanup_chunks(str(session.id))
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select, and_, func, desc
 from app.application.services.base import BaseService
 from app.core.exceptions import MonitoringError, ServiceError
+from app.core.executors import get_executor_metrics
 from app.core.enums import JobStatus
 from app.utils.date_utils import get_current_timestamp
 
@@ -510,6 +511,8 @@ class MonitoringService(BaseService):
                 "period": period,
                 "execution_statistics": execution_stats,
                 "resource_metrics": resource_metrics,
+                # Queue depth and latency of the blocking I/O and CPU pools
+                "executor_metrics": get_executor_metrics(),
                 "timestamp": get_current_timestamp()
             }
 
@@ -15,11 +15,110 @@ from app.infrastructure.db.models.raw_data.rejected_records import (
     RejectedRecordSummary
 )
 from app.core.exceptions import ETLError
+from app.infrastructure.db.bulk_writer import BulkInsertWriter
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class RejectedRecordSink:
+    """
+    Buffered writer for rejected records.
+
+    Rejected rows are collected with their error payloads and written in bulk
+    through ``BulkInsertWriter`` instead of one committed ORM insert per row.
+    The sink never commits: callers flush it at their own transaction
+    boundaries, after the raw records the rejections point to.
+    """
+
+    COLUMNS = (
+        "id", "source_file_id", "source_record_id", "row_number", "raw_data",
+        "rejection_reason", "validation_errors", "can_retry", "retry_count",
+        "is_resolved", "batch_id", "rejected_at"
+    )
+
+    def __init__(self, db_session: Session, batch_size: int = 5000, method: str = "auto"):
+        """
+        Initialize rejected record sink
+
+        Args:
+            db_session: Database session whose transaction is used
+            batch_size: Buffered rejections that trigger a flush
+            method: Bulk write method: auto, copy or insert
+        """
+        self.db = db_session
+        self._writer = BulkInsertWriter(
+            db_session,
+            RejectedRecord.__table__,
+            columns=self.COLUMNS,
+            batch_size=batch_size,
+            method=method
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rejections not yet written"""
+        return self._writer.pending
+
+    @property
+    def rows_written(self) -> int:
+        """Number of rejections written so far"""
+        return self._writer.rows_written
+
+    def add(
+        self,
+        source_file_id: UUID,
+        raw_data: Dict[str, Any],
+        rejection_reason: str,
+        row_number: Optional[int] = None,
+        source_record_id: Optional[UUID] = None,
+        validation_errors: Optional[List[Dict[str, Any]]] = None,
+        batch_id: Optional[str] = None,
+        can_retry: bool = True
+    ) -> bool:
+        """
+        Buffer a rejected record, flushing when the batch is full
+
+        Args:
+            Same as ``RejectedRecordsService.store_rejected_record``
+
+        Returns:
+            True if the buffer was flushed by this call
+        """
+        row = {
+            "id": uuid4(),
+            "source_file_id": source_file_id,
+            "source_record_id": source_record_id,
+            "row_number": row_number,
+            "raw_data": raw_data,
+            "rejection_reason": rejection_reason,
+            "validation_errors": validation_errors,
+            "can_retry": can_retry,
+            "retry_count": 0,
+            "is_resolved": False,
+            "batch_id": batch_id,
+            "rejected_at": datetime.utcnow()
+        }
+        if self._writer.pending + 1 >= self._writer.batch_size:
+            # Referenced raw records may still be pending ORM inserts
+            self.db.flush()
+        return self._writer.add(row)
+
+    def flush(self) -> int:
+        """
+        Write all buffered rejections
+
+        Returns:
+            Number of rejections written
+        """
+        if not self._writer.pending:
+            return 0
+        self.db.flush()
+        written = self._writer.flush()
+        logger.debug(f"Wrote {written} rejected records")
+        return written
+
+
 class RejectedRecordsService:
     """Service for managing rejected records"""
     
@@ -0,0 +1,332 @@
+"""
+Value codecs for Redis payloads (cache values and Pub/Sub messages).
+
+Encoded payloads carry a 3-byte header::
+
+    b"\\x00" <codec tag> <compression tag> <body>
+
+- codec tag: ``m`` msgpack, ``j`` typed JSON
+- compression tag: ``-`` none, ``z`` zlib, ``4`` lz4
+
+JSON text never starts with a NUL byte, so anything without the header is
+decoded as the plain JSON written before codecs existed. Readers decode
+every known codec whatever they are configured to write, so the codec can
+be changed without flushing Redis. The ``legacy`` codec writes that plain
+JSON, which keeps older processes able to read during a rolling deploy.
+
+Both codecs round-trip ``datetime``, ``date``, ``time``, ``UUID``,
+``Decimal``, ``bytes`` and sets, which ``json.dumps(default=str)`` turned
+into strings. Other unknown types are still stored as ``str(value)``.
+
+msgpack and lz4 are optional dependencies. Without msgpack the typed JSON
+codec is used; without lz4 zlib is used.
+"""
+
+import base64
+import json
+import logging
+import zlib
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from uuid import UUID
+
+from app.core.config import get_settings
+
+try:
+    import msgpack
+except ImportError:  # Optional: enables the msgpack codec
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # Optional: enables lz4 compression
+    lz4_frame = None
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"\x00"
+HEADER_SIZE = 3
+NO_COMPRESSION = b"-"
+
+# msgpack extension type codes
+EXT_DATETIME = 1
+EXT_DATE = 2
+EXT_TIME = 3
+EXT_UUID = 4
+EXT_DECIMAL = 5
+EXT_SET = 6
+
+# Marker key of typed JSON objects: {"__t__": <type>, "v": <value>}
+JSON_TYPE_KEY = "__t__"
+
+DEFAULT_COMPRESS_THRESHOLD = 1024
+
+
+class Codec:
+    """Serializes values to bytes and back."""
+
+    name = "base"
+    tag = b"?"
+
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """Compact JSON with tagged objects for non-JSON types."""
+
+    name = "json"
+    tag = b"j"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(
+            default=self._default, ensure_ascii=False, separators=(",", ":")
+        )
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return {JSON_TYPE_KEY: "datetime", "v": value.isoformat()}
+        if isinstance(value, date):
+            return {JSON_TYPE_KEY: "date", "v": value.isoformat()}
+        if isinstance(value, dt_time):
+            return {JSON_TYPE_KEY: "time", "v": value.isoformat()}
+        if isinstance(value, UUID):
+            return {JSON_TYPE_KEY: "uuid", "v": str(value)}
+        if isinstance(value, Decimal):
+            return {JSON_TYPE_KEY: "decimal", "v": str(value)}
+        if isinstance(value, (set, frozenset)):
+            return {JSON_TYPE_KEY: "set", "v": list(value)}
+        if isinstance(value, (bytes, bytearray)):
+            return {JSON_TYPE_KEY: "bytes", "v": base64.b64encode(value).decode("ascii")}
+        return str(value)
+
+    @staticmethod
+    def _object_hook(obj: Dict[str, Any]) -> Any:
+        kind = obj.get(JSON_TYPE_KEY)
+        if kind is None or len(obj) != 2 or "v" not in obj:
+            return obj
+        decoder = _JSON_TYPE_DECODERS.get(kind)
+        return decoder(obj["v"]) if decoder else obj
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data, object_hook=self._object_hook)
+
+
+_JSON_TYPE_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": dt_time.fromisoformat,
+    "uuid": UUID,
+    "decimal": Decimal,
+    "set": set,
+    "bytes": base64.b64decode,
+}
+
+
+class MsgpackCodec(Codec):
+    """msgpack with extension types for datetime, UUID, Decimal and sets."""
+
+    name = "msgpack"
+    tag = b"m"
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError("msgpack is not installed")
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return msgpack.ExtType(EXT_DATETIME, value.isoformat().encode("ascii"))
+        if isinstance(value, date):
+            return msgpack.ExtType(EXT_DATE, value.isoformat().encode("ascii"))
+        if isinstance(value, dt_time):
+            return msgpack.ExtType(EXT_TIME, value.isoformat().encode("ascii"))
+        if isinstance(value, UUID):
+            return msgpack.ExtType(EXT_UUID, value.bytes)
+        if isinstance(value, Decimal):
+            return msgpack.ExtType(EXT_DECIMAL, str(value).encode("ascii"))
+        if isinstance(value, (set, frozenset)):
+            return msgpack.ExtType(EXT_SET, self.dumps(list(value)))
+        return str(value)
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == EXT_DATETIME:
+            return datetime.fromisoformat(data.decode("ascii"))
+        if code == EXT_DATE:
+            return date.fromisoformat(data.decode("ascii"))
+        if code == EXT_TIME:
+            return dt_time.fromisoformat(data.decode("ascii"))
+        if code == EXT_UUID:
+            return UUID(bytes=data)
+        if code == EXT_DECIMAL:
+            return Decimal(data.decode("ascii"))
+        if code == EXT_SET:
+            return set(self.loads(data))
+        return msgpack.ExtType(code, data)
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=self._default, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=self._ext_hook, raw=False, strict_map_key=False)
+
+
+# Compression tag -> (compress, decompress)
+COMPRESSORS: Dict[bytes, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    b"z": (lambda data: zlib.compress(data, 1), zlib.decompress),
+}
+if lz4_frame is not None:
+    COMPRESSORS[b"4"] = (lz4_frame.compress, lz4_frame.decompress)
+
+COMPRESSION_TAGS = {"zlib": b"z", "lz4": b"4"}
+
+
+def _codec_classes() -> Dict[bytes, type]:
+    classes = {JsonCodec.tag: JsonCodec}
+    if msgpack is not None:
+        classes[MsgpackCodec.tag] = MsgpackCodec
+    return classes
+
+
+class ValueCodec:
+    """
+    Encodes values into tagged, optionally compressed payloads.
+
+    Decoding accepts every available codec and compression, plus untagged
+    legacy JSON.
+    """
+
+    def __init__(
+        self,
+        codec: str = "msgpack",
+        compression: Optional[str] = "zlib",
+        compress_threshold: int = DEFAULT_COMPRESS_THRESHOLD,
+    ):
+        """
+        Initialize codec
+
+        Args:
+            codec: msgpack, json or legacy (untagged plain JSON); msgpack
+                falls back to json when not installed
+            compression: zlib, lz4 or None; lz4 falls back to zlib when not
+                installed
+            compress_threshold: Minimum encoded size in bytes to compress
+        """
+        codec = (codec or "msgpack").lower()
+        if codec == "msgpack" and msgpack is None:
+            logger.warning("msgpack not installed, using json cache codec")
+            codec = "json"
+        if codec not in ("msgpack", "json", "legacy"):
+            raise ValueError(f"Unknown codec: {codec}")
+
+        compression = compression.lower() if compression else None
+        if compression == "lz4" and lz4_frame is None:
+            logger.warning("lz4 not installed, using zlib compression")
+            compression = "zlib"
+        if compression and compression not in COMPRESSION_TAGS:
+            raise ValueError(f"Unknown compression: {compression}")
+
+        self.legacy = codec == "legacy"
+        self.codec_name = codec
+        self.compression = None if self.legacy else compression
+        self.compress_threshold = compress_threshold
+
+        self._decoders: Dict[bytes, Codec] = {tag: cls() for tag, cls in _codec_classes().items()}
+        self._encoder: Optional[Codec] = None if self.legacy else self._decoders[
+            MsgpackCodec.tag if codec == "msgpack" else JsonCodec.tag
+        ]
+        self._compression_tag = COMPRESSION_TAGS.get(self.compression) if self.compression else None
+
+    @property
+    def name(self) -> str:
+        """Codec and compression, e.g. ``msgpack+zlib``"""
+        return f"{self.codec_name}+{self.compression}" if self.compression else self.codec_name
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a value
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Tagged payload (untagged JSON for the legacy codec)
+        """
+        if self._encoder is None:
+            return json.dumps(value, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        body = self._encoder.dumps(value)
+        compression_tag = NO_COMPRESSION
+        if self._compression_tag and len(body) >= self.compress_threshold:
+            compressed = COMPRESSORS[self._compression_tag][0](body)
+            if len(compressed) < len(body):
+                body, compression_tag = compressed, self._compression_tag
+        return MAGIC + self._encoder.tag + compression_tag + body
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a payload written by any codec
+
+        Args:
+            data: Payload bytes (str is treated as legacy JSON)
+
+        Returns:
+            Decoded value
+
+        Raises:
+            ValueError: If the payload is corrupt or uses a codec or
+                compression that isn't installed
+        """
+        if isinstance(data, str):
+            return json.loads(data)
+        if data[:1] != MAGIC:
+            return json.loads(data)
+        if len(data) < HEADER_SIZE:
+            raise ValueError("Truncated payload header")
+
+        codec = self._decoders.get(data[1:2])
+        if codec is None:
+            raise ValueError(f"Unsupported payload codec: {data[1:2]!r}")
+
+        body = data[HEADER_SIZE:]
+        compression_tag = data[2:3]
+        if compression_tag != NO_COMPRESSION:
+            compressor = COMPRESSORS.get(compression_tag)
+            if compressor is None:
+                raise ValueError(f"Unsupported payload compression: {compression_tag!r}")
+            body = compressor[1](body)
+        return codec.loads(body)
+
+
+def create_codec(
+    codec: Optional[str] = None,
+    compression: Optional[str] = None,
+    compress_threshold: Optional[int] = None,
+) -> ValueCodec:
+    """
+    Build a ValueCodec, with settings for unspecified options
+
+    Args:
+        codec: msgpack, json or legacy (default: ``CACHE_CODEC``)
+        compression: zlib, lz4 or none (default: ``CACHE_COMPRESSION``)
+        compress_threshold: Minimum size to compress (default:
+            ``CACHE_COMPRESS_THRESHOLD``)
+
+    Returns:
+        Configured codec
+    """
+    settings = get_settings()
+    if compression is None:
+        compression = settings.cache_compression
+    return ValueCodec(
+        codec=codec or settings.cache_codec,
+        compression=None if (compression or "none").lower() == "none" else compression,
+        compress_threshold=settings.cache_compress_threshold if compress_threshold is None else compress_threshold,
+    )
@@ -314,6 +314,19 @@ class Settings(BaseSettings):
     rate_limit_requests: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
     rate_limit_window: int = Field(default=60, env="RATE_LIMIT_WINDOW")  # seconds
 
+    # Shared pools for blocking work in async code (app.core.executors)
+    blocking_io_workers: Optional[int] = Field(default=None, env="BLOCKING_IO_WORKERS")  # Default: min(32, CPUs + 4)
+    cpu_workers: Optional[int] = Field(default=None, env="CPU_WORKERS")  # Default: CPU count
+
+    # Near cache: in-process L1 in front of Redis (app.infrastructure.cache.near_cache)
+    near_cache_enabled: bool = Field(default=False, env="NEAR_CACHE_ENABLED")
+    near_cache_max_size: int = Field(default=2000, env="NEAR_CACHE_MAX_SIZE")
+
+    # Redis value codec for cache entries and Pub/Sub messages (app.core.codecs)
+    cache_codec: str = Field(default="msgpack", env="CACHE_CODEC")  # msgpack, json or legacy
+    cache_compression: str = Field(default="zlib", env="CACHE_COMPRESSION")  # zlib, lz4 or none
+    cache_compress_threshold: int = Field(default=1024, env="CACHE_COMPRESS_THRESHOLD")  # bytes
+
     # Pagination
     default_page_size: int = Field(default=10, env="DEFAULT_PAGE_SIZE")
     max_page_size: int = Field(default=100, env="MAX_PAGE_SIZE")
@@ -0,0 +1,242 @@
+"""
+Execution layer for blocking work called from async code.
+
+``run_blocking`` runs file I/O and blocking library calls (pandas readers,
+openpyxl, ElementTree, chardet, file copies) on a bounded thread pool, so one
+large file doesn't stall the event loop for every other request.
+``run_cpu_bound`` runs CPU-heavy parsing on a process pool; the callable and
+its arguments must be picklable (module-level functions).
+
+Both pools count submitted, in-flight and queued tasks and keep recent queue
+wait and run times; ``get_executor_metrics`` reports them.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+# Recent samples kept per pool for latency percentiles
+LATENCY_WINDOW = 1024
+
+
+def _timed_call(func: Callable[[], T]) -> Tuple[float, T]:
+    """Run ``func`` and return when it started (monotonic clock is system-wide on Linux)"""
+    started = time.monotonic()
+    return started, func()
+
+
+class ManagedExecutor:
+    """
+    Lazily created thread or process pool with queue and latency metrics.
+    """
+
+    def __init__(self, name: str, kind: str = "thread", max_workers: Optional[int] = None):
+        """
+        Initialize executor
+
+        Args:
+            name: Pool name used in metrics and thread names
+            kind: 'thread' or 'process'
+            max_workers: Pool size (default: CPU count for processes,
+                ``min(32, CPU count + 4)`` for threads)
+        """
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        cpu_count = multiprocessing.cpu_count()
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers or (cpu_count if kind == "process" else min(32, cpu_count + 4))
+
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._in_flight = 0
+        self._wait_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._run_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @property
+    def executor(self) -> Executor:
+        """Underlying pool, created on first use"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers, thread_name_prefix=self.name
+                        )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run ``func(*args, **kwargs)`` on the pool and await its result
+
+        Args:
+            func: Callable to run (picklable for process pools)
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Return value of ``func``
+        """
+        loop = asyncio.get_running_loop()
+        call = partial(func, *args, **kwargs)
+        with self._lock:
+            self._submitted += 1
+            self._in_flight += 1
+        submitted = time.monotonic()
+        try:
+            started, result = await loop.run_in_executor(self.executor, _timed_call, call)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+                self._failed += 1
+                self._run_times.append(time.monotonic() - submitted)
+            raise
+
+        finished = time.monotonic()
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+            self._wait_times.append(max(started - submitted, 0.0))
+            self._run_times.append(finished - started)
+        return result
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pool size, task counters, queue depth and recent latencies in ms"""
+        with self._lock:
+            wait_times = sorted(self._wait_times)
+            run_times = sorted(self._run_times)
+            in_flight = self._in_flight
+            metrics = {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "started": self._executor is not None,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "in_flight": in_flight,
+                # Tasks beyond the worker count wait in the pool's queue
+                "queue_depth": max(in_flight - self.max_workers, 0),
+            }
+        metrics.update(_latency_summary("wait", wait_times))
+        metrics.update(_latency_summary("run", run_times))
+        return metrics
+
+    def shutdown(self, wait: bool = True):
+        """Shut the pool down; it is recreated on next use"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _latency_summary(prefix: str, samples: list) -> Dict[str, Optional[float]]:
+    """Average, p95 and max of sorted second samples, in milliseconds"""
+    if not samples:
+        return {f"{prefix}_avg_ms": None, f"{prefix}_p95_ms": None, f"{prefix}_max_ms": None}
+    return {
+        f"{prefix}_avg_ms": round(sum(samples) / len(samples) * 1000, 3),
+        f"{prefix}_p95_ms": round(samples[min(int(len(samples) * 0.95), len(samples) - 1)] * 1000, 3),
+        f"{prefix}_max_ms": round(samples[-1] * 1000, 3),
+    }
+
+
+_settings = get_settings()
+blocking_io_executor = ManagedExecutor(
+    "blocking-io", "thread", _settings.blocking_io_workers
+)
+cpu_executor = ManagedExecutor(
+    "cpu", "process", _settings.cpu_workers
+)
+
+
+def cpu_pool_available() -> bool:
+    """Whether this process can start worker processes (Celery prefork children are daemonic and can't)"""
+    return not multiprocessing.current_process().daemon
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run blocking I/O on the shared thread pool
+
+    Args:
+        func: Blocking callable
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        Return value of ``func``
+    """
+    return await blocking_io_executor.run(func, *args, **kwargs)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run CPU-heavy work on the shared process pool
+
+    Falls back to the thread pool where worker processes can't be started.
+
+    Args:
+        func: Picklable callable
+        *args: Picklable positional arguments
+        **kwargs: Picklable keyword arguments
+
+    Returns:
+        Return value of ``func``
+    """
+    if not cpu_pool_available():
+        return await blocking_io_executor.run(func, *args, **kwargs)
+    return await cpu_executor.run(func, *args, **kwargs)
+
+
+async def iterate_blocking(iterable: Iterable[T], batch_size: int = 1) -> AsyncIterator[T]:
+    """
+    Consume a blocking iterator (file reader, parser) on the shared thread pool
+
+    Args:
+        iterable: Iterable whose ``next`` blocks
+        batch_size: Items pulled per pool round trip
+
+    Yields:
+        Items of ``iterable`` in order
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = await blocking_io_executor.run(_next_batch, iterator, batch_size)
+        if not batch:
+            return
+        for item in batch:
+            yield item
+
+
+def _next_batch(iterator: Iterator[T], size: int) -> List[T]:
+    """Up to ``size`` next items of ``iterator``"""
+    return list(islice(iterator, size))
+
+
+def get_executor_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics of the shared pools keyed by pool name"""
+    return {
+        executor.name: executor.get_metrics()
+        for executor in (blocking_io_executor, cpu_executor)
+    }
+
+
+def shutdown_executors(wait: bool = True):
+    """Shut down the shared pools (application shutdown)"""
+    for executor in (blocking_io_executor, cpu_executor):
+        executor.shutdown(wait=wait)
@@ -8,7 +8,9 @@ including Redis cache, memory cache, decorators, and utilities.
 from .base import CacheInterface
 from .redis_cache import RedisCache, redis_manager
 from .memory_cache import MemoryCache
+from .near_cache import NearCache
 from .manager import CacheManager, cache_manager
+from .read_through import ReadThroughLoader, SyncReadThroughCache
 from .decorators import (
     cache_result,
     invalidate_cache,
@@ -40,11 +42,16 @@ __all__ = [
     "RedisCache", 
     "redis_manager",
     "MemoryCache",
+    "NearCache",
     
     # Manager
     "CacheManager",
     "cache_manager",
     
+    # Read-through
+    "ReadThroughLoader",
+    "SyncReadThroughCache",
+    
     # Decorators
     "cache_result",
     "invalidate_cache", 
@@ -96,6 +96,10 @@ class CacheInterface(ABC):
             "type": "unknown",
             "status": "available" if await self.health_check() else "unavailable"
         }
+    
+    def record_read_through(self, event: str) -> None:
+        """Count a read-through event (hits, misses, coalesced, ...) in the cache metrics."""
+        pass
 
 
 class CacheBackend(ABC):
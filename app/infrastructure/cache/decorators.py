@@ -5,21 +5,34 @@ Cache decorators for easy caching of function results.
 import asyncio
 import functools
 import logging
-from typing import Any, Callable, Optional, Union, TypeVar, Dict, List
+from typing import Any, Callable, Optional, Sequence, Union, TypeVar, Dict, List
 from datetime import timedelta
 from inspect import signature, iscoroutinefunction
 
 from .redis_cache import get_redis_cache
 from .memory_cache import MemoryCache
-from .utils import serialize_cache_args, get_cache_namespace
+from .read_through import ReadThroughLoader, SyncReadThroughCache
+from .utils import serialize_cache_args
 
 logger = logging.getLogger(__name__)
 
 F = TypeVar('F', bound=Callable[..., Any])
 
+# Tags, or a function of the decorated call's arguments returning them
+Tags = Union[Sequence[str], Callable[..., Sequence[str]]]
+
+# Redis glob metacharacters
+_GLOB_CHARS = frozenset("*?[]\\")
+
 # Fallback cache for when Redis is unavailable
 _fallback_cache = MemoryCache(max_size=1000, default_ttl=300)
 
+# Single-flight loader shared by all coroutine functions
+read_through_loader = ReadThroughLoader()
+
+# In-process cache for sync functions
+sync_read_through_cache = SyncReadThroughCache(max_size=1000)
+
 
 def cache_result(
     ttl: Optional[Union[int, timedelta]] = None,
@@ -27,9 +40,21 @@ def cache_result(
     skip_cache: Optional[Callable[..., bool]] = None,
     use_fallback: bool = True,
     serialize_args: bool = True,
+    stale_ttl: Optional[Union[int, timedelta]] = None,
+    negative_ttl: Optional[Union[int, timedelta]] = None,
+    early_refresh_beta: float = 1.0,
+    lease_timeout: float = 10.0,
+    tags: Optional[Tags] = None,
 ) -> Callable[[F], F]:
     """
-    Decorator to cache function results.
+    Decorator to cache function results (read-through with stampede protection).
+    
+    Concurrent misses for the same key share one call of the function, and on
+    Redis a lease keeps other processes from recomputing it at the same time.
+    Sync functions are cached in process memory.
+    
+    Results of coroutine functions are tagged with their key prefix, so
+    ``invalidate_cache("<prefix>:*")`` deletes them through the tag index.
     
     Args:
         ttl: Cache TTL (seconds or timedelta)
@@ -37,11 +62,29 @@ def cache_result(
         skip_cache: Function to determine if cache should be skipped
         use_fallback: Whether to use fallback cache when Redis unavailable
         serialize_args: Whether to serialize function arguments for cache key
+        stale_ttl: How long an expired result may still be served while it
+            is recomputed in the background
+        negative_ttl: TTL for caching ``None`` results (None disables)
+        early_refresh_beta: Eagerness of probabilistic refresh before expiry
+            (0 disables)
+        lease_timeout: Seconds another process waits for the lease holder's
+            result before computing it itself
+        tags: Extra tags for the cached result, or a function of the call's
+            arguments returning them (e.g. ``lambda job_id: [f"job:{job_id}"]``)
         
     Returns:
         Decorated function
     """
     def decorator(func: F) -> F:
+        # get_cache_namespace() of a plain function is its class
+        # ("builtins.function"), which every function shares
+        prefix = key_prefix or f"{func.__module__}.{func.__qualname__}"
+        
+        def build_key(args, kwargs) -> str:
+            if serialize_args:
+                return f"{prefix}:{serialize_cache_args(*args, **kwargs)}"
+            return f"{prefix}:static"
+        
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             # Get cache instance
@@ -57,43 +100,33 @@ def cache_result(
             if skip_cache and skip_cache(*args, **kwargs):
                 return await func(*args, **kwargs)
             
-            # Generate cache key
-            prefix = key_prefix or get_cache_namespace(func)
-            if serialize_args:
-                args_key = serialize_cache_args(*args, **kwargs)
-                cache_key = f"{prefix}:{args_key}"
-            else:
-                cache_key = f"{prefix}:static"
-            
-            # Try to get from cache
-            try:
-                cached_result = await cache.get(cache_key)
-                if cached_result is not None:
-                    logger.debug(f"Cache hit for {func.__name__}: {cache_key}")
-                    return cached_result
-            except Exception as e:
-                logger.warning(f"Cache get error for {func.__name__}: {e}")
-            
-            # Execute function
-            logger.debug(f"Cache miss for {func.__name__}: {cache_key}")
-            result = await func(*args, **kwargs)
-            
-            # Store in cache
-            try:
-                await cache.set(cache_key, result, ttl=ttl)
-                logger.debug(f"Cached result for {func.__name__}: {cache_key}")
-            except Exception as e:
-                logger.warning(f"Cache set error for {func.__name__}: {e}")
-            
-            return result
+            return await read_through_loader.get_or_load(
+                cache,
+                build_key(args, kwargs),
+                functools.partial(func, *args, **kwargs),
+                ttl=ttl,
+                stale_ttl=stale_ttl,
+                negative_ttl=negative_ttl,
+                beta=early_refresh_beta,
+                lease_timeout=lease_timeout,
+                tags=[prefix, *_resolve_tags(tags, args, kwargs)],
+            )
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            # For sync functions, we need to handle caching differently
-            # This is a simplified version - in practice, you might want to
-            # run the async cache operations in an event loop
-            result = func(*args, **kwargs)
-            return result
+            # The Redis client is async and bound to the event loop, so sync
+            # functions are cached in process memory
+            if skip_cache and skip_cache(*args, **kwargs):
+                return func(*args, **kwargs)
+            
+            return sync_read_through_cache.get_or_load(
+                build_key(args, kwargs),
+                functools.partial(func, *args, **kwargs),
+                ttl=ttl,
+                stale_ttl=stale_ttl,
+                negative_ttl=negative_ttl,
+                beta=early_refresh_beta,
+            )
         
         # Return appropriate wrapper based on function type
         if iscoroutinefunction(func):
@@ -105,21 +138,34 @@ def cache_result(
 
 
 def invalidate_cache(
-    patterns: Union[str, List[str]],
-    wait_for_completion: bool = False
+    patterns: Union[str, List[str], None] = None,
+    wait_for_completion: bool = False,
+    tags: Optional[Tags] = None,
+    scan_untagged: bool = True,
 ) -> Callable[[F], F]:
     """
     Decorator to invalidate cache patterns after function execution.
     
+    ``"<prefix>:*"`` patterns and tags are resolved through the tag index
+    and exact keys are deleted directly; other glob patterns fall back to
+    scanning the keyspace. Keys stored with a plain ``set``/``set_many`` are
+    not in the index, so prefix patterns also scan for them unless
+    ``scan_untagged`` is off.
+    
     Args:
         patterns: Cache key patterns to invalidate
         wait_for_completion: Whether to wait for cache invalidation
+        tags: Tags to invalidate, or a function of the call's arguments
+            returning them
+        scan_untagged: Scan for untagged keys of ``"<prefix>:*"`` patterns;
+            turn off when every key under the prefix comes from cache_result
         
     Returns:
         Decorated function
     """
     if isinstance(patterns, str):
         patterns = [patterns]
+    patterns = patterns or []
     
     def decorator(func: F) -> F:
         @functools.wraps(func)
@@ -127,15 +173,21 @@ def invalidate_cache(
             # Execute function first
             result = await func(*args, **kwargs)
             
-            # Invalidate cache patterns
-            cache = get_redis_cache()
+            # Invalidate cache patterns (in the cache cache_result used)
+            cache = get_redis_cache() or _fallback_cache
             if cache:
                 invalidation_tasks = []
                 
                 for pattern in patterns:
-                    task = asyncio.create_task(_invalidate_pattern(cache, pattern))
+                    task = asyncio.create_task(_invalidate_pattern(cache, pattern, scan_untagged))
                     invalidation_tasks.append(task)
                 
+                invalidated_tags = _resolve_tags(tags, args, kwargs)
+                if invalidated_tags:
+                    invalidation_tasks.append(
+                        asyncio.create_task(_invalidate_tags(cache, invalidated_tags))
+                    )
+                
                 if wait_for_completion:
                     await asyncio.gather(*invalidation_tasks, return_exceptions=True)
                 else:
@@ -161,14 +213,42 @@ def invalidate_cache(
     return decorator
 
 
-async def _invalidate_pattern(cache, pattern: str) -> None:
+def _resolve_tags(tags: Optional[Tags], args: tuple, kwargs: dict) -> List[str]:
+    """Tags for one call of a decorated function."""
+    if tags is None:
+        return []
+    if callable(tags):
+        return list(tags(*args, **kwargs) or ())
+    return list(tags)
+
+
+async def _invalidate_tags(cache, tags: List[str]) -> None:
+    """Helper function to invalidate tagged keys."""
+    try:
+        deleted = await cache.delete_by_tags(*tags)
+        logger.debug(f"Invalidated {deleted} keys tagged: {tags}")
+    except Exception as e:
+        logger.error(f"Error invalidating cache tags {tags}: {e}")
+
+
+async def _invalidate_pattern(cache, pattern: str, scan_untagged: bool = True) -> None:
     """Helper function to invalidate cache pattern."""
     try:
-        # Use scan_keys for production safety
-        keys = await cache.scan_keys(pattern)
-        if keys:
-            await cache.delete(*keys)
-            logger.debug(f"Invalidated {len(keys)} keys matching pattern: {pattern}")
+        prefix = pattern[:-2] if pattern.endswith(":*") else None
+        if prefix and not _GLOB_CHARS.intersection(prefix):
+            # cache_result tags every key with its prefix
+            deleted = await cache.delete_by_tags(prefix)
+            if scan_untagged:
+                # Keys set without tags are not in the index
+                keys = await cache.scan_keys(pattern)
+                deleted += await cache.delete(*keys) if keys else 0
+        elif not _GLOB_CHARS.intersection(pattern):
+            deleted = await cache.delete(pattern)
+        else:
+            logger.warning(f"Cache pattern {pattern} is not a key prefix; scanning the keyspace")
+            keys = await cache.scan_keys(pattern)
+            deleted = await cache.delete(*keys) if keys else 0
+        logger.debug(f"Invalidated {deleted} keys matching pattern: {pattern}")
     except Exception as e:
         logger.error(f"Error invalidating cache pattern {pattern}: {e}")
 
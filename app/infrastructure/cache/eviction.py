@@ -0,0 +1,377 @@
+"""
+Eviction policies for MemoryCache.
+
+Every operation is O(1), so inserting under memory pressure costs the same
+with 100 entries as with 1,000,000:
+
+- ``LRUPolicy``: ordered dict, oldest access first.
+- ``LFUPolicy``: frequency buckets in a doubly linked list (lowest frequency
+  first); ties within a bucket go to the least recently used key.
+- ``RandomPolicy``: key list with swap-remove.
+- ``WTinyLFUPolicy``: W-TinyLFU admission. New keys enter a small LRU
+  window; a key leaving the window only replaces the main policy's victim
+  if a count-min sketch has seen it more often. One-off keys from a scan
+  can't flush the hot set.
+
+Policies only track keys. The cache calls ``insert``/``access``/``remove``
+as entries change and ``victim`` when it must evict; ``remove`` ignores
+keys the policy no longer tracks.
+"""
+
+import random
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# Byte translation table halving every counter
+_HALVE = bytes(count >> 1 for count in range(256))
+
+
+class EvictionPolicy:
+    """Tracks cache keys and picks the key to evict."""
+
+    name = "base"
+
+    def insert(self, key: str) -> None:
+        """Track a new key."""
+        raise NotImplementedError
+
+    def access(self, key: str) -> None:
+        """Record a read or overwrite of a tracked key."""
+        raise NotImplementedError
+
+    def remove(self, key: str) -> None:
+        """Stop tracking a key (no-op for unknown keys)."""
+        raise NotImplementedError
+
+    def victim(self) -> Optional[str]:
+        """Key to evict next, or None when empty."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Stop tracking all keys."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, key: str) -> bool:
+        raise NotImplementedError
+
+
+class LRUPolicy(EvictionPolicy):
+    """Least recently used first."""
+
+    name = "lru"
+
+    def __init__(self):
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+
+    def insert(self, key: str) -> None:
+        self._order[key] = None
+
+    def access(self, key: str) -> None:
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        return next(iter(self._order), None)
+
+    def clear(self) -> None:
+        self._order.clear()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._order
+
+
+class _FrequencyNode:
+    """Keys accessed ``frequency`` times, least recently used first."""
+
+    __slots__ = ("frequency", "keys", "prev", "next")
+
+    def __init__(self, frequency: int):
+        self.frequency = frequency
+        self.keys: "OrderedDict[str, None]" = OrderedDict()
+        self.prev: Optional["_FrequencyNode"] = None
+        self.next: Optional["_FrequencyNode"] = None
+
+
+class LFUPolicy(EvictionPolicy):
+    """Least frequently used first, with O(1) frequency buckets."""
+
+    name = "lfu"
+
+    def __init__(self):
+        # Sentinel; head.next is the lowest frequency bucket
+        self._head = _FrequencyNode(0)
+        self._head.prev = self._head.next = self._head
+        self._nodes: Dict[str, _FrequencyNode] = {}
+
+    def _bucket_after(self, node: _FrequencyNode, frequency: int) -> _FrequencyNode:
+        """Bucket for ``frequency`` right after ``node``, created if missing."""
+        following = node.next
+        if following is not self._head and following.frequency == frequency:
+            return following
+        bucket = _FrequencyNode(frequency)
+        bucket.prev, bucket.next = node, following
+        node.next = following.prev = bucket
+        return bucket
+
+    def _unlink_if_empty(self, node: _FrequencyNode) -> None:
+        if not node.keys:
+            node.prev.next = node.next
+            node.next.prev = node.prev
+
+    def insert(self, key: str) -> None:
+        if key in self._nodes:
+            self.access(key)
+            return
+        bucket = self._bucket_after(self._head, 1)
+        bucket.keys[key] = None
+        self._nodes[key] = bucket
+
+    def access(self, key: str) -> None:
+        node = self._nodes.get(key)
+        if node is None:
+            return
+        bucket = self._bucket_after(node, node.frequency + 1)
+        del node.keys[key]
+        bucket.keys[key] = None
+        self._nodes[key] = bucket
+        self._unlink_if_empty(node)
+
+    def remove(self, key: str) -> None:
+        node = self._nodes.pop(key, None)
+        if node is not None:
+            del node.keys[key]
+            self._unlink_if_empty(node)
+
+    def victim(self) -> Optional[str]:
+        lowest = self._head.next
+        if lowest is self._head:
+            return None
+        return next(iter(lowest.keys))
+
+    def frequency(self, key: str) -> int:
+        """Accesses recorded for key (0 if untracked)."""
+        node = self._nodes.get(key)
+        return node.frequency if node else 0
+
+    def clear(self) -> None:
+        self._head.prev = self._head.next = self._head
+        self._nodes.clear()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._nodes
+
+
+class RandomPolicy(EvictionPolicy):
+    """Uniformly random victim."""
+
+    name = "random"
+
+    def __init__(self):
+        self._keys: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def insert(self, key: str) -> None:
+        if key not in self._index:
+            self._index[key] = len(self._keys)
+            self._keys.append(key)
+
+    def access(self, key: str) -> None:
+        pass
+
+    def remove(self, key: str) -> None:
+        index = self._index.pop(key, None)
+        if index is None:
+            return
+        last = self._keys.pop()
+        if last != key:
+            self._keys[index] = last
+            self._index[last] = index
+
+    def victim(self) -> Optional[str]:
+        return random.choice(self._keys) if self._keys else None
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._index.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+
+class FrequencySketch:
+    """
+    Count-min sketch of recent key frequencies.
+
+    Four rows of 4-bit-style counters (capped at 15). After ``10 x capacity``
+    increments every counter is halved, so old popularity fades.
+    """
+
+    _ROWS = 4
+    _MAX_COUNT = 15
+
+    def __init__(self, capacity: int):
+        width = 1
+        while width < max(capacity, 16):
+            width <<= 1
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in range(self._ROWS)]
+        self._sample_size = 10 * max(capacity, 16)
+        self._additions = 0
+
+    def _indexes(self, key: str):
+        h = hash(key)
+        # Double hashing: row i uses h + i * step
+        step = (h >> 17) | 1
+        mask = self._mask
+        return [(h + i * step) & mask for i in range(self._ROWS)]
+
+    def increment(self, key: str) -> None:
+        """Count one occurrence of key."""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def frequency(self, key: str) -> int:
+        """Estimated recent occurrences of key."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def _age(self) -> None:
+        """Halve every counter."""
+        self._rows = [row.translate(_HALVE) for row in self._rows]
+        self._additions //= 2
+
+    def clear(self) -> None:
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._additions = 0
+
+
+class WTinyLFUPolicy(EvictionPolicy):
+    """
+    W-TinyLFU: LRU admission window in front of a main policy.
+
+    The window holds ``window_ratio`` of the capacity. When it is full, its
+    oldest key is promoted to the main policy if there is room, or if the
+    sketch estimates it more frequent than the main policy's victim;
+    otherwise the window key itself is evicted.
+    """
+
+    def __init__(self, capacity: int, main: EvictionPolicy, window_ratio: float = 0.01):
+        """
+        Initialize policy
+
+        Args:
+            capacity: Expected maximum number of entries
+            main: Policy for the main (protected) region
+            window_ratio: Share of the capacity for the admission window
+        """
+        self.name = f"{main.name}+tinylfu"
+        self._capacity = max(capacity, 1)
+        self._window_size = max(1, int(self._capacity * window_ratio))
+        self._main_size = max(self._capacity - self._window_size, 1)
+        self._window = LRUPolicy()
+        self._main = main
+        self._sketch = FrequencySketch(self._capacity)
+
+    def insert(self, key: str) -> None:
+        self._sketch.increment(key)
+        if key in self._main:
+            self._main.access(key)
+        elif key in self._window:
+            self._window.access(key)
+        else:
+            self._window.insert(key)
+
+    def access(self, key: str) -> None:
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.access(key)
+        else:
+            self._main.access(key)
+
+    def remove(self, key: str) -> None:
+        self._window.remove(key)
+        self._main.remove(key)
+
+    def victim(self) -> Optional[str]:
+        # Called when the cache needs room for one more key. A full window
+        # hands its oldest key to the main region, or makes it compete with
+        # the main region's victim when that is full too. The returned key
+        # is already untracked.
+        while len(self._window) >= self._window_size:
+            candidate = self._window.victim()
+            self._window.remove(candidate)
+            if len(self._main) < self._main_size:
+                self._main.insert(candidate)
+                continue
+
+            main_victim = self._main.victim()
+            if self._sketch.frequency(candidate) > self._sketch.frequency(main_victim):
+                self._main.remove(main_victim)
+                self._main.insert(candidate)
+                return main_victim
+            return candidate
+
+        if len(self._main):
+            return self._main.victim()
+        return self._window.victim()
+
+    def clear(self) -> None:
+        self._window.clear()
+        self._main.clear()
+        self._sketch.clear()
+
+    def __len__(self) -> int:
+        return len(self._window) + len(self._main)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._window or key in self._main
+
+
+EVICTION_POLICIES = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "random": RandomPolicy,
+}
+
+
+def create_policy(
+    eviction_policy: str = "lru",
+    admission_policy: Optional[str] = None,
+    capacity: int = 1000,
+) -> EvictionPolicy:
+    """
+    Build an eviction policy
+
+    Args:
+        eviction_policy: lru, lfu or random (unknown names fall back to lru)
+        admission_policy: None or "tinylfu"
+        capacity: Expected maximum number of entries (sizes the sketch)
+
+    Returns:
+        Policy instance
+    """
+    policy = EVICTION_POLICIES.get(eviction_policy, LRUPolicy)()
+    if admission_policy == "tinylfu":
+        return WTinyLFUPolicy(capacity, policy)
+    if admission_policy:
+        raise ValueError(f"Unknown admission policy: {admission_policy}")
+    return policy
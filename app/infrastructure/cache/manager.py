@@ -2,16 +2,19 @@
 Cache Manager - Orchestrates cache instances with fallback logic.
 
 This module provides high-level cache management with automatic
-fallback from Redis to memory cache when Redis is unavailable.
+fallback from Redis to memory cache when Redis is unavailable, and an
+optional near cache (in-process L1 in front of Redis).
 """
 
 import asyncio
 import logging
+import time
 from typing import Optional, Dict, Any
 
 from .base import CacheInterface
 from .redis_cache import RedisCache
 from .memory_cache import MemoryCache
+from .near_cache import NearCache
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +28,20 @@ class CacheManager:
     - Automatic health monitoring and switching
     - Graceful degradation when primary cache fails
     - Background recovery attempts
+    - Near cache mode: in-process L1 in front of a Redis primary
     """
     
     def __init__(self):
         self._primary_cache: Optional[CacheInterface] = None
         self._fallback_cache: Optional[MemoryCache] = None
+        self._near_cache: Optional[NearCache] = None
         self._use_fallback = False
         self._recovery_task: Optional[asyncio.Task] = None
         self._recovery_interval = 60  # seconds
         self._is_running = False
+        # Primary health is re-checked at most this often on get_cache()
+        self._health_check_ttl = 5.0
+        self._primary_checked_at = 0.0
     
     async def initialize(
         self,
@@ -41,6 +49,8 @@ class CacheManager:
         enable_fallback: bool = True,
         fallback_config: Optional[Dict[str, Any]] = None,
         recovery_interval: int = 60,
+        enable_near_cache: bool = False,
+        near_cache_config: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Initialize cache manager.
@@ -50,6 +60,10 @@ class CacheManager:
             enable_fallback: Whether to enable memory cache fallback
             fallback_config: Configuration for fallback cache
             recovery_interval: Interval for recovery attempts in seconds
+            enable_near_cache: Whether to put an in-process L1 in front of
+                a Redis primary cache
+            near_cache_config: NearCache arguments (max_size, max_memory_mb,
+                namespace_ttls, default_ttl, channel)
         """
         self._primary_cache = primary_cache
         self._recovery_interval = recovery_interval
@@ -85,6 +99,11 @@ class CacheManager:
             self._use_fallback = True
             logger.info("No primary cache provided, using fallback only")
         
+        # Near cache in front of Redis
+        if enable_near_cache and isinstance(self._primary_cache, RedisCache):
+            self._near_cache = NearCache(self._primary_cache, **(near_cache_config or {}))
+            await self._near_cache.start()
+        
         # Start recovery monitoring
         if self._primary_cache and enable_fallback:
             self._recovery_task = asyncio.create_task(self._recovery_loop())
@@ -102,6 +121,11 @@ class CacheManager:
                 pass
             self._recovery_task = None
         
+        # Shutdown near cache
+        if self._near_cache:
+            await self._near_cache.stop()
+            self._near_cache = None
+        
         # Shutdown fallback cache
         if self._fallback_cache:
             await self._fallback_cache.stop_cleanup_task()
@@ -122,9 +146,17 @@ class CacheManager:
         """
         # Try primary cache first (if not in fallback mode)
         if self._primary_cache and not self._use_fallback:
+            primary = self._near_cache or self._primary_cache
+            
+            # Skip the health check round trip if the last one was recent
+            now = time.monotonic()
+            if now - self._primary_checked_at < self._health_check_ttl:
+                return primary
+            
             try:
                 if await self._primary_cache.health_check():
-                    return self._primary_cache
+                    self._primary_checked_at = now
+                    return primary
                 else:
                     logger.warning("Primary cache health check failed, switching to fallback")
                     self._use_fallback = True
@@ -139,6 +171,15 @@ class CacheManager:
         logger.error("No cache available")
         return None
     
+    def get_near_cache(self) -> Optional[NearCache]:
+        """
+        Get near cache instance.
+        
+        Returns:
+            Near cache or None if near cache mode is off
+        """
+        return self._near_cache
+    
     async def force_primary(self) -> bool:
         """
         Force attempt to use primary cache.
@@ -152,6 +193,7 @@ class CacheManager:
         try:
             if await self._primary_cache.health_check():
                 self._use_fallback = False
+                await self._reset_near_cache()
                 logger.info("Successfully forced switch to primary cache")
                 return True
         except Exception as e:
@@ -185,10 +227,18 @@ class CacheManager:
             "primary_cache_available": self._primary_cache is not None,
             "fallback_cache_available": self._fallback_cache is not None,
             "using_fallback": self._use_fallback,
+            "near_cache_enabled": self._near_cache is not None,
             "is_running": self._is_running,
             "recovery_interval": self._recovery_interval,
         }
         
+        # Near cache tiers
+        if self._near_cache:
+            near_metrics = self._near_cache.get_metrics()
+            status["l1_hit_ratio"] = near_metrics["l1_hit_ratio"]
+            status["l2_hit_ratio"] = near_metrics["l2_hit_ratio"]
+            status["near_cache_metrics"] = near_metrics
+        
         # Check primary cache health
         if self._primary_cache:
             try:
@@ -236,6 +286,7 @@ class CacheManager:
         try:
             if await self._primary_cache.health_check():
                 self._use_fallback = False
+                await self._reset_near_cache()
                 logger.info("Successfully recovered to primary cache")
                 
                 # Optionally sync some data from fallback to primary
@@ -244,6 +295,11 @@ class CacheManager:
         except Exception as e:
             logger.debug(f"Recovery attempt failed: {e}")
     
+    async def _reset_near_cache(self) -> None:
+        """Drop L1 entries that may have missed invalidations while Redis was down."""
+        if self._near_cache:
+            await self._near_cache.l1.clear()
+    
     async def _sync_fallback_to_primary(self) -> None:
         """Sync important data from fallback to primary cache."""
         if not self._fallback_cache or not self._primary_cache:
@@ -11,52 +11,67 @@ import logging
 import threading
 import time
 import fnmatch
-from typing import Any, Optional, Dict, List, Union
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field
-from collections import OrderedDict
+from typing import Any, Optional, Dict, List, Set, Tuple, Union
+from datetime import timedelta
 from contextlib import asynccontextmanager
 
 from .base import CacheInterface
+from .eviction import create_policy
+from .utils import deep_sizeof
 from ...core.exceptions import CacheError
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class CacheEntry:
     """
-    Enhanced cache entry with comprehensive metadata.
+    Cache entry with metadata.
+    
+    Slotted, with ``time.monotonic()`` timestamps, so millions of entries
+    stay small and expiry checks are a float comparison.
     """
-    value: Any
-    created_at: datetime
-    expires_at: Optional[datetime] = None
-    access_count: int = 0
-    last_accessed: Optional[datetime] = None
-    size_bytes: int = 0
-    tags: List[str] = field(default_factory=list)
-    
-    def __post_init__(self):
-        """Calculate entry size after initialization."""
-        if self.size_bytes == 0:
-            self.size_bytes = self._calculate_size()
-    
-    def is_expired(self) -> bool:
+    
+    __slots__ = (
+        "value",
+        "created_at",
+        "expires_at",
+        "access_count",
+        "last_accessed",
+        "size_bytes",
+        "tags",
+    )
+    
+    def __init__(
+        self,
+        value: Any,
+        created_at: float,
+        expires_at: Optional[float] = None,
+        size_bytes: int = 0,
+        tags: Tuple[str, ...] = (),
+    ):
+        self.value = value
+        self.created_at = created_at
+        self.expires_at = expires_at
+        self.access_count = 0
+        self.last_accessed: Optional[float] = None
+        self.tags = tags
+        self.size_bytes = size_bytes or self._calculate_size()
+    
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if cache entry has expired."""
         if self.expires_at is None:
             return False
-        return datetime.utcnow() > self.expires_at
+        return (time.monotonic() if now is None else now) > self.expires_at
     
-    def access(self) -> None:
+    def access(self, now: Optional[float] = None) -> None:
         """Record access to this cache entry."""
         self.access_count += 1
-        self.last_accessed = datetime.utcnow()
+        self.last_accessed = time.monotonic() if now is None else now
     
     def _calculate_size(self) -> int:
-        """Estimate memory size of the cached value."""
+        """Estimate memory size of the cached value including nested objects."""
         try:
-            import sys
-            return sys.getsizeof(self.value)
+            return deep_sizeof(self.value)
         except Exception:
             return 0
     
@@ -65,8 +80,7 @@ class CacheEntry:
         if self.expires_at is None:
             return None
         
-        remaining = self.expires_at - datetime.utcnow()
-        return max(0, int(remaining.total_seconds()))
+        return max(0, int(self.expires_at - time.monotonic()))
 
 
 class MemoryCache(CacheInterface):
@@ -75,10 +89,11 @@ class MemoryCache(CacheInterface):
     
     Features:
     - Async/await support
-    - LRU eviction with size-based eviction
+    - O(1) LRU, LFU or random eviction with size and memory bounds
+    - Optional W-TinyLFU admission
     - TTL support with background cleanup
     - Cache tagging for bulk operations
-    - Memory usage tracking
+    - Memory usage tracking (deep object size)
     - Statistics and monitoring
     - Pattern-based key operations
     """
@@ -91,6 +106,7 @@ class MemoryCache(CacheInterface):
         cleanup_interval: int = 300,  # 5 minutes
         eviction_policy: str = "lru",  # lru, lfu, random
         enable_stats: bool = True,
+        admission_policy: Optional[str] = None,  # None, tinylfu
     ):
         """
         Initialize enhanced memory cache.
@@ -102,17 +118,22 @@ class MemoryCache(CacheInterface):
             cleanup_interval: Cleanup interval in seconds
             eviction_policy: Eviction policy (lru, lfu, random)
             enable_stats: Whether to collect statistics
+            admission_policy: Admission policy in front of eviction
+                ("tinylfu" for W-TinyLFU)
         """
         self.max_size = max_size
         self.max_memory_bytes = max_memory_mb * 1024 * 1024 if max_memory_mb else None
         self.default_ttl = default_ttl
         self.cleanup_interval = cleanup_interval
         self.eviction_policy = eviction_policy.lower()
+        self.admission_policy = admission_policy.lower() if admission_policy else None
         self.enable_stats = enable_stats
         
         # Cache storage
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._tags: Dict[str, List[str]] = {}  # tag -> [keys]
+        self._cache: Dict[str, CacheEntry] = {}
+        self._tags: Dict[str, Set[str]] = {}  # tag -> {keys}
+        self._policy = create_policy(self.eviction_policy, self.admission_policy, max_size or 10000)
+        self._memory_usage = 0
         
         # Thread safety
         self._lock = asyncio.Lock()
@@ -126,8 +147,15 @@ class MemoryCache(CacheInterface):
             "deletes": 0,
             "evictions": 0,
             "expirations": 0,
+            "rejections": 0,
             "memory_usage_bytes": 0,
             "cleanup_runs": 0,
+            "read_through_hits": 0,
+            "read_through_misses": 0,
+            "read_through_coalesced": 0,
+            "read_through_stale_hits": 0,
+            "read_through_early_refreshes": 0,
+            "read_through_negative_hits": 0,
         } if enable_stats else {}
         
         # Background cleanup
@@ -136,7 +164,7 @@ class MemoryCache(CacheInterface):
         
         logger.info(
             f"Memory cache initialized: max_size={max_size}, "
-            f"max_memory_mb={max_memory_mb}, policy={eviction_policy}"
+            f"max_memory_mb={max_memory_mb}, policy={self._policy.name}"
         )
     
     async def start_cleanup_task(self) -> None:
@@ -170,18 +198,14 @@ class MemoryCache(CacheInterface):
     async def _remove_expired_entries(self) -> None:
         """Remove expired entries from cache."""
         async with self._lock:
-            expired_keys = []
-            current_time = datetime.utcnow()
-            
-            for key, entry in self._cache.items():
-                if entry.expires_at and current_time > entry.expires_at:
-                    expired_keys.append(key)
+            current_time = time.monotonic()
+            expired_keys = [
+                key for key, entry in self._cache.items()
+                if entry.expires_at is not None and current_time > entry.expires_at
+            ]
             
             for key in expired_keys:
-                entry = self._cache[key]
-                del self._cache[key]
-                self._update_memory_usage(-entry.size_bytes)
-                self._remove_from_tags(key)
+                self._remove_entry(key)
                 
                 if self.enable_stats:
                     self._stats["expirations"] += 1
@@ -193,129 +217,153 @@ class MemoryCache(CacheInterface):
                 logger.debug(f"Cleaned up {len(expired_keys)} expired entries")
     
     def _update_memory_usage(self, delta: int) -> None:
-        """Update memory usage statistics."""
+        """Update memory usage (tracked even with statistics disabled)."""
+        self._memory_usage = max(0, self._memory_usage + delta)
         if self.enable_stats:
-            self._stats["memory_usage_bytes"] = max(0, self._stats["memory_usage_bytes"] + delta)
+            self._stats["memory_usage_bytes"] = self._memory_usage
     
-    def _add_to_tags(self, key: str, tags: List[str]) -> None:
+    def _add_to_tags(self, key: str, tags: Tuple[str, ...]) -> None:
         """Add key to tag mappings."""
         for tag in tags:
-            if tag not in self._tags:
-                self._tags[tag] = []
-            if key not in self._tags[tag]:
-                self._tags[tag].append(key)
-    
-    def _remove_from_tags(self, key: str) -> None:
-        """Remove key from all tag mappings."""
-        for tag, keys in self._tags.items():
-            if key in keys:
-                keys.remove(key)
-        
-        # Clean up empty tag lists
-        empty_tags = [tag for tag, keys in self._tags.items() if not keys]
-        for tag in empty_tags:
-            del self._tags[tag]
+            self._tags.setdefault(tag, set()).add(key)
+    
+    def _remove_from_tags(self, key: str, tags: Tuple[str, ...]) -> None:
+        """Remove key from the mappings of its own tags."""
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+    
+    def _remove_entry(self, key: str) -> Optional[CacheEntry]:
+        """Remove an entry and its bookkeeping (caller holds the lock)."""
+        entry = self._cache.pop(key, None)
+        self._policy.remove(key)
+        if entry is not None:
+            self._update_memory_usage(-entry.size_bytes)
+            self._remove_from_tags(key, entry.tags)
+        return entry
     
-    async def _evict_entries(self) -> None:
-        """Evict entries based on eviction policy."""
+    def _evict_entries(self, incoming_bytes: int = 0, incoming_count: int = 0) -> None:
+        """
+        Evict entries until the size and memory limits hold.
+        
+        Args:
+            incoming_bytes: Size of an entry about to be added
+            incoming_count: Number of entries about to be added
+        """
         evicted_count = 0
+        over_count = len(self._cache) + incoming_count - self.max_size if self.max_size else 0
+        memory_limit = self.max_memory_bytes
         
-        while (
-            (self.max_size and len(self._cache) >= self.max_size) or
-            (self.max_memory_bytes and self._stats.get("memory_usage_bytes", 0) > self.max_memory_bytes)
+        while self._cache and (
+            over_count > 0 or
+            (memory_limit and self._memory_usage + incoming_bytes > memory_limit)
         ):
-            if not self._cache:
+            key_to_evict = self._policy.victim()
+            if key_to_evict is None:
                 break
             
-            key_to_evict = self._select_eviction_key()
-            if key_to_evict:
-                entry = self._cache[key_to_evict]
-                del self._cache[key_to_evict]
-                self._update_memory_usage(-entry.size_bytes)
-                self._remove_from_tags(key_to_evict)
-                evicted_count += 1
-                
-                if self.enable_stats:
-                    self._stats["evictions"] += 1
-            else:
-                break
+            self._remove_entry(key_to_evict)
+            over_count -= 1
+            evicted_count += 1
         
         if evicted_count > 0:
-            logger.debug(f"Evicted {evicted_count} entries using {self.eviction_policy} policy")
+            if self.enable_stats:
+                self._stats["evictions"] += evicted_count
+            logger.debug(f"Evicted {evicted_count} entries using {self._policy.name} policy")
     
-    def _select_eviction_key(self) -> Optional[str]:
-        """Select key for eviction based on policy."""
-        if not self._cache:
+    def _convert_ttl(self, ttl: Optional[Union[int, timedelta]]) -> Optional[float]:
+        """Convert TTL to monotonic expiration time."""
+        if ttl is None:
             return None
         
-        if self.eviction_policy == "lru":
-            # First item in OrderedDict is least recently used
-            return next(iter(self._cache))
+        if isinstance(ttl, timedelta):
+            ttl = ttl.total_seconds()
+        
+        if ttl <= 0:
+            return None
         
-        elif self.eviction_policy == "lfu":
-            # Find key with lowest access count
-            min_access_key = min(
-                self._cache.keys(),
-                key=lambda k: self._cache[k].access_count
-            )
-            return min_access_key
+        return time.monotonic() + ttl
+    
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[Union[int, timedelta]],
+        tags: Optional[List[str]] = None,
+    ) -> bool:
+        """Insert or replace an entry (caller holds the lock)."""
+        entry = CacheEntry(
+            value=value,
+            created_at=time.monotonic(),
+            expires_at=self._convert_ttl(ttl),
+            tags=tuple(tags) if tags else (),
+        )
         
-        elif self.eviction_policy == "random":
-            import random
-            return random.choice(list(self._cache.keys()))
+        if self.max_memory_bytes and entry.size_bytes > self.max_memory_bytes:
+            if self.enable_stats:
+                self._stats["rejections"] += 1
+            logger.debug(f"Value for key {key} ({entry.size_bytes} bytes) exceeds the cache memory limit")
+            return False
         
+        existing_entry = self._cache.get(key)
+        if existing_entry is not None:
+            # Replace in place so the key keeps its recency/frequency
+            self._update_memory_usage(entry.size_bytes - existing_entry.size_bytes)
+            self._remove_from_tags(key, existing_entry.tags)
+            entry.access_count = existing_entry.access_count
+            self._cache[key] = entry
+            self._add_to_tags(key, entry.tags)
+            self._policy.access(key)
+            self._evict_entries()
         else:
-            # Default to LRU
-            return next(iter(self._cache))
+            # Make room first so the new key can't be its own victim
+            self._evict_entries(incoming_bytes=entry.size_bytes, incoming_count=1)
+            self._cache[key] = entry
+            self._add_to_tags(key, entry.tags)
+            self._policy.insert(key)
+            self._update_memory_usage(entry.size_bytes)
+        
+        return key in self._cache
     
-    def _convert_ttl(self, ttl: Optional[Union[int, timedelta]]) -> Optional[datetime]:
-        """Convert TTL to expiration datetime."""
-        if ttl is None:
+    def _get_live_entry(self, key: str, now: float) -> Optional[CacheEntry]:
+        """Entry for key, dropping it if expired (caller holds the lock)."""
+        entry = self._cache.get(key)
+        if entry is not None and entry.expires_at is not None and now > entry.expires_at:
+            self._remove_entry(key)
+            if self.enable_stats:
+                self._stats["expirations"] += 1
+            logger.debug(f"Cache expired for key: {key}")
             return None
+        return entry
+    
+    def _get_locked(self, key: str) -> Optional[Any]:
+        """Get value and record the access (caller holds the lock)."""
+        now = time.monotonic()
+        entry = self._get_live_entry(key, now)
         
-        if isinstance(ttl, timedelta):
-            ttl = int(ttl.total_seconds())
-        
-        if ttl <= 0:
+        if entry is None:
+            if self.enable_stats:
+                self._stats["misses"] += 1
+            logger.debug(f"Cache miss for key: {key}")
             return None
         
-        return datetime.utcnow() + timedelta(seconds=ttl)
+        # Update access information
+        entry.access(now)
+        self._policy.access(key)
+        
+        if self.enable_stats:
+            self._stats["hits"] += 1
+        
+        logger.debug(f"Cache hit for key: {key}")
+        return entry.value
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         async with self._lock:
-            entry = self._cache.get(key)
-            
-            if entry is None:
-                if self.enable_stats:
-                    self._stats["misses"] += 1
-                logger.debug(f"Cache miss for key: {key}")
-                return None
-            
-            if entry.is_expired():
-                del self._cache[key]
-                self._update_memory_usage(-entry.size_bytes)
-                self._remove_from_tags(key)
-                
-                if self.enable_stats:
-                    self._stats["misses"] += 1
-                    self._stats["expirations"] += 1
-                
-                logger.debug(f"Cache expired for key: {key}")
-                return None
-            
-            # Update access information
-            entry.access()
-            
-            # Move to end for LRU (only if using LRU policy)
-            if self.eviction_policy == "lru":
-                self._cache.move_to_end(key)
-            
-            if self.enable_stats:
-                self._stats["hits"] += 1
-            
-            logger.debug(f"Cache hit for key: {key}")
-            return entry.value
+            return self._get_locked(key)
     
     async def set(
         self,
@@ -328,53 +376,25 @@ class MemoryCache(CacheInterface):
     ) -> bool:
         """Set value in cache with optional tags."""
         async with self._lock:
-            existing_entry = self._cache.get(key)
+            existing_entry = self._get_live_entry(key, time.monotonic())
             
             # Check nx condition
-            if nx and existing_entry is not None and not existing_entry.is_expired():
+            if nx and existing_entry is not None:
                 return False
             
             # Check xx condition
-            if xx and (existing_entry is None or existing_entry.is_expired()):
+            if xx and existing_entry is None:
                 return False
             
-            # Remove old entry if exists
-            if existing_entry:
-                self._update_memory_usage(-existing_entry.size_bytes)
-                self._remove_from_tags(key)
-            
             # Use provided TTL or default
             effective_ttl = ttl if ttl is not None else self.default_ttl
-            expires_at = self._convert_ttl(effective_ttl)
-            
-            # Create new entry
-            entry = CacheEntry(
-                value=value,
-                created_at=datetime.utcnow(),
-                expires_at=expires_at,
-                tags=tags or [],
-            )
-            
-            # Add to cache
-            self._cache[key] = entry
-            self._update_memory_usage(entry.size_bytes)
-            
-            # Add to tags
-            if tags:
-                self._add_to_tags(key, tags)
-            
-            # Move to end for LRU
-            if self.eviction_policy == "lru":
-                self._cache.move_to_end(key)
+            stored = self._store(key, value, effective_ttl, tags)
             
-            # Evict if necessary
-            await self._evict_entries()
-            
-            if self.enable_stats:
+            if stored and self.enable_stats:
                 self._stats["sets"] += 1
             
             logger.debug(f"Cache set for key: {key} (TTL: {effective_ttl}, tags: {tags})")
-            return True
+            return stored
     
     async def delete(self, *keys: str) -> int:
         """Delete keys from cache."""
@@ -382,15 +402,11 @@ class MemoryCache(CacheInterface):
             deleted_count = 0
             
             for key in keys:
-                entry = self._cache.get(key)
-                if entry:
-                    del self._cache[key]
-                    self._update_memory_usage(-entry.size_bytes)
-                    self._remove_from_tags(key)
+                if self._remove_entry(key) is not None:
                     deleted_count += 1
-                    
-                    if self.enable_stats:
-                        self._stats["deletes"] += 1
+            
+            if self.enable_stats:
+                self._stats["deletes"] += deleted_count
             
             logger.debug(f"Deleted {deleted_count} keys from cache")
             return deleted_count
@@ -398,13 +414,11 @@ class MemoryCache(CacheInterface):
     async def exists(self, *keys: str) -> int:
         """Check if keys exist in cache."""
         async with self._lock:
-            exist_count = 0
-            current_time = datetime.utcnow()
-            
-            for key in keys:
-                entry = self._cache.get(key)
-                if entry and (entry.expires_at is None or entry.expires_at > current_time):
-                    exist_count += 1
+            current_time = time.monotonic()
+            exist_count = sum(
+                1 for key in keys
+                if self._get_live_entry(key, current_time) is not None
+            )
             
             logger.debug(f"{exist_count} of {len(keys)} keys exist in cache")
             return exist_count
@@ -412,9 +426,9 @@ class MemoryCache(CacheInterface):
     async def expire(self, key: str, ttl: Union[int, timedelta]) -> bool:
         """Set TTL for existing key."""
         async with self._lock:
-            entry = self._cache.get(key)
+            entry = self._get_live_entry(key, time.monotonic())
             
-            if entry is None or entry.is_expired():
+            if entry is None:
                 return False
             
             entry.expires_at = self._convert_ttl(ttl)
@@ -424,61 +438,51 @@ class MemoryCache(CacheInterface):
     async def ttl(self, key: str) -> int:
         """Get TTL for key."""
         async with self._lock:
-            entry = self._cache.get(key)
+            entry = self._get_live_entry(key, time.monotonic())
             
-            if entry is None or entry.is_expired():
+            if entry is None:
                 return -2  # Key doesn't exist
             
             if entry.expires_at is None:
                 return -1  # No TTL set
             
-            remaining = entry.expires_at - datetime.utcnow()
-            ttl_seconds = int(remaining.total_seconds())
-            return max(0, ttl_seconds)
+            return entry.time_to_expire()
     
     async def increment(self, key: str, amount: int = 1, ttl: Optional[Union[int, timedelta]] = None) -> int:
         """Increment numeric value in cache."""
         async with self._lock:
-            entry = self._cache.get(key)
+            entry = self._get_live_entry(key, time.monotonic())
             
-            if entry is None or entry.is_expired():
+            if entry is None:
                 # Create new entry with initial value
                 new_value = amount
-                await self.set(key, new_value, ttl=ttl)
+                self._store(key, new_value, ttl if ttl is not None else self.default_ttl)
             else:
                 try:
-                    old_size = entry.size_bytes
                     new_value = int(entry.value) + amount
-                    entry.value = new_value
-                    entry.access()
-                    
-                    # Update size
-                    new_size = entry._calculate_size()
-                    self._update_memory_usage(new_size - old_size)
-                    entry.size_bytes = new_size
-                    
-                    # Move to end for LRU
-                    if self.eviction_policy == "lru":
-                        self._cache.move_to_end(key)
-                        
-                    # Set TTL if provided and this is a new key
-                    if ttl and entry.access_count == 1:
-                        entry.expires_at = self._convert_ttl(ttl)
-                        
                 except (ValueError, TypeError):
                     raise CacheError(f"Cannot increment non-numeric value for key: {key}")
+                
+                # Update value and size in place (TTL is kept)
+                old_size = entry.size_bytes
+                entry.value = new_value
+                entry.size_bytes = entry._calculate_size()
+                entry.access()
+                self._update_memory_usage(entry.size_bytes - old_size)
+                self._policy.access(key)
             
             logger.debug(f"Incremented key {key} by {amount}, new value: {new_value}")
             return new_value
     
     async def get_many(self, *keys: str) -> Dict[str, Any]:
         """Get multiple values from cache efficiently."""
-        result = {}
-        
-        for key in keys:
-            value = await self.get(key)
-            if value is not None:
-                result[key] = value
+        async with self._lock:
+            result = {}
+            
+            for key in keys:
+                value = self._get_locked(key)
+                if value is not None:
+                    result[key] = value
         
         logger.debug(f"Retrieved {len(result)} of {len(keys)} keys from cache")
         return result
@@ -489,11 +493,17 @@ class MemoryCache(CacheInterface):
         ttl: Optional[Union[int, timedelta]] = None,
     ) -> bool:
         """Set multiple values in cache efficiently."""
-        success_count = 0
+        effective_ttl = ttl if ttl is not None else self.default_ttl
         
-        for key, value in mapping.items():
-            if await self.set(key, value, ttl=ttl):
-                success_count += 1
+        async with self._lock:
+            success_count = 0
+            
+            for key, value in mapping.items():
+                if self._store(key, value, effective_ttl):
+                    success_count += 1
+            
+            if self.enable_stats:
+                self._stats["sets"] += success_count
         
         logger.debug(f"Set {success_count}/{len(mapping)} keys in cache (TTL: {ttl})")
         return success_count == len(mapping)
@@ -504,9 +514,8 @@ class MemoryCache(CacheInterface):
             count = len(self._cache)
             self._cache.clear()
             self._tags.clear()
-            
-            if self.enable_stats:
-                self._stats["memory_usage_bytes"] = 0
+            self._policy.clear()
+            self._update_memory_usage(-self._memory_usage)
             
             logger.warning(f"Cleared {count} keys from memory cache")
             return True
@@ -514,8 +523,8 @@ class MemoryCache(CacheInterface):
     async def keys(self, pattern: str = "*") -> List[str]:
         """Get keys matching pattern."""
         async with self._lock:
-            # Remove expired entries first
-            current_time = datetime.utcnow()
+            # Skip expired entries
+            current_time = time.monotonic()
             valid_keys = [
                 key for key, entry in self._cache.items()
                 if entry.expires_at is None or entry.expires_at > current_time
@@ -535,9 +544,8 @@ class MemoryCache(CacheInterface):
     
     async def scan_keys(self, pattern: str = "*", count: int = 100) -> List[str]:
         """Scan keys matching pattern (for compatibility with Redis interface)."""
-        # For memory cache, this is the same as keys() but with limit
-        all_keys = await self.keys(pattern)
-        return all_keys[:count]
+        # count is a per-iteration hint in Redis, not a limit; same as keys()
+        return await self.keys(pattern)
     
     async def delete_by_tags(self, *tags: str) -> int:
         """Delete all keys associated with given tags."""
@@ -545,22 +553,13 @@ class MemoryCache(CacheInterface):
             keys_to_delete = set()
             
             for tag in tags:
-                if tag in self._tags:
-                    keys_to_delete.update(self._tags[tag])
+                keys_to_delete.update(self._tags.get(tag, ()))
             
             deleted_count = 0
             for key in keys_to_delete:
-                if key in self._cache:
-                    entry = self._cache[key]
-                    del self._cache[key]
-                    self._update_memory_usage(-entry.size_bytes)
+                if self._remove_entry(key) is not None:
                     deleted_count += 1
             
-            # Clean up tag mappings
-            for tag in tags:
-                if tag in self._tags:
-                    del self._tags[tag]
-            
             if self.enable_stats:
                 self._stats["deletes"] += deleted_count
             
@@ -573,12 +572,11 @@ class MemoryCache(CacheInterface):
             keys_to_get = set()
             
             for tag in tags:
-                if tag in self._tags:
-                    keys_to_get.update(self._tags[tag])
+                keys_to_get.update(self._tags.get(tag, ()))
             
             result = {}
             for key in keys_to_get:
-                value = await self.get(key)
+                value = self._get_locked(key)
                 if value is not None:
                     result[key] = value
             
@@ -626,9 +624,10 @@ class MemoryCache(CacheInterface):
         """Get comprehensive cache information."""
         async with self._lock:
             total_entries = len(self._cache)
+            current_time = time.monotonic()
             expired_count = sum(
                 1 for entry in self._cache.values()
-                if entry.is_expired()
+                if entry.is_expired(current_time)
             )
             
             hit_rate = 0.0
@@ -637,11 +636,7 @@ class MemoryCache(CacheInterface):
                 if total_requests > 0:
                     hit_rate = self._stats["hits"] / total_requests
             
-            # Calculate memory usage if not tracked
-            if not self.enable_stats:
-                memory_usage = sum(entry.size_bytes for entry in self._cache.values())
-            else:
-                memory_usage = self._stats["memory_usage_bytes"]
+            memory_usage = self._memory_usage
             
             return {
                 "type": "memory",
@@ -653,6 +648,7 @@ class MemoryCache(CacheInterface):
                 "memory_usage_mb": round(memory_usage / (1024 * 1024), 2),
                 "hit_rate": round(hit_rate * 100, 2),
                 "eviction_policy": self.eviction_policy,
+                "admission_policy": self.admission_policy,
                 "stats": self._stats.copy() if self.enable_stats else {},
                 "default_ttl": self.default_ttl,
                 "cleanup_interval": self.cleanup_interval,
@@ -660,6 +656,12 @@ class MemoryCache(CacheInterface):
                 "is_running": self._is_running,
             }
     
+    def record_read_through(self, event: str) -> None:
+        """Count a read-through event (hits, misses, coalesced, ...)."""
+        if self.enable_stats:
+            metric = f"read_through_{event}"
+            self._stats[metric] = self._stats.get(metric, 0) + 1
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get cache metrics (sync version)."""
         if not self.enable_stats:
@@ -688,8 +690,15 @@ class MemoryCache(CacheInterface):
                 "deletes": 0,
                 "evictions": 0,
                 "expirations": 0,
+                "rejections": 0,
                 "memory_usage_bytes": current_memory,
                 "cleanup_runs": 0,
+                "read_through_hits": 0,
+                "read_through_misses": 0,
+                "read_through_coalesced": 0,
+                "read_through_stale_hits": 0,
+                "read_through_early_refreshes": 0,
+                "read_through_negative_hits": 0,
             }
     
     async def __aenter__(self):
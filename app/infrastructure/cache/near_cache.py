@@ -0,0 +1,375 @@
+"""
+Two-tier near cache: in-process L1 (MemoryCache) in front of L2 (RedisCache).
+
+Reads are served from L1 when possible and fill it from Redis on a miss.
+Writes go to Redis first, then drop the key from L1 in this process and
+publish an invalidation on a Redis Pub/Sub channel so every other API and
+worker process drops it from its L1 as well.
+
+L1 TTLs are per namespace (the key part before the first ``:``). Keys of
+namespaces without an L1 TTL always go to Redis; read-modify-write keys such
+as rate-limit counters must stay there.
+"""
+
+import logging
+import uuid
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Union
+
+from .base import CacheInterface
+from .memory_cache import MemoryCache
+from .redis_cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# L1 TTL (seconds) of namespaces that are read far more often than written
+DEFAULT_NAMESPACE_TTLS: Dict[str, int] = {
+    "auth_gateway": 30,
+    "job": 30,
+    "jobs": 30,
+    "user_exists": 60,
+}
+
+
+class NearCache(CacheInterface):
+    """
+    L1 memory cache in front of Redis with cross-process invalidation.
+
+    Features:
+    - Per-namespace L1 TTLs (namespaces without one bypass L1)
+    - Invalidation broadcast over Redis Pub/Sub
+    - Separate L1 and L2 hit ratios
+    - L1 is bypassed while the invalidation channel is down, so a process
+      never serves values it can't be told are stale
+    """
+
+    def __init__(
+        self,
+        l2: RedisCache,
+        max_size: int = 2000,
+        max_memory_mb: Optional[int] = 50,
+        namespace_ttls: Optional[Dict[str, int]] = None,
+        default_ttl: int = 0,
+        channel: str = INVALIDATION_CHANNEL,
+    ):
+        """
+        Initialize near cache.
+
+        Args:
+            l2: Shared Redis cache
+            max_size: Maximum number of L1 entries
+            max_memory_mb: Maximum L1 memory usage in MB
+            namespace_ttls: L1 TTL in seconds per key namespace
+            default_ttl: L1 TTL for other namespaces (0 bypasses L1)
+            channel: Pub/Sub channel for invalidations
+        """
+        self.l2 = l2
+        self.l1 = MemoryCache(
+            max_size=max_size,
+            max_memory_mb=max_memory_mb,
+            eviction_policy="lru",
+            enable_stats=True,
+        )
+        self.namespace_ttls = dict(DEFAULT_NAMESPACE_TTLS if namespace_ttls is None else namespace_ttls)
+        self.default_ttl = default_ttl
+        self.channel = channel
+
+        # Identifies this process's own invalidations on the channel
+        self.node_id = uuid.uuid4().hex
+        self._messaging = None
+        self._subscription_id: Optional[str] = None
+        self._l1_enabled = False
+        # Bumped on every invalidation; a fill that raced one is not stored
+        self._invalidation_seq = 0
+
+        self._metrics = {
+            "l1_hits": 0,
+            "l1_misses": 0,
+            "l2_hits": 0,
+            "l2_misses": 0,
+            "l1_fills": 0,
+            "l1_fills_skipped": 0,
+            "invalidations_sent": 0,
+            "invalidations_received": 0,
+        }
+
+    async def start(self) -> None:
+        """Subscribe to the invalidation channel and enable L1."""
+        from ..messaging.redis_messaging import RedisMessaging
+
+        await self.l1.start_cleanup_task()
+        try:
+            self._messaging = RedisMessaging(
+                url=self.l2.url,
+                host=self.l2.host,
+                port=self.l2.port,
+                password=self.l2.password,
+                db=self.l2.db,
+                max_connections=2,
+                enable_persistence=False,
+                on_connection_lost=self._on_channel_lost,
+                on_connection_restored=self._on_channel_restored,
+            )
+            await self._messaging.connect()
+            self._subscription_id = await self._messaging.subscribe(self.channel, self._on_invalidation)
+            await self._messaging.start_consuming()
+            self._l1_enabled = True
+            logger.info(f"Near cache L1 enabled (invalidations on '{self.channel}')")
+        except Exception as e:
+            logger.warning(f"Near cache invalidation channel unavailable, L1 disabled: {e}")
+            self._messaging = None
+            self._l1_enabled = False
+
+    async def stop(self) -> None:
+        """Stop listening for invalidations and drop L1."""
+        self._l1_enabled = False
+        if self._messaging:
+            try:
+                await self._messaging.disconnect()
+            except Exception as e:
+                logger.error(f"Error closing near cache invalidation channel: {e}")
+            self._messaging = None
+        await self.l1.stop_cleanup_task()
+        await self.l1.clear()
+
+    def _namespace_ttl(self, key: str) -> int:
+        """L1 TTL configured for the key's namespace (0 bypasses L1)."""
+        namespace = key.split(":", 1)[0]
+        return self.namespace_ttls.get(namespace, self.default_ttl)
+
+    def _l1_ttl(self, key: str) -> int:
+        """L1 TTL for key in this process (0 when L1 is bypassed)."""
+        return self._namespace_ttl(key) if self._l1_enabled else 0
+
+    async def _on_channel_lost(self) -> None:
+        """Bypass and drop L1: invalidations may be missed until resubscribed."""
+        self._l1_enabled = False
+        self._invalidation_seq += 1
+        await self.l1.clear()
+        logger.warning(f"Near cache invalidation channel '{self.channel}' lost, L1 disabled")
+
+    async def _on_channel_restored(self) -> None:
+        """Re-enable L1 after resubscribing to the invalidation channel."""
+        self._invalidation_seq += 1
+        await self.l1.clear()
+        self._l1_enabled = True
+        logger.info(f"Near cache resubscribed to '{self.channel}', L1 enabled")
+
+    async def _on_invalidation(self, message) -> None:
+        """Drop keys invalidated by another process."""
+        if message.source == self.node_id:
+            return
+
+        payload = message.payload or {}
+        self._invalidation_seq += 1
+        self._metrics["invalidations_received"] += 1
+        if payload.get("flush"):
+            await self.l1.clear()
+        elif payload.get("keys"):
+            await self.l1.delete(*payload["keys"])
+
+    async def _invalidate(self, keys: List[str], flush: bool = False) -> None:
+        """Drop keys from L1 here and in every other process."""
+        self._invalidation_seq += 1
+        if flush:
+            await self.l1.clear()
+        elif keys:
+            await self.l1.delete(*keys)
+
+        if not self._messaging:
+            return
+        try:
+            await self._messaging.publish(
+                self.channel,
+                {"flush": True} if flush else {"keys": keys},
+                source=self.node_id,
+            )
+            self._metrics["invalidations_sent"] += 1
+        except Exception as e:
+            logger.error(f"Failed to publish cache invalidation: {e}")
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from L1, then Redis."""
+        l1_ttl = self._l1_ttl(key)
+        if l1_ttl > 0:
+            value = await self.l1.get(key)
+            if value is not None:
+                self._metrics["l1_hits"] += 1
+                return value
+            self._metrics["l1_misses"] += 1
+
+        seq = self._invalidation_seq
+        value = await self.l2.get(key)
+        if value is None:
+            self._metrics["l2_misses"] += 1
+            return None
+
+        self._metrics["l2_hits"] += 1
+        if l1_ttl > 0:
+            if seq == self._invalidation_seq:
+                await self.l1.set(key, value, ttl=l1_ttl)
+                self._metrics["l1_fills"] += 1
+            else:
+                # The value read from Redis may predate the invalidation
+                self._metrics["l1_fills_skipped"] += 1
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[Union[int, timedelta]] = None,
+        nx: bool = False,
+        xx: bool = False,
+        tags: Optional[List[str]] = None,
+    ) -> bool:
+        """Set value in Redis and invalidate it in every L1."""
+        result = await self.l2.set(key, value, ttl=ttl, nx=nx, xx=xx, tags=tags)
+        if result and self._namespace_ttl(key) > 0:
+            await self._invalidate([key])
+        return result
+
+    async def delete(self, *keys: str) -> int:
+        """Delete keys from Redis and every L1."""
+        deleted = await self.l2.delete(*keys)
+        l1_keys = [key for key in keys if self._namespace_ttl(key) > 0]
+        if l1_keys:
+            await self._invalidate(l1_keys)
+        return deleted
+
+    async def exists(self, *keys: str) -> int:
+        """Check if keys exist in Redis."""
+        return await self.l2.exists(*keys)
+
+    async def expire(self, key: str, ttl: Union[int, timedelta]) -> bool:
+        """Set TTL in Redis (L1 entries expire on their own shorter TTL)."""
+        return await self.l2.expire(key, ttl)
+
+    async def ttl(self, key: str) -> int:
+        """Get TTL from Redis."""
+        return await self.l2.ttl(key)
+
+    async def increment(self, key: str, amount: int = 1, ttl: Optional[Union[int, timedelta]] = None) -> int:
+        """Increment value in Redis and invalidate it in every L1."""
+        value = await self.l2.increment(key, amount, ttl=ttl)
+        if self._namespace_ttl(key) > 0:
+            await self._invalidate([key])
+        return value
+
+    async def get_many(self, *keys: str) -> Dict[str, Any]:
+        """Get values from L1, then the rest from Redis in one call."""
+        result: Dict[str, Any] = {}
+        missing: List[str] = []
+        for key in keys:
+            if self._l1_ttl(key) > 0:
+                value = await self.l1.get(key)
+                if value is not None:
+                    self._metrics["l1_hits"] += 1
+                    result[key] = value
+                    continue
+                self._metrics["l1_misses"] += 1
+            missing.append(key)
+
+        if missing:
+            seq = self._invalidation_seq
+            found = await self.l2.get_many(*missing)
+            self._metrics["l2_hits"] += len(found)
+            self._metrics["l2_misses"] += len(missing) - len(found)
+            for key, value in found.items():
+                l1_ttl = self._l1_ttl(key)
+                if l1_ttl > 0 and seq == self._invalidation_seq:
+                    await self.l1.set(key, value, ttl=l1_ttl)
+                    self._metrics["l1_fills"] += 1
+            result.update(found)
+        return result
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[Union[int, timedelta]] = None,
+        tags: Optional[List[str]] = None,
+    ) -> bool:
+        """Set values in Redis and invalidate them in every L1."""
+        result = await self.l2.set_many(mapping, ttl=ttl, tags=tags)
+        l1_keys = [key for key in mapping if self._namespace_ttl(key) > 0]
+        if l1_keys:
+            await self._invalidate(l1_keys)
+        return result
+
+    async def get_by_tags(self, *tags: str) -> Dict[str, Any]:
+        """Get tagged values from Redis."""
+        return await self.l2.get_by_tags(*tags)
+
+    async def delete_by_tags(self, *tags: str) -> int:
+        """Delete tagged keys from Redis and every L1."""
+        l1_keys = [key for key in await self.l2.keys_by_tags(*tags) if self._namespace_ttl(key) > 0]
+        deleted = await self.l2.delete_by_tags(*tags)
+        if l1_keys:
+            await self._invalidate(l1_keys)
+        return deleted
+
+    async def clear(self) -> bool:
+        """Flush Redis and every L1."""
+        result = await self.l2.clear()
+        await self._invalidate([], flush=True)
+        return result
+
+    async def keys(self, pattern: str = "*") -> List[str]:
+        """Get keys matching pattern from Redis."""
+        return await self.l2.keys(pattern)
+
+    async def scan_keys(self, pattern: str = "*", count: int = 100) -> List[str]:
+        """Scan keys matching pattern in Redis."""
+        return await self.l2.scan_keys(pattern, count=count)
+
+    @asynccontextmanager
+    async def lock(self, key: str, timeout: int = 10, blocking: bool = True):
+        """Distributed lock (Redis)."""
+        async with self.l2.lock(key, timeout=timeout, blocking=blocking) as acquired:
+            yield acquired
+
+    async def health_check(self) -> bool:
+        """Check Redis health."""
+        return await self.l2.health_check()
+
+    async def info(self) -> Dict[str, Any]:
+        """Get near cache information."""
+        return {
+            "type": "near",
+            "l1_enabled": self._l1_enabled,
+            "channel": self.channel,
+            "namespace_ttls": self.namespace_ttls,
+            "default_ttl": self.default_ttl,
+            "l1": await self.l1.info(),
+        }
+
+    def record_read_through(self, event: str) -> None:
+        """Count a read-through event in the Redis cache metrics."""
+        self.l2.record_read_through(event)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get near cache metrics.
+
+        Returns:
+            Dictionary with L1/L2 counters and hit ratios (percent). The L1
+            ratio counts lookups of L1 namespaces; the L2 ratio counts the
+            lookups that reached Redis.
+        """
+        l1_lookups = self._metrics["l1_hits"] + self._metrics["l1_misses"]
+        l2_lookups = self._metrics["l2_hits"] + self._metrics["l2_misses"]
+        return {
+            **self._metrics,
+            "l1_enabled": self._l1_enabled,
+            "l1_size": len(self.l1._cache),
+            "l1_hit_ratio": round(self._metrics["l1_hits"] / l1_lookups * 100, 2) if l1_lookups else 0,
+            "l2_hit_ratio": round(self._metrics["l2_hits"] / l2_lookups * 100, 2) if l2_lookups else 0,
+        }
+
+    def reset_metrics(self) -> None:
+        """Reset near cache metrics."""
+        for name in self._metrics:
+            self._metrics[name] = 0
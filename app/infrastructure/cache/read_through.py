@@ -0,0 +1,482 @@
+"""
+Read-through caching with stampede protection.
+
+``ReadThroughLoader`` serves ``cache_result`` for coroutine functions:
+
+- Single-flight: concurrent misses for a key in one process await one
+  computation instead of each running the function.
+- Lease: on a shared cache (Redis) the computing process holds a short
+  ``cache.lock`` lease, so other processes wait for its result instead of
+  recomputing it.
+- Early refresh: values are stored with their logical expiry and how long
+  they took to compute, and a read close to expiry may refresh the value in
+  the background before it expires (probabilistic early expiration, weighted
+  by compute time).
+- Stale-while-revalidate: for ``stale_ttl`` seconds after expiry the old value
+  is still served while one background task recomputes it.
+- Negative caching: ``None`` results can be cached for ``negative_ttl``
+  seconds so missing rows aren't looked up on every call.
+
+Values are stored in an envelope dict; cached values without the envelope
+(written before this layer existed) are served as fresh hits.
+
+``SyncReadThroughCache`` gives sync callables the same behaviour in process
+memory, since the Redis client is async and bound to the event loop.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Set, Tuple, Union
+
+from .base import CacheInterface
+from .memory_cache import MemoryCache
+
+logger = logging.getLogger(__name__)
+
+# Envelope marker key
+ENVELOPE_KEY = "__rt__"
+# Suffix of the lease lock key
+LEASE_SUFFIX = ":lease"
+
+# (value, logical expiry or None, compute seconds, is negative)
+Entry = Tuple[Any, Optional[float], float, bool]
+
+
+class _LeaderCancelled(Exception):
+    """The task computing a shared result was cancelled; waiters retry"""
+
+
+def _ttl_seconds(ttl: Optional[Union[int, float, timedelta]]) -> Optional[float]:
+    """TTL as seconds (None for no TTL)"""
+    if ttl is None:
+        return None
+    if isinstance(ttl, timedelta):
+        return ttl.total_seconds()
+    return float(ttl)
+
+
+def _wrap(value: Any, ttl: Optional[float], delta: float, negative: bool = False) -> Dict[str, Any]:
+    """Envelope stored in the cache"""
+    return {
+        ENVELOPE_KEY: 1,
+        "v": value,
+        "exp": time.time() + ttl if ttl else None,
+        "d": round(delta, 6),
+        "n": negative,
+    }
+
+
+def _unwrap(cached: Any) -> Optional[Entry]:
+    """Entry of a cached value; None when nothing is cached"""
+    if cached is None:
+        return None
+    if isinstance(cached, dict) and cached.get(ENVELOPE_KEY) == 1:
+        return cached.get("v"), cached.get("exp"), cached.get("d") or 0.0, bool(cached.get("n"))
+    # Plain value from before the envelope
+    return cached, None, 0.0, False
+
+
+def should_refresh_early(expires_at: Optional[float], delta: float, beta: float, now: float) -> bool:
+    """
+    Probabilistic early expiration
+
+    Returns True with a probability that grows as ``now`` approaches
+    ``expires_at`` and with the time the value took to compute, so one caller
+    usually refreshes a hot key shortly before it expires.
+
+    Args:
+        expires_at: Logical expiry (epoch seconds)
+        delta: Seconds the value took to compute
+        beta: Eagerness; 0 disables early refresh, values above 1 refresh
+            earlier
+        now: Current epoch seconds
+    """
+    if expires_at is None or beta <= 0 or delta <= 0:
+        return False
+    # 1 - random() is in (0, 1], so the log is defined
+    return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+def _record(cache: Any, event: str) -> None:
+    """Count a read-through event in the cache's metrics"""
+    try:
+        cache.record_read_through(event)
+    except Exception:
+        pass
+
+
+class ReadThroughLoader:
+    """
+    Single-flight, lease-protected read-through over a ``CacheInterface``.
+    """
+
+    def __init__(self, lease_poll_interval: float = 0.05, lease_poll_max: float = 0.5):
+        """
+        Initialize loader
+
+        Args:
+            lease_poll_interval: First delay between cache polls while another
+                process holds the lease
+            lease_poll_max: Longest delay between polls
+        """
+        self.lease_poll_interval = lease_poll_interval
+        self.lease_poll_max = lease_poll_max
+        # (id(cache), key) -> future of the computation in progress
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+        # Background refresh tasks (kept referenced until done)
+        self._background: Set[asyncio.Task] = set()
+
+    async def get_or_load(
+        self,
+        cache: CacheInterface,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[Union[int, timedelta]] = None,
+        stale_ttl: Optional[Union[int, timedelta]] = None,
+        negative_ttl: Optional[Union[int, timedelta]] = None,
+        beta: float = 1.0,
+        lease_timeout: float = 10.0,
+        tags: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """
+        Return the cached value for ``key``, computing it with ``loader`` on a miss
+
+        Args:
+            cache: Cache instance
+            key: Cache key
+            loader: Coroutine function computing the value
+            ttl: Freshness TTL
+            stale_ttl: How long an expired value may still be served while
+                it is refreshed
+            negative_ttl: TTL for cached ``None`` results (None disables)
+            beta: Early refresh eagerness (0 disables)
+            lease_timeout: Lease duration and longest wait for another
+                process's result, in seconds
+            tags: Tags to store the value under (for ``delete_by_tags``)
+
+        Returns:
+            Cached or computed value
+        """
+        options = (
+            _ttl_seconds(ttl), _ttl_seconds(stale_ttl) or 0.0,
+            _ttl_seconds(negative_ttl), beta, lease_timeout, list(tags or ()),
+        )
+
+        entry = await self._read(cache, key)
+        if entry is not None:
+            value, expires_at, delta, negative = entry
+            now = time.time()
+            if expires_at is None or now < expires_at:
+                if should_refresh_early(expires_at, delta, beta, now):
+                    _record(cache, "early_refreshes")
+                    self._refresh_in_background(cache, key, loader, options)
+                _record(cache, "negative_hits" if negative else "hits")
+                return value
+            if now < expires_at + options[1]:
+                _record(cache, "stale_hits")
+                self._refresh_in_background(cache, key, loader, options)
+                return value
+
+        _record(cache, "misses")
+        return await self._load_once(cache, key, loader, options)
+
+    async def _read(self, cache: CacheInterface, key: str) -> Optional[Entry]:
+        """Cached entry of ``key``; None on a miss or cache error"""
+        try:
+            return _unwrap(await cache.get(key))
+        except Exception as e:
+            logger.warning(f"Cache get error for {key}: {e}")
+            return None
+
+    async def _load_once(
+        self,
+        cache: CacheInterface,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        options: tuple,
+    ) -> Any:
+        """Compute ``key`` once per process, however many callers miss at once"""
+        flight_key = (id(cache), key)
+        while True:
+            future = self._inflight.get(flight_key)
+            if future is None:
+                break
+            _record(cache, "coalesced")
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # Leader gone; the next waiter through becomes the leader
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the outcome as retrieved when nobody else awaited it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[flight_key] = future
+        try:
+            value = await self._load_with_lease(cache, key, loader, options)
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(flight_key) is future:
+                del self._inflight[flight_key]
+
+    async def _load_with_lease(
+        self,
+        cache: CacheInterface,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        options: tuple,
+    ) -> Any:
+        """Compute under a cross-process lease when the cache is shared"""
+        lease_timeout = options[4]
+        lock = getattr(cache, "lock", None)
+        if isinstance(cache, MemoryCache) or lock is None or lease_timeout <= 0:
+            return await self._compute_and_store(cache, key, loader, options)
+
+        async with lock(f"{key}{LEASE_SUFFIX}", timeout=max(1, int(math.ceil(lease_timeout))), blocking=False) as acquired:
+            if acquired:
+                return await self._compute_and_store(cache, key, loader, options)
+
+        # Another process holds the lease: wait for it to store the value
+        _record(cache, "lease_waits")
+        entry = await self._wait_for_fill(cache, key, lease_timeout)
+        if entry is not None:
+            return entry[0]
+        logger.debug(f"Lease wait timed out for {key}, computing locally")
+        return await self._compute_and_store(cache, key, loader, options)
+
+    async def _wait_for_fill(self, cache: CacheInterface, key: str, timeout: float) -> Optional[Entry]:
+        """Poll the cache until ``key`` has a value or ``timeout`` passes"""
+        deadline = time.monotonic() + timeout
+        delay = self.lease_poll_interval
+        while time.monotonic() < deadline:
+            entry = await self._read(cache, key)
+            if entry is not None:
+                return entry
+            await asyncio.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 2, self.lease_poll_max)
+        return None
+
+    async def _compute_and_store(
+        self,
+        cache: CacheInterface,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        options: tuple,
+    ) -> Any:
+        """Run ``loader`` and store its result in an envelope"""
+        ttl, stale_ttl, negative_ttl = options[0], options[1], options[2]
+        # Only caches with a tag index take tags
+        tagged = {"tags": options[5]} if options[5] else {}
+        started = time.monotonic()
+        value = await loader()
+        delta = time.monotonic() - started
+
+        try:
+            if value is None:
+                if negative_ttl:
+                    await cache.set(
+                        key, _wrap(None, negative_ttl, delta, negative=True),
+                        ttl=int(math.ceil(negative_ttl)), **tagged,
+                    )
+            else:
+                # Keep the value past its logical expiry for the stale window
+                physical_ttl = int(math.ceil(ttl + stale_ttl)) if ttl else None
+                await cache.set(key, _wrap(value, ttl, delta), ttl=physical_ttl, **tagged)
+        except Exception as e:
+            logger.warning(f"Cache set error for {key}: {e}")
+        return value
+
+    def _refresh_in_background(
+        self,
+        cache: CacheInterface,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        options: tuple,
+    ) -> None:
+        """Recompute ``key`` in a task unless it is already being computed"""
+        if (id(cache), key) in self._inflight:
+            return
+        task = asyncio.create_task(self._load_once(cache, key, loader, options))
+        self._background.add(task)
+        task.add_done_callback(self._refresh_done)
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        """Drop a finished refresh task and log its failure"""
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background cache refresh failed: {task.exception()}")
+
+
+class _Flight:
+    """Computation in progress for one key of a ``SyncReadThroughCache``"""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SyncReadThroughCache:
+    """
+    Thread-safe in-process read-through cache for sync callables.
+
+    Same single-flight, early refresh, stale-while-revalidate and negative
+    caching behaviour as ``ReadThroughLoader``. The thread that wins a refresh
+    recomputes inline while other threads keep getting the stale value.
+    Entries are evicted least recently used first.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        """
+        Initialize cache
+
+        Args:
+            max_size: Maximum number of entries
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # key -> (entry, physical expiry or None)
+        self._entries: "OrderedDict[str, Tuple[Entry, Optional[float]]]" = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._metrics = {
+            "read_through_hits": 0,
+            "read_through_misses": 0,
+            "read_through_coalesced": 0,
+            "read_through_stale_hits": 0,
+            "read_through_early_refreshes": 0,
+            "read_through_negative_hits": 0,
+        }
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[Union[int, timedelta]] = None,
+        stale_ttl: Optional[Union[int, timedelta]] = None,
+        negative_ttl: Optional[Union[int, timedelta]] = None,
+        beta: float = 1.0,
+    ) -> Any:
+        """
+        Return the cached value for ``key``, computing it with ``loader`` on a miss
+
+        Args:
+            key: Cache key
+            loader: Callable computing the value
+            ttl: Freshness TTL
+            stale_ttl: How long an expired value may still be served while
+                it is refreshed
+            negative_ttl: TTL for cached ``None`` results (None disables)
+            beta: Early refresh eagerness (0 disables)
+
+        Returns:
+            Cached or computed value
+        """
+        ttl_s, stale_s, negative_s = _ttl_seconds(ttl), _ttl_seconds(stale_ttl) or 0.0, _ttl_seconds(negative_ttl)
+        now = time.time()
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None and stored[1] is not None and now >= stored[1]:
+                del self._entries[key]
+                stored = None
+            if stored is not None:
+                self._entries.move_to_end(key)
+                value, expires_at, delta, negative = stored[0]
+                fresh = expires_at is None or now < expires_at
+                refreshing = key in self._inflight
+                if fresh and (refreshing or not should_refresh_early(expires_at, delta, beta, now)):
+                    self._metrics["read_through_negative_hits" if negative else "read_through_hits"] += 1
+                    return value
+                if refreshing:
+                    # Stale, and another thread is already refreshing it
+                    self._metrics["read_through_stale_hits"] += 1
+                    return value
+                self._metrics["read_through_early_refreshes" if fresh else "read_through_stale_hits"] += 1
+                flight = self._inflight[key] = _Flight()
+                leader = True
+            else:
+                flight = self._inflight.get(key)
+                leader = flight is None
+                if leader:
+                    self._metrics["read_through_misses"] += 1
+                    flight = self._inflight[key] = _Flight()
+                else:
+                    self._metrics["read_through_coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        delta = 0.0
+        try:
+            started = time.monotonic()
+            value = loader()
+            delta = time.monotonic() - started
+            flight.value = value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if flight.error is None:
+                    self._store(key, flight.value, ttl_s, stale_s, negative_s, delta)
+                self._inflight.pop(key, None)
+            flight.done.set()
+        return value
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float],
+        stale_ttl: float,
+        negative_ttl: Optional[float],
+        delta: float,
+    ) -> None:
+        """Store a computed value (caller holds the lock)"""
+        now = time.time()
+        if value is None:
+            if not negative_ttl:
+                self._entries.pop(key, None)
+                return
+            entry = (None, now + negative_ttl, delta, True)
+            physical_expiry = now + negative_ttl
+        else:
+            entry = (value, now + ttl if ttl else None, delta, False)
+            physical_expiry = now + ttl + stale_ttl if ttl else None
+        self._entries[key] = (entry, physical_expiry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> bool:
+        """Drop ``key``; returns whether it was cached"""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Read-through counters and current size"""
+        with self._lock:
+            return {**self._metrics, "current_size": len(self._entries)}
@@ -3,7 +3,6 @@ Redis cache implementation with async support and improved features.
 """
 
 import asyncio
-import json
 import logging
 from typing import Any, Optional, Union, List, Dict, Callable
 from datetime import timedelta
@@ -11,15 +10,69 @@ from contextlib import asynccontextmanager
 
 import redis.asyncio as redis
 from redis.asyncio import ConnectionPool
-from redis.exceptions import RedisError, ConnectionError
+from redis.exceptions import RedisError, ConnectionError, LockError
 from redis.typing import ExpiryT
 
 from .base import CacheInterface
+from ...core.codecs import ValueCodec, create_codec
 from ...core.config import get_settings
 from ...core.exceptions import CacheError
 
 logger = logging.getLogger(__name__)
 
+# Tag index: the set "cache_tag:<tag>" holds the cache keys stored with <tag>
+TAG_KEY_PREFIX = "cache_tag:"
+
+# Commands (and keys per MGET) sent per pipeline round trip in bulk operations
+BULK_CHUNK_SIZE = 1000
+
+# KEYS[1]: cache key, KEYS[2..]: tag sets
+# ARGV[1]: value, ARGV[2]: TTL in seconds (0 = none), ARGV[3]: "NX", "XX" or ""
+# Tag sets live as long as their longest-lived key; returns 1 if the key was set.
+# Writes the key and its tag sets atomically, so on Redis Cluster they must
+# share a hash slot (e.g. a "{tenant}" hash tag in both names)
+SET_WITH_TAGS_SCRIPT = """
+local ttl = tonumber(ARGV[2])
+local command = {'SET', KEYS[1], ARGV[1]}
+if ttl > 0 then
+    table.insert(command, 'EX')
+    table.insert(command, ttl)
+end
+if ARGV[3] ~= '' then
+    table.insert(command, ARGV[3])
+end
+if not redis.call(unpack(command)) then
+    return 0
+end
+for i = 2, #KEYS do
+    local existed = redis.call('EXISTS', KEYS[i])
+    redis.call('SADD', KEYS[i], KEYS[1])
+    if ttl == 0 then
+        redis.call('PERSIST', KEYS[i])
+    else
+        local remaining = redis.call('TTL', KEYS[i])
+        if existed == 0 or (remaining >= 0 and remaining < ttl) then
+            redis.call('EXPIRE', KEYS[i], ttl)
+        end
+    end
+end
+return 1
+"""
+
+# KEYS[1]: tag set; deletes the set and returns its members. Only touches
+# the declared key, so the tagged keys are deleted by the client (one slot
+# per script call, as Redis Cluster requires)
+POP_TAG_SCRIPT = """
+local members = redis.call('SMEMBERS', KEYS[1])
+redis.call('DEL', KEYS[1])
+return members
+"""
+
+
+def _tag_key(tag: str) -> str:
+    """Redis key of a tag's index set."""
+    return f"{TAG_KEY_PREFIX}{tag}"
+
 
 class RedisCache(CacheInterface):
     """
@@ -28,9 +81,11 @@ class RedisCache(CacheInterface):
     Features:
     - Async/await support
     - Connection pooling
-    - JSON serialization with custom encoders
+    - msgpack/JSON value codec with optional compression
     - Circuit breaker pattern
     - Distributed locking
+    - Tag index for O(tagged keys) invalidation
+    - Pipelined bulk operations
     - Cache warming
     - Metrics collection
     """
@@ -49,6 +104,7 @@ class RedisCache(CacheInterface):
         health_check_interval: int = 30,
         custom_serializer: Optional[Callable] = None,
         custom_deserializer: Optional[Callable] = None,
+        codec: Optional[ValueCodec] = None,
     ):
         """
         Initialize Redis cache.
@@ -66,6 +122,7 @@ class RedisCache(CacheInterface):
             health_check_interval: Health check interval in seconds
             custom_serializer: Custom serialization function
             custom_deserializer: Custom deserialization function
+            codec: Value codec (default: from CACHE_CODEC settings)
         """
         settings = get_settings()
         
@@ -86,10 +143,13 @@ class RedisCache(CacheInterface):
         # Serialization
         self.custom_serializer = custom_serializer
         self.custom_deserializer = custom_deserializer
+        self.codec = codec or create_codec()
         
         # State
         self._client: Optional[redis.Redis] = None
         self._pool: Optional[ConnectionPool] = None
+        self._set_with_tags = None
+        self._pop_tag = None
         self._is_connected = False
         self._circuit_breaker_failures = 0
         self._circuit_breaker_threshold = 5
@@ -103,6 +163,15 @@ class RedisCache(CacheInterface):
             'sets': 0,
             'deletes': 0,
             'errors': 0,
+            'bytes_written': 0,
+            'bytes_read': 0,
+            'read_through_hits': 0,
+            'read_through_misses': 0,
+            'read_through_coalesced': 0,
+            'read_through_stale_hits': 0,
+            'read_through_early_refreshes': 0,
+            'read_through_negative_hits': 0,
+            'read_through_lease_waits': 0,
         }
     
     async def connect(self) -> None:
@@ -116,7 +185,7 @@ class RedisCache(CacheInterface):
                     retry_on_timeout=self.retry_on_timeout,
                     socket_timeout=self.socket_timeout,
                     socket_connect_timeout=self.socket_connect_timeout,
-                    decode_responses=True,
+                    decode_responses=False,
                 )
             else:
                 # Use individual parameters
@@ -129,10 +198,12 @@ class RedisCache(CacheInterface):
                     retry_on_timeout=self.retry_on_timeout,
                     socket_timeout=self.socket_timeout,
                     socket_connect_timeout=self.socket_connect_timeout,
-                    decode_responses=True,
+                    decode_responses=False,
                 )
             
             self._client = redis.Redis(connection_pool=self._pool)
+            self._set_with_tags = self._client.register_script(SET_WITH_TAGS_SCRIPT)
+            self._pop_tag = self._client.register_script(POP_TAG_SCRIPT)
             
             # Test connection
             await self._client.ping()
@@ -192,45 +263,46 @@ class RedisCache(CacheInterface):
         
         return False
     
-    def _serialize(self, value: Any) -> str:
+    def _serialize(self, value: Any) -> Union[str, bytes]:
         """
-        Serialize value to JSON string with custom serializer support.
+        Serialize value with the codec or a custom serializer.
         
         Args:
             value: Value to serialize
             
         Returns:
-            JSON string
+            Encoded payload
         """
         try:
             if self.custom_serializer:
-                return self.custom_serializer(value)
-            
-            return json.dumps(
-                value,
-                default=str,
-                ensure_ascii=False,
-                separators=(',', ':')  # More compact JSON
-            )
-        except (TypeError, ValueError) as e:
+                serialized = self.custom_serializer(value)
+            else:
+                serialized = self.codec.encode(value)
+        except (TypeError, ValueError, OverflowError) as e:
             raise CacheError(f"Failed to serialize value: {e}")
+        
+        self._metrics['bytes_written'] += len(serialized)
+        return serialized
     
-    def _deserialize(self, value: str) -> Any:
+    def _deserialize(self, value: bytes) -> Any:
         """
-        Deserialize JSON string to Python object with custom deserializer support.
+        Deserialize a payload written by any codec (or legacy JSON).
         
         Args:
-            value: JSON string to deserialize
+            value: Raw payload from Redis
             
         Returns:
             Deserialized Python object
         """
+        self._metrics['bytes_read'] += len(value)
         try:
             if self.custom_deserializer:
-                return self.custom_deserializer(value)
+                # Custom deserializers receive the str they were written as
+                return self.custom_deserializer(value.decode('utf-8'))
             
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError) as e:
+            return self.codec.decode(value)
+        except (ValueError, TypeError) as e:
+            # JSONDecodeError, UnicodeDecodeError and codec errors are ValueErrors
             raise CacheError(f"Failed to deserialize value: {e}")
     
     async def get(self, key: str) -> Optional[Any]:
@@ -260,6 +332,9 @@ class RedisCache(CacheInterface):
             logger.debug(f"Cache hit for key: {key}")
             return self._deserialize(value)
             
+        except CacheError as e:
+            logger.warning(f"Unreadable cache value for key {key}: {e}")
+            return None
         except RedisError as e:
             logger.error(f"Redis get error for key {key}: {e}")
             self._handle_error()
@@ -272,6 +347,7 @@ class RedisCache(CacheInterface):
         ttl: Optional[Union[int, timedelta]] = None,
         nx: bool = False,
         xx: bool = False,
+        tags: Optional[List[str]] = None,
     ) -> bool:
         """
         Set value in cache.
@@ -282,6 +358,7 @@ class RedisCache(CacheInterface):
             ttl: Time to live (seconds or timedelta)
             nx: Only set if key doesn't exist
             xx: Only set if key exists
+            tags: Tags to index the key under (see delete_by_tags)
             
         Returns:
             True if value was set, False otherwise
@@ -299,17 +376,24 @@ class RedisCache(CacheInterface):
             if isinstance(ttl, timedelta):
                 ttl = int(ttl.total_seconds())
             
-            result = await self._client.set(
-                key,
-                serialized_value,
-                ex=ttl,
-                nx=nx,
-                xx=xx,
-            )
+            if tags:
+                # Value and tag index are written atomically in one round trip
+                result = await self._set_with_tags(
+                    keys=[key, *(_tag_key(tag) for tag in tags)],
+                    args=[serialized_value, ttl or 0, 'NX' if nx else 'XX' if xx else ''],
+                )
+            else:
+                result = await self._client.set(
+                    key,
+                    serialized_value,
+                    ex=ttl,
+                    nx=nx,
+                    xx=xx,
+                )
             
             if result:
                 self._metrics['sets'] += 1
-                logger.debug(f"Cache set for key: {key} (TTL: {ttl})")
+                logger.debug(f"Cache set for key: {key} (TTL: {ttl}, tags: {tags})")
             
             return bool(result)
             
@@ -468,7 +552,7 @@ class RedisCache(CacheInterface):
     
     async def get_many(self, *keys: str) -> Dict[str, Any]:
         """
-        Get multiple values from cache efficiently.
+        Get multiple values from cache in one pipelined round trip.
         
         Args:
             keys: Cache keys to retrieve
@@ -483,7 +567,12 @@ class RedisCache(CacheInterface):
             if not self._client:
                 await self.connect()
             
-            values = await self._client.mget(keys)
+            # MGET in chunks so one huge call doesn't block Redis
+            async with self._client.pipeline(transaction=False) as pipe:
+                for start in range(0, len(keys), BULK_CHUNK_SIZE):
+                    await pipe.mget(keys[start:start + BULK_CHUNK_SIZE])
+                chunks = await pipe.execute()
+            values = [value for chunk in chunks for value in chunk]
             result = {}
             
             for i, value in enumerate(values):
@@ -508,13 +597,15 @@ class RedisCache(CacheInterface):
         self,
         mapping: Dict[str, Any],
         ttl: Optional[Union[int, timedelta]] = None,
+        tags: Optional[List[str]] = None,
     ) -> bool:
         """
-        Set multiple values in cache efficiently.
+        Set multiple values in cache in one pipelined round trip.
         
         Args:
             mapping: Dictionary of key-value pairs to set
             ttl: Time to live for all keys
+            tags: Tags to index every key under
             
         Returns:
             True if all values were set
@@ -532,22 +623,27 @@ class RedisCache(CacheInterface):
                 for key, value in mapping.items()
             }
             
-            # Use pipeline for efficient batch operation
-            async with self._client.pipeline() as pipe:
-                await pipe.mset(serialized_mapping)
-                
-                # Set TTL if specified
-                if ttl:
-                    if isinstance(ttl, timedelta):
-                        ttl = int(ttl.total_seconds())
-                    
-                    for key in mapping.keys():
-                        await pipe.expire(key, ttl)
-                
-                results = await pipe.execute()
+            if isinstance(ttl, timedelta):
+                ttl = int(ttl.total_seconds())
+            tag_keys = [_tag_key(tag) for tag in tags or ()]
+            
+            # One SET (with its TTL) per key instead of MSET plus an EXPIRE
+            # per key; large batches are flushed every BULK_CHUNK_SIZE keys
+            results = []
+            items = list(serialized_mapping.items())
+            for start in range(0, len(items), BULK_CHUNK_SIZE):
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for key, value in items[start:start + BULK_CHUNK_SIZE]:
+                        if tag_keys:
+                            await self._set_with_tags(
+                                keys=[key, *tag_keys], args=[value, ttl or 0, ''], client=pipe
+                            )
+                        else:
+                            await pipe.set(key, value, ex=ttl)
+                    results.extend(await pipe.execute())
             
             self._metrics['sets'] += len(mapping)
-            logger.debug(f"Set {len(mapping)} keys in cache (TTL: {ttl})")
+            logger.debug(f"Set {len(mapping)} keys in cache (TTL: {ttl}, tags: {tags})")
             return all(results)
             
         except RedisError as e:
@@ -595,7 +691,7 @@ class RedisCache(CacheInterface):
             if not self._client:
                 await self.connect()
             
-            keys = await self._client.keys(pattern)
+            keys = [key.decode('utf-8') for key in await self._client.keys(pattern)]
             logger.debug(f"Found {len(keys)} keys matching pattern: {pattern}")
             return keys
             
@@ -631,7 +727,7 @@ class RedisCache(CacheInterface):
                     match=pattern,
                     count=count
                 )
-                keys.extend(batch)
+                keys.extend(key.decode('utf-8') for key in batch)
                 
                 if cursor == 0:
                     break
@@ -644,6 +740,105 @@ class RedisCache(CacheInterface):
             self._handle_error()
             return []
     
+    async def keys_by_tags(self, *tags: str) -> List[str]:
+        """
+        Get keys indexed under any of the given tags.
+        
+        May include keys that have since expired or were deleted without
+        their tags; get_by_tags prunes those.
+        
+        Args:
+            tags: Tags to look up
+            
+        Returns:
+            List of tagged keys
+        """
+        if not self._should_attempt_operation() or not tags:
+            return []
+        
+        try:
+            if not self._client:
+                await self.connect()
+            
+            members = await self._client.sunion([_tag_key(tag) for tag in tags])
+            return [member.decode('utf-8') for member in members]
+            
+        except RedisError as e:
+            logger.error(f"Redis sunion error for tags {tags}: {e}")
+            self._handle_error()
+            return []
+    
+    async def get_by_tags(self, *tags: str) -> Dict[str, Any]:
+        """
+        Get all values indexed under any of the given tags.
+        
+        Args:
+            tags: Tags to look up
+            
+        Returns:
+            Dictionary mapping keys to values
+        """
+        keys = await self.keys_by_tags(*tags)
+        if not keys:
+            return {}
+        
+        result = await self.get_many(*keys)
+        gone = [key for key in keys if key not in result]
+        if gone:
+            # Drop expired keys from the index
+            try:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for tag in tags:
+                        await pipe.srem(_tag_key(tag), *gone)
+                    await pipe.execute()
+            except RedisError as e:
+                logger.warning(f"Failed to prune tag index for tags {tags}: {e}")
+        return result
+    
+    async def delete_by_tags(self, *tags: str) -> int:
+        """
+        Delete all keys indexed under any of the given tags, and the tags.
+        
+        Each tag set is read and dropped atomically by a single-key script,
+        then the members are deleted in pipelined chunks, so the cost grows
+        with the number of tagged keys rather than the size of the keyspace.
+        Keys written without tags are not in the index and are left alone.
+        
+        Args:
+            tags: Tags to invalidate
+            
+        Returns:
+            Number of keys that were deleted
+        """
+        if not self._should_attempt_operation() or not tags:
+            return 0
+        
+        try:
+            if not self._client:
+                await self.connect()
+            
+            async with self._client.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    await self._pop_tag(keys=[_tag_key(tag)], client=pipe)
+                popped = await pipe.execute()
+            
+            keys = list({member for members in popped for member in members})
+            deleted = 0
+            for start in range(0, len(keys), BULK_CHUNK_SIZE):
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for key in keys[start:start + BULK_CHUNK_SIZE]:
+                        await pipe.delete(key)
+                    deleted += sum(await pipe.execute())
+            
+            self._metrics['deletes'] += deleted
+            logger.debug(f"Deleted {deleted} keys by tags: {tags}")
+            return deleted
+            
+        except RedisError as e:
+            logger.error(f"Redis delete by tags error for tags {tags}: {e}")
+            self._handle_error()
+            return 0
+    
     @asynccontextmanager
     async def lock(self, key: str, timeout: int = 10, blocking: bool = True):
         """
@@ -652,7 +847,10 @@ class RedisCache(CacheInterface):
         Args:
             key: Lock key
             timeout: Lock timeout in seconds
-            blocking: Whether to block until lock is acquired
+            blocking: Whether to wait (up to ``timeout``) for the lock
+            
+        Yields:
+            True if the lock was acquired
         """
         if not self._should_attempt_operation():
             yield False
@@ -662,15 +860,33 @@ class RedisCache(CacheInterface):
             if not self._client:
                 await self.connect()
             
-            lock = self._client.lock(key, timeout=timeout, blocking=blocking)
-            
-            async with lock:
-                yield True
-                
+            lock = self._client.lock(
+                key,
+                timeout=timeout,
+                blocking=blocking,
+                blocking_timeout=timeout if blocking else None,
+            )
+            acquired = await lock.acquire()
         except RedisError as e:
             logger.error(f"Redis lock error for key {key}: {e}")
             self._handle_error()
+            acquired = False
+        
+        if not acquired:
             yield False
+            return
+        
+        try:
+            yield True
+        finally:
+            try:
+                await lock.release()
+            except LockError:
+                # Lock expired before the holder finished
+                logger.warning(f"Redis lock {key} expired before release")
+            except RedisError as e:
+                logger.error(f"Redis lock release error for key {key}: {e}")
+                self._handle_error()
     
     async def health_check(self) -> bool:
         """
@@ -720,6 +936,11 @@ class RedisCache(CacheInterface):
             self._handle_error()
             return {}
     
+    def record_read_through(self, event: str) -> None:
+        """Count a read-through event (hits, misses, coalesced, ...)."""
+        metric = f'read_through_{event}'
+        self._metrics[metric] = self._metrics.get(metric, 0) + 1
+    
     def get_metrics(self) -> Dict[str, Any]:
         """
         Get cache metrics.
@@ -734,6 +955,7 @@ class RedisCache(CacheInterface):
             **self._metrics,
             'hit_rate': round(hit_rate, 2),
             'total_operations': total_operations,
+            'read_through_hit_rate': _read_through_hit_rate(self._metrics),
             'is_connected': self._is_connected,
             'circuit_breaker_failures': self._circuit_breaker_failures,
         }
@@ -746,9 +968,29 @@ class RedisCache(CacheInterface):
             'sets': 0,
             'deletes': 0,
             'errors': 0,
+            'bytes_written': 0,
+            'bytes_read': 0,
+            'read_through_hits': 0,
+            'read_through_misses': 0,
+            'read_through_coalesced': 0,
+            'read_through_stale_hits': 0,
+            'read_through_early_refreshes': 0,
+            'read_through_negative_hits': 0,
+            'read_through_lease_waits': 0,
         }
 
 
+def _read_through_hit_rate(metrics: Dict[str, Any]) -> float:
+    """Share of read-through lookups served from cache, in percent."""
+    served = (
+        metrics.get('read_through_hits', 0)
+        + metrics.get('read_through_stale_hits', 0)
+        + metrics.get('read_through_negative_hits', 0)
+    )
+    total = served + metrics.get('read_through_misses', 0)
+    return round(served / total * 100, 2) if total > 0 else 0
+
+
 class RedisManager:
     """
     Redis connection manager with lifecycle management.
@@ -5,6 +5,7 @@ Cache utilities and helper functions.
 from typing import Any, List, Optional
 from hashlib import md5
 import json
+import sys
 
 
 def cache_key(*parts: Any, prefix: str = "", separator: str = ":", hash_long_keys: bool = True) -> str:
@@ -162,4 +163,59 @@ def get_cache_namespace(obj: Any) -> str:
     elif hasattr(obj, '__name__'):
         return obj.__name__
     else:
-        return str(type(obj).__name__)
\ No newline at end of file
+        return str(type(obj).__name__)
+
+
+# Containers whose items deep_sizeof walks
+_SEQUENCE_TYPES = (list, tuple, set, frozenset)
+# Leaf types; their size doesn't depend on anything they reference
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, complex, type(None))
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Estimate memory size of an object including the objects it references.
+    
+    Walks dicts, lists, tuples, sets and object attributes iteratively and
+    counts shared objects once, unlike ``sys.getsizeof`` which only measures
+    the outer container.
+    
+    Args:
+        obj: Object to measure
+        
+    Returns:
+        Size in bytes
+    """
+    getsizeof = sys.getsizeof
+    seen = set()
+    total = 0
+    stack = [obj]
+    
+    while stack:
+        current = stack.pop()
+        current_id = id(current)
+        if current_id in seen:
+            continue
+        seen.add(current_id)
+        
+        try:
+            total += getsizeof(current)
+        except TypeError:
+            continue
+        
+        if isinstance(current, _ATOMIC_TYPES):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, _SEQUENCE_TYPES):
+            stack.extend(current)
+        else:
+            attributes = getattr(current, '__dict__', None)
+            if attributes is not None:
+                stack.append(attributes)
+            for slot in getattr(type(current), '__slots__', ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    
+    return total
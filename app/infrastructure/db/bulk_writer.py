@@ -0,0 +1,197 @@
+import io
+import json
+import logging
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Table, insert
+from sqlalchemy.types import ARRAY, JSON
+from sqlmodel import Session
+
+from app.core.exceptions import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+
+class BulkInsertWriter:
+    """
+    Buffered bulk writer for a single table.
+
+    Rows are collected as plain dicts and written in batches instead of one ORM
+    object per row. On PostgreSQL with psycopg2 the batch is streamed through
+    ``COPY ... FROM STDIN``; on any other dialect it falls back to a multi-row
+    ``INSERT ... VALUES`` executemany. Writes run on the session's own connection,
+    so they share its transaction and become visible on ``session.commit()``.
+
+    Example:
+        writer = BulkInsertWriter(db, RawRecords.__table__, batch_size=5000)
+        for row in rows:
+            if writer.add(row):
+                db.commit()
+        writer.flush()
+        db.commit()
+    """
+
+    METHODS = ("auto", "copy", "insert")
+
+    def __init__(
+        self,
+        session: Session,
+        table: Table,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = 5000,
+        method: str = "auto",
+    ):
+        """
+        Initialize bulk writer
+
+        Args:
+            session: Database session whose connection/transaction is used
+            table: Target SQLAlchemy table (e.g. ``RawRecords.__table__``)
+            columns: Columns to write; defaults to every column of the table
+            batch_size: Number of buffered rows that triggers a flush
+            method: ``copy``, ``insert`` or ``auto`` (COPY when supported)
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unsupported bulk write method: {method}. Supported: {self.METHODS}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        self.session = session
+        self.table = table
+        self.columns: List[str] = list(columns) if columns else [c.name for c in table.columns]
+        self.batch_size = batch_size
+        self.method = method
+        self.rows_written = 0
+        self.batches_written = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._resolved_method: Optional[str] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rows not yet written"""
+        return len(self._buffer)
+
+    def add(self, row: Dict[str, Any]) -> bool:
+        """
+        Buffer a row, flushing when the batch is full
+
+        Args:
+            row: Mapping of column name to value
+
+        Returns:
+            True if the buffer was flushed by this call
+        """
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+            return True
+        return False
+
+    def flush(self) -> int:
+        """
+        Write all buffered rows
+
+        Returns:
+            Number of rows written
+        """
+        if not self._buffer:
+            return 0
+
+        rows, self._buffer = self._buffer, []
+        method = self._resolve_method()
+
+        try:
+            if method == "copy":
+                self._copy_rows(rows)
+            else:
+                self._insert_rows(rows)
+        except Exception as e:
+            logger.error(f"Bulk {method} into {self.table.fullname} failed: {e}")
+            raise DatabaseError(f"Bulk write to {self.table.fullname} failed: {e}")
+
+        self.rows_written += len(rows)
+        self.batches_written += 1
+        logger.debug(f"Bulk {method} wrote {len(rows)} rows into {self.table.fullname}")
+        return len(rows)
+
+    def _resolve_method(self) -> str:
+        """Pick COPY when the session is bound to PostgreSQL through psycopg2"""
+        if self._resolved_method:
+            return self._resolved_method
+
+        bind = self.session.get_bind()
+        supports_copy = bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2"
+
+        if self.method == "copy" and not supports_copy:
+            raise DatabaseError(
+                f"COPY requires postgresql+psycopg2, got {bind.dialect.name}+{bind.dialect.driver}"
+            )
+
+        if self.method == "auto":
+            self._resolved_method = "copy" if supports_copy else "insert"
+        else:
+            self._resolved_method = self.method
+        return self._resolved_method
+
+    def _insert_rows(self, rows: List[Dict[str, Any]]):
+        """Write rows with a multi-row INSERT executemany"""
+        params = [{column: row.get(column) for column in self.columns} for row in rows]
+        self.session.execute(insert(self.table), params)
+
+    def _copy_rows(self, rows: List[Dict[str, Any]]):
+        """Stream rows through COPY FROM STDIN in CSV format"""
+        buffer = io.StringIO()
+        column_types = [self.table.c[column].type for column in self.columns]
+
+        for row in rows:
+            buffer.write(",".join(
+                self._encode_copy_field(row.get(column), column_type)
+                for column, column_type in zip(self.columns, column_types)
+            ))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        quoted_columns = ", ".join(f'"{column}"' for column in self.columns)
+        target = f'"{self.table.schema}"."{self.table.name}"' if self.table.schema else f'"{self.table.name}"'
+        copy_sql = f"COPY {target} ({quoted_columns}) FROM STDIN WITH (FORMAT csv)"
+
+        dbapi_connection = self.session.connection().connection.dbapi_connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(copy_sql, buffer)
+
+    def _encode_copy_field(self, value: Any, column_type: Any) -> str:
+        """
+        Convert a Python value to a COPY CSV field
+
+        NULL is an unquoted empty field; every other value is quoted, so empty
+        strings survive as '' rather than turning into NULL.
+        """
+        if value is None:
+            return ""
+        if isinstance(column_type, ARRAY):
+            text = self._encode_array(value)
+        elif isinstance(column_type, JSON) or isinstance(value, (dict, list)):
+            text = json.dumps(value, default=str)
+        elif isinstance(value, bool):
+            text = "t" if value else "f"
+        elif isinstance(value, Enum):
+            text = str(value.value)
+        elif isinstance(value, (datetime, date)):
+            text = value.isoformat()
+        else:
+            text = str(value)
+        return '"' + text.replace('"', '""') + '"'
+
+    @staticmethod
+    def _encode_array(values: Sequence[Any]) -> str:
+        """Render a PostgreSQL array literal such as {"a","b"}"""
+        elements = []
+        for item in values:
+            if item is None:
+                elements.append("NULL")
+                continue
+            text = str(item).replace("\\", "\\\\").replace('"', '\\"')
+            elements.append(f'"{text}"')
+        return "{" + ",".join(elements) + "}"
@@ -0,0 +1,225 @@
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Column, desc, select, tuple_
+from sqlalchemy.orm.attributes import flag_modified
+from sqlmodel import Session
+
+from app.infrastructure.db.models.etl_control.job_executions import JobExecution
+
+logger = logging.getLogger(__name__)
+
+
+class KeysetPaginator:
+    """
+    Resumable keyset pagination over a select statement.
+
+    Rows are read in ``key_columns`` order with ``WHERE (k1, k2) > (:v1, :v2)``
+    instead of OFFSET, so every batch is an index range scan and each row is
+    returned exactly once even when earlier rows change status in between.
+    ``checkpoint`` holds the key of the last returned row and can be stored
+    (e.g. on ``JobExecution.checkpoint``) to resume after a crash.
+
+    A checkpoint is a position, not a record of what was processed: an
+    identity value such as ``ingest_seq`` is assigned at INSERT, not at
+    COMMIT, so a row inserted by a transaction that commits late can land
+    behind a stored checkpoint, exactly like a ``created_at`` timestamp.
+    Statements must therefore filter out processed rows themselves (e.g. a
+    marker set in the same transaction as the batch); checkpoints only save
+    rereading them, and a run without one picks up such late rows.
+
+    With ``skip_locked`` every batch is read ``FOR UPDATE SKIP LOCKED``: rows
+    claimed by another worker's open transaction are skipped, so concurrent
+    workers get disjoint batches as long as each batch is processed and
+    committed in one transaction. Skipped rows lie behind the cursor, so a
+    skip-locked paginator has no checkpoint; if the claiming worker dies its
+    rows are picked up by the next run.
+
+    Example:
+        paginator = KeysetPaginator(
+            db, select(RawRecords).where(...),
+            [RawRecords.ingest_seq],
+            batch_size=1000, checkpoint=saved_checkpoint
+        )
+        for batch in paginator:
+            ...
+            save_checkpoint(execution, "transform", paginator.checkpoint)
+            db.commit()
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        statement,
+        key_columns: Sequence[Any],
+        batch_size: int = 1000,
+        checkpoint: Optional[Dict[str, Any]] = None,
+        skip_locked: bool = False,
+    ):
+        """
+        Initialize paginator
+
+        Args:
+            session: Database session used to run the batches
+            statement: Select statement with filters (no ORDER BY/LIMIT)
+            key_columns: Columns forming a unique, indexed sort key
+            batch_size: Rows per batch
+            checkpoint: Checkpoint to resume after (from ``checkpoint``)
+            skip_locked: Claim rows with FOR UPDATE SKIP LOCKED (no
+                checkpoint is kept or resumed)
+        """
+        if not key_columns:
+            raise ValueError("key_columns must contain at least one column")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        self.session = session
+        self.statement = statement
+        self.key_columns = list(key_columns)
+        self.batch_size = batch_size
+        self.skip_locked = skip_locked
+        self.last_key: Optional[tuple] = None
+        if checkpoint and skip_locked:
+            logger.warning("Ignoring keyset checkpoint: skip_locked pagination is not resumable")
+        elif checkpoint:
+            self.last_key = self._decode_checkpoint(checkpoint)
+        self.batches_read = 0
+        self.rows_read = 0
+
+    @property
+    def checkpoint(self) -> Optional[Dict[str, Any]]:
+        """JSON-serializable key of the last returned row (None with skip_locked)"""
+        if self.last_key is None or self.skip_locked:
+            return None
+        return {
+            column.key: _encode_key_value(value)
+            for column, value in zip(self.key_columns, self.last_key)
+        }
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        while True:
+            batch = self.fetch_batch()
+            if not batch:
+                return
+            yield batch
+
+    def fetch_batch(self) -> List[Any]:
+        """
+        Read the next batch and advance the checkpoint
+
+        Returns:
+            Rows of the batch (empty when exhausted)
+        """
+        statement = self.statement
+        if self.last_key is not None:
+            statement = statement.where(tuple_(*self.key_columns) > tuple_(*self.last_key))
+        statement = statement.order_by(*self.key_columns).limit(self.batch_size)
+        if self.skip_locked:
+            statement = statement.with_for_update(skip_locked=True)
+
+        rows = self.session.exec(statement).all()
+        if rows:
+            self.last_key = tuple(_row_value(rows[-1], column) for column in self.key_columns)
+            self.batches_read += 1
+            self.rows_read += len(rows)
+        return rows
+
+    def _decode_checkpoint(self, checkpoint: Dict[str, Any]) -> Optional[tuple]:
+        if set(checkpoint) != {column.key for column in self.key_columns}:
+            # Saved for another key (e.g. the former created_at/id key)
+            logger.warning(f"Ignoring keyset checkpoint {checkpoint}: key columns changed")
+            return None
+        try:
+            return tuple(
+                _decode_key_value(checkpoint[column.key], column)
+                for column in self.key_columns
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid keyset checkpoint {checkpoint}: {e}")
+
+
+def load_checkpoint(
+    session: Session,
+    execution: JobExecution,
+    phase: str,
+    resume_previous: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    Checkpoint of a phase for an execution
+
+    With ``resume_previous`` falls back to the checkpoint of the job's most
+    recent earlier execution so a new run continues where the previous one
+    stopped. That skips rows committed behind that checkpoint by transactions
+    still open at the time, so it is off by default: the ETL phases mark the
+    rows they finish (``transformed_at``, ``loaded_at``) and filter on that
+    marker, so a new run only reads pending rows anyway.
+
+    Args:
+        session: Database session
+        execution: Current job execution
+        phase: Phase name (e.g. ``transform``, ``load``)
+        resume_previous: Whether to fall back to earlier executions of the job
+
+    Returns:
+        Stored checkpoint or None to start from the beginning
+    """
+    checkpoint = (execution.checkpoint or {}).get(phase)
+    if checkpoint or not resume_previous:
+        return checkpoint
+
+    previous_executions = session.exec(
+        select(JobExecution)
+        .where(
+            JobExecution.job_id == execution.job_id,
+            JobExecution.id != execution.id,
+            JobExecution.checkpoint.is_not(None),
+        )
+        .order_by(desc(JobExecution.created_at))
+        .limit(10)
+    ).all()
+    for previous in previous_executions:
+        checkpoint = (previous.checkpoint or {}).get(phase)
+        if checkpoint:
+            logger.info(f"Resuming {phase} from checkpoint of execution {previous.id}")
+            return checkpoint
+    return None
+
+
+def save_checkpoint(execution: JobExecution, phase: str, checkpoint: Optional[Dict[str, Any]]):
+    """Store a phase checkpoint on the execution (committed with the batch)"""
+    if checkpoint is None:
+        return
+    execution.checkpoint = {**(execution.checkpoint or {}), phase: checkpoint}
+    flag_modified(execution, "checkpoint")
+
+
+def _row_value(row: Any, column: Any) -> Any:
+    if hasattr(row, "_mapping"):
+        return row._mapping[column]
+    return getattr(row, column.key)
+
+
+def _encode_key_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _decode_key_value(value: Any, column: Column) -> Any:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if value is None or isinstance(value, python_type):
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return python_type(value)
@@ -34,6 +34,8 @@ class JobExecutionBase(BaseModel):
     execution_log: Optional[str] = Field(default=None)
     error_details: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))
     performance_metrics: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))
+    # Keyset pagination watermark per phase, e.g. {"transform": {"created_at": ..., "id": ...}}
+    checkpoint: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))
     # Phase 7: Parent job tracking for orchestration
     triggered_by_parent_job_id: Optional[UUID] = Field(default=None, index=True)
     parent_execution_id: Optional[UUID] = Field(default=None, index=True)
@@ -12,6 +12,7 @@ class EntityBase(BaseModel):
     """Base model untuk Entity dengan field-field umum"""
     entity_type: str = Field(max_length=100, index=True)
     entity_key: str = Field(max_length=255, index=True)
+    entity_hash: Optional[str] = Field(default=None, max_length=64, index=True)
     entity_data: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))
     source_files: Optional[List[int]] = Field(default=None, sa_column=Column(ARRAY(Integer)))
     confidence_score: Optional[Decimal] = Field(default=None, max_digits=3, decimal_places=2)
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 from sqlmodel import SQLModel, Field, Column, JSON, ARRAY, String, ForeignKey
 from uuid import UUID
+from sqlalchemy import BigInteger, Identity, func
 from app.core.enums import ValidationStatus
 
 from ..base import BaseModel
@@ -64,6 +65,23 @@ class RawRecords(BaseModel, table=True):
         max_length=50,
         description="Batch identifier for grouping related records"
     )
+
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": func.now(), "nullable": False},
+        description="Ingestion timestamp"
+    )
+
+    ingest_seq: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(), nullable=False, unique=True),
+        description="Insertion sequence, used as keyset pagination key"
+    )
+
+    transformed_at: Optional[datetime] = Field(
+        default=None,
+        description="When the transform phase standardized or rejected the record"
+    )
     
     class Config:
         json_schema_extra = {
@@ -4,7 +4,7 @@ from decimal import Decimal
 from uuid import UUID
 
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import ARRAY, String, text
+from sqlalchemy import ARRAY, BigInteger, Identity, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from app.infrastructure.db.models.base import BaseModel
 
@@ -29,6 +29,13 @@ class StandardizedData(StandardizedDataBase, table=True):
     )
     
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Insertion sequence, used as keyset pagination key
+    ingest_seq: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(), nullable=False, unique=True)
+    )
+    # Set by the load phase in the transaction that loads the record
+    loaded_at: Optional[datetime] = Field(default=None)
     
     class Config:
         json_schema_extra = {
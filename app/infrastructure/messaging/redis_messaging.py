@@ -4,8 +4,7 @@ Redis-based messaging implementation using Pub/Sub.
 
 import asyncio
 import logging
-import json
-from typing import Any, Optional, Dict, List, Callable, Set
+from typing import Any, Awaitable, Optional, Dict, List, Callable, Set
 from datetime import datetime
 
 import redis.asyncio as redis
@@ -19,11 +18,15 @@ from .base import (
     MessageFilter,
     MessageStatus,
 )
+from ...core.codecs import ValueCodec, create_codec
 from ...core.config import get_settings
 from ...core.exceptions import MessagingError
 
 logger = logging.getLogger(__name__)
 
+# Called without arguments when the subscriber connection fails or recovers
+ConnectionCallback = Callable[[], Awaitable[None]]
+
 
 class RedisMessaging(MessageInterface, MessageBrokerInterface):
     """
@@ -47,6 +50,9 @@ class RedisMessaging(MessageInterface, MessageBrokerInterface):
         max_connections: Optional[int] = None,
         message_ttl: int = 3600,  # 1 hour
         enable_persistence: bool = True,
+        codec: Optional[ValueCodec] = None,
+        on_connection_lost: Optional[ConnectionCallback] = None,
+        on_connection_restored: Optional[ConnectionCallback] = None,
     ):
         """
         Initialize Redis messaging.
@@ -60,17 +66,23 @@ class RedisMessaging(MessageInterface, MessageBrokerInterface):
             max_connections: Max connections in pool
             message_ttl: Message TTL in seconds
             enable_persistence: Whether to use Redis Streams for persistence
+            codec: Pub/Sub payload codec (default: from CACHE_CODEC settings)
+            on_connection_lost: Awaited when the consume loop loses the
+                subscriber connection; messages may be missed until restored
+            on_connection_restored: Awaited once every topic is subscribed
+                again after a connection loss
         """
         settings = get_settings()
         
         self.url = url or settings.redis_settings.url 
-        self.host = host or settings.redis_settings.localhost
+        self.host = host or settings.redis_settings.host
         self.port = port or settings.redis_settings.port
         self.password = password or settings.redis_settings.password
         self.db = db or settings.redis_settings.db
         self.max_connections = max_connections or 10
         self.message_ttl = message_ttl
         self.enable_persistence = enable_persistence
+        self.codec = codec or create_codec()
         
         # Connection pools
         self._publisher_pool: Optional[ConnectionPool] = None
@@ -84,6 +96,9 @@ class RedisMessaging(MessageInterface, MessageBrokerInterface):
         self._subscription_counter = 0
         self._is_consuming = False
         self._consume_task: Optional[asyncio.Task] = None
+        self._connection_lost = False
+        self._on_connection_lost = on_connection_lost
+        self._on_connection_restored = on_connection_restored
         
         # Stream names for persistence
         self._stream_prefix = "msg_stream:"
@@ -99,10 +114,11 @@ class RedisMessaging(MessageInterface, MessageBrokerInterface):
                     max_connections=self.max_connections,
                     decode_responses=True,
                 )
+                # Subscriber payloads are codec bytes
                 self._subscriber_pool = ConnectionPool.from_url(
                     self.url,
                     max_connections=self.max_connections,
-                    decode_responses=True,
+                    decode_responses=False,
                 )
             else:
                 self._publisher_pool = ConnectionPool(
@@ -119,7 +135,7 @@ class RedisMessaging(MessageInterface, MessageBrokerInterface):
                     password=self.password,
                     db=self.db,
                     max_connections=self.max_connections,
-                    decode_responses=True,
+                    decode_responses=False,
                 )
             
             # Create Redis clients
@@ -210,7 +226,7 @@ class RedisMessaging(MessageInterface, MessageBrokerInterface):
                 raise MessagingError("Publisher not connected")
             
             # Serialize message
-            message_data = json.dumps(message.to_dict(), default=str)
+            message_data = self.codec.encode(message.to_dict())
             
             # Publish to Pub/Sub
             await self._publisher.publish(message.topic, message_data)
@@ -310,6 +326,10 @@ class RedisMessaging(MessageInterface, MessageBrokerInterface):
         try:
             while self._is_consuming:
                 try:
+                    if self._connection_lost and not await self._resubscribe():
+                        await asyncio.sleep(1)
+                        continue
+                    
                     # Get message from pubsub
                     redis_message = await self._pubsub.get_message(
                         ignore_subscribe_messages=True,
@@ -323,20 +343,56 @@ class RedisMessaging(MessageInterface, MessageBrokerInterface):
                     continue
                 except Exception as e:
                     logger.error(f"Error consuming message: {e}")
+                    await self._mark_connection_lost()
                     await asyncio.sleep(1)
                     
         except asyncio.CancelledError:
             logger.info("Message consumption cancelled")
         except Exception as e:
             logger.error(f"Fatal error in message consumption: {e}")
+            await self._mark_connection_lost()
+    
+    async def _mark_connection_lost(self) -> None:
+        """Record a subscriber connection loss and notify the callback once."""
+        if self._connection_lost:
+            return
+        self._connection_lost = True
+        if self._on_connection_lost:
+            try:
+                await self._on_connection_lost()
+            except Exception as e:
+                logger.error(f"Error in connection lost callback: {e}")
+    
+    async def _resubscribe(self) -> bool:
+        """Subscribe to every topic again after a connection loss."""
+        topics = {subscription["topic"] for subscription in self._subscriptions.values()}
+        try:
+            if topics:
+                await self._pubsub.subscribe(*topics)
+            else:
+                await self._subscriber.ping()
+        except Exception as e:
+            logger.warning(f"Resubscribing to {sorted(topics)} failed: {e}")
+            return False
+        
+        self._connection_lost = False
+        logger.info(f"Resubscribed to {sorted(topics)}")
+        if self._on_connection_restored:
+            try:
+                await self._on_connection_restored()
+            except Exception as e:
+                logger.error(f"Error in connection restored callback: {e}")
+        return True
     
     async def _process_redis_message(self, redis_message: Dict[str, Any]) -> None:
         """Process message from Redis."""
         try:
-            # Parse message
-            message_data = json.loads(redis_message["data"])
+            # Parse message (any codec, or JSON from older publishers)
+            message_data = self.codec.decode(redis_message["data"])
             message = Message.from_dict(message_data)
             topic = redis_message["channel"]
+            if isinstance(topic, bytes):
+                topic = topic.decode("utf-8")
             
             # Find matching subscriptions
             matching_subscriptions = [
@@ -10,6 +10,7 @@ from fastapi.responses import JSONResponse
 from app.core.logging import setup_logging
 from app.core.config import get_settings
 from app.core.exceptions import AppException
+from app.core.executors import shutdown_executors
 from app.infrastructure.db.manager import database_manager
 from app.infrastructure.cache import redis_manager
 from app.infrastructure.cache import cache_manager
@@ -55,7 +56,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                     'default_ttl': 300,
                     'eviction_policy': 'lru'
                 },
-                recovery_interval=60
+                recovery_interval=60,
+                enable_near_cache=settings.near_cache_enabled,
+                near_cache_config={
+                    'max_size': settings.near_cache_max_size,
+                }
             )
             print("✅ Cache system initialized (Redis + Memory fallback)")
         except Exception as e:
@@ -143,6 +148,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             print(f"⚠️  Database disconnect error: {e}")
 
+        # Shutdown blocking I/O and CPU pools
+        shutdown_executors(wait=False)
+        print("✅ Executor pools shut down")
+
 def create_application() -> FastAPI:
     app = FastAPI(
         title=settings.APP_NAME,
@@ -0,0 +1,70 @@
+# ==============================================
+# app/processors/api_connection.py
+# ==============================================
+"""
+Shared HTTP connection pool for API sources.
+
+Every ``APIProcessor`` session is created on one tuned ``aiohttp.TCPConnector``
+per event loop, so keep-alive connections and cached DNS lookups survive across
+processor instances, previews and validation requests in a worker. aiohttp
+connectors are bound to their event loop: tasks that run ``asyncio.run`` get
+their own connector, which is closed when that loop shuts down.
+"""
+import asyncio
+import weakref
+from typing import Tuple
+
+import aiohttp
+
+# Connections kept open in total and per API host
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 16
+# Seconds an idle keep-alive connection is kept for reuse
+KEEPALIVE_TIMEOUT = 30
+# Seconds resolved host addresses are cached
+DNS_CACHE_TTL = 300
+
+_connectors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[aiohttp.TCPConnector, asyncio.Task]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """
+    Connector shared by all API sessions of the running event loop
+
+    Sessions using it must pass ``connector_owner=False`` so closing a session
+    leaves the pool open for the next one.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _connectors.get(loop)
+    if entry is not None and not entry[0].closed:
+        return entry[0]
+
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    # asyncio.run cancels pending tasks before closing the loop, which closes the pool
+    _connectors[loop] = (connector, loop.create_task(_close_on_shutdown(connector)))
+    return connector
+
+
+async def close_shared_connector():
+    """Close the running loop's shared connector (e.g. on worker shutdown)"""
+    entry = _connectors.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        connector, closer = entry
+        closer.cancel()
+        await connector.close()
+
+
+async def _close_on_shutdown(connector: aiohttp.TCPConnector):
+    """Hold the connector open until the loop cancels this task"""
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await connector.close()
@@ -0,0 +1,140 @@
+# ==============================================
+# app/processors/api_pagination.py
+# ==============================================
+"""
+Concurrent pagination for REST sources.
+
+Offset and page pagination allow random access, so page ``k + 1`` does not
+have to wait for page ``k``: ``prefetch_pages`` keeps a bounded window of page
+requests in flight and yields the pages strictly in order. Cursor pagination
+can't be fetched ahead, but ``pipeline_cursor_pages`` starts the request for
+the next page as soon as its cursor is known, so parsing and consuming page
+``k`` overlaps with fetching page ``k + 1``.
+
+All requests draw from one ``TokenBucket``, so the configured rate limit holds
+for the whole window rather than per request.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Optional, Tuple
+
+DEFAULT_PREFETCH_PAGES = 4
+
+
+class TokenBucket:
+    """
+    Async token bucket rate limiter shared by concurrent requests.
+
+    Tokens refill continuously at ``rate_per_minute``; a full bucket allows a
+    burst of ``capacity`` requests.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket
+
+        Args:
+            rate_per_minute: Sustained requests per minute
+            capacity: Burst size (defaults to ``rate_per_minute``)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        # The lock queues waiters so tokens are handed out first come, first served
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+
+async def prefetch_pages(
+    fetch_page: Callable[[int], Awaitable[Tuple[Any, bool]]],
+    window: int = DEFAULT_PREFETCH_PAGES
+) -> AsyncIterator[Any]:
+    """
+    Fetch random-access pages concurrently and yield them in order
+
+    Args:
+        fetch_page: Coroutine function fetching page ``index`` (0-based) and
+            returning ``(records, has_more)``
+        window: Maximum number of page requests in flight
+
+    Yields:
+        Records of each page in page order, up to and including the first
+        page that is empty or reports no more pages
+    """
+    window = max(int(window), 1)
+    in_flight: Deque[asyncio.Task] = deque()
+    next_index = 0
+
+    try:
+        while True:
+            while len(in_flight) < window:
+                in_flight.append(asyncio.ensure_future(fetch_page(next_index)))
+                next_index += 1
+            # Let new requests go out before the caller consumes the page
+            await asyncio.sleep(0)
+
+            records, has_more = await in_flight.popleft()
+            if records:
+                yield records
+            if not records or not has_more:
+                break
+    finally:
+        # Pages past the end (or after a failure) are not needed
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def pipeline_cursor_pages(
+    fetch_page: Callable[[Optional[Any]], Awaitable[Any]],
+    next_cursor: Callable[[Any], Optional[Any]],
+    parse_page: Callable[[Any], Any]
+) -> AsyncIterator[Any]:
+    """
+    Fetch cursor pages, overlapping each page's processing with the next fetch
+
+    Args:
+        fetch_page: Coroutine function fetching the raw page for a cursor
+            (None for the first page)
+        next_cursor: Cursor of the page after a raw page, None at the end
+        parse_page: Converts a raw page into records
+
+    Yields:
+        Records of each page in page order
+    """
+    pending = asyncio.ensure_future(fetch_page(None))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+
+            cursor = next_cursor(page)
+            if cursor is not None:
+                pending = asyncio.ensure_future(fetch_page(cursor))
+                await asyncio.sleep(0)
+
+            records = parse_page(page)
+            if records:
+                yield records
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
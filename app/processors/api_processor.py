@@ -3,9 +3,9 @@
 # ==============================================
 import asyncio
 import aiohttp
+import ijson
 import json
-import time
-from typing import Dict, List, Any, Optional, Tuple, Iterator, Union
+from typing import Dict, List, Any, Optional, Tuple, Iterator, AsyncIterator, Union
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
 import base64
@@ -13,12 +13,23 @@ from dataclasses import dataclass
 import xml.etree.ElementTree as ET
 
 from .base_processor import BaseProcessor
+from .api_connection import get_shared_connector
+from .api_pagination import DEFAULT_PREFETCH_PAGES, TokenBucket, pipeline_cursor_pages, prefetch_pages
+from .column_profiler import profile_values
+from .record_flattener import DEFAULT_MAX_DEPTH, RecordFlattener
 from app.core.exceptions import FileProcessingException
 from app.infrastructure.db.models.raw_data.file_registry import FileRegistry
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Response fields checked (in order) for the record array when no data_path is set
+RECORD_KEYS = ('data', 'results', 'items', 'records', 'response', 'content')
+# Response fields holding the total number of records
+TOTAL_KEYS = ('total', 'total_count', 'count', 'total_records')
+# Leading bytes of a streamed body searched for the record array
+STREAM_PEEK_BYTES = 64 * 1024
+
 @dataclass
 class APIConfig:
     """Configuration for API data source"""
@@ -31,6 +42,8 @@ class APIConfig:
     pagination_type: str = None  # 'offset', 'cursor', 'page', 'link_header'
     pagination_params: Dict[str, Any] = None
     rate_limit: int = 100  # requests per minute
+    rate_limit_burst: Optional[int] = None  # requests allowed at once (default rate_limit)
+    prefetch_pages: int = DEFAULT_PREFETCH_PAGES  # offset/page requests in flight
     timeout: int = 30
     retry_attempts: int = 3
     retry_delay: int = 1
@@ -50,20 +63,30 @@ class APIProcessor(BaseProcessor):
             batch_id: Optional batch ID
             **kwargs: Additional configuration options including API config
         """
-        super().__init__(db_session, batch_id)
+        super().__init__(db_session, batch_id, **kwargs)
         
         # API-specific configuration
         self.api_config = self._parse_api_config(kwargs)
         self.session = None
         self.requests_made = 0
-        self.rate_limit_window_start = time.time()
+        self.rate_limiter = (
+            TokenBucket(self.api_config.rate_limit, self.api_config.rate_limit_burst)
+            if self.api_config.rate_limit else None
+        )
         self.chunk_size = kwargs.get('chunk_size', 1000)
         
         # Response processing configuration
         self.response_format = kwargs.get('response_format', 'json')  # 'json', 'xml'
         self.data_path = kwargs.get('data_path', None)  # JSONPath or XPath for data extraction
         self.flatten_response = kwargs.get('flatten_response', True)
+        self.flattener = RecordFlattener(
+            self._response_list_value, max_depth=kwargs.get('max_depth', DEFAULT_MAX_DEPTH)
+        )
         self.include_metadata = kwargs.get('include_metadata', True)
+        # Parse JSON bodies incrementally and yield records while they arrive
+        self.stream_response = kwargs.get('stream_response', False)
+        # Top-level fields of the last sample response (reused for total estimates)
+        self.sample_metadata = None
         
     def _parse_api_config(self, kwargs: Dict[str, Any]) -> APIConfig:
         """Parse API configuration from kwargs"""
@@ -77,6 +100,8 @@ class APIProcessor(BaseProcessor):
             pagination_type=kwargs.get('pagination_type'),
             pagination_params=kwargs.get('pagination_params', {}),
             rate_limit=kwargs.get('rate_limit', 100),
+            rate_limit_burst=kwargs.get('rate_limit_burst'),
+            prefetch_pages=kwargs.get('prefetch_pages', DEFAULT_PREFETCH_PAGES),
             timeout=kwargs.get('timeout', 30),
             retry_attempts=kwargs.get('retry_attempts', 3),
             retry_delay=kwargs.get('retry_delay', 1)
@@ -330,6 +355,10 @@ class APIProcessor(BaseProcessor):
                 # Extract records from response
                 records = self._extract_records_from_response(data)
                 self.requests_made += 1
+                if isinstance(data, dict):
+                    self.sample_metadata = {
+                        key: value for key, value in data.items() if not isinstance(value, (list, dict))
+                    }
                 
                 return records
                 
@@ -345,46 +374,28 @@ class APIProcessor(BaseProcessor):
             url = urljoin(self.api_config.base_url, self.api_config.endpoint)
             headers = await self._get_auth_headers()
             
-            # Initialize pagination
-            if self.api_config.pagination_type == 'offset':
-                offset = 0
-                limit = self.chunk_size
-                has_more = True
-                
-                while has_more:
-                    params = {'limit': limit, 'offset': offset}
-                    records, has_more = await self._fetch_page(url, headers, params)
-                    
-                    for record in records:
-                        yield record
-                    
-                    offset += limit
-                    
-            elif self.api_config.pagination_type == 'page':
-                page = 1
-                per_page = self.chunk_size
-                has_more = True
+            if self._can_stream():
+                # Records are parsed and yielded while each response body arrives
+                async for record in self._stream_all_pages(url, headers):
+                    yield record
+            
+            # Offset and page pagination allow random access: keep a window of requests in flight
+            elif self.api_config.pagination_type in ('offset', 'page'):
+                async def fetch_indexed_page(index: int):
+                    return await self._fetch_page(url, headers, self._page_params(index))
                 
-                while has_more:
-                    params = {'page': page, 'per_page': per_page}
-                    records, has_more = await self._fetch_page(url, headers, params)
-                    
+                async for records in prefetch_pages(fetch_indexed_page, self.api_config.prefetch_pages):
                     for record in records:
                         yield record
                     
-                    page += 1
-                    
             elif self.api_config.pagination_type == 'cursor':
-                cursor = None
-                has_more = True
+                # Each cursor comes from the previous page: overlap its processing with the next fetch
+                async def fetch_cursor_page(cursor):
+                    return await self._request_page(url, headers, self._cursor_params(cursor))
                 
-                while has_more:
-                    params = {'limit': self.chunk_size}
-                    if cursor:
-                        params['cursor'] = cursor
-                    
-                    records, has_more, cursor = await self._fetch_cursor_page(url, headers, params)
-                    
+                async for records in pipeline_cursor_pages(
+                    fetch_cursor_page, self._next_cursor, self._extract_records_from_response
+                ):
                     for record in records:
                         yield record
                         
@@ -402,38 +413,81 @@ class APIProcessor(BaseProcessor):
     
     async def _fetch_page(self, url: str, headers: Dict[str, str], params: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
         """Fetch a single page of data"""
-        await self._enforce_rate_limit()
+        data = await self._request_page(url, headers, params)
+        if data is None:
+            return [], False
+        
+        records = self._extract_records_from_response(data)
+        
+        # Determine if there are more pages
+        has_more = self._has_more_pages(data, records)
+        
+        return records, has_more
+    
+    async def _request_page(self, url: str, headers: Dict[str, str], params: Dict[str, Any]) -> Any:
+        """Request a single page and return the parsed response body (None when rate limited throughout)"""
+        response = await self._open_response(url, headers, params)
+        if response is None:
+            return None
+        
+        async with response:
+            # Parse response
+            if self.response_format == 'json':
+                return await response.json()
+            elif self.response_format == 'xml':
+                text = await response.text()
+                return self._parse_xml_response(text)
+        return None
+    
+    async def _open_response(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        params: Dict[str, Any],
+        stream: bool = False
+    ) -> Optional[aiohttp.ClientResponse]:
+        """
+        Send a request with rate limiting and retries
+        
+        Args:
+            url: Request URL
+            headers: Request headers
+            params: Query parameters
+            stream: The body is read incrementally, so only idle reads time out
+            
+        Returns:
+            Successful response with unread body (caller releases it), or None
+            when the API kept answering 429
+        """
+        if stream:
+            timeout = aiohttp.ClientTimeout(
+                total=None, sock_connect=self.api_config.timeout, sock_read=self.api_config.timeout
+            )
+        else:
+            timeout = aiohttp.ClientTimeout(total=self.api_config.timeout)
         
         for attempt in range(self.api_config.retry_attempts):
             try:
-                async with self.session.request(
+                # Every attempt, retries included, takes a token from the shared bucket
+                await self._enforce_rate_limit()
+                
+                response = await self.session.request(
                     method=self.api_config.method,
                     url=url,
                     headers=headers,
                     params=params,
-                    timeout=aiohttp.ClientTimeout(total=self.api_config.timeout)
-                ) as response:
-                    
-                    if response.status >= 400:
-                        if response.status == 429:  # Rate limited
-                            await asyncio.sleep(self.api_config.retry_delay * (attempt + 1))
-                            continue
-                        raise FileProcessingException(f"API request failed: {response.status}")
-                    
-                    # Parse response
-                    if self.response_format == 'json':
-                        data = await response.json()
-                    elif self.response_format == 'xml':
-                        text = await response.text()
-                        data = self._parse_xml_response(text)
-                    
-                    records = self._extract_records_from_response(data)
-                    self.requests_made += 1
-                    
-                    # Determine if there are more pages
-                    has_more = self._has_more_pages(data, records)
-                    
-                    return records, has_more
+                    timeout=timeout
+                )
+                
+                if response.status >= 400:
+                    response.release()
+                    if response.status == 429:  # Rate limited
+                        await asyncio.sleep(self.api_config.retry_delay * (attempt + 1))
+                        continue
+                    raise FileProcessingException(f"API request failed: {response.status}")
+                
+                self.requests_made += 1
+                return response
                     
             except asyncio.TimeoutError:
                 if attempt == self.api_config.retry_attempts - 1:
@@ -444,23 +498,224 @@ class APIProcessor(BaseProcessor):
                     raise
                 await asyncio.sleep(self.api_config.retry_delay * (attempt + 1))
         
-        return [], False
+        return None
+    
+    def _can_stream(self) -> bool:
+        """Whether responses are parsed incrementally (JSON, data_path without list indexes)"""
+        return (
+            self.stream_response
+            and self.response_format == 'json'
+            and not any(key.isdigit() for key in (self.data_path or '').split('.'))
+        )
+    
+    async def _stream_all_pages(self, url: str, headers: Dict[str, str]) -> AsyncIterator[Dict[str, Any]]:
+        """Stream records page after page (each page is consumed while it arrives, so none is prefetched)"""
+        pagination_type = self.api_config.pagination_type
+        index = 0
+        cursor = None
+        
+        while True:
+            if pagination_type in ('offset', 'page'):
+                params = self._page_params(index)
+            elif pagination_type == 'cursor':
+                params = self._cursor_params(cursor)
+            else:
+                params = self.api_config.pagination_params or {}
+            
+            paginated = pagination_type in ('offset', 'page', 'cursor')
+            page: Dict[str, Any] = {}
+            async for record in self._stream_page(url, headers, params, page, collect_metadata=paginated):
+                yield record
+            
+            if not paginated:
+                return
+            if not self._has_more_records(page['metadata'], page['count']):
+                return
+            if pagination_type == 'cursor':
+                cursor = self._record_cursor(page['last_record'])
+                if cursor is None:
+                    return
+            index += 1
     
-    async def _fetch_cursor_page(self, url: str, headers: Dict[str, str], params: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool, Optional[str]]:
-        """Fetch a single page using cursor pagination"""
-        records, has_more = await self._fetch_page(url, headers, params)
+    async def _stream_page(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        params: Dict[str, Any],
+        page: Dict[str, Any],
+        collect_metadata: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the records of one JSON response while its body arrives
         
-        # Extract next cursor from last record or response metadata
-        next_cursor = None
-        if records and has_more:
-            # This would need to be customized based on API structure
-            last_record = records[-1]
-            next_cursor = last_record.get('id') or last_record.get('cursor')
+        Memory is bounded by one record plus the response fields outside the
+        record array, however large the page. ``page`` receives those fields
+        (``metadata``, only with ``collect_metadata``), the record ``count``
+        and the ``last_record`` as sent by the API, for the pagination decision.
+        """
+        page.update(metadata=None, count=0, last_record=None)
+        response = await self._open_response(url, headers, params, stream=True)
+        if response is None:
+            return
+        
+        async with response:
+            async for record in self._iter_json_records(response.content, page, collect_metadata):
+                yield self._process_record(record)
+    
+    async def _iter_json_records(
+        self,
+        stream,
+        page: Dict[str, Any],
+        collect_metadata: bool = True
+    ) -> AsyncIterator[Any]:
+        """
+        Incrementally parse a JSON body into records
+        
+        The record array is the ``data_path`` array or, without one, a
+        top-level array or the array field that comes first in
+        ``RECORD_KEYS`` order. A body without record array (or whose record
+        array field is empty) is a single record, as in
+        ``_locate_records``.
+        
+        A record array field is streamed once every higher-priority key has
+        been seen. One that comes earlier is kept with the other fields until
+        a better one turns up or the body ends.
+        """
+        items_prefix = f"{self.data_path}.item" if self.data_path else None
+        if items_prefix is None:
+            # Look for the record array in the first bytes, then replay them to the parser
+            head = b''
+            while len(head) < STREAM_PEEK_BYTES:
+                chunk = await stream.read(STREAM_PEEK_BYTES - len(head))
+                if not chunk:
+                    break
+                head += chunk
+            items_prefix = _find_records_prefix(head)
+            stream = _ReplayStream(head, stream)
+        
+        if items_prefix is not None and not collect_metadata:
+            # Records are built by ijson's C backend; the surrounding fields are not needed
+            async for record in ijson.items_async(stream, items_prefix, use_float=True):
+                page['count'] += 1
+                page['last_record'] = record
+                yield record
+            return
+        
+        # Everything outside the record array
+        metadata = ijson.ObjectBuilder()
+        builder = None
+        end_event = None
+        # Without a known record array: top-level keys seen so far and the
+        # best record array field kept in the metadata, as (rank, key)
+        decided = items_prefix is not None
+        seen_keys = set()
+        best = None
+        
+        async for prefix, event, value in ijson.parse_async(stream, use_float=True):
+            if builder is not None:
+                if prefix == items_prefix and event == end_event:
+                    record = builder.value
+                    builder = None
+                    page['count'] += 1
+                    page['last_record'] = record
+                    yield record
+                else:
+                    builder.event(event, value)
+                continue
+            
+            if not decided:
+                if prefix == '' and event == 'map_key':
+                    seen_keys.add(value)
+                elif event == 'start_array' and prefix == '':
+                    items_prefix = 'item'
+                    decided = True
+                elif event in ('start_array', 'end_array') and prefix in RECORD_KEYS:
+                    rank = RECORD_KEYS.index(prefix)
+                    if best is None or rank < best[0]:
+                        if event == 'end_array':
+                            best = (rank, prefix)
+                        elif seen_keys.issuperset(RECORD_KEYS[:rank]):
+                            items_prefix = f"{prefix}.item"
+                            decided = True
+                            best = None
+            elif prefix == items_prefix:
+                if event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    end_event = event.replace('start', 'end')
+                else:
+                    page['count'] += 1
+                    page['last_record'] = value
+                    yield value
+                continue
+            
+            metadata.event(event, value)
+        
+        page['metadata'] = getattr(metadata, 'value', None)
+        if best is not None:
+            for record in page['metadata'][best[1]]:
+                page['count'] += 1
+                page['last_record'] = record
+                yield record
+        if not self.data_path and items_prefix != 'item' and page['count'] == 0 and hasattr(metadata, 'value'):
+            # No record array or an empty one: the whole body is one record
+            page['count'] += 1
+            page['last_record'] = metadata.value
+            yield metadata.value
+    
+    def _page_params(self, index: int) -> Dict[str, Any]:
+        """Query parameters of the 0-based page ``index`` for offset/page pagination"""
+        if self.api_config.pagination_type == 'offset':
+            return {'limit': self.chunk_size, 'offset': index * self.chunk_size}
+        return {'page': index + 1, 'per_page': self.chunk_size}
+    
+    def _cursor_params(self, cursor: Optional[Any]) -> Dict[str, Any]:
+        """Query parameters of the cursor page after ``cursor`` (None for the first page)"""
+        params = {'limit': self.chunk_size}
+        if cursor is not None:
+            params['cursor'] = cursor
+        return params
+    
+    def _next_cursor(self, data: Any) -> Optional[Any]:
+        """Cursor of the page after a raw cursor page, None when it was the last one"""
+        if data is None:
+            return None
+        
+        records = self._locate_records(data)
+        if not records or not self._has_more_pages(data, records):
+            return None
         
-        return records, has_more, next_cursor
+        return self._record_cursor(records[-1])
+    
+    def _record_cursor(self, record: Any) -> Optional[Any]:
+        """Cursor taken from the last record of a page"""
+        # This would need to be customized based on API structure
+        if not isinstance(record, dict):
+            return None
+        return record.get('id') or record.get('cursor')
     
     def _extract_records_from_response(self, data: Any) -> List[Dict[str, Any]]:
         """Extract records from API response"""
+        if data is None:
+            return []
+        records = self._locate_records(data)
+        
+        return [self._process_record(record) for record in records]
+    
+    def _process_record(self, record: Any) -> Any:
+        """Flatten a record and add API metadata as configured"""
+        if self.flatten_response and isinstance(record, dict):
+            record = self._flatten_response_data(record)
+        
+        # Add API metadata if requested
+        if self.include_metadata:
+            record['_api_source'] = urljoin(self.api_config.base_url, self.api_config.endpoint)
+            record['_fetch_timestamp'] = datetime.utcnow().isoformat()
+        
+        return record
+    
+    def _locate_records(self, data: Any) -> List[Any]:
+        """Find the list of raw records in an API response"""
         if self.data_path:
             # Use data path to extract records
             records = self._extract_by_path(data, self.data_path)
@@ -470,10 +725,9 @@ class APIProcessor(BaseProcessor):
                 records = data
             elif isinstance(data, dict):
                 # Look for common array field names
-                possible_keys = ['data', 'results', 'items', 'records', 'response', 'content']
                 records = []
                 
-                for key in possible_keys:
+                for key in RECORD_KEYS:
                     if key in data and isinstance(data[key], list):
                         records = data[key]
                         break
@@ -484,24 +738,15 @@ class APIProcessor(BaseProcessor):
             else:
                 records = [data]
         
-        # Process each record
-        processed_records = []
-        for record in records:
-            if self.flatten_response and isinstance(record, dict):
-                record = self._flatten_response_data(record)
-            
-            # Add API metadata if requested
-            if self.include_metadata:
-                record['_api_source'] = urljoin(self.api_config.base_url, self.api_config.endpoint)
-                record['_fetch_timestamp'] = datetime.utcnow().isoformat()
-            
-            processed_records.append(record)
-        
-        return processed_records
+        return records
     
     def _has_more_pages(self, response_data: Any, records: List[Dict[str, Any]]) -> bool:
         """Determine if there are more pages available"""
-        if not records:
+        return self._has_more_records(response_data, len(records))
+    
+    def _has_more_records(self, response_data: Any, record_count: int) -> bool:
+        """Determine if there are more pages after a page of ``record_count`` records"""
+        if not record_count:
             return False
         
         # Check common pagination indicators
@@ -517,27 +762,19 @@ class APIProcessor(BaseProcessor):
                         return value is not None
             
             # Check if we got a full page
-            if len(records) == self.chunk_size:
+            if record_count == self.chunk_size:
                 return True
         
         return False
     
-    def _flatten_response_data(self, data: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
+    def _flatten_response_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Flatten nested response data"""
-        items = []
-        
-        for k, v in data.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            
-            if isinstance(v, dict) and len(str(v)) < 1000:
-                items.extend(self._flatten_response_data(v, new_key, sep=sep).items())
-            elif isinstance(v, list):
-                # Convert arrays to JSON strings for now
-                items.append((new_key, json.dumps(v) if v else None))
-            else:
-                items.append((new_key, v))
-        
-        return dict(items)
+        return self.flattener.flatten(data)
+    
+    @staticmethod
+    def _response_list_value(values: List[Any]) -> Optional[str]:
+        """Convert arrays to JSON strings for now"""
+        return json.dumps(values) if values else None
     
     def _parse_xml_response(self, xml_text: str) -> Dict[str, Any]:
         """Parse XML response to dictionary"""
@@ -597,49 +834,27 @@ class APIProcessor(BaseProcessor):
         if not sample_data:
             return []
         
-        # Use the same schema analysis as JSON processor
-        from collections import defaultdict
-        
-        schema = defaultdict(lambda: {
-            'sample_values': [],
-            'unique_values': set(),
-            'null_count': 0,
-            'total_count': 0
-        })
+        values = {}
+        null_counts = {}
         
         for record in sample_data:
             for field_name, value in record.items():
+                field_values = values.setdefault(field_name, [])
                 if value is None:
-                    schema[field_name]['null_count'] += 1
+                    null_counts[field_name] = null_counts.get(field_name, 0) + 1
                 else:
-                    schema[field_name]['sample_values'].append(value)
-                    schema[field_name]['unique_values'].add(value)
-                
-                schema[field_name]['total_count'] += 1
-        
-        # Convert to column info format
-        columns_info = []
-        for position, (field_name, field_info) in enumerate(schema.items()):
-            sample_values = list(field_info['sample_values'])[:10]
-            
-            column_info = {
-                "name": field_name,
-                "position": position,
-                "data_type": self._detect_data_type(sample_values),
-                "sample_values": [str(v) for v in sample_values],
-                "null_count": field_info['null_count'],
-                "unique_count": len(field_info['unique_values']),
-                "total_count": field_info['total_count'],
-                "null_percentage": round((field_info['null_count'] / field_info['total_count']) * 100, 2)
-            }
-            
-            columns_info.append(column_info)
+                    field_values.append(value)
         
-        return columns_info
+        return profile_values(values, null_counts=null_counts)
     
     async def _estimate_total_records(self) -> Optional[int]:
         """Estimate total number of records available from API"""
         try:
+            # The sample request usually already carried the total
+            for key in TOTAL_KEYS:
+                if self.sample_metadata and self.sample_metadata.get(key) is not None:
+                    return int(self.sample_metadata[key])
+            
             # Make a request to get metadata about total records
             await self._ensure_session()
             
@@ -647,14 +862,20 @@ class APIProcessor(BaseProcessor):
             headers = await self._get_auth_headers()
             
             params = {'limit': 1}  # Minimal request
+            await self._enforce_rate_limit()
             
-            async with self.session.get(url, headers=headers, params=params) as response:
+            async with self.session.get(
+                url,
+                headers=headers,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=self.api_config.timeout)
+            ) as response:
                 if response.status == 200:
                     data = await response.json()
+                    self.requests_made += 1
                     
                     # Look for total count indicators
-                    total_keys = ['total', 'total_count', 'count', 'total_records']
-                    for key in total_keys:
+                    for key in TOTAL_KEYS:
                         if key in data:
                             return int(data[key])
                 
@@ -690,7 +911,8 @@ class APIProcessor(BaseProcessor):
     async def _ensure_session(self):
         """Ensure aiohttp session is available"""
         if self.session is None:
-            self.session = aiohttp.ClientSession()
+            # Pooled connections are shared with every other API session of this event loop
+            self.session = aiohttp.ClientSession(connector=get_shared_connector(), connector_owner=False)
     
     async def _close_session(self):
         """Close aiohttp session"""
@@ -699,21 +921,9 @@ class APIProcessor(BaseProcessor):
             self.session = None
     
     async def _enforce_rate_limit(self):
-        """Enforce rate limiting"""
-        current_time = time.time()
-        
-        # Reset counter if window has passed
-        if current_time - self.rate_limit_window_start >= 60:
-            self.requests_made = 0
-            self.rate_limit_window_start = current_time
-        
-        # Wait if rate limit exceeded
-        if self.requests_made >= self.api_config.rate_limit:
-            sleep_time = 60 - (current_time - self.rate_limit_window_start)
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-                self.requests_made = 0
-                self.rate_limit_window_start = time.time()
+        """Enforce rate limiting (token bucket shared by all in-flight requests)"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
     
     async def _custom_record_validation(self, record: Dict[str, Any], row_number: int) -> Dict[str, Any]:
         """API-specific record validation"""
@@ -740,4 +950,55 @@ class APIProcessor(BaseProcessor):
             validation_result["is_valid"] = False
             validation_result["errors"].append(f"Validation error: {str(e)}")
         
-        return validation_result
\ No newline at end of file
+        return validation_result
+
+
+def _find_records_prefix(head: bytes) -> Optional[str]:
+    """
+    ijson prefix of the record array if the leading bytes of a body decide it
+    
+    That is a top-level array, or the ``RECORD_KEYS`` array field that
+    ``_locate_records`` picks once every higher-priority key has been seen
+    (or the body ended). An empty one is left to the full parse, which
+    returns the whole body as one record.
+    """
+    seen_keys = set()
+    best = None
+    empty = None
+    try:
+        for prefix, event, value in ijson.parse(head):
+            if best is not None and empty is None:
+                empty = event == 'end_array' and prefix == RECORD_KEYS[best]
+            
+            if prefix == '' and event == 'map_key':
+                seen_keys.add(value)
+            elif event == 'start_array' and prefix == '':
+                return 'item'
+            elif event == 'start_array' and prefix in RECORD_KEYS:
+                rank = RECORD_KEYS.index(prefix)
+                if best is None or rank < best:
+                    best, empty = rank, None
+            
+            if empty is not None and seen_keys.issuperset(RECORD_KEYS[:best]):
+                return None if empty else f"{RECORD_KEYS[best]}.item"
+    except ijson.JSONError:
+        # Truncated head (or a body that is not valid JSON, reported by the real parse)
+        return None
+    return None if best is None or empty else f"{RECORD_KEYS[best]}.item"
+
+
+class _ReplayStream:
+    """Async byte stream returning already-read leading bytes before the rest of a response"""
+    
+    def __init__(self, head: bytes, stream):
+        self._head = head
+        self._stream = stream
+    
+    async def read(self, size: int = -1) -> bytes:
+        if self._head:
+            if size < 0:
+                data, self._head = self._head, b''
+                return data + await self._stream.read()
+            data, self._head = self._head[:size], self._head[size:]
+            return data
+        return await self._stream.read(size)
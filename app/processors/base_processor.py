@@ -2,34 +2,56 @@
 # app/processors/base_processor.py
 # ==============================================
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple, Iterator
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple, Iterator, AsyncIterator, Union
 from datetime import datetime
+from itertools import groupby
 import hashlib
-import json
+from uuid import uuid4
+import numpy as np
+import pandas as pd
 from sqlmodel import Session
 from pathlib import Path
 
 from app.utils.logger import get_logger
-from app.core.exceptions import FileProcessingException
+from app.utils.record_fingerprint import get_fingerprinter
+from app.core.exceptions import FileProcessingException, DatabaseError
 from app.infrastructure.db.models.raw_data.file_registry import FileRegistry
 from app.infrastructure.db.models.raw_data.raw_records import RawRecords
 from app.infrastructure.db.models.raw_data.column_structure import ColumnStructure
+from app.infrastructure.db.bulk_writer import BulkInsertWriter
+from .column_profiler import infer_data_type, is_date_like
 
 logger = get_logger(__name__)
 
+
+class FingerprintedRecord(NamedTuple):
+    """A record with its data_hash, computed by a chunk reader"""
+    record: Dict[str, Any]
+    data_hash: str
+
+
 class BaseProcessor(ABC):
     """
     Abstract base class for all file processors.
     Defines common interface and shared functionality for processing different file types.
     """
     
-    def __init__(self, db_session: Session, batch_id: Optional[str] = None):
+    def __init__(self, db_session: Session, batch_id: Optional[str] = None, **kwargs):
         """
         Initialize base processor
         
         Args:
             db_session: Database session for data operations
             batch_id: Optional batch ID for grouping processed records
+            **kwargs: Shared configuration options
+                bulk_insert: Write raw records through the bulk writer (default True)
+                bulk_method: Bulk write method: auto, copy or insert (default auto)
+                write_batch_size: Rows per flush/commit (default 5000)
+                hash_algorithm: Record fingerprint algorithm for data_hash
+                    (default ``legacy``, the original SHA-256 hashes; run
+                    ``manage.py rehash-records`` before switching)
+                max_error_samples: Validation error messages kept in the
+                    processing statistics; all are counted (default 1000)
         """
         self.db = db_session
         self.batch_id = batch_id or self._generate_batch_id()
@@ -38,6 +60,15 @@ class BaseProcessor(ABC):
         self.failed_records = 0
         self.validation_errors = []
         
+        # Raw record write configuration
+        self.bulk_insert = kwargs.get('bulk_insert', True)
+        self.bulk_method = kwargs.get('bulk_method', 'auto')
+        self.write_batch_size = kwargs.get('write_batch_size', 5000)
+        self.max_error_samples = kwargs.get('max_error_samples', 1000)
+        
+        # Record fingerprints stored in data_hash
+        self.fingerprinter = get_fingerprinter(kwargs.get('hash_algorithm'))
+        
     def _generate_batch_id(self) -> str:
         """Generate unique batch ID"""
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -97,13 +128,20 @@ class BaseProcessor(ABC):
         """
         pass
     
-    async def process_records(self, records: Iterator[Dict[str, Any]], file_registry: FileRegistry) -> Dict[str, Any]:
+    async def process_records(
+        self,
+        records: Union[Iterator[Dict[str, Any]], AsyncIterator[Dict[str, Any]]],
+        file_registry: FileRegistry,
+        first_row_number: int = 1
+    ) -> Dict[str, Any]:
         """
         Process individual records and store in database
         
         Args:
-            records: Iterator of record dictionaries
+            records: Iterator or async iterator (e.g. API pages) of record dictionaries,
+                or of ``FingerprintedRecord`` from readers that hash whole chunks
             file_registry: File registry record
+            first_row_number: Row number of the first record (for file partitions)
             
         Returns:
             Processing statistics
@@ -114,6 +152,7 @@ class BaseProcessor(ABC):
             "failed_records": 0,
             "rejected_records": 0,
             "validation_errors": [],
+            "validation_error_count": 0,
             "processing_time": 0
         }
         
@@ -121,72 +160,105 @@ class BaseProcessor(ABC):
         
         # Deferred import to break circular dependency:
         # base_processor → application.services → file_service → processors
-        from app.application.services.rejected_records_service import RejectedRecordsService
-        # Initialize rejected records service
-        rejected_service = RejectedRecordsService(self.db)
+        from app.application.services.rejected_records_service import RejectedRecordSink
+        # Rejections are buffered and written with the raw-record batches
+        rejected_sink = RejectedRecordSink(
+            self.db,
+            batch_size=self.write_batch_size,
+            method=self.bulk_method
+        )
+        
+        # Buffer raw records and write them with COPY / multi-row INSERT
+        writer = None
+        if self.bulk_insert:
+            writer = BulkInsertWriter(
+                self.db,
+                RawRecords.__table__,
+                columns=[
+                    "id", "file_id", "row_number", "raw_data", "data_hash",
+                    "validation_status", "validation_errors", "batch_id"
+                ],
+                batch_size=self.write_batch_size,
+                method=self.bulk_method
+            )
         
         try:
-            for row_number, record in enumerate(records, 1):
+            async for row_number, record in _enumerate_records(records, first_row_number):
+                record_hash = None
+                if isinstance(record, FingerprintedRecord):
+                    record, record_hash = record
+                
                 try:
                     # Validate record
                     validation_result = await self._validate_record(record, row_number)
                     
                     # Generate record hash for deduplication
-                    record_hash = self._generate_record_hash(record)
+                    if record_hash is None:
+                        record_hash = self._generate_record_hash(record)
                     
-                    # Create raw record
-                    raw_record = RawRecords(
-                        file_id=file_registry.id,
-                        row_number=row_number,
-                        raw_data=record,
-                        data_hash=record_hash,
-                        validation_status="VALID" if validation_result["is_valid"] else "INVALID",
-                        validation_errors=validation_result["errors"],
-                        batch_id=self.batch_id
-                    )
+                    raw_values = {
+                        "id": uuid4(),
+                        "file_id": file_registry.id,
+                        "row_number": row_number,
+                        "raw_data": record,
+                        "data_hash": record_hash,
+                        "validation_status": "VALID" if validation_result["is_valid"] else "INVALID",
+                        "validation_errors": validation_result["errors"],
+                        "batch_id": self.batch_id
+                    }
                     
                     # Save to database
-                    self.db.add(raw_record)
+                    if writer is not None:
+                        writer.add(raw_values)
+                    else:
+                        self.db.add(RawRecords(**raw_values))
                     
                     if validation_result["is_valid"]:
                         processing_stats["successful_records"] += 1
                     else:
                         processing_stats["failed_records"] += 1
-                        processing_stats["validation_errors"].extend(validation_result["errors"])
+                        self.collect_validation_errors(processing_stats, validation_result["errors"])
                         
-                        # Store rejected record
-                        try:
-                            await rejected_service.store_rejected_record(
-                                source_file_id=file_registry.id,
-                                raw_data=record,
-                                rejection_reason="; ".join(validation_result["errors"][:3]),  # First 3 errors
-                                row_number=row_number,
-                                validation_errors=[
-                                    {"field": "record", "error": err}
-                                    for err in validation_result["errors"]
-                                ],
-                                batch_id=self.batch_id,
-                                can_retry=True
-                            )
-                            processing_stats["rejected_records"] += 1
-                        except Exception as e:
-                            self.logger.warning(f"Failed to store rejected record: {str(e)}")
+                        # Queue rejected record
+                        rejected_sink.add(
+                            source_file_id=file_registry.id,
+                            raw_data=record,
+                            rejection_reason="; ".join(validation_result["errors"][:3]),  # First 3 errors
+                            row_number=row_number,
+                            source_record_id=raw_values["id"],
+                            validation_errors=[
+                                {"field": "record", "error": err}
+                                for err in validation_result["errors"]
+                            ],
+                            batch_id=self.batch_id,
+                            can_retry=True
+                        )
+                        processing_stats["rejected_records"] += 1
                     
                     processing_stats["total_records"] += 1
-                    
-                    # Commit in batches for performance
-                    if row_number % 1000 == 0:
-                        self.db.commit()
-                        self.logger.info(f"Processed {row_number} records ({processing_stats['rejected_records']} rejected)")
                 
+                except DatabaseError:
+                    # A failed bulk flush loses the whole batch, abort instead of counting a row error
+                    raise
                 except Exception as e:
                     processing_stats["failed_records"] += 1
                     processing_stats["total_records"] += 1
                     error_msg = f"Row {row_number}: {str(e)}"
-                    processing_stats["validation_errors"].append(error_msg)
+                    self.collect_validation_errors(processing_stats, [error_msg])
                     self.logger.error(f"Error processing record {row_number}: {str(e)}")
+                
+                # Commit in batches for performance
+                if row_number % self.write_batch_size == 0:
+                    if writer is not None:
+                        writer.flush()
+                    rejected_sink.flush()
+                    self.db.commit()
+                    self.logger.info(f"Processed {row_number} records ({processing_stats['rejected_records']} rejected)")
             
-            # Final commit
+            # Final flush and commit
+            if writer is not None:
+                writer.flush()
+            rejected_sink.flush()
             self.db.commit()
             
             # Calculate processing time
@@ -201,6 +273,27 @@ class BaseProcessor(ABC):
             self.logger.error(f"Error during record processing: {str(e)}")
             raise FileProcessingException(f"Failed to process records: {str(e)}")
     
+    def collect_validation_errors(
+        self,
+        stats: Dict[str, Any],
+        errors: List[str],
+        count: Optional[int] = None
+    ):
+        """
+        Count validation errors, keeping at most ``max_error_samples`` messages
+        
+        Args:
+            stats: Processing statistics with ``validation_errors``
+            errors: Error messages to add
+            count: Errors they stand for, when ``errors`` is already a sample
+        """
+        stats["validation_error_count"] = stats.get("validation_error_count", 0) + (
+            len(errors) if count is None else count
+        )
+        room = self.max_error_samples - len(stats["validation_errors"])
+        if room > 0:
+            stats["validation_errors"].extend(errors[:room])
+    
     async def save_column_structure(self, file_registry: FileRegistry, columns: List[Dict[str, Any]]):
         """
         Save detected column structure to database
@@ -211,6 +304,7 @@ class BaseProcessor(ABC):
         """
         try:
             for position, column_info in enumerate(columns):
+                total_count = column_info.get("total_count")
                 column_structure = ColumnStructure(
                     file_id=file_registry.id,
                     column_name=column_info.get("name", f"column_{position}"),
@@ -220,7 +314,15 @@ class BaseProcessor(ABC):
                     null_count=column_info.get("null_count", 0),
                     unique_count=column_info.get("unique_count", 0),
                     min_length=column_info.get("min_length"),
-                    max_length=column_info.get("max_length")
+                    max_length=column_info.get("max_length"),
+                    total_count=total_count,
+                    distinct_count=column_info.get("unique_count"),
+                    completeness_ratio=(
+                        round(1 - column_info.get("null_count", 0) / total_count, 4) if total_count else None
+                    ),
+                    uniqueness_ratio=(
+                        round(column_info.get("unique_count", 0) / total_count, 4) if total_count else None
+                    )
                 )
                 
                 self.db.add(column_structure)
@@ -296,16 +398,53 @@ class BaseProcessor(ABC):
             record: Record data
             
         Returns:
-            SHA-256 hash of record
+            Record fingerprint (see ``app.utils.record_fingerprint``)
         """
-        try:
-            # Sort keys for consistent hashing
-            sorted_record = {k: v for k, v in sorted(record.items())}
-            record_string = json.dumps(sorted_record, sort_keys=True, default=str)
-            return hashlib.sha256(record_string.encode()).hexdigest()
-        except Exception as e:
-            self.logger.warning(f"Error generating record hash: {str(e)}")
-            return hashlib.sha256(str(record).encode()).hexdigest()
+        return self.fingerprinter.fingerprint(record)
+    
+    def _fingerprint_frame_records(self, frame: pd.DataFrame) -> Iterator[FingerprintedRecord]:
+        """
+        Records of a DataFrame chunk with their data_hash
+        
+        Args:
+            frame: Cleaned chunk, one record per row
+            
+        Returns:
+            FingerprintedRecord per row, hashed column-wise with ``fingerprint_frame``
+        """
+        columns = list(frame.columns)
+        # Same Python values as to_dict('records'), without boxing value by value
+        records = (
+            dict(zip(columns, row))
+            for row in zip(*(frame[column].to_numpy(dtype=object) for column in columns))
+        )
+        return map(FingerprintedRecord, records, self.fingerprinter.fingerprint_frame(frame))
+    
+    def _fingerprint_chunk(self, records: List[Dict[str, Any]]) -> Iterator[FingerprintedRecord]:
+        """
+        Pair a chunk of records with their data_hash
+        
+        Runs of records with the same keys are hashed column-wise with
+        ``fingerprint_frame``; the records themselves are passed through.
+        
+        Args:
+            records: Chunk of record dictionaries
+            
+        Yields:
+            FingerprintedRecord per record, in order
+        """
+        for keys, run in groupby(records, key=tuple):
+            run = list(run)
+            if keys:
+                # Object columns keep the Python values (no int -> float coercion)
+                frame = pd.DataFrame({
+                    key: np.fromiter((record[key] for record in run), dtype=object, count=len(run))
+                    for key in keys
+                })
+                hashes = self.fingerprinter.fingerprint_frame(frame)
+            else:
+                hashes = self.fingerprinter.fingerprint_many(run)
+            yield from map(FingerprintedRecord, run, hashes)
     
     def _detect_data_type(self, values: List[Any]) -> str:
         """
@@ -317,39 +456,7 @@ class BaseProcessor(ABC):
         Returns:
             Detected data type (STRING, NUMBER, DATE, BOOLEAN)
         """
-        # Remove null values for type detection
-        non_null_values = [v for v in values if v is not None and v != ""]
-        
-        if not non_null_values:
-            return "STRING"
-        
-        # Check for boolean
-        boolean_values = {"true", "false", "1", "0", "yes", "no", "y", "n"}
-        if all(str(v).lower() in boolean_values for v in non_null_values):
-            return "BOOLEAN"
-        
-        # Check for number
-        numeric_count = 0
-        for value in non_null_values[:100]:  # Check first 100 values
-            try:
-                float(str(value).replace(",", ""))
-                numeric_count += 1
-            except ValueError:
-                pass
-        
-        if numeric_count / len(non_null_values) > 0.8:  # 80% are numeric
-            return "NUMBER"
-        
-        # Check for date
-        date_count = 0
-        for value in non_null_values[:100]:
-            if self._is_date_like(str(value)):
-                date_count += 1
-        
-        if date_count / len(non_null_values) > 0.8:  # 80% are date-like
-            return "DATE"
-        
-        return "STRING"
+        return infer_data_type(values)
     
     def _is_date_like(self, value: str) -> bool:
         """
@@ -361,15 +468,7 @@ class BaseProcessor(ABC):
         Returns:
             True if value appears to be a date
         """
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',  # 2023-01-01
-            r'\d{2}/\d{2}/\d{4}',  # 01/01/2023
-            r'\d{2}-\d{2}-\d{4}',  # 01-01-2023
-            r'\d{4}/\d{2}/\d{2}',  # 2023/01/01
-        ]
-        
-        import re
-        return any(re.match(pattern, value.strip()) for pattern in date_patterns)
+        return is_date_like(value)
     
     def _get_file_size(self, file_path: str) -> int:
         """Get file size in bytes"""
@@ -417,4 +516,19 @@ class BaseProcessor(ABC):
                 Path(file_path).unlink(missing_ok=True)
                 self.logger.debug(f"Cleaned up temp file: {file_path}")
             except Exception as e:
-                self.logger.warning(f"Failed to clean up temp file {file_path}: {str(e)}")
\ No newline at end of file
+                self.logger.warning(f"Failed to clean up temp file {file_path}: {str(e)}")
+
+
+async def _enumerate_records(
+    records: Union[Iterator[Dict[str, Any]], AsyncIterator[Dict[str, Any]]],
+    start: int
+) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """``enumerate`` over a sync or async record iterator"""
+    if hasattr(records, "__aiter__"):
+        row_number = start
+        async for record in records:
+            yield row_number, record
+            row_number += 1
+    else:
+        for item in enumerate(records, start):
+            yield item
@@ -0,0 +1,285 @@
+# ==============================================
+# app/processors/csv_partitioner.py
+# ==============================================
+"""
+Byte-range partitioning of CSV files for parallel ingestion.
+
+One vectorized pass over the memory-mapped file finds the record boundaries:
+a newline ends a record only when an even number of quote characters precedes
+it, so newlines inside quoted fields never split a record (doubled ``""``
+escapes keep the parity). The same pass counts records, skipping blank and
+whitespace-only lines like ``pd.read_csv`` does, so every partition knows the
+global row number of its first record before any worker starts.
+
+The functions here are module level so partitions can be parsed inside worker
+processes or Celery subtasks.
+"""
+import codecs
+import io
+import mmap
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.errors import EmptyDataError
+
+QUOTE = ord('"')
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+# Bytes a line may consist of and still be skipped as blank
+BLANK_BYTES = b' \t\r'
+
+DEFAULT_SCAN_BYTES = 32 * 1024 * 1024
+
+
+def is_partitionable_encoding(encoding: str) -> bool:
+    """
+    Whether newline and quote bytes can only mean newline and quote
+
+    True for ASCII-compatible encodings (UTF-8, Latin-1, cp125x, ...), false
+    for UTF-16/32 where those byte values occur inside other characters.
+    """
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return False
+    if name.startswith(('utf-16', 'utf-32')):
+        return False
+    return '\n"'.encode(encoding) == b'\n"'
+
+
+def plan_partitions(
+    file_path: str,
+    partition_count: int,
+    scan_bytes: int = DEFAULT_SCAN_BYTES
+) -> List[Dict[str, Any]]:
+    """
+    Split a CSV file into record-aligned byte ranges of similar size
+
+    Args:
+        file_path: Path to CSV file (first non-blank record is the header)
+        partition_count: Desired number of partitions
+        scan_bytes: Bytes examined per vectorized scan step
+
+    Returns:
+        Partitions in file order as JSON-serializable dicts with ``index``,
+        ``start``/``end`` byte offsets, ``first_row`` (global 1-based row
+        number of the first record) and ``row_count``. Empty for files
+        without data rows.
+    """
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return []
+
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        data = np.frombuffer(mapped, dtype=np.uint8)
+        try:
+            header_end, boundaries, total_rows, records_end = _scan_boundaries(data, partition_count, scan_bytes)
+            header_end, total_rows = _count_tail_record(data, header_end, total_rows, records_end)
+        finally:
+            # The mmap can't be closed while a view on it is alive
+            del data
+
+    if header_end is None:
+        return []
+
+    starts = [header_end] + [offset for offset, _ in boundaries]
+    ends = [offset for offset, _ in boundaries] + [size]
+    first_rows = [1] + [rows_before + 1 for _, rows_before in boundaries]
+    last_rows = [rows_before for _, rows_before in boundaries] + [total_rows]
+
+    partitions = []
+    for start, end, first_row, last_row in zip(starts, ends, first_rows, last_rows):
+        if start >= end:
+            continue
+        partitions.append({
+            "index": len(partitions),
+            "start": int(start),
+            "end": int(end),
+            "first_row": int(first_row),
+            "row_count": int(last_row - first_row + 1),
+        })
+    return partitions
+
+
+def scan_sample(sample: bytes, at_eof: bool = False) -> Tuple[Optional[int], int, int]:
+    """
+    Locate the header and complete records in a sample from the file start
+
+    Args:
+        sample: Leading bytes of a CSV file
+        at_eof: Whether the sample is the whole file (a trailing record
+            without newline then counts as complete)
+
+    Returns:
+        (offset after the header record or None, offset after the last
+        complete record, number of complete data records)
+    """
+    data = np.frombuffer(sample, dtype=np.uint8)
+    header_end, _, rows, records_end = _scan_boundaries(data, 1, max(len(data), 1))
+    if at_eof:
+        header_end, rows = _count_tail_record(data, header_end, rows, records_end)
+        return header_end, len(data), rows
+    return header_end, records_end, rows
+
+
+def iter_partition_chunks(
+    file_path: str,
+    partition: Dict[str, Any],
+    columns: Sequence[str],
+    encoding: str,
+    delimiter: str,
+    chunk_size: int = 10000
+) -> Iterator[pd.DataFrame]:
+    """
+    Parse one partition with pandas, streaming ``chunk_size`` rows at a time
+
+    Args:
+        file_path: Path to CSV file
+        partition: Partition from ``plan_partitions``
+        columns: Header column names
+        encoding: File encoding
+        delimiter: CSV delimiter
+        chunk_size: Rows per DataFrame chunk
+
+    Yields:
+        DataFrame chunks with all values read as strings
+    """
+    with open(file_path, 'rb') as file:
+        stream = io.BufferedReader(
+            ByteRangeReader(file, partition["start"], partition["end"]),
+            buffer_size=1024 * 1024
+        )
+        try:
+            chunk_reader = pd.read_csv(
+                stream,
+                header=None,
+                names=list(columns),
+                delimiter=delimiter,
+                encoding=encoding,
+                chunksize=chunk_size,
+                low_memory=False,
+                dtype=str
+            )
+        except EmptyDataError:
+            # Partition holds only blank lines
+            return
+        with chunk_reader:
+            yield from chunk_reader
+
+
+class ByteRangeReader(io.RawIOBase):
+    """Read-only raw stream over ``[start, end)`` of an open binary file"""
+
+    def __init__(self, file, start: int, end: int):
+        self._file = file
+        self._position = start
+        self._end = end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        remaining = self._end - self._position
+        if remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:remaining]
+        self._file.seek(self._position)
+        count = self._file.readinto(view)
+        self._position += count
+        return count
+
+
+def _scan_boundaries(
+    data: np.ndarray,
+    partition_count: int,
+    scan_bytes: int
+) -> Tuple[Optional[int], List[Tuple[int, int]], int, int]:
+    """
+    Find the header end, partition boundaries and newline-terminated data rows
+
+    Returns:
+        (offset after the header record or None, [(boundary offset, data rows
+        before it)], terminated data rows, offset after the last terminator)
+    """
+    size = len(data)
+    parity = 0
+    previous_end = -1
+    rows = 0
+    header_end = None
+    targets: List[int] = []
+    boundaries: List[Tuple[int, int]] = []
+
+    for chunk_start in range(0, size, scan_bytes):
+        chunk = data[chunk_start:chunk_start + scan_bytes]
+        quotes = np.flatnonzero(chunk == QUOTE)
+        newlines = np.flatnonzero(chunk == NEWLINE)
+
+        # Record terminators: newlines preceded by an even number of quotes
+        terminators = newlines[((np.searchsorted(quotes, newlines) + parity) & 1) == 0] + chunk_start
+        parity = (parity + len(quotes)) & 1
+        if len(terminators) == 0:
+            continue
+
+        starts = np.concatenate(([previous_end], terminators[:-1])) + 1
+        non_blank = _non_blank_records(data, starts, terminators)
+        previous_end = int(terminators[-1])
+
+        if header_end is None:
+            header_index = np.flatnonzero(non_blank)
+            if len(header_index) == 0:
+                continue
+            first = int(header_index[0])
+            header_end = int(terminators[first]) + 1
+            terminators = terminators[first + 1:]
+            non_blank = non_blank[first + 1:]
+            step = (size - header_end) / max(partition_count, 1)
+            targets = [int(header_end + step * k) for k in range(partition_count - 1, 0, -1)]
+
+        # Data rows up to and including each terminator
+        rows_through = rows + np.cumsum(non_blank)
+        while targets and len(terminators):
+            index = int(np.searchsorted(terminators + 1, targets[-1], side='left'))
+            if index >= len(terminators):
+                break
+            targets.pop()
+            offset = int(terminators[index]) + 1
+            if offset < size and (not boundaries or offset > boundaries[-1][0]):
+                boundaries.append((offset, int(rows_through[index])))
+        rows += int(non_blank.sum())
+
+    return header_end, boundaries, rows, previous_end + 1
+
+
+def _count_tail_record(
+    data: np.ndarray,
+    header_end: Optional[int],
+    rows: int,
+    records_end: int
+) -> Tuple[Optional[int], int]:
+    """Account for a last record without trailing newline"""
+    if records_end < len(data) and bytes(data[records_end:]).strip(BLANK_BYTES):
+        if header_end is None:
+            return len(data), rows
+        return header_end, rows + 1
+    return header_end, rows
+
+
+def _non_blank_records(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Whether each record ``data[start:end]`` holds more than blank bytes"""
+    lengths = ends - starts
+    last_bytes = data[np.maximum(ends - 1, 0)]
+
+    # A single trailing \r is part of a CRLF terminator: judge the byte before it
+    crlf = (lengths > 0) & (last_bytes == CARRIAGE_RETURN)
+    content_lengths = lengths - crlf
+    last_bytes = np.where(crlf, data[np.maximum(ends - 2, 0)], last_bytes)
+
+    maybe_blank = (content_lengths == 0) | np.isin(last_bytes, np.frombuffer(BLANK_BYTES, dtype=np.uint8))
+    non_blank = ~maybe_blank
+
+    # Only lines ending in whitespace need a full look
+    for index in np.flatnonzero(maybe_blank & (content_lengths > 0)):
+        non_blank[index] = bool(bytes(data[starts[index]:ends[index]]).strip(BLANK_BYTES))
+    return non_blank
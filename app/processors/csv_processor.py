@@ -1,21 +1,34 @@
 # ==============================================
 # app/processors/csv_processor.py
 # ==============================================
+import asyncio
 import csv
 import io
+import multiprocessing
+import time
 import chardet
-from typing import Dict, List, Any, Optional, Tuple, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Iterator, AsyncIterator
 from pathlib import Path
 from datetime import datetime
+from uuid import UUID
+import numpy as np
 import pandas as pd
 
-from .base_processor import BaseProcessor
+from .base_processor import BaseProcessor, FingerprintedRecord
+from .column_profiler import profile_dataframe
+from .csv_partitioner import is_partitionable_encoding, iter_partition_chunks, plan_partitions, scan_sample
 from app.core.exceptions import FileProcessingException
+from app.core.executors import iterate_blocking, run_blocking
+from app.infrastructure.db.manager import get_engine, get_session
 from app.infrastructure.db.models.raw_data.file_registry import FileRegistry
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bump when the cached file profile layout changes
+FILE_PROFILE_VERSION = 2
+
 class CSVProcessor(BaseProcessor):
     """
     CSV file processor with automatic delimiter detection,
@@ -31,7 +44,7 @@ class CSVProcessor(BaseProcessor):
             batch_id: Optional batch ID
             **kwargs: Additional configuration options
         """
-        super().__init__(db_session, batch_id)
+        super().__init__(db_session, batch_id, **kwargs)
         
         # CSV-specific configuration
         self.delimiter = kwargs.get('delimiter', None)  # Auto-detect if None
@@ -42,6 +55,17 @@ class CSVProcessor(BaseProcessor):
         self.max_sample_rows = kwargs.get('max_sample_rows', 1000)
         self.chunk_size = kwargs.get('chunk_size', 10000)
         
+        # Parallel byte-range ingestion of large files
+        self.parallel_partitions = kwargs.get('parallel_partitions', False)
+        self.max_partition_workers = kwargs.get('max_partition_workers', None)
+        self.partition_min_bytes = kwargs.get('partition_min_bytes', 64 * 1024 * 1024)
+        self.partition_executor = kwargs.get('partition_executor', 'process')  # process or celery
+        
+        # File profile shared by validate/detect/preview/process (e.g. from FileRegistry.file_metadata)
+        self.profile_sample_bytes = kwargs.get('profile_sample_bytes', 1024 * 1024)
+        self.file_profile: Optional[Dict[str, Any]] = kwargs.get('file_profile', None)
+        self._profile_sample: Optional[pd.DataFrame] = None
+        
         # Common delimiters to try for auto-detection
         self.delimiter_candidates = [',', ';', '\t', '|', ':']
         
@@ -74,33 +98,16 @@ class CSVProcessor(BaseProcessor):
             if file_size > 1024 * 1024 * 1024:  # 1GB limit
                 return False, "File too large (>1GB)"
             
-            # Try to read first few lines
-            encoding = await self._detect_encoding(file_path)
-            delimiter = await self._detect_delimiter(file_path, encoding)
-            
-            with open(file_path, 'r', encoding=encoding) as file:
-                # Read first few lines to validate CSV structure
-                sample_lines = []
-                for i, line in enumerate(file):
-                    if i >= 10:  # Check first 10 lines
-                        break
-                    sample_lines.append(line.strip())
-                
-                if not sample_lines:
-                    return False, "File appears to be empty"
-                
-                # Try to parse with detected delimiter
-                reader = csv.reader(sample_lines, delimiter=delimiter)
-                rows = list(reader)
-                
-                if len(rows) < 1:
-                    return False, "No valid CSV rows found"
-                
-                # Check if all rows have similar column counts
-                if len(rows) > 1:
-                    col_counts = [len(row) for row in rows]
-                    if max(col_counts) - min(col_counts) > 5:  # Allow some variance
-                        return False, "Inconsistent column counts across rows"
+            # Field counts of the first lines, parsed with the detected delimiter
+            profile = await self.get_file_profile(file_path)
+            col_counts = profile["line_field_counts"]
+            
+            if not col_counts:
+                return False, "File appears to be empty"
+            
+            # Check if all rows have similar column counts
+            if len(col_counts) > 1 and max(col_counts) - min(col_counts) > 5:  # Allow some variance
+                return False, "Inconsistent column counts across rows"
             
             return True, "Valid CSV file"
             
@@ -118,56 +125,8 @@ class CSVProcessor(BaseProcessor):
             List of column information dictionaries
         """
         try:
-            encoding = await self._detect_encoding(file_path)
-            delimiter = await self._detect_delimiter(file_path, encoding)
-            
-            # Read sample data for analysis
-            df_sample = pd.read_csv(
-                file_path,
-                delimiter=delimiter,
-                encoding=encoding,
-                nrows=self.max_sample_rows,
-                low_memory=False
-            )
-            
-            columns_info = []
-            
-            for position, column_name in enumerate(df_sample.columns):
-                column_data = df_sample[column_name]
-                
-                # Get sample values (non-null)
-                sample_values = column_data.dropna().head(10).astype(str).tolist()
-                
-                # Calculate statistics
-                null_count = column_data.isnull().sum()
-                unique_count = column_data.nunique()
-                
-                # Detect data type
-                data_type = self._detect_data_type(sample_values)
-                
-                # Calculate string lengths for string columns
-                min_length = None
-                max_length = None
-                if data_type == "STRING":
-                    str_lengths = [len(str(val)) for val in sample_values if val]
-                    if str_lengths:
-                        min_length = min(str_lengths)
-                        max_length = max(str_lengths)
-                
-                column_info = {
-                    "name": column_name,
-                    "position": position,
-                    "data_type": data_type,
-                    "sample_values": sample_values,
-                    "null_count": int(null_count),
-                    "unique_count": int(unique_count),
-                    "total_count": len(column_data),
-                    "min_length": min_length,
-                    "max_length": max_length,
-                    "null_percentage": round((null_count / len(column_data)) * 100, 2)
-                }
-                
-                columns_info.append(column_info)
+            profile = await self.get_file_profile(file_path)
+            columns_info = profile["columns"]
             
             self.logger.info(f"Detected {len(columns_info)} columns in CSV file")
             return columns_info
@@ -188,30 +147,37 @@ class CSVProcessor(BaseProcessor):
             Dictionary containing preview data and metadata
         """
         try:
-            encoding = await self._detect_encoding(file_path)
-            delimiter = await self._detect_delimiter(file_path, encoding)
-            
-            # Read preview data
-            df_preview = pd.read_csv(
-                file_path,
-                delimiter=delimiter,
-                encoding=encoding,
-                nrows=rows,
-                low_memory=False
-            )
+            profile = await self.get_file_profile(file_path)
+            encoding = profile["encoding"]
+            delimiter = profile["delimiter"]
+            
+            # Serve the preview from the profiling sample when it covers the rows
+            sample = self._profile_sample
+            if sample is not None and (rows <= len(sample) or profile["row_count_exact"]):
+                df_preview = sample.head(rows)
+            else:
+                df_preview = await run_blocking(
+                    pd.read_csv,
+                    file_path,
+                    delimiter=delimiter,
+                    encoding=encoding,
+                    nrows=rows,
+                    low_memory=False
+                )
             
             # Convert to records for JSON serialization
             preview_records = df_preview.fillna("").to_dict('records')
             
-            # Get file statistics
-            total_rows = sum(1 for _ in open(file_path, 'r', encoding=encoding)) - 1  # Exclude header
-            file_size = self._get_file_size(file_path)
+            # Row count is estimated from the sample unless the whole file was sampled
+            total_rows = profile["estimated_rows"]
+            file_size = profile["size"]
             
             preview_data = {
                 "columns": df_preview.columns.tolist(),
                 "data": preview_records,
                 "metadata": {
                     "total_rows": total_rows,
+                    "total_rows_estimated": not profile["row_count_exact"],
                     "preview_rows": len(preview_records),
                     "total_columns": len(df_preview.columns),
                     "file_size": file_size,
@@ -241,9 +207,10 @@ class CSVProcessor(BaseProcessor):
         try:
             self.logger.info(f"Starting CSV processing for file: {file_path}")
             
-            # Detect file characteristics
-            encoding = await self._detect_encoding(file_path)
-            delimiter = await self._detect_delimiter(file_path, encoding)
+            # Detect file characteristics (reuses the profile from validation)
+            profile = await self.get_file_profile(file_path)
+            encoding = profile["encoding"]
+            delimiter = profile["delimiter"]
             
             # Update file metadata
             metadata = file_registry.file_metadata or {}
@@ -251,18 +218,23 @@ class CSVProcessor(BaseProcessor):
                 "encoding": encoding,
                 "delimiter": delimiter,
                 "delimiter_name": self._get_delimiter_name(delimiter),
-                "processor": "CSVProcessor"
+                "processor": "CSVProcessor",
+                "file_profile": profile
             })
             file_registry.file_metadata = metadata
             self.db.add(file_registry)
             
-            # Detect and save column structure
-            columns_info = await self.detect_structure(file_path)
+            # Save column structure detected while profiling
+            columns_info = profile["columns"]
             await self.save_column_structure(file_registry, columns_info)
             
-            # Process records in chunks for memory efficiency
-            record_iterator = self._read_csv_chunks(file_path, encoding, delimiter)
-            processing_stats = await self.process_records(record_iterator, file_registry)
+            if self._use_partitions(file_path, encoding):
+                # Parse and write newline-aligned byte ranges in parallel
+                processing_stats = await self._process_partitioned(file_path, file_registry, profile)
+            else:
+                # Process records in chunks for memory efficiency
+                record_iterator = self._read_csv_chunks(file_path, encoding, delimiter)
+                processing_stats = await self.process_records(record_iterator, file_registry)
             
             # Update processing statistics
             processing_stats.update({
@@ -279,21 +251,24 @@ class CSVProcessor(BaseProcessor):
             self.logger.error(f"Error processing CSV file: {str(e)}")
             raise FileProcessingException(f"Failed to process CSV file: {str(e)}")
     
-    def _read_csv_chunks(self, file_path: str, encoding: str, delimiter: str) -> Iterator[Dict[str, Any]]:
+    async def _read_csv_chunks(self, file_path: str, encoding: str, delimiter: str) -> AsyncIterator[FingerprintedRecord]:
         """
         Read CSV file in chunks to handle large files efficiently
         
+        Chunks are parsed on the blocking I/O pool.
+        
         Args:
             file_path: Path to CSV file
             encoding: File encoding
             delimiter: CSV delimiter
             
         Yields:
-            Dictionary records from CSV
+            Cleaned records from CSV with their data_hash
         """
         try:
             # Use pandas for efficient chunked reading
-            chunk_reader = pd.read_csv(
+            chunk_reader = await run_blocking(
+                pd.read_csv,
                 file_path,
                 delimiter=delimiter,
                 encoding=encoding,
@@ -302,28 +277,310 @@ class CSVProcessor(BaseProcessor):
                 dtype=str  # Read everything as string initially
             )
             
-            for chunk in chunk_reader:
-                # Convert chunk to records
-                chunk_records = chunk.fillna("").to_dict('records')
-                
-                for record in chunk_records:
-                    # Clean up the record
-                    cleaned_record = {
-                        key.strip(): str(value).strip() if value else None
-                        for key, value in record.items()
-                    }
-                    yield cleaned_record
+            with chunk_reader:
+                # Chunks are cleaned and fingerprinted on the blocking I/O pool as well
+                async for record in iterate_blocking(self._clean_records(chunk_reader), batch_size=self.chunk_size):
+                    yield record
                     
         except Exception as e:
             self.logger.error(f"Error reading CSV chunks: {str(e)}")
             raise FileProcessingException(f"Failed to read CSV file: {str(e)}")
     
-    async def _detect_encoding(self, file_path: str) -> str:
+    def _clean_records(self, chunks: Iterator[pd.DataFrame]) -> Iterator[FingerprintedRecord]:
+        """
+        Convert DataFrame chunks to cleaned, fingerprinted record dictionaries
+        
+        Keys and values are stripped column by column and each cleaned chunk
+        is hashed with ``fingerprint_frame``.
+        
+        Args:
+            chunks: DataFrame chunks read as strings
+            
+        Yields:
+            Records with stripped keys and values (None for empty cells) and their data_hash
+        """
+        for chunk in chunks:
+            chunk = chunk.fillna("")
+            keys = [key.strip() for key in chunk.columns]
+            
+            if len(set(keys)) != len(keys) or not all(
+                pd.api.types.infer_dtype(chunk[column], skipna=False) in ("string", "empty")
+                for column in chunk.columns
+            ):
+                # Headers that collide once stripped, or non-string cells: clean per record
+                yield from self._fingerprint_chunk([
+                    {key.strip(): str(value).strip() if value else None for key, value in record.items()}
+                    for record in chunk.to_dict('records')
+                ])
+                continue
+            
+            cleaned = {}
+            for key, column in zip(keys, chunk.columns):
+                values = chunk[column].to_numpy(dtype=object)
+                cleaned_values = np.fromiter(map(str.strip, values), dtype=object, count=len(values))
+                cleaned_values[values == ""] = None
+                cleaned[key] = cleaned_values
+            
+            yield from self._fingerprint_frame_records(pd.DataFrame(cleaned, index=chunk.index))
+    
+    def _use_partitions(self, file_path: str, encoding: str) -> bool:
+        """
+        Whether a file should be ingested as parallel byte-range partitions
+        
+        Args:
+            file_path: Path to CSV file
+            encoding: Detected file encoding
+            
+        Returns:
+            True when partitioned ingestion is enabled and applicable
+        """
+        if not self.parallel_partitions or self._get_file_size(file_path) < self.partition_min_bytes:
+            return False
+        
+        if not is_partitionable_encoding(encoding):
+            self.logger.warning(f"Encoding {encoding} can't be split on byte boundaries, reading sequentially")
+            return False
+        
+        # Celery prefork children are daemonic and cannot spawn worker processes
+        if self.partition_executor == 'process' and multiprocessing.current_process().daemon:
+            self.logger.warning(
+                "Partitioned CSV ingestion unavailable in daemonic worker "
+                "(use partition_executor='celery'), reading sequentially"
+            )
+            return False
+        
+        return True
+    
+    async def _process_partitioned(
+        self,
+        file_path: str,
+        file_registry: FileRegistry,
+        profile: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Ingest a CSV file as record-aligned byte ranges processed in parallel
+        
+        Each partition is parsed and written to raw_records by its own worker
+        process (or Celery subtask) with its own session. Global row numbers
+        are assigned up front from the partition plan.
+        
+        With ``partition_executor='celery'`` the subtasks run as a chord and
+        this returns right away with ``partitions_pending`` set; the chord
+        callback (``finish_partitioned_file``) records the merged statistics
+        and the processing status on the file.
+        
+        Args:
+            file_path: Path to CSV file
+            file_registry: File registry record
+            profile: File profile (encoding, delimiter, header)
+            
+        Returns:
+            Processing statistics merged over all partitions
+        """
+        started = time.perf_counter()
+        workers = self.max_partition_workers or multiprocessing.cpu_count()
+        
+        partitions = plan_partitions(file_path, workers)
+        columns = profile["header"]
+        options = {
+            "encoding": profile["encoding"],
+            "delimiter": profile["delimiter"],
+            "chunk_size": self.chunk_size,
+            "bulk_insert": self.bulk_insert,
+            "bulk_method": self.bulk_method,
+            "write_batch_size": self.write_batch_size,
+            "max_error_samples": self.max_error_samples,
+        }
+        partition_args = [
+            (file_path, str(file_registry.id), self.batch_id, partition, columns, options)
+            for partition in partitions
+        ]
+        self.logger.info(
+            f"Ingesting {file_path} in {len(partitions)} partitions "
+            f"({self.partition_executor}, {workers} workers)"
+        )
+        
+        if partition_args and self.partition_executor == 'celery':
+            # Don't wait on subtasks from inside a task; a chord callback
+            # merges their statistics and finishes the file
+            chord_id = _dispatch_partition_chord(
+                partition_args, str(file_registry.id), self.batch_id, len(profile["columns"]), options
+            )
+            processing_stats = self._merge_partition_stats([])
+            processing_stats.update({
+                "partitions": len(partitions),
+                "partitions_pending": True,
+                "partition_chord_id": chord_id,
+            })
+            return processing_stats
+        
+        loop = asyncio.get_running_loop()
+        if not partition_args:
+            partition_stats = []
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(partition_args)),
+                initializer=_init_partition_worker
+            ) as executor:
+                partition_stats = await asyncio.gather(*(
+                    loop.run_in_executor(executor, process_csv_partition, *args)
+                    for args in partition_args
+                ))
+        
+        processing_stats = self._merge_partition_stats(partition_stats)
+        processing_stats["processing_time"] = time.perf_counter() - started
+        processing_stats["partitions"] = len(partitions)
+        return processing_stats
+    
+    def _merge_partition_stats(self, partition_stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Sum per-partition processing statistics into file statistics"""
+        merged = {
+            "total_records": 0,
+            "successful_records": 0,
+            "failed_records": 0,
+            "rejected_records": 0,
+            "validation_errors": [],
+            "validation_error_count": 0,
+            "processing_time": 0
+        }
+        for stats in partition_stats:
+            for key in ("total_records", "successful_records", "failed_records", "rejected_records"):
+                merged[key] += stats.get(key, 0)
+            errors = stats.get("validation_errors", [])
+            self.collect_validation_errors(merged, errors, stats.get("validation_error_count", len(errors)))
+        return merged
+    
+    async def get_file_profile(self, file_path: str) -> Dict[str, Any]:
+        """
+        Profile of a CSV file, computed once per file version
+        
+        Encoding, dialect, header, column statistics and an approximate row
+        count are derived from one sample read from the start of the file. The
+        profile is reused while path, size, mtime and the explicitly configured
+        encoding/delimiter are unchanged, including one passed in as
+        ``file_profile`` (e.g. from FileRegistry.file_metadata).
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            JSON-serializable file profile
+        """
+        stat = Path(file_path).stat()
+        signature = {
+            "path": str(file_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            # Explicit settings win over detection; None when auto-detected
+            "requested_encoding": self.encoding,
+            "requested_delimiter": self.delimiter,
+        }
+        
+        profile = self.file_profile
+        if (
+            profile
+            and profile.get("version") == FILE_PROFILE_VERSION
+            and all(profile.get(key) == value for key, value in signature.items())
+        ):
+            return profile
+        
+        # Sampling, encoding/dialect sniffing and profiling run off the event loop
+        self.file_profile, self._profile_sample = await run_blocking(self._build_file_profile, file_path, signature)
+        return self.file_profile
+    
+    def _build_file_profile(
+        self,
+        file_path: str,
+        signature: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], pd.DataFrame]:
+        """
+        Compute a file profile from a single sample of the file
+        
+        Args:
+            file_path: Path to CSV file
+            signature: Path, size, mtime and explicit encoding/delimiter
+                identifying the file version and settings
+            
+        Returns:
+            Tuple of (profile, parsed sample DataFrame)
+        """
+        with open(file_path, 'rb') as file:
+            sample = file.read(self.profile_sample_bytes)
+        at_eof = len(sample) >= signature["size"]
+        
+        # Cut the sample after its last complete record
+        header_end, records_end, sample_rows = scan_sample(sample, at_eof)
+        if header_end is not None and records_end > header_end:
+            sample = sample[:records_end]
+        
+        encoding = self._detect_encoding(file_path, sample)
+        sample_text = sample.decode(encoding, errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+        sample_lines = sample_text.splitlines(keepends=True)
+        delimiter = self._detect_delimiter(file_path, encoding, sample_lines[:5])
+        
+        # First lines as the format validation checks them
+        line_field_counts = [
+            len(row) for row in csv.reader([line.strip() for line in sample_lines[:10]], delimiter=delimiter)
+        ]
+        
+        try:
+            df_sample = pd.read_csv(
+                io.BytesIO(sample),
+                delimiter=delimiter,
+                encoding=encoding,
+                nrows=self.max_sample_rows,
+                low_memory=False
+            )
+        except pd.errors.EmptyDataError:
+            df_sample = pd.DataFrame()
+        
+        # Extrapolate the row count from the bytes per record in the sample
+        if at_eof or header_end is None:
+            estimated_rows = sample_rows
+        else:
+            sampled_bytes = records_end - header_end
+            estimated_rows = round(sample_rows * (signature["size"] - header_end) / sampled_bytes) if sampled_bytes else 0
+        
+        profile = {
+            "version": FILE_PROFILE_VERSION,
+            **signature,
+            "encoding": encoding,
+            "delimiter": delimiter,
+            "delimiter_name": self._get_delimiter_name(delimiter),
+            "header": [str(column) for column in df_sample.columns],
+            "columns": self._analyze_columns(df_sample),
+            "line_field_counts": line_field_counts,
+            "sample_bytes": len(sample),
+            "sample_rows": len(df_sample),
+            "estimated_rows": int(estimated_rows),
+            "row_count_exact": at_eof,
+            "profiled_at": datetime.utcnow().isoformat()
+        }
+        self.logger.info(
+            f"Profiled {file_path}: {len(profile['header'])} columns, "
+            f"~{profile['estimated_rows']} rows from {len(sample)} sampled bytes"
+        )
+        return profile, df_sample
+    
+    def _analyze_columns(self, df_sample: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Column statistics and inferred types of a sample DataFrame
+        
+        Args:
+            df_sample: Sample rows of the file
+            
+        Returns:
+            List of column information dictionaries
+        """
+        return profile_dataframe(df_sample)
+    
+    def _detect_encoding(self, file_path: str, sample: Optional[bytes] = None) -> str:
         """
         Auto-detect file encoding
         
         Args:
             file_path: Path to file
+            sample: Leading bytes already read from the file
             
         Returns:
             Detected encoding string
@@ -333,8 +590,10 @@ class CSVProcessor(BaseProcessor):
         
         try:
             # Read sample of file for encoding detection
-            with open(file_path, 'rb') as file:
-                sample = file.read(10000)  # Read first 10KB
+            if sample is None:
+                with open(file_path, 'rb') as file:
+                    sample = file.read(10000)  # Read first 10KB
+            sample = sample[:10000]
             
             detected = chardet.detect(sample)
             encoding = detected.get('encoding', 'utf-8')
@@ -351,13 +610,14 @@ class CSVProcessor(BaseProcessor):
             self.logger.warning(f"Encoding detection failed: {str(e)}, using utf-8")
             return 'utf-8'
     
-    async def _detect_delimiter(self, file_path: str, encoding: str) -> str:
+    def _detect_delimiter(self, file_path: str, encoding: str, sample_lines: Optional[List[str]] = None) -> str:
         """
         Auto-detect CSV delimiter
         
         Args:
             file_path: Path to CSV file
             encoding: File encoding
+            sample_lines: First lines already read from the file
             
         Returns:
             Detected delimiter character
@@ -366,15 +626,16 @@ class CSVProcessor(BaseProcessor):
             return self.delimiter
         
         try:
-            with open(file_path, 'r', encoding=encoding) as file:
-                # Read first few lines for delimiter detection
-                sample_lines = []
-                for i, line in enumerate(file):
-                    if i >= 5:  # Check first 5 lines
-                        break
-                    sample_lines.append(line)
-                
-                sample_text = '\n'.join(sample_lines)
+            if sample_lines is None:
+                with open(file_path, 'r', encoding=encoding) as file:
+                    # Read first few lines for delimiter detection
+                    sample_lines = []
+                    for i, line in enumerate(file):
+                        if i >= 5:  # Check first 5 lines
+                            break
+                        sample_lines.append(line)
+            
+            sample_text = '\n'.join(sample_lines)
             
             # Use csv.Sniffer to detect delimiter
             sniffer = csv.Sniffer()
@@ -454,4 +715,154 @@ class CSVProcessor(BaseProcessor):
             validation_result["is_valid"] = False
             validation_result["errors"].append(f"Validation error: {str(e)}")
         
-        return validation_result
\ No newline at end of file
+        return validation_result
+
+
+def process_csv_partition(
+    file_path: str,
+    file_id: str,
+    batch_id: str,
+    partition: Dict[str, Any],
+    columns: List[str],
+    options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Worker entry point: parse one partition and write it to raw_records
+
+    Args:
+        file_path: Path to CSV file
+        file_id: FileRegistry id
+        batch_id: Batch ID shared by all partitions of the file
+        partition: Partition from ``plan_partitions``
+        columns: Header column names
+        options: CSVProcessor options (encoding, delimiter, write settings)
+
+    Returns:
+        Processing statistics of the partition
+    """
+    with get_session() as db:
+        file_registry = db.get(FileRegistry, UUID(file_id))
+        if file_registry is None:
+            raise FileProcessingException(f"File record not found: {file_id}")
+
+        processor = CSVProcessor(db, batch_id, **options)
+        chunks = iter_partition_chunks(
+            file_path, partition, columns, options["encoding"], options["delimiter"], processor.chunk_size
+        )
+        processing_stats = asyncio.run(processor.process_records(
+            processor._clean_records(chunks), file_registry, first_row_number=partition["first_row"]
+        ))
+
+    if processing_stats["total_records"] != partition["row_count"]:
+        logger.warning(
+            f"Partition {partition['index']} of {file_path} parsed {processing_stats['total_records']} "
+            f"records, expected {partition['row_count']}; row numbers may be shifted"
+        )
+    return processing_stats
+
+
+def _init_partition_worker():
+    """Drop database connections inherited from the parent process through fork"""
+    get_engine().dispose(close=False)
+
+
+def _dispatch_partition_chord(
+    partition_args: List[Tuple],
+    file_id: str,
+    batch_id: str,
+    columns_detected: int,
+    options: Dict[str, Any]
+) -> str:
+    """Fan partitions out as a Celery chord and return its id"""
+    # Deferred import: tasks import the processors package
+    from celery import chord
+    from app.tasks.etl_tasks import (
+        csv_partitions_failed_task,
+        finish_csv_partitions_task,
+        process_csv_partition_task,
+    )
+
+    callback = finish_csv_partitions_task.s(
+        file_id, batch_id, columns_detected, options, time.time()
+    ).on_error(csv_partitions_failed_task.s(file_id, batch_id))
+    result = chord(process_csv_partition_task.s(*args) for args in partition_args)(callback)
+    return result.id
+
+
+def finish_partitioned_file(
+    partition_stats: List[Dict[str, Any]],
+    file_id: str,
+    batch_id: str,
+    columns_detected: int,
+    options: Dict[str, Any],
+    dispatched_at: float
+) -> Dict[str, Any]:
+    """
+    Chord callback body: merge partition statistics and finish the file
+
+    Args:
+        partition_stats: Statistics returned by the partition subtasks
+        file_id: FileRegistry id
+        batch_id: Batch ID shared by all partitions of the file
+        columns_detected: Number of header columns
+        options: CSVProcessor options the partitions ran with
+        dispatched_at: Epoch time the chord was dispatched
+
+    Returns:
+        Processing statistics merged over all partitions
+    """
+    from app.core.enums import ProcessingStatus
+
+    with get_session() as db:
+        file_registry = db.get(FileRegistry, UUID(file_id))
+        if file_registry is None:
+            raise FileProcessingException(f"File record not found: {file_id}")
+
+        processor = CSVProcessor(db, batch_id, **options)
+        processing_stats = processor._merge_partition_stats(partition_stats)
+        processing_stats.update({
+            "processing_time": time.time() - dispatched_at,
+            "partitions": len(partition_stats),
+            "file_type": "CSV",
+            "encoding": options["encoding"],
+            "delimiter": options["delimiter"],
+            "columns_detected": columns_detected,
+        })
+
+        if processing_stats["successful_records"] > 0:
+            file_registry.processing_status = ProcessingStatus.COMPLETED.value
+        else:
+            file_registry.processing_status = ProcessingStatus.FAILED.value
+        metadata = dict(file_registry.file_metadata or {})
+        metadata.update({
+            "processing_results": processing_stats,
+            "processed_at": datetime.utcnow().isoformat(),
+            "task_id": batch_id,
+        })
+        file_registry.file_metadata = metadata
+        db.add(file_registry)
+        db.commit()
+
+    logger.info(f"Partitioned CSV processing completed for {file_id}: {processing_stats}")
+    return processing_stats
+
+
+def fail_partitioned_file(file_id: str, batch_id: str, error: str) -> None:
+    """Mark a file failed after one of its partition subtasks failed"""
+    from app.core.enums import ProcessingStatus
+
+    with get_session() as db:
+        file_registry = db.get(FileRegistry, UUID(file_id))
+        if file_registry is None:
+            return
+
+        file_registry.processing_status = ProcessingStatus.FAILED.value
+        metadata = dict(file_registry.file_metadata or {})
+        metadata.update({
+            "error": error,
+            "failed_at": datetime.utcnow().isoformat(),
+            "task_id": batch_id,
+        })
+        file_registry.file_metadata = metadata
+        db.add(file_registry)
+        db.commit()
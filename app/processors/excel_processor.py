@@ -8,9 +8,13 @@ from typing import Dict, List, Any, Optional, Tuple, Iterator
 from pathlib import Path
 from datetime import datetime
 import json
+import multiprocessing
 
-from .base_processor import BaseProcessor
+from .base_processor import BaseProcessor, FingerprintedRecord
+from .column_profiler import profile_dataframe
+from .excel_reader import ParallelSheetReader, iter_sheet_records
 from app.core.exceptions import FileProcessingException
+from app.core.executors import iterate_blocking, run_blocking
 from app.infrastructure.db.models.raw_data.file_registry import FileRegistry
 from app.utils.logger import get_logger
 
@@ -31,7 +35,7 @@ class ExcelProcessor(BaseProcessor):
             batch_id: Optional batch ID
             **kwargs: Additional configuration options
         """
-        super().__init__(db_session, batch_id)
+        super().__init__(db_session, batch_id, **kwargs)
         
         # Excel-specific configuration
         self.sheet_names = kwargs.get('sheet_names', None)  # Process all sheets if None
@@ -42,6 +46,8 @@ class ExcelProcessor(BaseProcessor):
         self.ignore_hidden_sheets = kwargs.get('ignore_hidden_sheets', True)
         self.preserve_formulas = kwargs.get('preserve_formulas', False)
         self.include_formatting = kwargs.get('include_formatting', False)
+        self.parallel_sheets = kwargs.get('parallel_sheets', False)  # Stream sheets from worker processes
+        self.max_sheet_workers = kwargs.get('max_sheet_workers', None)
         
     async def validate_file_format(self, file_path: str) -> Tuple[bool, str]:
         """
@@ -75,16 +81,9 @@ class ExcelProcessor(BaseProcessor):
             
             # Try to open the Excel file
             try:
-                if file_path_obj.suffix.lower() == '.xls':
-                    # Handle legacy XLS format
-                    workbook = xlrd.open_workbook(file_path)
-                    if workbook.nsheets == 0:
-                        return False, "No sheets found in Excel file"
-                else:
-                    # Handle modern XLSX format
-                    workbook = openpyxl.load_workbook(file_path, read_only=True)
-                    if len(workbook.sheetnames) == 0:
-                        return False, "No sheets found in Excel file"
+                sheet_count = await run_blocking(self._count_sheets, file_path)
+                if sheet_count == 0:
+                    return False, "No sheets found in Excel file"
                 
                 return True, "Valid Excel file"
                 
@@ -115,7 +114,8 @@ class ExcelProcessor(BaseProcessor):
                 
                 try:
                     # Read sample data from sheet
-                    df_sample = pd.read_excel(
+                    df_sample = await run_blocking(
+                        pd.read_excel,
                         file_path,
                         sheet_name=sheet_name,
                         header=self.header_row,
@@ -128,49 +128,13 @@ class ExcelProcessor(BaseProcessor):
                         self.logger.warning(f"Sheet '{sheet_name}' is empty, skipping")
                         continue
                     
-                    columns_info = []
+                    columns_info = profile_dataframe(df_sample)
                     
-                    for position, column_name in enumerate(df_sample.columns):
-                        column_data = df_sample[column_name]
-                        
+                    for column_name, column_info in zip(df_sample.columns, columns_info):
                         # Handle unnamed columns
                         if pd.isna(column_name) or str(column_name).startswith('Unnamed'):
-                            column_name = f"Column_{position + 1}"
-                        
-                        # Get sample values (non-null)
-                        sample_values = column_data.dropna().head(10).astype(str).tolist()
-                        
-                        # Calculate statistics
-                        null_count = column_data.isnull().sum()
-                        unique_count = column_data.nunique()
-                        
-                        # Detect data type
-                        data_type = self._detect_data_type(sample_values)
-                        
-                        # Calculate string lengths for string columns
-                        min_length = None
-                        max_length = None
-                        if data_type == "STRING":
-                            str_lengths = [len(str(val)) for val in sample_values if val]
-                            if str_lengths:
-                                min_length = min(str_lengths)
-                                max_length = max(str_lengths)
-                        
-                        column_info = {
-                            "name": str(column_name),
-                            "position": position,
-                            "data_type": data_type,
-                            "sample_values": sample_values,
-                            "null_count": int(null_count),
-                            "unique_count": int(unique_count),
-                            "total_count": len(column_data),
-                            "min_length": min_length,
-                            "max_length": max_length,
-                            "null_percentage": round((null_count / len(column_data)) * 100, 2),
-                            "sheet_name": sheet_name
-                        }
-                        
-                        columns_info.append(column_info)
+                            column_info["name"] = f"Column_{column_info['position'] + 1}"
+                        column_info["sheet_name"] = sheet_name
                     
                     # Add sheet structure info
                     sheet_structure = {
@@ -222,7 +186,8 @@ class ExcelProcessor(BaseProcessor):
                 
                 try:
                     # Read preview data from sheet
-                    df_preview = pd.read_excel(
+                    df_preview = await run_blocking(
+                        pd.read_excel,
                         file_path,
                         sheet_name=sheet_name,
                         header=self.header_row,
@@ -236,9 +201,8 @@ class ExcelProcessor(BaseProcessor):
                     # Convert to records for JSON serialization
                     preview_records = df_preview.fillna("").to_dict('records')
                     
-                    # Get total row count for the sheet
-                    df_full = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
-                    total_rows = len(df_full) - (self.header_row + 1 if self.header_row is not None else 0)
+                    # Row count from sheet dimensions, avoids parsing the whole sheet again
+                    total_rows = max(sheet_info.get('rows') or 0, 0) - (self.header_row + 1 if self.header_row is not None else 0)
                     
                     sheet_preview = {
                         "sheet_name": sheet_name,
@@ -309,46 +273,62 @@ class ExcelProcessor(BaseProcessor):
                 "successful_records": 0,
                 "failed_records": 0,
                 "validation_errors": [],
+                "validation_error_count": 0,
                 "processing_time": 0,
                 "sheets_processed": 0,
                 "file_type": "Excel",
                 "sheets_info": []
             }
             
+            sheets_to_process = []
             for sheet_info in sheets_info:
-                sheet_name = sheet_info['name']
-                
                 # Skip hidden sheets if configured
                 if self.ignore_hidden_sheets and sheet_info.get('hidden', False):
-                    self.logger.info(f"Skipping hidden sheet: {sheet_name}")
+                    self.logger.info(f"Skipping hidden sheet: {sheet_info['name']}")
                     continue
-                
-                try:
-                    self.logger.info(f"Processing sheet: {sheet_name}")
-                    
-                    # Process sheet records
-                    record_iterator = self._read_excel_sheet_chunks(file_path, sheet_name)
-                    sheet_stats = await self.process_records(record_iterator, file_registry)
-                    
-                    # Update total statistics
-                    total_stats["total_records"] += sheet_stats["total_records"]
-                    total_stats["successful_records"] += sheet_stats["successful_records"]
-                    total_stats["failed_records"] += sheet_stats["failed_records"]
-                    total_stats["validation_errors"].extend(sheet_stats["validation_errors"])
-                    total_stats["processing_time"] += sheet_stats["processing_time"]
-                    total_stats["sheets_processed"] += 1
-                    
-                    # Add sheet-specific info
-                    sheet_info_detail = {
-                        "sheet_name": sheet_name,
-                        "records": sheet_stats["total_records"],
-                        "success_rate": round((sheet_stats["successful_records"] / max(sheet_stats["total_records"], 1)) * 100, 2)
-                    }
-                    total_stats["sheets_info"].append(sheet_info_detail)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing sheet '{sheet_name}': {str(e)}")
-                    total_stats["validation_errors"].append(f"Sheet '{sheet_name}' processing failed: {str(e)}")
+                sheets_to_process.append(sheet_info['name'])
+            
+            parallel_reader = await self._start_parallel_reader(file_path, sheets_to_process)
+            try:
+                for sheet_name in sheets_to_process:
+                    try:
+                        self.logger.info(f"Processing sheet: {sheet_name}")
+                        
+                        # Process sheet records
+                        sheet_records = parallel_reader.iter_records(sheet_name) if parallel_reader else None
+                        record_iterator = iterate_blocking(
+                            self._read_excel_sheet_chunks(file_path, sheet_name, sheet_records),
+                            batch_size=self.chunk_size
+                        )
+                        sheet_stats = await self.process_records(record_iterator, file_registry)
+                        
+                        # Update total statistics
+                        total_stats["total_records"] += sheet_stats["total_records"]
+                        total_stats["successful_records"] += sheet_stats["successful_records"]
+                        total_stats["failed_records"] += sheet_stats["failed_records"]
+                        self.collect_validation_errors(
+                            total_stats, sheet_stats["validation_errors"], sheet_stats["validation_error_count"]
+                        )
+                        total_stats["processing_time"] += sheet_stats["processing_time"]
+                        total_stats["sheets_processed"] += 1
+                        
+                        # Add sheet-specific info
+                        sheet_info_detail = {
+                            "sheet_name": sheet_name,
+                            "records": sheet_stats["total_records"],
+                            "success_rate": round((sheet_stats["successful_records"] / max(sheet_stats["total_records"], 1)) * 100, 2)
+                        }
+                        total_stats["sheets_info"].append(sheet_info_detail)
+                        
+                    except Exception as e:
+                        self.logger.error(f"Error processing sheet '{sheet_name}': {str(e)}")
+                        self.collect_validation_errors(total_stats, [f"Sheet '{sheet_name}' processing failed: {str(e)}"])
+                        if parallel_reader is not None:
+                            # Unblock the sheet's worker, or the next sheet may never start
+                            await run_blocking(parallel_reader.discard, sheet_name)
+            finally:
+                if parallel_reader is not None:
+                    await run_blocking(parallel_reader.close)
             
             self.logger.info(f"Excel processing completed: {total_stats}")
             return total_stats
@@ -368,135 +348,154 @@ class ExcelProcessor(BaseProcessor):
             List of sheet information dictionaries
         """
         try:
-            sheets_info = []
-            file_extension = Path(file_path).suffix.lower()
-            
-            if file_extension == '.xls':
-                # Handle legacy XLS format
-                workbook = xlrd.open_workbook(file_path)
-                for i, sheet_name in enumerate(workbook.sheet_names()):
-                    sheet = workbook.sheet_by_index(i)
-                    sheets_info.append({
-                        "name": sheet_name,
-                        "index": i,
-                        "rows": sheet.nrows,
-                        "columns": sheet.ncols,
-                        "hidden": False,  # XLS doesn't easily expose hidden state
-                        "type": "worksheet"
-                    })
-            else:
-                # Handle modern XLSX format
-                workbook = openpyxl.load_workbook(file_path, read_only=True)
-                for i, sheet_name in enumerate(workbook.sheetnames):
-                    worksheet = workbook[sheet_name]
-                    sheets_info.append({
-                        "name": sheet_name,
-                        "index": i,
-                        "rows": worksheet.max_row,
-                        "columns": worksheet.max_column,
-                        "hidden": worksheet.sheet_state == 'hidden',
-                        "type": "worksheet"  # Could extend to detect chart sheets, etc.
-                    })
-                
-                workbook.close()
-            
-            return sheets_info
+            return await run_blocking(self._read_sheets_info, file_path)
             
         except Exception as e:
             self.logger.error(f"Error getting sheets info: {str(e)}")
             raise FileProcessingException(f"Failed to get Excel sheets information: {str(e)}")
     
-    def _read_excel_sheet_chunks(self, file_path: str, sheet_name: str) -> Iterator[Dict[str, Any]]:
+    def _read_sheets_info(self, file_path: str) -> List[Dict[str, Any]]:
         """
-        Read Excel sheet in chunks to handle large files efficiently
+        Read sheet names, dimensions and visibility from the workbook
         
         Args:
             file_path: Path to Excel file
-            sheet_name: Name of sheet to read
             
-        Yields:
-            Dictionary records from Excel sheet
+        Returns:
+            List of sheet information dictionaries
         """
-        try:
-            # For Excel, we'll read in chunks using skiprows and nrows
-            total_rows = self._get_sheet_row_count(file_path, sheet_name)
+        sheets_info = []
+        file_extension = Path(file_path).suffix.lower()
+        
+        if file_extension == '.xls':
+            # Handle legacy XLS format
+            workbook = xlrd.open_workbook(file_path)
+            for i, sheet_name in enumerate(workbook.sheet_names()):
+                sheet = workbook.sheet_by_index(i)
+                sheets_info.append({
+                    "name": sheet_name,
+                    "index": i,
+                    "rows": sheet.nrows,
+                    "columns": sheet.ncols,
+                    "hidden": False,  # XLS doesn't easily expose hidden state
+                    "type": "worksheet"
+                })
+        else:
+            # Handle modern XLSX format
+            workbook = openpyxl.load_workbook(file_path, read_only=True)
+            for i, sheet_name in enumerate(workbook.sheetnames):
+                worksheet = workbook[sheet_name]
+                sheets_info.append({
+                    "name": sheet_name,
+                    "index": i,
+                    "rows": worksheet.max_row,
+                    "columns": worksheet.max_column,
+                    "hidden": worksheet.sheet_state == 'hidden',
+                    "type": "worksheet"  # Could extend to detect chart sheets, etc.
+                })
+            
+            workbook.close()
+        
+        return sheets_info
+    
+    def _count_sheets(self, file_path: str) -> int:
+        """
+        Open the workbook and count its sheets
+        
+        Args:
+            file_path: Path to Excel file
             
-            for start_row in range(0, total_rows, self.chunk_size):
-                try:
-                    # Calculate skiprows (account for header)
-                    skip_rows = None
-                    if start_row > 0:
-                        # Skip header for subsequent chunks
-                        skip_rows = list(range(self.header_row + 1)) if self.header_row is not None else None
-                        actual_skip = start_row + (self.header_row + 1 if self.header_row is not None else 0)
-                    else:
-                        skip_rows = self.skip_rows
-                        actual_skip = start_row
-                    
-                    # Read chunk
-                    df_chunk = pd.read_excel(
-                        file_path,
-                        sheet_name=sheet_name,
-                        header=self.header_row if start_row == 0 else 0,
-                        skiprows=range(1, actual_skip + 1) if actual_skip > 0 and start_row > 0 else skip_rows,
-                        nrows=self.chunk_size
-                    )
-                    
-                    if df_chunk.empty:
-                        break
-                    
-                    # Convert chunk to records
-                    chunk_records = df_chunk.fillna("").to_dict('records')
-                    
-                    for record in chunk_records:
-                        # Clean up the record and add sheet information
-                        cleaned_record = {
-                            key.strip() if isinstance(key, str) else str(key): 
-                            str(value).strip() if value and not pd.isna(value) else None
-                            for key, value in record.items()
-                        }
-                        
-                        # Add sheet metadata to record
-                        cleaned_record['_sheet_name'] = sheet_name
-                        
-                        yield cleaned_record
-                        
-                except Exception as e:
-                    self.logger.error(f"Error reading chunk starting at row {start_row}: {str(e)}")
-                    continue
-                    
-        except Exception as e:
-            self.logger.error(f"Error reading Excel sheet chunks: {str(e)}")
-            raise FileProcessingException(f"Failed to read Excel sheet: {str(e)}")
+        Returns:
+            Number of sheets
+        """
+        if Path(file_path).suffix.lower() == '.xls':
+            # Handle legacy XLS format
+            return xlrd.open_workbook(file_path).nsheets
+        
+        # Handle modern XLSX format
+        workbook = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            return len(workbook.sheetnames)
+        finally:
+            workbook.close()
     
-    def _get_sheet_row_count(self, file_path: str, sheet_name: str) -> int:
+    async def _start_parallel_reader(self, file_path: str, sheet_names: List[str]) -> Optional[ParallelSheetReader]:
         """
-        Get total row count for a specific sheet
+        Start a parallel sheet reader when enabled and useful
+        
+        The queue manager and worker pool are started on the blocking I/O pool.
         
         Args:
             file_path: Path to Excel file
-            sheet_name: Name of sheet
+            sheet_names: Sheets that will be processed, in order
             
         Returns:
-            Total number of rows
+            Opened ParallelSheetReader (close it with ``close``), or None to read sheets sequentially
+        """
+        if not self.parallel_sheets or len(sheet_names) < 2:
+            return None
+        
+        # Celery prefork children are daemonic and cannot spawn worker processes
+        if multiprocessing.current_process().daemon:
+            self.logger.warning("Parallel sheet reading unavailable in daemonic worker, reading sheets sequentially")
+            return None
+        
+        reader = ParallelSheetReader(
+            file_path,
+            sheet_names,
+            chunk_size=self.chunk_size,
+            header_row=self.header_row,
+            skip_rows=self.skip_rows,
+            max_workers=self.max_sheet_workers
+        )
+        return await run_blocking(reader.open)
+    
+    def _read_excel_sheet_chunks(
+        self,
+        file_path: str,
+        sheet_name: str,
+        records: Optional[Iterator[Dict[str, Any]]] = None
+    ) -> Iterator[FingerprintedRecord]:
+        """
+        Stream Excel sheet records, parsing the sheet exactly once
+        
+        Cleaned records are fingerprinted per chunk of ``chunk_size`` with
+        ``fingerprint_frame``.
+        
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Name of sheet to read
+            records: Optional pre-parsed record stream (e.g. from a parallel reader)
+            
+        Yields:
+            Dictionary records from Excel sheet with their data_hash
         """
         try:
-            file_extension = Path(file_path).suffix.lower()
-            
-            if file_extension == '.xls':
-                workbook = xlrd.open_workbook(file_path)
-                sheet = workbook.sheet_by_name(sheet_name)
-                return sheet.nrows
-            else:
-                workbook = openpyxl.load_workbook(file_path, read_only=True)
-                worksheet = workbook[sheet_name]
-                row_count = worksheet.max_row
-                workbook.close()
-                return row_count
+            if records is None:
+                records = iter_sheet_records(file_path, sheet_name, self.header_row, self.skip_rows)
+            
+            chunk = []
+            for record in records:
+                # Clean up the record and add sheet information
+                cleaned_record = {
+                    key.strip() if isinstance(key, str) else str(key):
+                    str(value).strip() if value and not pd.isna(value) else None
+                    for key, value in record.items()
+                }
                 
+                # Add sheet metadata to record
+                cleaned_record['_sheet_name'] = sheet_name
+                
+                chunk.append(cleaned_record)
+                if len(chunk) >= self.chunk_size:
+                    yield from self._fingerprint_chunk(chunk)
+                    chunk = []
+            
+            yield from self._fingerprint_chunk(chunk)
+                    
         except Exception as e:
-            self.logger.warning(f"Could not get row count for sheet '{sheet_name}': {str(e)}")
-            return 1000000  # Large default value
+            self.logger.error(f"Error reading Excel sheet chunks: {str(e)}")
+            raise FileProcessingException(f"Failed to read Excel sheet: {str(e)}")
     
     async def _custom_record_validation(self, record: Dict[str, Any], row_number: int) -> Dict[str, Any]:
         """
@@ -0,0 +1,354 @@
+# ==============================================
+# app/processors/excel_reader.py
+# ==============================================
+"""
+Single-pass streaming readers for Excel workbooks.
+
+Each sheet is parsed exactly once: XLSX/XLSM through openpyxl in read-only mode
+(``iter_rows(values_only=True)``) and legacy XLS through xlrd. Rows are yielded
+lazily as dicts keyed by the header row, so memory stays bounded by the chunk
+size instead of growing with the sheet.
+
+The functions here are module level so they can run inside worker processes
+when several sheets of one workbook are streamed in parallel.
+"""
+import multiprocessing
+import queue as queue_module
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import openpyxl
+import xlrd
+
+from app.core.exceptions import FileProcessingException
+
+SkipRows = Optional[Union[int, Sequence[int]]]
+
+
+def iter_sheet_values(file_path: str, sheet_name: str) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield raw row tuples of a sheet in a single pass
+
+    Args:
+        file_path: Path to Excel file
+        sheet_name: Name of sheet to read
+
+    Yields:
+        Tuple of cell values per physical row
+    """
+    if Path(file_path).suffix.lower() == '.xls':
+        workbook = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            sheet = workbook.sheet_by_name(sheet_name)
+            for row_index in range(sheet.nrows):
+                yield tuple(
+                    _convert_xls_cell(cell, workbook.datemode)
+                    for cell in sheet.row(row_index)
+                )
+        finally:
+            workbook.release_resources()
+    else:
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook[sheet_name]
+            for row in worksheet.iter_rows(values_only=True):
+                yield tuple(_convert_xlsx_value(value) for value in row)
+        finally:
+            workbook.close()
+
+
+def iter_sheet_records(
+    file_path: str,
+    sheet_name: str,
+    header_row: Optional[int] = 0,
+    skip_rows: SkipRows = None
+) -> Iterator[Dict[Any, Any]]:
+    """
+    Yield sheet rows as dicts keyed by the header row
+
+    Header handling mirrors ``pd.read_excel``: rows listed in ``skip_rows`` are
+    dropped first, ``header_row`` indexes the remaining rows, empty header cells
+    become ``Unnamed: N`` and duplicated names get a ``.N`` suffix. Blank rows
+    are kept between data rows but trailing blank rows are dropped.
+
+    Args:
+        file_path: Path to Excel file
+        sheet_name: Name of sheet to read
+        header_row: Index of the header row (None for positional column keys)
+        skip_rows: Number of leading rows, or row indices, to skip
+
+    Yields:
+        Dictionary record per data row
+    """
+    if isinstance(skip_rows, int):
+        skip = set(range(skip_rows))
+    else:
+        skip = set(skip_rows or [])
+
+    columns: Optional[List[Any]] = None
+    pending_blank_rows = 0
+    logical_index = -1
+
+    for physical_index, values in enumerate(iter_sheet_values(file_path, sheet_name)):
+        if physical_index in skip:
+            continue
+        logical_index += 1
+
+        if header_row is not None:
+            if logical_index < header_row:
+                continue
+            if logical_index == header_row:
+                columns = _build_header(values)
+                continue
+
+        if columns is None:
+            columns = []
+        if len(values) > len(columns):
+            columns = _extend_columns(columns, len(values), positional=header_row is None)
+
+        if all(value is None for value in values):
+            pending_blank_rows += 1
+            continue
+
+        # Blank rows followed by data are part of the sheet, emit them now
+        for _ in range(pending_blank_rows):
+            yield dict.fromkeys(columns)
+        pending_blank_rows = 0
+
+        record = dict.fromkeys(columns)
+        record.update(zip(columns, values))
+        yield record
+
+
+def iter_sheet_chunks(
+    file_path: str,
+    sheet_name: str,
+    chunk_size: int,
+    header_row: Optional[int] = 0,
+    skip_rows: SkipRows = None
+) -> Iterator[List[Dict[Any, Any]]]:
+    """
+    Group streamed sheet records into lists of at most ``chunk_size``
+
+    Yields:
+        List of dictionary records
+    """
+    chunk: List[Dict[Any, Any]] = []
+    for record in iter_sheet_records(file_path, sheet_name, header_row, skip_rows):
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ParallelSheetReader:
+    """
+    Stream several sheets of one workbook from worker processes.
+
+    Every sheet is parsed by its own worker, which pushes record chunks onto a
+    per-sheet bounded queue. Sheets are consumed in order; workers that run ahead
+    block once their queue is full, so memory is bounded by
+    ``len(sheets) * queue_size * chunk_size`` records.
+
+    A sheet that is abandoned before its end must be ``discard``-ed, otherwise
+    its worker stays blocked on the full queue and, with fewer workers than
+    sheets, the next sheet never starts. ``open``, ``discard`` and ``close``
+    block (process start-up, draining), so async callers run them off the
+    event loop.
+
+    Example:
+        with ParallelSheetReader(path, sheets, chunk_size=10000) as reader:
+            for sheet_name in sheets:
+                for record in reader.iter_records(sheet_name):
+                    ...
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        sheet_names: Sequence[str],
+        chunk_size: int = 10000,
+        header_row: Optional[int] = 0,
+        skip_rows: SkipRows = None,
+        max_workers: Optional[int] = None,
+        queue_size: int = 4
+    ):
+        self.file_path = file_path
+        self.sheet_names = list(sheet_names)
+        self.chunk_size = chunk_size
+        self.header_row = header_row
+        self.skip_rows = skip_rows
+        self.max_workers = max_workers or min(len(self.sheet_names), multiprocessing.cpu_count()) or 1
+        self.queue_size = queue_size
+        self._manager = None
+        self._executor = None
+        self._queues: Dict[str, Any] = {}
+        self._futures: Dict[str, Future] = {}
+        self._finished: set = set()
+
+    def __enter__(self) -> "ParallelSheetReader":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self) -> "ParallelSheetReader":
+        """Start the queue manager and submit one worker per sheet"""
+        self._manager = multiprocessing.Manager()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        # Submitted in consumption order so an earlier sheet never waits on a later one
+        for sheet_name in self.sheet_names:
+            queue = self._manager.Queue(maxsize=self.queue_size)
+            self._queues[sheet_name] = queue
+            self._futures[sheet_name] = self._executor.submit(
+                _stream_sheet_to_queue,
+                self.file_path,
+                sheet_name,
+                self.chunk_size,
+                self.header_row,
+                self.skip_rows,
+                queue
+            )
+        return self
+
+    def close(self):
+        """Stop the workers (draining running ones) and the queue manager"""
+        if self._executor is not None:
+            for sheet_name, future in self._futures.items():
+                if sheet_name in self._finished:
+                    continue
+                # Sheets not started yet are dropped, running ones are drained
+                # so their workers are not left blocked on a full queue
+                if not future.cancel():
+                    _drain_queue(self._queues[sheet_name], future)
+            self._executor.shutdown(wait=True)
+        if self._manager is not None:
+            self._manager.shutdown()
+        self._queues = {}
+        self._futures = {}
+        self._finished = set()
+
+    def discard(self, sheet_name: str):
+        """
+        Drop the unread rest of a sheet so its worker can finish
+
+        Call when a sheet is abandoned before ``iter_records`` reached its end.
+        """
+        if sheet_name in self._finished:
+            return
+        future = self._futures[sheet_name]
+        if not future.cancel():
+            _drain_queue(self._queues[sheet_name], future)
+        self._finished.add(sheet_name)
+
+    def iter_records(self, sheet_name: str) -> Iterator[Dict[Any, Any]]:
+        """
+        Yield the records of one sheet as its worker produces them
+
+        Raises:
+            FileProcessingException: If the worker failed to read the sheet
+                or exited without finishing it
+        """
+        queue = self._queues[sheet_name]
+        future = self._futures[sheet_name]
+        while True:
+            try:
+                kind, payload = queue.get(timeout=1)
+            except queue_module.Empty:
+                if not future.done():
+                    continue
+                # Everything the worker put is queued once it is done
+                try:
+                    kind, payload = queue.get_nowait()
+                except queue_module.Empty:
+                    self._finished.add(sheet_name)
+                    raise FileProcessingException(
+                        f"Failed to read Excel sheet '{sheet_name}': worker exited before finishing the sheet"
+                    )
+            if kind == "rows":
+                yield from payload
+                continue
+            self._finished.add(sheet_name)
+            if kind == "done":
+                return
+            raise FileProcessingException(f"Failed to read Excel sheet '{sheet_name}': {payload}")
+
+
+def _stream_sheet_to_queue(
+    file_path: str,
+    sheet_name: str,
+    chunk_size: int,
+    header_row: Optional[int],
+    skip_rows: SkipRows,
+    queue: Any
+):
+    """Worker entry point: push record chunks of one sheet onto ``queue``"""
+    try:
+        for chunk in iter_sheet_chunks(file_path, sheet_name, chunk_size, header_row, skip_rows):
+            queue.put(("rows", chunk))
+        queue.put(("done", None))
+    except Exception as e:
+        queue.put(("error", str(e)))
+
+
+def _drain_queue(queue: Any, future: Future):
+    """Consume a sheet queue until its worker signals completion or exits"""
+    while True:
+        try:
+            kind, _ = queue.get(timeout=1)
+        except queue_module.Empty:
+            if future.done():
+                return
+            continue
+        if kind != "rows":
+            return
+
+
+def _build_header(values: Sequence[Any]) -> List[str]:
+    """Build column names the way pandas does for an Excel header row"""
+    columns: List[str] = []
+    seen: Dict[str, int] = {}
+    for position, value in enumerate(values):
+        name = f"Unnamed: {position}" if value is None or value == "" else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        columns.append(name)
+    return columns
+
+
+def _extend_columns(columns: List[Any], width: int, positional: bool) -> List[Any]:
+    """Add names for cells beyond the header width"""
+    extra = range(len(columns), width)
+    if positional:
+        return columns + list(extra)
+    return columns + [f"Unnamed: {position}" for position in extra]
+
+
+def _convert_xlsx_value(value: Any) -> Any:
+    """Normalize an openpyxl cell value (integral floats become ints)"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _convert_xls_cell(cell: Any, datemode: int) -> Any:
+    """Convert an xlrd cell to a Python value"""
+    if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR):
+        return None
+    if cell.ctype == xlrd.XL_CELL_DATE:
+        try:
+            return xlrd.xldate_as_datetime(cell.value, datemode)
+        except Exception:
+            return cell.value
+    if cell.ctype == xlrd.XL_CELL_BOOLEAN:
+        return bool(cell.value)
+    if cell.ctype == xlrd.XL_CELL_NUMBER and float(cell.value).is_integer():
+        return int(cell.value)
+    return cell.value
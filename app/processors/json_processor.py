@@ -3,14 +3,20 @@
 # ==============================================
 import json
 import ijson
-from typing import Dict, List, Any, Optional, Tuple, Iterator, Union
+from functools import partial
+from typing import Dict, List, Any, Optional, Tuple, Iterator, AsyncIterator, Union
 from pathlib import Path
 from datetime import datetime
 import pandas as pd
 from collections import defaultdict
 
 from .base_processor import BaseProcessor
+from .column_profiler import profile_values
+from .csv_partitioner import is_partitionable_encoding
+from .jsonl_reader import DEFAULT_BLOCK_BYTES, iter_jsonl_blocks
+from .record_flattener import RecordFlattener
 from app.core.exceptions import FileProcessingException
+from app.core.executors import cpu_executor, cpu_pool_available, iterate_blocking, run_blocking, run_cpu_bound
 from app.infrastructure.db.models.raw_data.file_registry import FileRegistry
 from app.utils.logger import get_logger
 
@@ -34,7 +40,7 @@ class JSONProcessor(BaseProcessor):
             batch_id: Optional batch ID
             **kwargs: Additional configuration options
         """
-        super().__init__(db_session, batch_id)
+        super().__init__(db_session, batch_id, **kwargs)
         
         # JSON-specific configuration
         self.json_path = kwargs.get('json_path', None)      # JSONPath for nested data
@@ -44,6 +50,16 @@ class JSONProcessor(BaseProcessor):
         self.chunk_size = kwargs.get('chunk_size', 5000)   # Records per chunk
         self.encoding = kwargs.get('encoding', 'utf-8')    # File encoding
         self.strict_mode = kwargs.get('strict_mode', False) # Strict JSON parsing
+        # Module-level list handler so the flattener can be sent to parse workers
+        self.flattener = RecordFlattener(
+            partial(handle_json_array, array_handling=self.array_handling),
+            max_depth=self.max_depth
+        )
+        
+        # JSONL parsing: byte blocks, parsed in the shared process pool for large files
+        self.parallel_parsing = kwargs.get('parallel_parsing', True)
+        self.parallel_min_bytes = kwargs.get('parallel_min_bytes', 16 * 1024 * 1024)
+        self.block_bytes = kwargs.get('block_bytes', DEFAULT_BLOCK_BYTES)
         
         # Supported JSON structures
         self.json_types = {
@@ -132,16 +148,8 @@ class JSONProcessor(BaseProcessor):
             
             for field_path, field_info in schema_info.items():
                 column_info = {
-                    "name": field_path,
+                    **field_info['profile'],
                     "position": len(columns_info),
-                    "data_type": field_info['detected_type'],
-                    "sample_values": field_info['sample_values'][:10],
-                    "null_count": field_info['null_count'],
-                    "unique_count": len(field_info['unique_values']),
-                    "total_count": field_info['total_count'],
-                    "min_length": field_info.get('min_length'),
-                    "max_length": field_info.get('max_length'),
-                    "null_percentage": round((field_info['null_count'] / field_info['total_count']) * 100, 2),
                     "json_path": field_path,
                     "nested_level": field_path.count('.'),
                     "field_type": field_info['field_type']  # 'primitive', 'object', 'array'
@@ -264,7 +272,9 @@ class JSONProcessor(BaseProcessor):
             if json_structure['type'] == 'jsonl':
                 record_iterator = self._read_jsonl_chunks(file_path)
             else:
-                record_iterator = self._read_json_chunks(file_path, json_structure)
+                record_iterator = iterate_blocking(
+                    self._read_json_chunks(file_path, json_structure), batch_size=self.chunk_size
+                )
             
             processing_stats = await self.process_records(record_iterator, file_registry)
             
@@ -287,6 +297,18 @@ class JSONProcessor(BaseProcessor):
         """
         Detect the type of JSON structure in the file
         
+        Args:
+            file_path: Path to JSON file
+            
+        Returns:
+            Dictionary with structure type and metadata
+        """
+        return await run_blocking(self._read_json_structure, file_path)
+    
+    def _read_json_structure(self, file_path: str) -> Dict[str, Any]:
+        """
+        Detect the type of JSON structure by reading the start of the file
+        
         Args:
             file_path: Path to JSON file
             
@@ -365,55 +387,74 @@ class JSONProcessor(BaseProcessor):
         """
         try:
             json_structure = await self._detect_json_structure(file_path)
-            sample_records = []
+            return await run_blocking(self._read_sample_records, file_path, json_structure, max_records)
             
-            if json_structure['type'] == 'jsonl':
-                # Line-delimited JSON
-                with open(file_path, 'r', encoding=self.encoding) as file:
-                    for i, line in enumerate(file):
-                        if i >= max_records:
-                            break
-                        try:
-                            record = json.loads(line.strip())
-                            if self.flatten_nested:
-                                record = self._flatten_json(record)
-                            sample_records.append(record)
-                        except json.JSONDecodeError:
-                            continue
-            
-            elif json_structure['type'] == 'array_of_objects':
-                # Array of objects
-                with open(file_path, 'r', encoding=self.encoding) as file:
-                    parser = ijson.items(file, 'item')
-                    for i, record in enumerate(parser):
-                        if i >= max_records:
-                            break
+        except Exception as e:
+            self.logger.error(f"Error getting sample records: {str(e)}")
+            return []
+    
+    def _read_sample_records(
+        self,
+        file_path: str,
+        json_structure: Dict[str, Any],
+        max_records: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse up to ``max_records`` records
+        
+        Args:
+            file_path: Path to JSON file
+            json_structure: Result of ``_detect_json_structure``
+            max_records: Maximum number of records to sample
+            
+        Returns:
+            List of sample records
+        """
+        sample_records = []
+        
+        if json_structure['type'] == 'jsonl':
+            # Line-delimited JSON
+            with open(file_path, 'r', encoding=self.encoding) as file:
+                for i, line in enumerate(file):
+                    if i >= max_records:
+                        break
+                    try:
+                        record = json.loads(line.strip())
                         if self.flatten_nested:
                             record = self._flatten_json(record)
                         sample_records.append(record)
-            
-            elif json_structure['type'] == 'single_object':
-                # Single object - extract records from nested structure
-                with open(file_path, 'r', encoding=self.encoding) as file:
-                    data = json.load(file)
-                    
-                if self.json_path:
-                    # Use JSONPath to extract data
-                    records = self._extract_by_path(data, self.json_path)
-                else:
-                    # Auto-detect arrays in the object
-                    records = self._auto_extract_records(data)
-                
-                for i, record in enumerate(records[:max_records]):
+                    except json.JSONDecodeError:
+                        continue
+        
+        elif json_structure['type'] == 'array_of_objects':
+            # Array of objects
+            with open(file_path, 'r', encoding=self.encoding) as file:
+                parser = ijson.items(file, 'item')
+                for i, record in enumerate(parser):
+                    if i >= max_records:
+                        break
                     if self.flatten_nested:
                         record = self._flatten_json(record)
                     sample_records.append(record)
+        
+        elif json_structure['type'] == 'single_object':
+            # Single object - extract records from nested structure
+            with open(file_path, 'r', encoding=self.encoding) as file:
+                data = json.load(file)
+                
+            if self.json_path:
+                # Use JSONPath to extract data
+                records = self._extract_by_path(data, self.json_path)
+            else:
+                # Auto-detect arrays in the object
+                records = self._auto_extract_records(data)
             
-            return sample_records
-            
-        except Exception as e:
-            self.logger.error(f"Error getting sample records: {str(e)}")
-            return []
+            for i, record in enumerate(records[:max_records]):
+                if self.flatten_nested:
+                    record = self._flatten_json(record)
+                sample_records.append(record)
+        
+        return sample_records
     
     def _read_json_chunks(self, file_path: str, json_structure: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
@@ -467,9 +508,66 @@ class JSONProcessor(BaseProcessor):
             self.logger.error(f"Error reading JSON chunks: {str(e)}")
             raise FileProcessingException(f"Failed to read JSON file: {str(e)}")
     
-    def _read_jsonl_chunks(self, file_path: str) -> Iterator[Dict[str, Any]]:
+    async def _read_jsonl_chunks(self, file_path: str) -> AsyncIterator[Dict[str, Any]]:
         """
-        Read JSONL (line-delimited JSON) file in chunks
+        Read JSONL (line-delimited JSON) file in byte blocks
+        
+        Blocks are split on newlines without decoding the file. Large files are
+        parsed in the shared process pool (see ``_use_parallel_parsing``),
+        others on the blocking I/O pool, one block ahead. Records are yielded
+        in file order.
+        
+        Args:
+            file_path: Path to JSONL file
+            
+        Yields:
+            Dictionary records from JSONL
+        """
+        if not is_partitionable_encoding(self.encoding):
+            # Newline bytes are ambiguous in UTF-16/32; read as text on the blocking I/O pool
+            async for record in iterate_blocking(self._read_jsonl_text(file_path), batch_size=self.chunk_size):
+                yield record
+            return
+        
+        parallel = self._use_parallel_parsing(file_path)
+        try:
+            blocks = iter_jsonl_blocks(
+                file_path,
+                encoding=self.encoding,
+                flattener=self.flattener if self.flatten_nested else None,
+                run=run_cpu_bound if parallel else run_blocking,
+                max_pending=cpu_executor.max_workers * 2 if parallel else 2,
+                block_bytes=self.block_bytes
+            )
+            async for first_line, (records, errors, _) in blocks:
+                for line_number, message in errors:
+                    self.logger.warning(f"Invalid JSON on line {first_line + line_number - 1}: {message}")
+                for record in records:
+                    yield record
+                    
+        except Exception as e:
+            self.logger.error(f"Error reading JSONL chunks: {str(e)}")
+            raise FileProcessingException(f"Failed to read JSONL file: {str(e)}")
+    
+    def _use_parallel_parsing(self, file_path: str) -> bool:
+        """
+        Whether JSONL blocks are parsed in the shared process pool
+        
+        Args:
+            file_path: Path to JSONL file
+            
+        Returns:
+            True for large files where worker processes are available
+        """
+        if not self.parallel_parsing or self._get_file_size(file_path) < self.parallel_min_bytes:
+            return False
+        
+        # Celery prefork children are daemonic and cannot spawn worker processes
+        return cpu_pool_available()
+    
+    def _read_jsonl_text(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Read JSONL (line-delimited JSON) file line by line in text mode
         
         Args:
             file_path: Path to JSONL file
@@ -510,36 +608,17 @@ class JSONProcessor(BaseProcessor):
             self.logger.error(f"Error reading JSONL chunks: {str(e)}")
             raise FileProcessingException(f"Failed to read JSONL file: {str(e)}")
     
-    def _flatten_json(self, obj: Any, parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
+    def _flatten_json(self, obj: Any) -> Any:
         """
         Flatten nested JSON object
         
         Args:
             obj: JSON object to flatten
-            parent_key: Parent key for nested objects
-            sep: Separator for nested keys
             
         Returns:
-            Flattened dictionary
+            Flattened dictionary (arrays are converted by ``_handle_array``)
         """
-        items = []
-        
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                new_key = f"{parent_key}{sep}{k}" if parent_key else k
-                
-                if isinstance(v, dict) and len(str(v)) < 1000:  # Avoid very deep nesting
-                    items.extend(self._flatten_json(v, new_key, sep=sep).items())
-                elif isinstance(v, list):
-                    items.append((new_key, self._handle_array(v)))
-                else:
-                    items.append((new_key, v))
-        elif isinstance(obj, list):
-            return self._handle_array(obj)
-        else:
-            return obj
-        
-        return dict(items)
+        return self.flattener.flatten(obj)
     
     def _handle_array(self, arr: List[Any]) -> Any:
         """
@@ -551,17 +630,7 @@ class JSONProcessor(BaseProcessor):
         Returns:
             Processed array value
         """
-        if not arr:
-            return None
-        
-        if self.array_handling == 'separate_records':
-            # For now, convert to JSON string (could be expanded to create separate records)
-            return json.dumps(arr)
-        elif self.array_handling == 'join_string':
-            # Join array elements as string
-            return ', '.join(str(item) for item in arr)
-        else:  # json_string
-            return json.dumps(arr)
+        return handle_json_array(arr, self.array_handling)
     
     def _auto_extract_records(self, data: Any) -> List[Dict[str, Any]]:
         """
@@ -639,9 +708,7 @@ class JSONProcessor(BaseProcessor):
         """
         schema = defaultdict(lambda: {
             'field_type': 'primitive',
-            'detected_type': 'STRING',
-            'sample_values': [],
-            'unique_values': set(),
+            'values': [],
             'null_count': 0,
             'total_count': 0
         })
@@ -649,21 +716,15 @@ class JSONProcessor(BaseProcessor):
         for record in records:
             self._analyze_record_schema(record, schema, '')
         
-        # Convert sets to lists and finalize analysis
-        for field_path, field_info in schema.items():
-            field_info['unique_values'] = list(field_info['unique_values'])
-            field_info['sample_values'] = list(field_info['sample_values'])[:10]
-            
-            # Detect final data type
-            if field_info['sample_values']:
-                field_info['detected_type'] = self._detect_data_type(field_info['sample_values'])
-            
-            # Calculate string lengths for string fields
-            if field_info['detected_type'] == 'STRING':
-                lengths = [len(str(val)) for val in field_info['sample_values'] if val]
-                if lengths:
-                    field_info['min_length'] = min(lengths)
-                    field_info['max_length'] = max(lengths)
+        # Profile all fields at once
+        profiles = profile_values(
+            {field_path: field_info['values'] for field_path, field_info in schema.items()},
+            total_counts={field_path: field_info['total_count'] for field_path, field_info in schema.items()},
+            null_counts={field_path: field_info['null_count'] for field_path, field_info in schema.items()}
+        )
+        for (field_path, field_info), field_profile in zip(schema.items(), profiles):
+            del field_info['values']
+            field_info['profile'] = field_profile
         
         return dict(schema)
     
@@ -687,11 +748,10 @@ class JSONProcessor(BaseProcessor):
                     self._analyze_record_schema(value, schema, field_path)
                 elif isinstance(value, list):
                     schema[field_path]['field_type'] = 'array'
-                    schema[field_path]['sample_values'].append(str(value)[:100])
+                    schema[field_path]['values'].append(str(value)[:100])
                 else:
                     schema[field_path]['field_type'] = 'primitive'
-                    schema[field_path]['sample_values'].append(value)
-                    schema[field_path]['unique_values'].add(value)
+                    schema[field_path]['values'].append(value)
                 
                 schema[field_path]['total_count'] += 1
     
@@ -767,4 +827,28 @@ class JSONProcessor(BaseProcessor):
         elif isinstance(obj, list) and obj:
             return max([self._calculate_nesting_depth(item, depth + 1) for item in obj] + [depth])
         else:
-            return depth
\ No newline at end of file
+            return depth
+
+
+def handle_json_array(arr: List[Any], array_handling: str) -> Any:
+    """
+    Convert an array value according to ``array_handling``
+    
+    Args:
+        arr: Array to handle
+        array_handling: 'separate_records', 'join_string' or 'json_string'
+        
+    Returns:
+        Processed array value
+    """
+    if not arr:
+        return None
+    
+    if array_handling == 'separate_records':
+        # For now, convert to JSON string (could be expanded to create separate records)
+        return json.dumps(arr)
+    elif array_handling == 'join_string':
+        # Join array elements as string
+        return ', '.join(str(item) for item in arr)
+    else:  # json_string
+        return json.dumps(arr)
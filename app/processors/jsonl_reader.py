@@ -0,0 +1,172 @@
+# ==============================================
+# app/processors/jsonl_reader.py
+# ==============================================
+"""
+Byte-level JSONL parsing.
+
+The file is split into newline-aligned byte blocks with ``rfind`` on a
+memory-mapped view, so the reader never decodes or copies the file to find
+lines. Each block is read, split on ``\\n`` and parsed by
+``parse_jsonl_block``. For ASCII-compatible UTF-8 files ``json.loads`` is fed
+the raw bytes. Blocks are independent, so ``iter_jsonl_blocks`` can parse
+them in a process pool (e.g. ``app.core.executors.run_cpu_bound``). The pool
+only receives byte offsets, and records come back in file order.
+
+Line numbers are 1-based and count blank lines, like enumerating the file in
+text mode. A block only knows its own line numbers, and the caller adds the
+lines of the preceding blocks.
+
+The functions here are module level so blocks can be parsed inside worker
+processes.
+"""
+import asyncio
+import codecs
+import json
+import mmap
+import os
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Iterator, List, Optional, Tuple
+
+from .record_flattener import RecordFlattener
+
+DEFAULT_BLOCK_BYTES = 4 * 1024 * 1024
+
+# Encodings json.loads detects from the bytes themselves
+_NATIVE_ENCODINGS = ('utf-8', 'utf-8-sig', 'ascii')
+
+# (records, [(line number in block, error message)], lines in block)
+BlockResult = Tuple[List[Any], List[Tuple[int, str]], int]
+
+
+def plan_blocks(file_path: str, block_bytes: int = DEFAULT_BLOCK_BYTES) -> Iterator[Tuple[int, int]]:
+    """
+    Split a JSONL file into newline-aligned byte ranges
+
+    Args:
+        file_path: Path to JSONL file
+        block_bytes: Target block size; a block grows to the end of a line
+            that is longer
+
+    Yields:
+        ``(start, end)`` byte offsets in file order
+    """
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return
+
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start = 0
+        while start < size:
+            end = start + block_bytes
+            if end < size:
+                newline = mapped.rfind(b'\n', start, end)
+                if newline == -1:
+                    newline = mapped.find(b'\n', end)
+                end = newline + 1 if newline != -1 else size
+            else:
+                end = size
+            yield start, end
+            start = end
+
+
+def parse_jsonl_block(
+    file_path: str,
+    start: int,
+    end: int,
+    encoding: str = 'utf-8',
+    flattener: Optional[RecordFlattener] = None
+) -> BlockResult:
+    """
+    Parse the JSONL lines in ``[start, end)``
+
+    Args:
+        file_path: Path to JSONL file
+        start: Offset of the first line
+        end: Offset after the last line
+        encoding: File encoding (must be ASCII compatible)
+        flattener: Flattens each parsed record when given
+
+    Returns:
+        (records in order, [(line number within the block, error)], number of
+        lines in the block)
+    """
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    lines = data.split(b'\n')
+    if lines and not lines[-1]:
+        # Terminating newline of the block's last line
+        lines.pop()
+
+    decode = None if codecs.lookup(encoding).name in _NATIVE_ENCODINGS else encoding
+    flatten = flattener.flatten if flattener is not None else None
+    loads = json.loads
+
+    records: List[Any] = []
+    errors: List[Tuple[int, str]] = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = loads(line.decode(decode) if decode else line)
+        except (ValueError, UnicodeDecodeError) as e:
+            errors.append((line_number, str(e)))
+            continue
+        records.append(flatten(record) if flatten is not None else record)
+
+    return records, errors, len(lines)
+
+
+async def iter_jsonl_blocks(
+    file_path: str,
+    encoding: str = 'utf-8',
+    flattener: Optional[RecordFlattener] = None,
+    run: Optional[Callable[..., Awaitable[BlockResult]]] = None,
+    max_pending: int = 1,
+    block_bytes: int = DEFAULT_BLOCK_BYTES
+) -> AsyncIterator[Tuple[int, BlockResult]]:
+    """
+    Parse a JSONL file block by block, in file order
+
+    With ``run``, up to ``max_pending`` blocks are parsed concurrently; without
+    it, blocks are parsed inline one at a time.
+
+    Args:
+        file_path: Path to JSONL file
+        encoding: File encoding (must be ASCII compatible)
+        flattener: Flattens each parsed record when given
+        run: Coroutine function running ``parse_jsonl_block`` in a pool,
+            e.g. ``run_cpu_bound``
+        max_pending: Blocks in flight in the pool
+        block_bytes: Target block size
+
+    Yields:
+        (file line number of the block's first line, block result)
+    """
+    first_line = 1
+    if run is None:
+        for start, end in plan_blocks(file_path, block_bytes):
+            result = parse_jsonl_block(file_path, start, end, encoding, flattener)
+            yield first_line, result
+            first_line += result[2]
+        return
+
+    pending: Deque[asyncio.Future] = deque()
+    try:
+        for start, end in plan_blocks(file_path, block_bytes):
+            pending.append(asyncio.ensure_future(
+                run(parse_jsonl_block, file_path, start, end, encoding, flattener)
+            ))
+            if len(pending) >= max_pending:
+                result = await pending.popleft()
+                yield first_line, result
+                first_line += result[2]
+        while pending:
+            result = await pending.popleft()
+            yield first_line, result
+            first_line += result[2]
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,153 @@
+# ==============================================
+# app/processors/record_flattener.py
+# ==============================================
+"""
+Nested record flattening shared by the JSON, XML and API processors.
+
+Records are flattened with an explicit stack instead of recursion, and nesting
+is bounded by ``max_depth`` (the number of segments in an output key path)
+instead of serializing every nested dict to measure it.
+
+Feeds repeat the same structure record after record, so the first walk over a
+structure also records a *plan*: the key paths and their pre-joined output
+keys. Later records with the same top-level keys replay the plan, which only
+checks that every nested dict still has the expected keys and copies the leaf
+values. A record that does not match its plan is walked again and its plan is
+replaced.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_MAX_DEPTH = 10
+DEFAULT_MAX_PLANS = 256
+
+# Plan entry kinds besides a nested (child keys, child entries) plan
+_LEAF = object()    # scalar or list value
+_OPAQUE = object()  # value at the depth limit, kept whole even if it is a dict
+
+PlanEntry = Tuple[Any, Any, Any]
+
+
+class RecordFlattener:
+    """
+    Flattens nested dicts into ``{"a.b.c": value}`` records.
+
+    Lists are not expanded; they are passed to ``list_handler``, which returns
+    the stored value (e.g. a JSON string). Dicts nested deeper than
+    ``max_depth`` path segments are kept as values.
+    """
+
+    def __init__(
+        self,
+        list_handler: Callable[[List[Any]], Any],
+        sep: str = '.',
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        max_plans: int = DEFAULT_MAX_PLANS
+    ):
+        """
+        Initialize flattener
+
+        Args:
+            list_handler: Converts list values to the stored value
+            sep: Separator between key path segments
+            max_depth: Maximum number of segments in an output key
+            max_plans: Maximum number of cached structure plans
+        """
+        self.list_handler = list_handler
+        self.sep = sep
+        self.max_depth = max(1, max_depth)
+        self.max_plans = max_plans
+        # Plans keyed by the record's top-level keys (in order)
+        self._plans: Dict[Tuple[Any, ...], List[PlanEntry]] = {}
+
+    def flatten(self, record: Any) -> Any:
+        """
+        Flatten one record
+
+        Args:
+            record: Parsed record
+
+        Returns:
+            Flattened dictionary; lists go through ``list_handler`` and other
+            values are returned unchanged
+        """
+        if isinstance(record, list):
+            return self.list_handler(record)
+        if not isinstance(record, dict):
+            return record
+
+        keys = tuple(record)
+        plan = self._plans.get(keys)
+        if plan is not None:
+            flattened = self._apply_plan(plan, record)
+            if flattened is not None:
+                return flattened
+
+        flattened: Dict[Any, Any] = {}
+        plan = self._walk(record, flattened)
+        if keys in self._plans or len(self._plans) < self.max_plans:
+            self._plans[keys] = plan
+        return flattened
+
+    def clear(self):
+        """Forget all cached plans"""
+        self._plans.clear()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Plans are rebuilt where the copy is used, e.g. in a worker process
+        state = self.__dict__.copy()
+        state['_plans'] = {}
+        return state
+
+    def _walk(self, record: Dict[Any, Any], flattened: Dict[Any, Any]) -> List[PlanEntry]:
+        """Flatten a record depth-first and build its plan on the way"""
+        sep = self.sep
+        max_depth = self.max_depth
+        list_handler = self.list_handler
+
+        root: List[PlanEntry] = []
+        stack = [(iter(record.items()), '', 1, root)]
+        while stack:
+            items, prefix, depth, entries = stack[-1]
+            for key, value in items:
+                out_key = f"{prefix}{sep}{key}" if prefix else key
+                if isinstance(value, dict):
+                    if depth < max_depth:
+                        child: List[PlanEntry] = []
+                        entries.append((key, out_key, (tuple(value), child)))
+                        # Descend now so keys keep their depth-first order
+                        stack.append((iter(value.items()), out_key, depth + 1, child))
+                        break
+                    entries.append((key, out_key, _OPAQUE))
+                    flattened[out_key] = value
+                else:
+                    entries.append((key, out_key, _LEAF))
+                    flattened[out_key] = list_handler(value) if isinstance(value, list) else value
+            else:
+                stack.pop()
+        return root
+
+    def _apply_plan(self, plan: List[PlanEntry], record: Dict[Any, Any]) -> Optional[Dict[Any, Any]]:
+        """Replay a plan; returns None when the record's structure differs"""
+        list_handler = self.list_handler
+
+        flattened: Dict[Any, Any] = {}
+        stack = [(iter(plan), record)]
+        while stack:
+            entries, node = stack[-1]
+            for key, out_key, child in entries:
+                value = node[key]
+                if child is _LEAF or child is _OPAQUE:
+                    if isinstance(value, list):
+                        value = list_handler(value)
+                    elif child is _LEAF and isinstance(value, dict):
+                        return None
+                    flattened[out_key] = value
+                else:
+                    child_keys, child_entries = child
+                    if not isinstance(value, dict) or tuple(value) != child_keys:
+                        return None
+                    stack.append((iter(child_entries), value))
+                    break
+            else:
+                stack.pop()
+        return flattened
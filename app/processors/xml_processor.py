@@ -12,7 +12,10 @@ import re
 from collections import defaultdict
 
 from .base_processor import BaseProcessor
+from .column_profiler import profile_values
+from .record_flattener import DEFAULT_MAX_DEPTH, RecordFlattener
 from app.core.exceptions import FileProcessingException
+from app.core.executors import iterate_blocking, run_blocking
 from app.infrastructure.db.models.raw_data.file_registry import FileRegistry
 from app.utils.logger import get_logger
 
@@ -37,7 +40,7 @@ class XMLProcessor(BaseProcessor):
             batch_id: Optional batch ID
             **kwargs: Additional configuration options
         """
-        super().__init__(db_session, batch_id)
+        super().__init__(db_session, batch_id, **kwargs)
         
         # XML-specific configuration
         self.record_xpath = kwargs.get('record_xpath', None)  # XPath for record elements
@@ -48,13 +51,20 @@ class XMLProcessor(BaseProcessor):
         self.chunk_size = kwargs.get('chunk_size', 5000)  # Records per chunk
         self.encoding = kwargs.get('encoding', 'utf-8')  # File encoding
         self.validate_xml = kwargs.get('validate_xml', True)  # Validate XML structure
+        self.streaming = kwargs.get('streaming', True)  # Use iterparse instead of loading the whole tree
         self.strip_whitespace = kwargs.get('strip_whitespace', True)  # Strip whitespace from text content
+        self.max_depth = kwargs.get('max_depth', DEFAULT_MAX_DEPTH)  # Maximum nesting depth of flattened keys
+        self.flattener = RecordFlattener(self._xml_list_value, max_depth=self.max_depth)
         
         # XML parsing options
         self.ignore_comments = kwargs.get('ignore_comments', True)
         self.ignore_processing_instructions = kwargs.get('ignore_processing_instructions', True)
         self.handle_mixed_content = kwargs.get('handle_mixed_content', True)
         
+        # Structure analysis cache keyed by (path, size, mtime); every entry point
+        # needs it and each analysis is a full pass over the file
+        self._structure_cache: Dict[Tuple[str, int, float], Dict[str, Any]] = {}
+        
     async def validate_file_format(self, file_path: str) -> Tuple[bool, str]:
         """
         Validate if file is valid XML format
@@ -87,14 +97,15 @@ class XMLProcessor(BaseProcessor):
             
             # Try to parse XML
             try:
-                tree = ET.parse(file_path)
-                root = tree.getroot()
-                
-                # Check if root element exists
-                if root is None:
-                    return False, "No root element found"
+                if not self.streaming:
+                    tree = await run_blocking(ET.parse, file_path)
+                    root = tree.getroot()
+                    
+                    # Check if root element exists
+                    if root is None:
+                        return False, "No root element found"
                 
-                # Detect XML structure
+                # Detect XML structure (parses the whole document)
                 structure_info = await self._analyze_xml_structure(file_path)
                 
                 if structure_info['record_count'] == 0:
@@ -136,16 +147,8 @@ class XMLProcessor(BaseProcessor):
             
             for field_path, field_info in schema_info.items():
                 column_info = {
-                    "name": field_path,
+                    **field_info['profile'],
                     "position": len(columns_info),
-                    "data_type": field_info['detected_type'],
-                    "sample_values": field_info['sample_values'][:10],
-                    "null_count": field_info['null_count'],
-                    "unique_count": len(field_info['unique_values']),
-                    "total_count": field_info['total_count'],
-                    "min_length": field_info.get('min_length'),
-                    "max_length": field_info.get('max_length'),
-                    "null_percentage": round((field_info['null_count'] / field_info['total_count']) * 100, 2),
                     "xml_path": field_path,
                     "element_type": field_info['element_type'],  # 'element', 'attribute', 'text'
                     "namespace": field_info.get('namespace')
@@ -272,7 +275,9 @@ class XMLProcessor(BaseProcessor):
             await self.save_column_structure(file_registry, structure_columns)
             
             # Process records
-            record_iterator = self._read_xml_records(file_path, structure_info)
+            record_iterator = iterate_blocking(
+                self._read_xml_records(file_path, structure_info), batch_size=self.chunk_size
+            )
             processing_stats = await self.process_records(record_iterator, file_registry)
             
             # Update processing statistics
@@ -301,78 +306,177 @@ class XMLProcessor(BaseProcessor):
         Returns:
             Dictionary with structure analysis results
         """
+        cache_key = self._structure_cache_key(file_path)
+        if cache_key in self._structure_cache:
+            return self._structure_cache[cache_key]
+        
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            if self.streaming:
+                structure_info = await run_blocking(self._analyze_xml_structure_streaming, file_path)
+            else:
+                structure_info = await run_blocking(self._analyze_xml_structure_tree, file_path)
+            
+            if cache_key:
+                self._structure_cache[cache_key] = structure_info
+            return structure_info
+            
+        except ET.ParseError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error analyzing XML structure: {str(e)}")
+            raise FileProcessingException(f"Failed to analyze XML structure: {str(e)}")
+    
+    def _analyze_xml_structure_tree(self, file_path: str) -> Dict[str, Any]:
+        """
+        Analyze XML structure on a fully loaded element tree
+        
+        Args:
+            file_path: Path to XML file
             
-            # Extract namespace information
-            namespaces = self._extract_namespaces(root)
+        Returns:
+            Dictionary with structure analysis results
+        """
+        tree = ET.parse(file_path)
+        root = tree.getroot()
+        
+        # Same namespace resolution as the streaming analysis, so both modes
+        # match the same record path
+        namespaces = self._scan_namespaces(file_path)
+        
+        # Analyze element structure
+        element_counts = defaultdict(int)
+        max_depth = 0
+        
+        def analyze_element(elem, depth=0):
+            nonlocal max_depth
+            max_depth = max(max_depth, depth)
             
-            # Analyze element structure
-            element_counts = defaultdict(int)
-            max_depth = 0
+            # Count elements at each level
+            element_counts[f"{depth}:{elem.tag}"] += 1
             
-            def analyze_element(elem, depth=0):
-                nonlocal max_depth
+            for child in elem:
+                analyze_element(child, depth + 1)
+        
+        analyze_element(root)
+        
+        structure_info = self._build_structure_info(root.tag, namespaces, element_counts, max_depth)
+        
+        # If user provided record_xpath, count elements matching it
+        if self.record_xpath:
+            structure_info['record_count'] = len(root.findall(self.record_xpath, namespaces))
+        
+        return structure_info
+    
+    def _analyze_xml_structure_streaming(self, file_path: str) -> Dict[str, Any]:
+        """
+        Analyze XML structure with iterparse, keeping memory flat
+        
+        Args:
+            file_path: Path to XML file
+            
+        Returns:
+            Dictionary with structure analysis results
+        """
+        namespaces = self._scan_namespaces(file_path)
+        
+        element_counts = defaultdict(int)
+        max_depth = 0
+        root_tag = None
+        
+        # Count matches of a user supplied record path in the same pass
+        record_steps = self._compile_record_path(self.record_xpath, namespaces) if self.record_xpath else None
+        custom_count = 0
+        
+        stack: List[ET.Element] = []
+        tags: List[str] = []
+        for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+            if event == 'start':
+                depth = len(stack)
+                if root_tag is None:
+                    root_tag = elem.tag
                 max_depth = max(max_depth, depth)
-                
-                # Count elements at each level
                 element_counts[f"{depth}:{elem.tag}"] += 1
-                
-                for child in elem:
-                    analyze_element(child, depth + 1)
-            
-            analyze_element(root)
-            
-            # Determine structure type and record pattern
-            structure_type = "single_record"
-            record_xpath = None
-            record_count = 1
-            
-            # Look for repeating patterns that might indicate records
-            level_1_elements = {tag.split(':', 1)[1]: count for tag, count in element_counts.items() 
-                              if tag.startswith('1:') and count > 1}
-            
-            if level_1_elements:
-                # Multiple elements at level 1 - likely array structure
-                most_common_element = max(level_1_elements, key=level_1_elements.get)
-                structure_type = "array_of_records"
-                record_xpath = f".//{most_common_element}"
-                record_count = level_1_elements[most_common_element]
+                stack.append(elem)
+                tags.append(elem.tag)
+                if record_steps and self._path_matches(record_steps, tags):
+                    custom_count += 1
             else:
-                # Look for deeper repeating patterns
-                for level in range(2, max_depth + 1):
-                    level_elements = {tag.split(':', 1)[1]: count for tag, count in element_counts.items() 
-                                    if tag.startswith(f'{level}:') and count > 1}
-                    
-                    if level_elements:
-                        most_common_element = max(level_elements, key=level_elements.get)
-                        structure_type = "nested_records"
-                        record_xpath = f".//{most_common_element}"
-                        record_count = level_elements[most_common_element]
-                        break
-            
-            # If user provided record_xpath, use it
-            if self.record_xpath:
-                record_xpath = self.record_xpath
-                # Count elements matching the xpath
-                matching_elements = root.findall(record_xpath, namespaces)
-                record_count = len(matching_elements)
-                structure_type = "custom_xpath"
-            
-            return {
-                "structure_type": structure_type,
-                "root_element": root.tag,
-                "namespaces": namespaces,
-                "record_xpath": record_xpath,
-                "record_count": record_count,
-                "max_depth": max_depth,
-                "element_counts": dict(element_counts)
-            }
+                stack.pop()
+                tags.pop()
+                self._release_element(elem, stack[-1] if stack else None)
+        
+        structure_info = self._build_structure_info(root_tag, namespaces, element_counts, max_depth)
+        
+        if self.record_xpath:
+            if record_steps is None:
+                # Record path not expressible as a streaming match, count on the tree
+                tree = ET.parse(file_path)
+                custom_count = len(tree.getroot().findall(self.record_xpath, namespaces))
+            structure_info['record_count'] = custom_count
+        
+        return structure_info
+    
+    def _build_structure_info(
+        self,
+        root_tag: str,
+        namespaces: Dict[str, str],
+        element_counts: Dict[str, int],
+        max_depth: int
+    ) -> Dict[str, Any]:
+        """
+        Determine structure type and record path from element counts
+        
+        Args:
+            root_tag: Tag of the document root
+            namespaces: Namespace prefix mapping
+            element_counts: Element counts keyed by "depth:tag"
+            max_depth: Maximum element depth
             
-        except Exception as e:
-            self.logger.error(f"Error analyzing XML structure: {str(e)}")
-            raise FileProcessingException(f"Failed to analyze XML structure: {str(e)}")
+        Returns:
+            Dictionary with structure analysis results
+        """
+        # Determine structure type and record pattern
+        structure_type = "single_record"
+        record_xpath = None
+        record_count = 1
+        
+        # Look for repeating patterns that might indicate records
+        level_1_elements = {tag.split(':', 1)[1]: count for tag, count in element_counts.items() 
+                          if tag.startswith('1:') and count > 1}
+        
+        if level_1_elements:
+            # Multiple elements at level 1 - likely array structure
+            most_common_element = max(level_1_elements, key=level_1_elements.get)
+            structure_type = "array_of_records"
+            record_xpath = f".//{most_common_element}"
+            record_count = level_1_elements[most_common_element]
+        else:
+            # Look for deeper repeating patterns
+            for level in range(2, max_depth + 1):
+                level_elements = {tag.split(':', 1)[1]: count for tag, count in element_counts.items() 
+                                if tag.startswith(f'{level}:') and count > 1}
+                
+                if level_elements:
+                    most_common_element = max(level_elements, key=level_elements.get)
+                    structure_type = "nested_records"
+                    record_xpath = f".//{most_common_element}"
+                    record_count = level_elements[most_common_element]
+                    break
+        
+        # If user provided record_xpath, use it
+        if self.record_xpath:
+            record_xpath = self.record_xpath
+            structure_type = "custom_xpath"
+        
+        return {
+            "structure_type": structure_type,
+            "root_element": root_tag,
+            "namespaces": namespaces,
+            "record_xpath": record_xpath,
+            "record_count": record_count,
+            "max_depth": max_depth,
+            "element_counts": dict(element_counts)
+        }
     
     async def _get_sample_records(self, file_path: str, max_records: int) -> List[Dict[str, Any]]:
         """
@@ -387,33 +491,60 @@ class XMLProcessor(BaseProcessor):
         """
         try:
             structure_info = await self._analyze_xml_structure(file_path)
+            return await run_blocking(self._read_sample_records, file_path, structure_info, max_records)
             
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+        except Exception as e:
+            self.logger.error(f"Error getting sample records: {str(e)}")
+            return []
+    
+    def _read_sample_records(
+        self,
+        file_path: str,
+        structure_info: Dict[str, Any],
+        max_records: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse up to ``max_records`` records
+        
+        Args:
+            file_path: Path to XML file
+            structure_info: Result of ``_analyze_xml_structure``
+            max_records: Maximum number of records to sample
             
+        Returns:
+            List of sample records
+        """
+        if self.streaming:
+            # Stop parsing as soon as enough records were read
             sample_records = []
+            for record in self._read_xml_records(file_path, structure_info):
+                sample_records.append(record)
+                if len(sample_records) >= max_records:
+                    break
+            return sample_records
+        
+        tree = ET.parse(file_path)
+        root = tree.getroot()
+        
+        sample_records = []
+        
+        if structure_info['record_xpath']:
+            # Use xpath to find record elements
+            record_elements = root.findall(structure_info['record_xpath'], structure_info['namespaces'])
             
-            if structure_info['record_xpath']:
-                # Use xpath to find record elements
-                record_elements = root.findall(structure_info['record_xpath'], structure_info['namespaces'])
-                
-                for i, element in enumerate(record_elements[:max_records]):
-                    record = self._element_to_dict(element)
-                    if self.flatten_nested:
-                        record = self._flatten_xml_record(record)
-                    sample_records.append(record)
-            else:
-                # Treat root as single record
-                record = self._element_to_dict(root)
+            for i, element in enumerate(record_elements[:max_records]):
+                record = self._element_to_dict(element)
                 if self.flatten_nested:
                     record = self._flatten_xml_record(record)
                 sample_records.append(record)
-            
-            return sample_records
-            
-        except Exception as e:
-            self.logger.error(f"Error getting sample records: {str(e)}")
-            return []
+        else:
+            # Treat root as single record
+            record = self._element_to_dict(root)
+            if self.flatten_nested:
+                record = self._flatten_xml_record(record)
+            sample_records.append(record)
+        
+        return sample_records
     
     def _read_xml_records(self, file_path: str, structure_info: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
@@ -427,41 +558,251 @@ class XMLProcessor(BaseProcessor):
             Dictionary records from XML
         """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            if structure_info['record_xpath']:
-                # Process records using xpath
-                record_elements = root.findall(structure_info['record_xpath'], structure_info['namespaces'])
-                
-                chunk = []
-                for element in record_elements:
-                    record = self._element_to_dict(element)
-                    
-                    if self.flatten_nested:
-                        record = self._flatten_xml_record(record)
-                    
-                    chunk.append(record)
-                    
-                    if len(chunk) >= self.chunk_size:
-                        for item in chunk:
-                            yield item
-                        chunk = []
-                
-                # Yield remaining items
-                for item in chunk:
-                    yield item
+            if self.streaming:
+                yield from self._read_xml_records_streaming(file_path, structure_info)
             else:
-                # Single record (root element)
-                record = self._element_to_dict(root)
-                if self.flatten_nested:
-                    record = self._flatten_xml_record(record)
-                yield record
+                yield from self._read_xml_records_tree(file_path, structure_info)
                 
         except Exception as e:
             self.logger.error(f"Error reading XML records: {str(e)}")
             raise FileProcessingException(f"Failed to read XML file: {str(e)}")
     
+    def _read_xml_records_tree(self, file_path: str, structure_info: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Read XML records from a fully loaded element tree
+        
+        Args:
+            file_path: Path to XML file
+            structure_info: XML structure analysis results
+            
+        Yields:
+            Dictionary records from XML
+        """
+        tree = ET.parse(file_path)
+        root = tree.getroot()
+        
+        if structure_info['record_xpath']:
+            # Process records using xpath
+            record_elements = root.findall(structure_info['record_xpath'], structure_info['namespaces'])
+            
+            chunk = []
+            for element in record_elements:
+                record = self._element_to_dict(element)
+                
+                if self.flatten_nested:
+                    record = self._flatten_xml_record(record)
+                
+                chunk.append(record)
+                
+                if len(chunk) >= self.chunk_size:
+                    for item in chunk:
+                        yield item
+                    chunk = []
+            
+            # Yield remaining items
+            for item in chunk:
+                yield item
+        else:
+            # Single record (root element)
+            record = self._element_to_dict(root)
+            if self.flatten_nested:
+                record = self._flatten_xml_record(record)
+            yield record
+    
+    def _read_xml_records_streaming(self, file_path: str, structure_info: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Read XML records incrementally with iterparse
+        
+        Each record element is converted as soon as its end tag is seen, then
+        cleared and detached from its parent, so memory stays flat regardless
+        of file size. Record elements nested inside another match are emitted
+        as part of the outer record only.
+        
+        Args:
+            file_path: Path to XML file
+            structure_info: XML structure analysis results
+            
+        Yields:
+            Dictionary records from XML
+        """
+        record_xpath = structure_info['record_xpath']
+        steps = self._compile_record_path(record_xpath, structure_info['namespaces']) if record_xpath else []
+        
+        if steps is None:
+            self.logger.warning(f"Record path '{record_xpath}' cannot be streamed, loading full XML tree")
+            yield from self._read_xml_records_tree(file_path, structure_info)
+            return
+        
+        stack: List[ET.Element] = []
+        tags: List[str] = []
+        open_match_depths: List[int] = []
+        
+        for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                tags.append(elem.tag)
+                # Without a record path the root itself is the single record
+                if (steps and self._path_matches(steps, tags)) or (not steps and len(stack) == 1):
+                    open_match_depths.append(len(stack))
+                continue
+            
+            depth = len(stack)
+            stack.pop()
+            tags.pop()
+            
+            if open_match_depths and open_match_depths[-1] == depth:
+                open_match_depths.pop()
+                if not open_match_depths:
+                    record = self._element_to_dict(elem)
+                    if self.flatten_nested:
+                        record = self._flatten_xml_record(record)
+                    yield record
+                else:
+                    continue
+            elif open_match_depths:
+                # Still inside a record, keep the subtree until the record ends
+                continue
+            
+            self._release_element(elem, stack[-1] if stack else None)
+    
+    def _release_element(self, elem: ET.Element, parent: Optional[ET.Element]):
+        """Clear a finished element and detach it so the tree never grows"""
+        elem.clear()
+        if parent is not None and len(parent) and parent[0] is elem:
+            del parent[0]
+        elif parent is not None:
+            try:
+                parent.remove(elem)
+            except ValueError:
+                pass
+    
+    def _scan_namespaces(self, file_path: str) -> Dict[str, str]:
+        """
+        Resolve namespace declarations once, up to the root start tag
+        
+        Args:
+            file_path: Path to XML file
+            
+        Returns:
+            Dictionary of namespace prefixes and URIs
+        """
+        namespaces = {}
+        for event, item in ET.iterparse(file_path, events=('start-ns', 'start')):
+            if event == 'start':
+                break
+            prefix, uri = item
+            namespaces[prefix] = uri
+        
+        # Add user-defined namespace mappings
+        namespaces.update(self.namespace_map)
+        return namespaces
+    
+    def _compile_record_path(self, record_xpath: str, namespaces: Dict[str, str]) -> Optional[List[Tuple[bool, str]]]:
+        """
+        Compile a simple record XPath into match steps for streaming
+        
+        Supports the ElementTree subset used for record paths: relative child
+        (``a/b``) and descendant (``.//a``) steps, ``*``, ``prefix:tag`` and
+        ``{uri}tag``. Predicates and parent/self steps are not streamable.
+        
+        Args:
+            record_xpath: ElementTree path relative to the root element
+            namespaces: Namespace prefix mapping
+            
+        Returns:
+            List of (is_descendant, tag) steps, or None if not streamable
+        """
+        path = record_xpath.strip()
+        if not path or (path.startswith('/') and not path.startswith('//')) or '[' in path or '@' in path:
+            return None
+        
+        if path.startswith('./'):
+            path = path[1:]
+        elif path == '.':
+            return None
+        
+        # Tokenize on '/', ignoring slashes inside {uri} namespaces
+        steps: List[Tuple[bool, str]] = []
+        descendant = False
+        token = ''
+        in_namespace = False
+        index = 0
+        while index <= len(path):
+            char = path[index] if index < len(path) else '/'
+            if char == '{':
+                in_namespace = True
+            elif char == '}':
+                in_namespace = False
+            
+            if char == '/' and not in_namespace:
+                if token:
+                    steps.append((descendant, token))
+                    descendant = False
+                    token = ''
+                elif index > 0 or path.startswith('//'):
+                    # Empty step between slashes means descendant axis
+                    descendant = True
+                index += 1
+                continue
+            
+            token += char
+            index += 1
+        
+        compiled: List[Tuple[bool, str]] = []
+        for is_descendant, tag in steps:
+            if tag in ('.', '..'):
+                return None
+            if not tag.startswith('{') and ':' in tag:
+                prefix, local = tag.split(':', 1)
+                if prefix not in namespaces:
+                    return None
+                tag = f"{{{namespaces[prefix]}}}{local}"
+            elif not tag.startswith('{') and tag != '*' and namespaces.get(''):
+                tag = f"{{{namespaces['']}}}{tag}"
+            compiled.append((is_descendant, tag))
+        
+        return compiled or None
+    
+    @staticmethod
+    def _path_matches(steps: List[Tuple[bool, str]], tags: List[str]) -> bool:
+        """
+        Check whether the current element path matches compiled record steps
+        
+        Args:
+            steps: Compiled (is_descendant, tag) steps
+            tags: Tags from the root down to the current element
+            
+        Returns:
+            True if the current element is selected by the record path
+        """
+        # Paths are evaluated relative to the root, which is never a match itself
+        path = tags[1:]
+        if not path:
+            return False
+        
+        # positions: set of path indices reachable after consuming each step
+        positions = {0}
+        for is_descendant, tag in steps:
+            next_positions = set()
+            for position in positions:
+                candidates = range(position, len(path)) if is_descendant else range(position, min(position + 1, len(path)))
+                for candidate in candidates:
+                    if tag == '*' or path[candidate] == tag:
+                        next_positions.add(candidate + 1)
+            if not next_positions:
+                return False
+            positions = next_positions
+        
+        return len(path) in positions
+    
+    def _structure_cache_key(self, file_path: str) -> Optional[Tuple[str, int, float]]:
+        """Cache key for structure analysis, None if the file cannot be stat'ed"""
+        try:
+            stat = Path(file_path).stat()
+            return (str(file_path), stat.st_size, stat.st_mtime)
+        except OSError:
+            return None
+    
     def _element_to_dict(self, element: ET.Element) -> Dict[str, Any]:
         """
         Convert XML element to dictionary
@@ -513,65 +854,23 @@ class XMLProcessor(BaseProcessor):
         
         return result
     
-    def _flatten_xml_record(self, record: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
+    def _flatten_xml_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """
         Flatten nested XML record
         
         Args:
             record: XML record to flatten
-            parent_key: Parent key for nested elements
-            sep: Separator for nested keys
             
         Returns:
             Flattened dictionary
         """
-        items = []
-        
-        if isinstance(record, dict):
-            for k, v in record.items():
-                new_key = f"{parent_key}{sep}{k}" if parent_key else k
-                
-                if isinstance(v, dict) and len(str(v)) < 1000:  # Avoid very deep nesting
-                    items.extend(self._flatten_xml_record(v, new_key, sep=sep).items())
-                elif isinstance(v, list):
-                    # Handle arrays in XML
-                    if len(v) == 1 and not isinstance(v[0], (dict, list)):
-                        # Single item array - flatten to single value
-                        items.append((new_key, v[0]))
-                    else:
-                        # Multiple items or complex items - convert to JSON
-                        items.append((new_key, json.dumps(v)))
-                else:
-                    items.append((new_key, v))
-        else:
-            return record
-        
-        return dict(items)
+        return self.flattener.flatten(record)
     
-    def _extract_namespaces(self, root: ET.Element) -> Dict[str, str]:
-        """
-        Extract namespace declarations from XML
-        
-        Args:
-            root: Root XML element
-            
-        Returns:
-            Dictionary of namespace prefixes and URIs
-        """
-        namespaces = {}
-        
-        # Extract from root element
-        for prefix, uri in root.attrib.items():
-            if prefix.startswith('xmlns'):
-                if prefix == 'xmlns':
-                    namespaces[''] = uri  # Default namespace
-                else:
-                    namespaces[prefix[6:]] = uri  # Remove 'xmlns:' prefix
-        
-        # Add user-defined namespace mappings
-        namespaces.update(self.namespace_map)
-        
-        return namespaces
+    def _xml_list_value(self, values: List[Any]) -> Any:
+        """Single-item scalar arrays become the item, anything else a JSON string"""
+        if len(values) == 1 and not isinstance(values[0], (dict, list)):
+            return values[0]
+        return json.dumps(values)
     
     def _clean_tag_name(self, tag: str) -> str:
         """
@@ -600,9 +899,7 @@ class XMLProcessor(BaseProcessor):
         """
         schema = defaultdict(lambda: {
             'element_type': 'element',
-            'detected_type': 'STRING',
-            'sample_values': [],
-            'unique_values': set(),
+            'values': [],
             'null_count': 0,
             'total_count': 0,
             'namespace': None
@@ -611,21 +908,15 @@ class XMLProcessor(BaseProcessor):
         for record in records:
             self._analyze_record_schema(record, schema, '')
         
-        # Convert sets to lists and finalize analysis
-        for field_path, field_info in schema.items():
-            field_info['unique_values'] = list(field_info['unique_values'])
-            field_info['sample_values'] = list(field_info['sample_values'])[:10]
-            
-            # Detect final data type
-            if field_info['sample_values']:
-                field_info['detected_type'] = self._detect_data_type(field_info['sample_values'])
-            
-            # Calculate string lengths for string fields
-            if field_info['detected_type'] == 'STRING':
-                lengths = [len(str(val)) for val in field_info['sample_values'] if val]
-                if lengths:
-                    field_info['min_length'] = min(lengths)
-                    field_info['max_length'] = max(lengths)
+        # Profile all fields at once
+        profiles = profile_values(
+            {field_path: field_info['values'] for field_path, field_info in schema.items()},
+            total_counts={field_path: field_info['total_count'] for field_path, field_info in schema.items()},
+            null_counts={field_path: field_info['null_count'] for field_path, field_info in schema.items()}
+        )
+        for (field_path, field_info), field_profile in zip(schema.items(), profiles):
+            del field_info['values']
+            field_info['profile'] = field_profile
             
             # Determine element type
             if field_path.startswith('@'):
@@ -655,10 +946,9 @@ class XMLProcessor(BaseProcessor):
                 elif isinstance(value, dict):
                     self._analyze_record_schema(value, schema, field_path)
                 elif isinstance(value, list):
-                    schema[field_path]['sample_values'].append(str(value)[:100])
+                    schema[field_path]['values'].append(str(value)[:100])
                 else:
-                    schema[field_path]['sample_values'].append(value)
-                    schema[field_path]['unique_values'].add(value)
+                    schema[field_path]['values'].append(value)
                 
                 schema[field_path]['total_count'] += 1
         elif isinstance(record, list):
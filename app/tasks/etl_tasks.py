@@ -7,9 +7,11 @@ import json
 import shutil
 import traceback
 import hashlib
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
+from sqlalchemy import text, update
 from sqlmodel import Session, select
 import pandas as pd
 
@@ -30,9 +32,12 @@ from app.infrastructure.db.models.etl_control.quality_rules import QualityRule
 from app.infrastructure.db.models.audit.data_lineage import DataLineage, DataLineageCreate
 from app.infrastructure.db.models.audit.change_log import ChangeLog, ChangeLogCreate
 from app.infrastructure.db.manager import get_session
+from app.infrastructure.db.entity_loader import BulkEntityLoader
+from app.infrastructure.db.keyset import KeysetPaginator, load_checkpoint, save_checkpoint
 from celery import group
 from app.processors import get_processor
-from app.transformers import create_transformation_pipeline
+from app.processors.csv_processor import fail_partitioned_file, finish_partitioned_file, process_csv_partition
+from app.transformers import StreamingPipeline, create_transformation_pipeline
 from app.application.services.etl_service import ETLService
 from app.application.services.file_service import FileService
 from app.application.services.data_quality_service import DataQualityService
@@ -81,7 +86,13 @@ def process_file_task(self, file_id: str, user_id:str, processing_config: Dict[s
             
             # Determine processor type
             file_type = file_record.file_type.lower()
-            processor = get_processor(file_type, db_session=db, batch_id=task_id)
+            processor_options = {
+                key: value for key, value in (processing_config or {}).items()
+                if key not in ('db_session', 'batch_id')
+            }
+            # Reuse the file profile cached by format validation
+            processor_options.setdefault('file_profile', (file_record.file_metadata or {}).get('file_profile'))
+            processor = get_processor(file_type, db_session=db, batch_id=task_id, **processor_options)
             
             # Process the file
             file_path = file_record.file_path
@@ -102,6 +113,18 @@ def process_file_task(self, file_id: str, user_id:str, processing_config: Dict[s
                 processor.process_file(file_path, file_record)
             )
             
+            if processing_results.get('partitions_pending'):
+                # finish_csv_partitions_task records the results and status
+                logger.info(
+                    f"File {file_id} dispatched as {processing_results['partitions']} partition subtasks "
+                    f"(chord {processing_results['partition_chord_id']})"
+                )
+                return {
+                    'file_id': file_id,
+                    'status': 'dispatched',
+                    'results': processing_results
+                }
+            
             # Update file status based on results
             if processing_results.get('successful_records', 0) > 0:
                 file_record.processing_status = ProcessingStatus.COMPLETED.value
@@ -221,6 +244,75 @@ def process_file_task(self, file_id: str, user_id:str, processing_config: Dict[s
         raise ETLException(f"File processing failed after {self.max_retries} retries: {str(e)}")
     
     
+@celery_app.task(
+    bind=True,
+    name='app.tasks.etl_tasks.process_csv_partition_task',
+    time_limit=1800,  # 30 minutes
+    soft_time_limit=1500  # 25 minutes
+)
+def process_csv_partition_task(
+    self,
+    file_path: str,
+    file_id: str,
+    batch_id: str,
+    partition: Dict[str, Any],
+    columns: List[str],
+    options: Dict[str, Any]
+):
+    """
+    Ingest one byte-range partition of a CSV file into raw_records
+
+    Fanned out by CSVProcessor with ``partition_executor='celery'``.
+
+    Returns:
+        Processing statistics of the partition
+    """
+    logger.info(
+        f"Processing CSV partition {partition.get('index')} of {file_path} "
+        f"(bytes {partition.get('start')}-{partition.get('end')})"
+    )
+    return process_csv_partition(file_path, file_id, batch_id, partition, columns, options)
+
+
+@celery_app.task(
+    bind=True,
+    name='app.tasks.etl_tasks.finish_csv_partitions_task'
+)
+def finish_csv_partitions_task(
+    self,
+    partition_stats: List[Dict[str, Any]],
+    file_id: str,
+    batch_id: str,
+    columns_detected: int,
+    options: Dict[str, Any],
+    dispatched_at: float
+):
+    """
+    Chord callback of partitioned CSV ingestion
+
+    Merges the statistics of all partitions and records them, with the
+    processing status, on the file.
+
+    Returns:
+        Processing results of the file
+    """
+    processing_results = finish_partitioned_file(
+        partition_stats, file_id, batch_id, columns_detected, options, dispatched_at
+    )
+    return {
+        'file_id': file_id,
+        'status': 'completed',
+        'results': processing_results
+    }
+
+
+@celery_app.task(name='app.tasks.etl_tasks.csv_partitions_failed_task')
+def csv_partitions_failed_task(request, exc, traceback, file_id: str, batch_id: str):
+    """Error callback of partitioned CSV ingestion: mark the file failed"""
+    logger.error(f"CSV partition subtask {request.id} of file {file_id} failed: {exc}")
+    fail_partitioned_file(file_id, batch_id, f"Partition subtask failed: {exc}")
+
+
 @celery_app.task(
     bind=True,
     name='app.tasks.etl_tasks.transformation_pipeline',
@@ -256,49 +348,28 @@ def run_transformation_pipeline(self, job_execution_id: str, transformation_conf
             db.add(execution)
             db.commit()
 
-            # Create transformation pipeline
+            # Create transformation pipeline (every stage shares this session)
             stages = transformation_config.get('stages', ['clean', 'validate', 'normalize'])
-            pipeline = create_transformation_pipeline(stages, **transformation_config)
-
-            # Get source data
-            source_query = transformation_config.get('source_query')
-            if source_query:
-                source_data = pd.read_sql(source_query, db.connection())
-                input_records = source_data.to_dict('records')
-            else:
-                # Default: get recent raw records
-                recent_records = db.exec(
-                    select(RawRecords)
-                    .where(RawRecords.validation_status == 'VALID')
-                    .limit(transformation_config.get('limit', 10000))
-                ).all()
-                input_records = [record.raw_data for record in recent_records]
-
-            # Execute transformation pipeline
-            total_results = {}
-            for stage_idx, transformer in enumerate(pipeline):
-                stage_name = stages[stage_idx] if stage_idx < len(stages) else f"stage_{stage_idx}"
-                logger.info(f"Executing transformation stage: {stage_name}")
-
-                # Transform the data
-                if stage_idx == 0:
-                    # First stage uses input records
-                    stage_results = asyncio.run(transformer.transform_dataset(
-                        input_records,
-                        output_entity_type=transformation_config.get('output_entity_type')
-                    ))
-                else:
-                    # Subsequent stages use results from previous stage
-                    previous_results = total_results[stages[stage_idx - 1]]['results']
-                    stage_data = [result.data for result in previous_results if result.is_success()]
-                    stage_results = asyncio.run(transformer.transform_dataset(
-                        stage_data,
-                        output_entity_type=transformation_config.get('output_entity_type')
-                    ))
-
-                total_results[stage_name] = stage_results
-
-                # Check if stage failed critically
+            stage_configs = {
+                f"{stage}_config": {
+                    'db_session': db,
+                    'job_execution_id': job_execution_id,
+                    **transformation_config.get(f"{stage}_config", {})
+                }
+                for stage in stages
+            }
+            pipeline = create_transformation_pipeline(stages, **stage_configs)
+
+            # Stream source data batch by batch through every stage
+            batch_size = transformation_config.get('batch_size', 1000)
+            streaming_pipeline = StreamingPipeline(pipeline, stages)
+            total_results = asyncio.run(streaming_pipeline.run(
+                _iter_source_batches(db, transformation_config, batch_size),
+                output_entity_type=transformation_config.get('output_entity_type')
+            ))
+
+            # Check if any stage failed critically
+            for stage_name, stage_results in total_results.items():
                 if not stage_results['success']:
                     raise ETLException(f"Transformation stage '{stage_name}' failed critically")
 
@@ -314,6 +385,8 @@ def run_transformation_pipeline(self, job_execution_id: str, transformation_conf
                 'total_processing_time': (execution.end_time - execution.start_time).total_seconds(),
                 'stages_executed': len(stages),
                 'stage_results': {stage: result['statistics'] for stage, result in total_results.items()},
+                'records_read': streaming_pipeline.records_read,
+                'batches_read': streaming_pipeline.batches_read,
                 'task_id': task_id
             }
             execution.performance_metrics = performance_metrics
@@ -353,6 +426,41 @@ def run_transformation_pipeline(self, job_execution_id: str, transformation_conf
 
             raise ETLException(f"Transformation pipeline failed: {str(e)}")
 
+def _iter_source_batches(db: Session, transformation_config: Dict[str, Any], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream transformation input through a server-side cursor
+
+    The cursor runs on its own connection so the per-batch commits made by the
+    pipeline stages on ``db`` don't close it.
+
+    Args:
+        db: Session whose engine is used for the read connection
+        transformation_config: Pipeline configuration (``source_query``/``limit``)
+        batch_size: Number of records per yielded batch
+
+    Yields:
+        List of source records
+    """
+    source_query = transformation_config.get('source_query')
+
+    with db.get_bind().connect() as connection:
+        connection = connection.execution_options(stream_results=True, yield_per=batch_size)
+
+        if source_query:
+            result = connection.execute(text(source_query))
+            for partition in result.mappings().partitions(batch_size):
+                yield [dict(row) for row in partition]
+        else:
+            # Default: get recent raw records
+            statement = select(RawRecords.raw_data).where(RawRecords.validation_status == 'VALID')
+            limit = transformation_config.get('limit', 10000)
+            if limit:
+                statement = statement.limit(limit)
+
+            result = connection.execute(statement)
+            for partition in result.scalars().partitions(batch_size):
+                yield list(partition)
+
 @celery_app.task(
     bind=True,
     name='app.tasks.etl_tasks.execute_job',
@@ -896,12 +1004,24 @@ async def transform_records(
            - SUCCESS: Insert to standardized_data, mark is_processed=true
            - FAILURE: Insert to rejected_records, increment records_failed counter
 
+    Raw records are read in keyset batches ordered by ingest_seq. Each batch
+    is processed with one savepoint per record and committed together with
+    the batch checkpoint on the job execution, so a retried execution resumes
+    after the last committed batch instead of rescanning the table. Records
+    that were standardized or rejected get ``transformed_at`` in the same
+    transaction and are never read again; records that raised stay pending.
+
     Args:
         db: Database session
         execution_id: Job execution ID
         transform_config: Transformation configuration including:
             - entity_type: Type of entity being transformed
             - batch_size: Number of records to process at once
+            - skip_locked: Claim batches with FOR UPDATE SKIP LOCKED so several
+              workers can transform concurrently; disables checkpoints
+              (default False)
+            - resume_from_checkpoint: Continue after the last checkpoint of an
+              earlier execution of the job (default False)
             - cleaner_config: Data cleaner configuration
             - field_mappings: List of field mappings
             - quality_rules: Quality validation rules
@@ -945,13 +1065,29 @@ async def transform_records(
 
         logger.info(f"[PHASE 5] Job ID: {job_id}, Entity Type: {entity_type}")
 
-        # Step 1: Query unprocessed raw records (validation_status = UNVALIDATED or VALID)
+        # Step 1: Query untransformed raw records (validation_status = UNVALIDATED or VALID)
+        # in keyset batches, resuming after the last committed checkpoint
         logger.debug(f"[PHASE 5] Querying unprocessed raw records")
         from app.core.enums import ValidationStatus
         raw_records_query = select(RawRecords).where(
-            RawRecords.validation_status.in_([ValidationStatus.UNVALIDATED, ValidationStatus.VALID])
-        ).limit(batch_size)
-        raw_records = db.exec(raw_records_query).all()
+            RawRecords.validation_status.in_([ValidationStatus.UNVALIDATED, ValidationStatus.VALID]),
+            RawRecords.transformed_at.is_(None)
+        )
+        skip_locked = transform_config.get("skip_locked", False)
+        checkpoint = None if skip_locked else load_checkpoint(
+            db, execution, "transform", transform_config.get("resume_from_checkpoint", False)
+        )
+        paginator = KeysetPaginator(
+            db,
+            raw_records_query,
+            [RawRecords.ingest_seq],
+            batch_size=batch_size,
+            checkpoint=checkpoint,
+            skip_locked=skip_locked
+        )
+        if checkpoint:
+            logs.append(f"Resuming transform after checkpoint {checkpoint}")
+        raw_records = paginator.fetch_batch()
 
         if not raw_records:
             logger.info(f"[PHASE 5] No unprocessed records found")
@@ -964,8 +1100,7 @@ async def transform_records(
                 "performance_metrics": {}
             }
 
-        logger.info(f"[PHASE 5] Found {len(raw_records)} unprocessed records")
-        logs.append(f"Found {len(raw_records)} records to transform")
+        logger.info(f"[PHASE 5] Found {len(raw_records)} unprocessed records in first batch")
 
         # Initialize transformers
         cleaner_config = transform_config.get("cleaner_config", {})
@@ -992,159 +1127,176 @@ async def transform_records(
         quality_rules = db.exec(quality_rules_query).all()
         logger.debug(f"[PHASE 5] Loaded {len(quality_rules)} quality rules for {entity_type}")
 
-        # Step 2: Process each raw record
-        for raw_record in raw_records:
-            records_processed += 1
-
-            try:
-                logger.debug(
-                    f"[PHASE 5] Processing record {records_processed}/{len(raw_records)} "
-                    f"(raw_record_id: {raw_record.id})"
-                )
+        # Step 2: Process each batch, committing records and checkpoint together
+        while raw_records:
+            logger.debug(f"[PHASE 5] Processing batch {paginator.batches_read} ({len(raw_records)} records)")
 
-                # Step 2a: Data Cleansing
-                logger.debug(f"[PHASE 5] Cleansing record {raw_record.id}")
-                clean_result = await cleaner.transform_record(raw_record.raw_data)
+            for raw_record in raw_records:
+                records_processed += 1
 
-                if not clean_result.is_success():
-                    logger.warning(f"[PHASE 5] Data cleansing failed for record {raw_record.id}")
-                    # Still continue with original data
-                    cleaned_data = raw_record.raw_data
-                else:
-                    cleaned_data = clean_result.data
-
-                # Step 2b: Field Mapping
-                logger.debug(f"[PHASE 5] Applying field mappings to record {raw_record.id}")
-                mapped_record, mapping_errors = await field_mapping_service.execute_mappings(
-                    cleaned_data, field_mappings, execution_id
-                )
-
-                if mapping_errors:
-                    logger.warning(
-                        f"[PHASE 5] Field mapping errors for record {raw_record.id}: {mapping_errors}"
+                # Savepoint per record; the batch is committed as a whole
+                savepoint = db.begin_nested()
+                try:
+                    logger.debug(
+                        f"[PHASE 5] Processing record {records_processed}/{len(raw_records)} "
+                        f"(raw_record_id: {raw_record.id})"
                     )
-                    # If critical mapping errors, reject the record
-                    if any(error for error in mapping_errors):
-                        raise ETLException(f"Field mapping failed: {'; '.join(mapping_errors)}")
-
-                # Step 2c: Data Validation
-                logger.debug(f"[PHASE 5] Validating record {raw_record.id}")
-
-                # Setup validator with quality rules
-                validation_rules = {}
-                for rule in quality_rules:
-                    field = rule.field_name or "general"
-                    if field not in validation_rules:
-                        validation_rules[field] = []
-
-                    validation_rules[field].append({
-                        "type": rule.rule_type.value.lower(),
-                        "severity": "error",  # Adjust based on rule configuration
-                        "parameters": {"rule_id": str(rule.rule_id), "expression": rule.rule_expression},
-                        "error_message": f"Quality rule '{rule.rule_name}' failed"
-                    })
 
-                # Validate the mapped record
-                if validation_rules:
-                    validator_with_rules = DataValidator(
-                        db, execution_id,
-                        validation_rules=validation_rules,
-                        stop_on_first_error=False,
-                        collect_all_errors=True
-                    )
-                    validation_result = await validator_with_rules.transform_record(mapped_record)
-                else:
-                    validation_result = await validator.transform_record(mapped_record)
-
-                # Step 2d: Result Handling
-                if validation_result.is_success() or validation_result.status.value == "warning":
-                    # SUCCESS: Insert to standardized_data
-                    logger.debug(f"[PHASE 5] Record {raw_record.id} validation PASSED")
-
-                    standardized_record = StandardizedDataCreate(
-                        source_file_id=raw_record.file_id,
-                        source_record_id=raw_record.id,
-                        entity_type=entity_type,
-                        standardized_data=mapped_record,
-                        quality_score=float(validation_result.metadata.get("quality_score", 0.95)),
-                        transformation_rules_applied=[
-                            f"{m.mapping_type}:{m.target_field}" for m in field_mappings[:5]  # Sample
-                        ],
-                        batch_id=execution_id,
-                        validation_status='passed'
+                    # Step 2a: Data Cleansing
+                    logger.debug(f"[PHASE 5] Cleansing record {raw_record.id}")
+                    clean_result = await cleaner.transform_record(raw_record.raw_data)
+
+                    if not clean_result.is_success():
+                        logger.warning(f"[PHASE 5] Data cleansing failed for record {raw_record.id}")
+                        # Still continue with original data
+                        cleaned_data = raw_record.raw_data
+                    else:
+                        cleaned_data = clean_result.data
+
+                    # Step 2b: Field Mapping
+                    logger.debug(f"[PHASE 5] Applying field mappings to record {raw_record.id}")
+                    mapped_record, mapping_errors = await field_mapping_service.execute_mappings(
+                        cleaned_data, field_mappings, execution_id
                     )
 
-                    # Create StandardizedData model instance
-                    standardized_data = StandardizedData.from_orm(standardized_record)
-                    db.add(standardized_data)
-                    db.flush()  # Flush to get the ID
-
-                    # Insert quality check results for passed validation
-                    for rule in quality_rules:
-                        quality_check = QualityCheckResult(
-                            execution_id=execution.id,
-                            rule_id=rule.rule_id,
-                            check_result=QualityCheckResultEnum.PASSED,
-                            records_checked=1,
-                            records_passed=1,
-                            records_failed=0,
-                            failure_details=None
+                    if mapping_errors:
+                        logger.warning(
+                            f"[PHASE 5] Field mapping errors for record {raw_record.id}: {mapping_errors}"
                         )
-                        db.add(quality_check)
+                        # If critical mapping errors, reject the record
+                        if any(error for error in mapping_errors):
+                            raise ETLException(f"Field mapping failed: {'; '.join(mapping_errors)}")
 
-                    # Mark raw record as processed
-                    raw_record.validation_status = ValidationStatus.VALID
-                    db.add(raw_record)
+                    # Step 2c: Data Validation
+                    logger.debug(f"[PHASE 5] Validating record {raw_record.id}")
 
-                    records_successful += 1
-                    logger.debug(f"[PHASE 5] Record {raw_record.id} inserted to standardized_data")
-
-                else:
-                    # FAILURE: Insert to rejected_records
-                    logger.warning(
-                        f"[PHASE 5] Record {raw_record.id} validation FAILED: {validation_result.errors}"
-                    )
+                    # Setup validator with quality rules
+                    validation_rules = {}
+                    for rule in quality_rules:
+                        field = rule.field_name or "general"
+                        if field not in validation_rules:
+                            validation_rules[field] = []
+
+                        validation_rules[field].append({
+                            "type": rule.rule_type.value.lower(),
+                            "severity": "error",  # Adjust based on rule configuration
+                            "parameters": {"rule_id": str(rule.rule_id), "expression": rule.rule_expression},
+                            "error_message": f"Quality rule '{rule.rule_name}' failed"
+                        })
+
+                    # Validate the mapped record
+                    if validation_rules:
+                        validator_with_rules = DataValidator(
+                            db, execution_id,
+                            validation_rules=validation_rules,
+                            stop_on_first_error=False,
+                            collect_all_errors=True
+                        )
+                        validation_result = await validator_with_rules.transform_record(mapped_record)
+                    else:
+                        validation_result = await validator.transform_record(mapped_record)
+
+                    # Step 2d: Result Handling
+                    if validation_result.is_success() or validation_result.status.value == "warning":
+                        # SUCCESS: Insert to standardized_data
+                        logger.debug(f"[PHASE 5] Record {raw_record.id} validation PASSED")
+
+                        standardized_record = StandardizedDataCreate(
+                            source_file_id=raw_record.file_id,
+                            source_record_id=raw_record.id,
+                            entity_type=entity_type,
+                            standardized_data=mapped_record,
+                            quality_score=float(validation_result.metadata.get("quality_score", 0.95)),
+                            transformation_rules_applied=[
+                                f"{m.mapping_type}:{m.target_field}" for m in field_mappings[:5]  # Sample
+                            ],
+                            batch_id=execution_id,
+                            validation_status='passed'
+                        )
 
-                    rejected_record = RejectedRecord(
-                        source_record_id=raw_record.id,
-                        source_file_id=raw_record.file_id,
-                        row_number=raw_record.row_number,
-                        raw_data=raw_record.raw_data,
-                        rejection_reason="; ".join(validation_result.errors),
-                        validation_errors=[
-                            {"error": error} for error in validation_result.errors
-                        ],
-                        batch_id=execution_id
-                    )
-                    db.add(rejected_record)
+                        # Create StandardizedData model instance
+                        standardized_data = StandardizedData.from_orm(standardized_record)
+                        db.add(standardized_data)
+                        db.flush()  # Flush to get the ID
+
+                        # Insert quality check results for passed validation
+                        for rule in quality_rules:
+                            quality_check = QualityCheckResult(
+                                execution_id=execution.id,
+                                rule_id=rule.rule_id,
+                                check_result=QualityCheckResultEnum.PASSED,
+                                records_checked=1,
+                                records_passed=1,
+                                records_failed=0,
+                                failure_details=None
+                            )
+                            db.add(quality_check)
+
+                        # Mark raw record as processed
+                        raw_record.validation_status = ValidationStatus.VALID
+                        raw_record.transformed_at = datetime.utcnow()
+                        db.add(raw_record)
+
+                        records_successful += 1
+                        logger.debug(f"[PHASE 5] Record {raw_record.id} inserted to standardized_data")
+
+                    else:
+                        # FAILURE: Insert to rejected_records
+                        logger.warning(
+                            f"[PHASE 5] Record {raw_record.id} validation FAILED: {validation_result.errors}"
+                        )
 
-                    # Insert quality check results for failed validation
-                    for rule in quality_rules:
-                        quality_check = QualityCheckResult(
-                            execution_id=execution.id,
-                            rule_id=rule.rule_id,
-                            check_result=QualityCheckResultEnum.FAILED,
-                            records_checked=1,
-                            records_passed=0,
-                            records_failed=1,
-                            failure_details={"errors": validation_result.errors}
+                        rejected_record = RejectedRecord(
+                            source_record_id=raw_record.id,
+                            source_file_id=raw_record.file_id,
+                            row_number=raw_record.row_number,
+                            raw_data=raw_record.raw_data,
+                            rejection_reason="; ".join(validation_result.errors),
+                            validation_errors=[
+                                {"error": error} for error in validation_result.errors
+                            ],
+                            batch_id=execution_id
                         )
-                        db.add(quality_check)
+                        db.add(rejected_record)
+
+                        # Insert quality check results for failed validation
+                        for rule in quality_rules:
+                            quality_check = QualityCheckResult(
+                                execution_id=execution.id,
+                                rule_id=rule.rule_id,
+                                check_result=QualityCheckResultEnum.FAILED,
+                                records_checked=1,
+                                records_passed=0,
+                                records_failed=1,
+                                failure_details={"errors": validation_result.errors}
+                            )
+                            db.add(quality_check)
+
+                        # Rejected records are not transformed again either
+                        raw_record.transformed_at = datetime.utcnow()
+                        db.add(raw_record)
+
+                        records_failed += 1
+                        logger.debug(f"[PHASE 5] Record {raw_record.id} inserted to rejected_records")
+
+                    savepoint.commit()
 
+                except Exception as e:
+                    savepoint.rollback()
+                    error_msg = f"Error processing record {raw_record.id}: {str(e)}"
+                    logger.error(f"[PHASE 5] {error_msg}")
+                    errors.append(error_msg)
                     records_failed += 1
-                    logger.debug(f"[PHASE 5] Record {raw_record.id} inserted to rejected_records")
 
-                db.commit()
+                    # Log the error for debugging
+                    continue
 
-            except Exception as e:
-                db.rollback()
-                error_msg = f"Error processing record {raw_record.id}: {str(e)}"
-                logger.error(f"[PHASE 5] {error_msg}")
-                errors.append(error_msg)
-                records_failed += 1
+            save_checkpoint(execution, "transform", paginator.checkpoint)
+            execution.records_transformed = records_successful
+            db.add(execution)
+            db.commit()
 
-                # Log the error for debugging
-                continue
+            raw_records = paginator.fetch_batch()
 
         # Step 3: Update job execution counters
         logger.info(
@@ -1157,6 +1309,7 @@ async def transform_records(
         db.add(execution)
         db.commit()
 
+        logs.append(f"Processed {records_processed} records in {paginator.batches_read} batches")
         logs.append(f"Transformed {records_successful} records successfully")
         logs.append(f"Rejected {records_failed} records")
 
@@ -1275,7 +1428,7 @@ async def _execute_load_job(db: Session, execution_id: str, config: Dict[str, An
 # ==============================================
 # Purpose: Load standardized records into processed entities with entity matching,
 # deduplication, conflict resolution, and complete lineage tracking.
-# Input: standardized_data WHERE validation_status='passed'
+# Input: standardized_data WHERE validation_status='passed' AND loaded_at IS NULL
 # Output: entities, entity_relationships, data_lineage records with transaction rollback on failure
 
 async def load_records(
@@ -1288,7 +1441,7 @@ async def load_records(
     deduplication, and conflict resolution.
 
     Flow:
-    1. Query standardized_data WHERE validation_status='passed'
+    1. Query standardized_data WHERE validation_status='passed' AND loaded_at IS NULL
     2. BEGIN TRANSACTION (explicit with db.begin())
     3. For each standardized record:
         a. EntityMatcher.match_entity():
@@ -1320,6 +1473,21 @@ async def load_records(
        - INSERT error_logs
        - UPDATE job_executions status='failed'
 
+    With ``bulk_load`` steps 2-3 run set-based for the whole batch through
+    BulkEntityLoader: one IN query resolves existing entities by hash,
+    entities/relationships/lineage are bulk inserted and duplicate counters are
+    updated in one statement. Hash matches are recorded as duplicates; fuzzy
+    matching and merging are only done by the per-record path, so enabling
+    ``bulk_load`` opts out of them. It also needs ``entity_hash`` on existing
+    entities (``manage.py backfill-entity-hash``); while any entity of the type
+    lacks one, the per-record path is used instead.
+
+    Standardized records are read in keyset batches ordered by ingest_seq and
+    the last loaded key is committed as the ``load`` checkpoint of the job
+    execution after every batch. Loaded records get ``loaded_at`` in the
+    transaction that loads them (the batch for bulk loads, the record
+    otherwise), so no execution loads a record twice.
+
     Args:
         db: Database session
         execution_id: Job execution ID
@@ -1327,6 +1495,12 @@ async def load_records(
             - entity_type: Type of entity being loaded
             - key_fields: Fields to calculate entity_hash
             - batch_size: Number of records to process at once
+            - skip_locked: Claim batches with FOR UPDATE SKIP LOCKED; disables
+              checkpoints (default False)
+            - resume_from_checkpoint: Continue after the last checkpoint of an
+              earlier execution of the job (default False)
+            - bulk_load: Use the set-based, hash-only load path (default False)
+            - bulk_method: 'auto' | 'copy' | 'insert' write method for bulk_load
             - similarity_threshold: Threshold for fuzzy matching (default 0.85)
             - conflict_resolution_strategy: 'newer_wins' | 'score_based' | 'manual_review'
 
@@ -1367,9 +1541,24 @@ async def load_records(
         # Step 1: Query validated standardized records (validation_status='passed')
         logger.debug(f"[PHASE 6] Querying validated standardized records")
         standardized_query = select(StandardizedData).where(
-            StandardizedData.validation_status == 'passed'
-        ).limit(batch_size)
-        standardized_records = db.exec(standardized_query).all()
+            StandardizedData.validation_status == 'passed',
+            StandardizedData.loaded_at.is_(None)
+        )
+        skip_locked = load_config.get("skip_locked", False)
+        checkpoint = None if skip_locked else load_checkpoint(
+            db, execution, "load", load_config.get("resume_from_checkpoint", False)
+        )
+        paginator = KeysetPaginator(
+            db,
+            standardized_query,
+            [StandardizedData.ingest_seq],
+            batch_size=batch_size,
+            checkpoint=checkpoint,
+            skip_locked=skip_locked
+        )
+        if checkpoint:
+            logs.append(f"Resuming load after checkpoint {checkpoint}")
+        standardized_records = paginator.fetch_batch()
 
         if not standardized_records:
             logger.info(f"[PHASE 6] No validated records found to load")
@@ -1383,198 +1572,255 @@ async def load_records(
                 "performance_metrics": {}
             }
 
-        logger.info(f"[PHASE 6] Found {len(standardized_records)} validated records to load")
-        logs.append(f"Found {len(standardized_records)} records to load")
-
-        # Initialize services
-        entity_service = EntityService(db)
-        entity_matcher = EntityMatcher(db, execution_id, **load_config)
-
-        # Step 2: Process records with individual commits for atomic operations
-        logger.debug(f"[PHASE 6] Starting record processing")
+        logger.info(f"[PHASE 6] Found {len(standardized_records)} validated records in first batch")
 
-        # Step 3: Process each standardized record
-        for std_record in standardized_records:
-            records_processed += 1
-
-            try:
-                logger.debug(
-                    f"[PHASE 6] Processing record {records_processed}/{len(standardized_records)} "
-                    f"(std_record_id: {std_record.id})"
+        entity_loader = None
+        if load_config.get("bulk_load", False):
+            entity_loader = BulkEntityLoader(
+                db,
+                entity_type,
+                key_fields,
+                execution_id=execution.id,
+                method=load_config.get("bulk_method", "auto")
+            )
+            if entity_loader.has_unhashed_entities():
+                # Hash-only matching would miss these and insert duplicates
+                logger.warning(
+                    f"[PHASE 6] {entity_type} entities without entity_hash found, "
+                    f"using per-record load; run backfill-entity-hash to enable bulk_load"
                 )
+                logs.append("bulk_load disabled: existing entities need backfill-entity-hash")
+                entity_loader = None
 
-                # Step 3a: Entity Matching
-                logger.debug(f"[PHASE 6] Matching entity for record {std_record.id}")
-
-                # Calculate entity_hash from key_fields
-                hash_input = "_".join(
-                    str(std_record.standardized_data.get(field, "")) for field in key_fields
-                )
-                entity_hash = hashlib.md5(hash_input.encode()).hexdigest()
-
-                # Match entity
-                match_result = await entity_matcher.match_entity(
-                    std_record.standardized_data,
-                    entity_type,
-                    entity_hash,
-                    similarity_threshold
-                )
+        if entity_loader is not None:
+            # Step 2-3 (bulk): resolve, insert and count each batch set-based
+            logger.debug(f"[PHASE 6] Starting bulk load")
+            load_started = time.perf_counter()
 
-                # Unpack match result
-                is_new = match_result.get("is_new", True)
-                is_duplicate = match_result.get("is_duplicate", False)
-                matched_entity = match_result.get("matched_entity")
-                confidence_score = match_result.get("confidence_score", 1.0)
-                match_score = match_result.get("match_score", 0.0)
-
-                # Step 3b: NEW ENTITY
-                if is_new:
-                    logger.debug(f"[PHASE 6] Record {std_record.id} identified as NEW entity")
-
-                    # INSERT entities
-                    new_entity = Entity(
-                        entity_type=entity_type,
-                        entity_key=std_record.standardized_data.get(key_fields[0], f"entity_{std_record.id}"),
-                        entity_data=std_record.standardized_data,
-                        confidence_score=float(confidence_score),
-                        source_files=[std_record.source_file_id] if std_record.source_file_id else [],
-                        version=1,
-                        is_active=True
-                    )
-                    db.add(new_entity)
-                    db.flush()  # Flush to get the entity_id
-
-                    # INSERT data_lineage (standardized → entity)
-                    lineage = DataLineage(
-                        source_entity_id=std_record.id,
-                        source_entity_type="StandardizedData",
-                        target_entity_id=new_entity.entity_id,
-                        target_entity_type=entity_type,
-                        transformation_rule_id=None,
-                        job_execution_id=execution.id,
-                        lineage_metadata={
-                            "hash": entity_hash,
-                            "confidence": confidence_score,
-                            "match_type": "new"
-                        }
-                    )
-                    db.add(lineage)
-
-                    records_loaded += 1
-                    logger.debug(f"[PHASE 6] NEW entity {new_entity.entity_id} created for record {std_record.id}")
-
-                # Step 3c: DUPLICATE ENTITY
-                elif is_duplicate and matched_entity:
-                    logger.debug(f"[PHASE 6] Record {std_record.id} identified as DUPLICATE of entity {matched_entity.entity_id}")
-
-                    # UPDATE entities: increment duplicate_count, set master_entity_id
-                    matched_entity.duplicate_count = (matched_entity.duplicate_count or 0) + 1
-                    matched_entity.master_entity_id = matched_entity.entity_id  # Self-reference for primary
-                    db.add(matched_entity)
-
-                    # INSERT entity_relationships (duplicate_of)
-                    relationship = EntityRelationship(
-                        entity_from=std_record.id,
-                        entity_to=matched_entity.entity_id,
-                        relationship_type="duplicate_of",
-                        relationship_strength=float(match_score),
-                        metadata={
-                            "confidence": confidence_score,
-                            "hash_match": entity_hash == getattr(matched_entity, 'entity_hash', None),
-                            "fuzzy_score": match_score
-                        }
-                    )
-                    db.add(relationship)
-
-                    # INSERT data_lineage (duplicate link)
-                    lineage = DataLineage(
-                        source_entity_id=std_record.id,
-                        source_entity_type="StandardizedData",
-                        target_entity_id=matched_entity.entity_id,
-                        target_entity_type=entity_type,
-                        transformation_rule_id=None,
-                        job_execution_id=execution.id,
-                        lineage_metadata={
-                            "hash": entity_hash,
-                            "confidence": confidence_score,
-                            "match_type": "duplicate",
-                            "match_score": match_score
-                        }
+            while standardized_records:
+                try:
+                    load_stats = entity_loader.load(standardized_records)
+                    db.execute(
+                        update(StandardizedData)
+                        .where(StandardizedData.id.in_([record.id for record in standardized_records]))
+                        .values(loaded_at=datetime.utcnow())
                     )
-                    db.add(lineage)
+                    save_checkpoint(execution, "load", paginator.checkpoint)
+                    db.add(execution)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+
+                records_processed += load_stats["records_processed"]
+                records_loaded += load_stats["records_loaded"]
+                records_duplicated += load_stats["records_duplicated"]
+                standardized_records = paginator.fetch_batch()
+
+            load_seconds = time.perf_counter() - load_started
+            logs.append(
+                f"Bulk loaded {records_processed} records in {load_seconds:.2f}s "
+                f"({records_processed / max(load_seconds, 1e-9):.0f} records/sec)"
+            )
+        else:
+            # Initialize services
+            entity_service = EntityService(db)
+            entity_matcher = EntityMatcher(db, execution_id, **load_config)
 
-                    records_duplicated += 1
-                    logger.debug(f"[PHASE 6] Record {std_record.id} marked as duplicate of {matched_entity.entity_id}")
+            # Step 2: Process records with individual commits for atomic operations
+            logger.debug(f"[PHASE 6] Starting record processing")
 
-                # Step 3d: UPDATE EXISTING ENTITY
-                elif matched_entity:
-                    logger.debug(f"[PHASE 6] Record {std_record.id} identified for MERGE with entity {matched_entity.entity_id}")
+            # Step 3: Process each standardized record, batch by batch
+            while standardized_records:
+                for std_record in standardized_records:
+                    records_processed += 1
 
-                    # SELECT existing entity
-                    existing_entity = matched_entity
+                    try:
+                        logger.debug(
+                            f"[PHASE 6] Processing record {records_processed}/{len(standardized_records)} "
+                            f"(std_record_id: {std_record.id})"
+                        )
 
-                    # MERGE DATA with CONFLICT RESOLUTION
-                    merged_data = await _merge_entity_data(
-                        existing_data=existing_entity.entity_data or {},
-                        new_data=std_record.standardized_data,
-                        confidence_score=float(confidence_score),
-                        strategy=conflict_resolution
-                    )
+                        # Step 3a: Entity Matching
+                        logger.debug(f"[PHASE 6] Matching entity for record {std_record.id}")
 
-                    # CREATE change_log entry
-                    change_log = ChangeLog(
-                        entity_id=existing_entity.entity_id,
-                        change_type="UPDATE",
-                        old_value=existing_entity.entity_data,
-                        new_value=merged_data,
-                        change_details={
-                            "merge_strategy": conflict_resolution,
-                            "new_confidence": confidence_score,
-                            "old_confidence": existing_entity.confidence_score,
-                            "match_score": match_score
-                        }
-                    )
-                    db.add(change_log)
-
-                    # UPDATE entities
-                    existing_entity.entity_data = merged_data
-                    existing_entity.confidence_score = float(max(
-                        existing_entity.confidence_score or 0,
-                        confidence_score
-                    ))
-                    existing_entity.version += 1
-                    existing_entity.last_updated = datetime.utcnow()
-                    db.add(existing_entity)
-
-                    # INSERT data_lineage (merge)
-                    lineage = DataLineage(
-                        source_entity_id=std_record.id,
-                        source_entity_type="StandardizedData",
-                        target_entity_id=existing_entity.entity_id,
-                        target_entity_type=entity_type,
-                        transformation_rule_id=None,
-                        job_execution_id=execution.id,
-                        lineage_metadata={
-                            "hash": entity_hash,
-                            "confidence": confidence_score,
-                            "match_type": "update",
-                            "match_score": match_score
-                        }
-                    )
-                    db.add(lineage)
+                        # Calculate entity_hash from key_fields
+                        hash_input = "_".join(
+                            str(std_record.standardized_data.get(field, "")) for field in key_fields
+                        )
+                        entity_hash = hashlib.md5(hash_input.encode()).hexdigest()
+
+                        # Match entity
+                        match_result = await entity_matcher.match_entity(
+                            std_record.standardized_data,
+                            entity_type,
+                            entity_hash,
+                            similarity_threshold
+                        )
 
-                    records_merged += 1
-                    records_loaded += 1
-                    logger.debug(f"[PHASE 6] Record {std_record.id} merged into entity {existing_entity.entity_id}")
+                        # Unpack match result
+                        is_new = match_result.get("is_new", True)
+                        is_duplicate = match_result.get("is_duplicate", False)
+                        matched_entity = match_result.get("matched_entity")
+                        confidence_score = match_result.get("confidence_score", 1.0)
+                        match_score = match_result.get("match_score", 0.0)
+
+                        # Step 3b: NEW ENTITY
+                        if is_new:
+                            logger.debug(f"[PHASE 6] Record {std_record.id} identified as NEW entity")
+
+                            # INSERT entities
+                            new_entity = Entity(
+                                entity_type=entity_type,
+                                entity_key=std_record.standardized_data.get(key_fields[0], f"entity_{std_record.id}"),
+                                entity_hash=entity_hash,
+                                entity_data=std_record.standardized_data,
+                                confidence_score=float(confidence_score),
+                                source_files=[std_record.source_file_id] if std_record.source_file_id else [],
+                                version=1,
+                                is_active=True
+                            )
+                            db.add(new_entity)
+                            db.flush()  # Flush to get the entity_id
+
+                            # INSERT data_lineage (standardized → entity)
+                            lineage = DataLineage(
+                                source_entity_id=std_record.id,
+                                source_entity_type="StandardizedData",
+                                target_entity_id=new_entity.entity_id,
+                                target_entity_type=entity_type,
+                                transformation_rule_id=None,
+                                job_execution_id=execution.id,
+                                lineage_metadata={
+                                    "hash": entity_hash,
+                                    "confidence": confidence_score,
+                                    "match_type": "new"
+                                }
+                            )
+                            db.add(lineage)
+
+                            records_loaded += 1
+                            logger.debug(f"[PHASE 6] NEW entity {new_entity.entity_id} created for record {std_record.id}")
+
+                        # Step 3c: DUPLICATE ENTITY
+                        elif is_duplicate and matched_entity:
+                            logger.debug(f"[PHASE 6] Record {std_record.id} identified as DUPLICATE of entity {matched_entity.entity_id}")
+
+                            # UPDATE entities: increment duplicate_count, set master_entity_id
+                            matched_entity.duplicate_count = (matched_entity.duplicate_count or 0) + 1
+                            matched_entity.master_entity_id = matched_entity.entity_id  # Self-reference for primary
+                            db.add(matched_entity)
+
+                            # INSERT entity_relationships (duplicate_of)
+                            relationship = EntityRelationship(
+                                entity_from=std_record.id,
+                                entity_to=matched_entity.entity_id,
+                                relationship_type="duplicate_of",
+                                relationship_strength=float(match_score),
+                                metadata={
+                                    "confidence": confidence_score,
+                                    "hash_match": entity_hash == getattr(matched_entity, 'entity_hash', None),
+                                    "fuzzy_score": match_score
+                                }
+                            )
+                            db.add(relationship)
+
+                            # INSERT data_lineage (duplicate link)
+                            lineage = DataLineage(
+                                source_entity_id=std_record.id,
+                                source_entity_type="StandardizedData",
+                                target_entity_id=matched_entity.entity_id,
+                                target_entity_type=entity_type,
+                                transformation_rule_id=None,
+                                job_execution_id=execution.id,
+                                lineage_metadata={
+                                    "hash": entity_hash,
+                                    "confidence": confidence_score,
+                                    "match_type": "duplicate",
+                                    "match_score": match_score
+                                }
+                            )
+                            db.add(lineage)
+
+                            records_duplicated += 1
+                            logger.debug(f"[PHASE 6] Record {std_record.id} marked as duplicate of {matched_entity.entity_id}")
+
+                        # Step 3d: UPDATE EXISTING ENTITY
+                        elif matched_entity:
+                            logger.debug(f"[PHASE 6] Record {std_record.id} identified for MERGE with entity {matched_entity.entity_id}")
+
+                            # SELECT existing entity
+                            existing_entity = matched_entity
+
+                            # MERGE DATA with CONFLICT RESOLUTION
+                            merged_data = await _merge_entity_data(
+                                existing_data=existing_entity.entity_data or {},
+                                new_data=std_record.standardized_data,
+                                confidence_score=float(confidence_score),
+                                strategy=conflict_resolution
+                            )
+
+                            # CREATE change_log entry
+                            change_log = ChangeLog(
+                                entity_id=existing_entity.entity_id,
+                                change_type="UPDATE",
+                                old_value=existing_entity.entity_data,
+                                new_value=merged_data,
+                                change_details={
+                                    "merge_strategy": conflict_resolution,
+                                    "new_confidence": confidence_score,
+                                    "old_confidence": existing_entity.confidence_score,
+                                    "match_score": match_score
+                                }
+                            )
+                            db.add(change_log)
+
+                            # UPDATE entities
+                            existing_entity.entity_data = merged_data
+                            existing_entity.confidence_score = float(max(
+                                existing_entity.confidence_score or 0,
+                                confidence_score
+                            ))
+                            existing_entity.version += 1
+                            existing_entity.last_updated = datetime.utcnow()
+                            db.add(existing_entity)
+
+                            # INSERT data_lineage (merge)
+                            lineage = DataLineage(
+                                source_entity_id=std_record.id,
+                                source_entity_type="StandardizedData",
+                                target_entity_id=existing_entity.entity_id,
+                                target_entity_type=entity_type,
+                                transformation_rule_id=None,
+                                job_execution_id=execution.id,
+                                lineage_metadata={
+                                    "hash": entity_hash,
+                                    "confidence": confidence_score,
+                                    "match_type": "update",
+                                    "match_score": match_score
+                                }
+                            )
+                            db.add(lineage)
+
+                            records_merged += 1
+                            records_loaded += 1
+                            logger.debug(f"[PHASE 6] Record {std_record.id} merged into entity {existing_entity.entity_id}")
+
+                        std_record.loaded_at = datetime.utcnow()
+                        db.add(std_record)
+                        db.commit()
+
+                    except Exception as e:
+                        db.rollback()
+                        error_msg = f"Error processing record {std_record.id}: {str(e)}"
+                        logger.error(f"[PHASE 6] {error_msg}", exc_info=True)
+                        errors.append(error_msg)
+                        continue
 
+                save_checkpoint(execution, "load", paginator.checkpoint)
+                db.add(execution)
                 db.commit()
-
-            except Exception as e:
-                db.rollback()
-                error_msg = f"Error processing record {std_record.id}: {str(e)}"
-                logger.error(f"[PHASE 6] {error_msg}", exc_info=True)
-                errors.append(error_msg)
-                continue
+                standardized_records = paginator.fetch_batch()
 
         # Step 4: Finalize load
         logger.info(
@@ -1587,6 +1833,7 @@ async def load_records(
         db.add(execution)
         db.commit()
 
+        logs.append(f"Processed {records_processed} records in {paginator.batches_read} batches")
         logs.append(f"Successfully loaded {records_loaded} records")
         logs.append(f"Identified {records_duplicated} duplicates")
         logs.append(f"Merged {records_merged} existing entities")
@@ -1809,13 +2056,13 @@ def validate_file_format_task(self, file_id: str):
 
             # Get appropriate processor
             file_type = file_record.file_type.lower()
-            processor = get_processor(file_type, db_session=db)
+            metadata = file_record.file_metadata or {}
+            processor = get_processor(file_type, db_session=db, file_profile=metadata.get('file_profile'))
 
             # Validate file format
             is_valid, error_message = asyncio.run(processor.validate_file_format(file_record.file_path))
 
             # Update file metadata
-            metadata = file_record.file_metadata or {}
             metadata.update({
                 'format_validated': True,
                 'format_valid': is_valid,
@@ -1823,6 +2070,10 @@ def validate_file_format_task(self, file_id: str):
                 'validated_at': datetime.utcnow().isoformat(),
                 'validation_task_id': task_id
             })
+            # Keep the file profile so detection/processing don't sample the file again
+            file_profile = getattr(processor, 'file_profile', None)
+            if file_profile:
+                metadata['file_profile'] = file_profile
             file_record.file_metadata = metadata
             db.add(file_record)
             db.commit()
@@ -1868,7 +2119,9 @@ def preview_file_data_task(self, file_id: str, rows: int = 10):
 
             # Get appropriate processor
             file_type = file_record.file_type.lower()
-            processor = get_processor(file_type, db_session=db)
+            processor = get_processor(
+                file_type, db_session=db, file_profile=(file_record.file_metadata or {}).get('file_profile')
+            )
 
             # Generate preview
             preview_data = asyncio.run(processor.preview_data(file_record.file_path, rows))
@@ -7,6 +7,7 @@ from .data_normalizer import DataNormalizer
 from .data_validator import DataValidator
 from .entity_matcher import EntityMatcher
 from .aggregator import Aggregator
+from .streaming_pipeline import StreamingPipeline
 
 # Transformer registry for pipeline building
 TRANSFORMER_REGISTRY = {
@@ -110,6 +111,7 @@ __all__ = [
     "DataValidator",
     "EntityMatcher",
     "Aggregator",
+    "StreamingPipeline",
     "get_transformer",
     "create_transformation_pipeline",
     "get_supported_transformers",
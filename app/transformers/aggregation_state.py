@@ -0,0 +1,415 @@
+# ==============================================
+# app/transformers/aggregation_state.py
+# ==============================================
+"""
+Mergeable partial aggregation state for incremental aggregation.
+
+Every group keeps one accumulator per aggregation rule. Accumulators hold
+running state only (count, sum, min/max, Welford mean/variance) or a bounded
+sketch (HyperLogLog for distinct counts, a KLL-style compactor for quantiles),
+so memory grows with the number of groups rather than the number of records.
+All state is plain Python/NumPy and picklable, so partial states built on
+different batches or worker processes can be combined with ``merge``.
+"""
+import copy
+import math
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Aggregation types (AggregationType values) served by each accumulator kind
+NUMERIC_TYPES = {"sum", "avg", "stddev", "variance"}
+QUANTILE_TYPES = {"median", "percentile"}
+VALUE_LIST_TYPES = {"list", "concat", "group_concat"}
+
+
+class RunningStats:
+    """Count, sum, min, max and Welford mean/variance of numeric values"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray):
+        """Add a batch of numeric values"""
+        if len(values) == 0:
+            return
+        batch = RunningStats()
+        batch.count = len(values)
+        batch.total = values.sum().item()
+        batch.minimum = values.min().item()
+        batch.maximum = values.max().item()
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        self.merge(batch)
+
+    def merge(self, other: "RunningStats"):
+        """Combine with another partial state (Chan et al. parallel variance)"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def variance(self, ddof: int = 1) -> Optional[float]:
+        """Sample variance (``ddof=1``, like pandas) or None if undefined"""
+        if self.count <= ddof:
+            return None
+        return self.m2 / (self.count - ddof)
+
+
+class DistinctCountSketch:
+    """
+    Distinct counter that is exact up to ``exact_limit`` values and switches
+    to a HyperLogLog estimate (precision ``p``) beyond that.
+    """
+
+    def __init__(self, exact_limit: int = 10000, precision: int = 12):
+        self.exact_limit = exact_limit
+        self.precision = precision
+        self.values: Optional[set] = set()
+        self.registers: Optional[np.ndarray] = None
+
+    def update(self, values: np.ndarray):
+        """Add a batch of non-null values"""
+        if self.registers is None:
+            self.values.update(values.tolist())
+            if len(self.values) > self.exact_limit:
+                self._convert_to_registers()
+        else:
+            self._add_hashes(values)
+
+    def merge(self, other: "DistinctCountSketch"):
+        """Combine with another partial state"""
+        if self.registers is None and other.registers is None:
+            self.values |= other.values
+            if len(self.values) > self.exact_limit:
+                self._convert_to_registers()
+            return
+
+        if self.registers is None:
+            self._convert_to_registers()
+        if other.registers is None:
+            self._add_hashes(np.array(list(other.values), dtype=object))
+        else:
+            np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        """Number of distinct values (estimated once registers are in use)"""
+        if self.registers is None:
+            return len(self.values)
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(float)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Small range correction (linear counting)
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def _convert_to_registers(self):
+        self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+        values, self.values = self.values, None
+        self._add_hashes(np.array(list(values), dtype=object))
+
+    def _add_hashes(self, values: np.ndarray):
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_array(np.asarray(values, dtype=object))
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+
+        # Rank = position of the lowest set bit in the remaining bits
+        remaining_bits = 64 - self.precision
+        rest = hashes & np.uint64((1 << remaining_bits) - 1)
+        lowest_bit = rest & (~rest + np.uint64(1))
+        ranks = np.full(len(hashes), remaining_bits + 1, dtype=np.uint8)
+        nonzero = rest != 0
+        ranks[nonzero] = np.log2(lowest_bit[nonzero].astype(np.float64)).astype(np.uint8) + 1
+
+        np.maximum.at(self.registers, index, ranks)
+
+
+class QuantileSketch:
+    """
+    KLL-style quantile sketch.
+
+    Values are kept exactly until a level holds more than ``capacity`` items;
+    a full level is sorted and every other item is promoted to the next level
+    with double weight. While nothing has been compacted, quantiles are exact
+    and interpolated the same way as ``pd.Series.quantile``.
+    """
+
+    def __init__(self, capacity: int = 2048):
+        self.capacity = capacity
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._offset = 0
+
+    @property
+    def count(self) -> int:
+        return sum(len(items) << level for level, items in enumerate(self.levels))
+
+    def update(self, values: np.ndarray):
+        """Add a batch of numeric values"""
+        if len(values) == 0:
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values.astype(float)])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch"):
+        """Combine with another partial state"""
+        for level, items in enumerate(other.levels):
+            if level >= len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile ``q`` (0..1) or None when empty"""
+        if len(self.levels) == 1:
+            if len(self.levels[0]) == 0:
+                return None
+            return float(np.quantile(self.levels[0], q))
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(items), 1 << level, dtype=np.int64)
+            for level, items in enumerate(self.levels)
+        ])
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return float(values[order][min(position, len(values) - 1)])
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.capacity:
+                items = np.sort(items)
+                # Odd leftovers stay on this level so no weight is lost
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                promoted = pairs[self._offset::2]
+                self._offset ^= 1
+
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+
+class RuleAccumulator:
+    """Running state of one aggregation rule for one group"""
+
+    def __init__(self, aggregation_type: str, parameters: Optional[Dict[str, Any]] = None,
+                 sketch_capacity: int = 2048, distinct_exact_limit: int = 10000):
+        self.aggregation_type = aggregation_type
+        self.parameters = parameters or {}
+        self.count = 0
+        self.stats: Optional[RunningStats] = None
+        self.sketch: Optional[QuantileSketch] = None
+        self.distinct: Optional[DistinctCountSketch] = None
+        self.counter: Optional[Counter] = None
+        self.values: Optional[list] = None
+        self.first = None
+        self.last = None
+        self.minimum = None
+        self.maximum = None
+
+        if aggregation_type in NUMERIC_TYPES:
+            self.stats = RunningStats()
+        elif aggregation_type in QUANTILE_TYPES:
+            self.sketch = QuantileSketch(sketch_capacity)
+        elif aggregation_type == "unique_count":
+            self.distinct = DistinctCountSketch(distinct_exact_limit)
+        elif aggregation_type == "mode":
+            self.counter = Counter()
+        elif aggregation_type in VALUE_LIST_TYPES:
+            self.values = []
+
+    def update(self, values: np.ndarray):
+        """Add the non-null values of one group from a batch"""
+        values = values[~pd.isna(values)]
+        if len(values) == 0:
+            return
+        self.count += len(values)
+
+        if self.stats is not None:
+            self.stats.update(_to_numeric(values))
+        elif self.sketch is not None:
+            self.sketch.update(_to_numeric(values))
+        elif self.distinct is not None:
+            self.distinct.update(values)
+        elif self.counter is not None:
+            self.counter.update(values.tolist())
+        elif self.values is not None:
+            self.values.extend(values.tolist())
+        elif self.aggregation_type in ("min", "max"):
+            low, high = min(values.tolist()), max(values.tolist())
+            self.minimum = low if self.minimum is None else min(self.minimum, low)
+            self.maximum = high if self.maximum is None else max(self.maximum, high)
+        else:
+            if self.first is None:
+                self.first = values[0]
+            self.last = values[-1]
+
+    def merge(self, other: "RuleAccumulator"):
+        """Combine with the accumulator of the same rule from a later partial state"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.__dict__.update(copy.deepcopy(other.__dict__))
+            return
+        self.count += other.count
+
+        if self.stats is not None:
+            self.stats.merge(other.stats)
+        elif self.sketch is not None:
+            self.sketch.merge(other.sketch)
+        elif self.distinct is not None:
+            self.distinct.merge(other.distinct)
+        elif self.counter is not None:
+            self.counter.update(other.counter)
+        elif self.values is not None:
+            self.values.extend(other.values)
+        elif self.aggregation_type in ("min", "max"):
+            self.minimum = min(self.minimum, other.minimum)
+            self.maximum = max(self.maximum, other.maximum)
+        else:
+            self.last = other.last
+
+    def result(self) -> Any:
+        """Final aggregated value"""
+        aggregation_type = self.aggregation_type
+        if aggregation_type == "count":
+            return self.count
+        if aggregation_type == "sum":
+            # Like groupby().sum(), a group without numeric values sums to 0
+            return self.stats.total if self.stats.count else 0
+        if self.count == 0:
+            return None
+
+        if aggregation_type == "avg":
+            return self.stats.mean if self.stats.count else None
+        if aggregation_type == "stddev":
+            variance = self.stats.variance()
+            return math.sqrt(variance) if variance is not None else None
+        if aggregation_type == "variance":
+            return self.stats.variance()
+        if aggregation_type == "median":
+            return self.sketch.quantile(0.5)
+        if aggregation_type == "percentile":
+            return self.sketch.quantile(self.parameters.get('percentile', 50) / 100)
+        if aggregation_type == "unique_count":
+            return self.distinct.estimate()
+        if aggregation_type == "mode":
+            return self.counter.most_common(1)[0][0]
+        if aggregation_type == "list":
+            return list(self.values)
+        if aggregation_type in ("concat", "group_concat"):
+            separator = self.parameters.get('separator', ',')
+            return separator.join(map(str, self.values))
+        if aggregation_type == "min":
+            return self.minimum
+        if aggregation_type == "max":
+            return self.maximum
+        if aggregation_type == "first":
+            return self.first
+        if aggregation_type == "last":
+            return self.last
+        # Default for anything else
+        return self.stats.total if self.stats is not None and self.stats.count else None
+
+
+class GroupedAggregationState:
+    """
+    Partial aggregation state: one accumulator per rule for every group key.
+
+    Keys are tuples over all configured group columns (None where a column was
+    absent). The set of group columns and source fields actually seen is kept
+    so the materialized table matches what a full DataFrame aggregation of the
+    same records would contain.
+    """
+
+    def __init__(self, rule_specs: Sequence[Tuple[str, Dict[str, Any]]],
+                 sketch_capacity: int = 2048, distinct_exact_limit: int = 10000):
+        """
+        Args:
+            rule_specs: (aggregation type value, parameters) per aggregation rule
+            sketch_capacity: Items per quantile sketch level
+            distinct_exact_limit: Distinct values counted exactly before HyperLogLog
+        """
+        self.rule_specs = [(aggregation_type, dict(parameters or {})) for aggregation_type, parameters in rule_specs]
+        self.sketch_capacity = sketch_capacity
+        self.distinct_exact_limit = distinct_exact_limit
+        self.groups: Dict[Tuple, List[RuleAccumulator]] = {}
+        self.record_count = 0
+        self.seen_group_columns: set = set()
+        self.seen_source_fields: set = set()
+
+    def observe(self, record_count: int, group_columns: Iterable[str], source_fields: Iterable[str]):
+        """Record batch size and which columns were present in it"""
+        self.record_count += record_count
+        self.seen_group_columns.update(group_columns)
+        self.seen_source_fields.update(source_fields)
+
+    def get_group(self, key: Tuple) -> List[RuleAccumulator]:
+        """Accumulators of a group, created on first use"""
+        accumulators = self.groups.get(key)
+        if accumulators is None:
+            accumulators = [
+                RuleAccumulator(aggregation_type, parameters, self.sketch_capacity, self.distinct_exact_limit)
+                for aggregation_type, parameters in self.rule_specs
+            ]
+            self.groups[key] = accumulators
+        return accumulators
+
+    def update(self, key: Tuple, rule_index: int, values: np.ndarray):
+        """Add values of one rule for one group"""
+        self.get_group(key)[rule_index].update(values)
+
+    def merge(self, other: "GroupedAggregationState"):
+        """
+        Merge another partial state into this one
+
+        ``other`` is treated as coming after this state, which matters only
+        for first/last/list/concat ordering.
+        """
+        if [spec[0] for spec in other.rule_specs] != [spec[0] for spec in self.rule_specs]:
+            raise ValueError("Cannot merge aggregation states built from different rules")
+
+        self.record_count += other.record_count
+        self.seen_group_columns |= other.seen_group_columns
+        self.seen_source_fields |= other.seen_source_fields
+
+        for key, other_accumulators in other.groups.items():
+            accumulators = self.get_group(key)
+            for accumulator, other_accumulator in zip(accumulators, other_accumulators):
+                accumulator.merge(other_accumulator)
+
+
+def _to_numeric(values: np.ndarray) -> np.ndarray:
+    """Coerce values to a numeric array, dropping anything non-numeric"""
+    if values.dtype.kind in "iuf":
+        return values
+    if values.dtype.kind == "b":
+        return values.astype(np.int64)
+    numeric = pd.to_numeric(pd.Series(values), errors='coerce').dropna()
+    return numeric.to_numpy()
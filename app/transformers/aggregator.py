@@ -12,6 +12,7 @@ from collections import defaultdict, Counter
 import statistics
 
 from .base_transformer import BaseTransformer, TransformationResult, TransformationStatus
+from .aggregation_state import GroupedAggregationState, NUMERIC_TYPES, QUANTILE_TYPES
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -116,9 +117,24 @@ class Aggregator(BaseTransformer):
         self.enable_hierarchical = kwargs.get('enable_hierarchical', False)
         self.hierarchy_levels = kwargs.get('hierarchy_levels', [])
         
+        # Incremental aggregation: keep per-group running state instead of raw records
+        self.incremental = kwargs.get('incremental', True)
+        self.aggregation_chunk_size = kwargs.get('aggregation_chunk_size', 10000)
+        self.sketch_capacity = kwargs.get('sketch_capacity', 2048)
+        self.distinct_exact_limit = kwargs.get('distinct_exact_limit', 10000)
+        
         # Data storage for aggregation
         self.data_buffer = []
         self.aggregated_results = {}
+        self.partial_state = self._create_partial_state()
+        
+        # Quantile buckets need the whole dataset, so they keep the buffered mode
+        if self.incremental and any(
+            rule.custom_buckets and rule.custom_buckets.get('type', 'range') == 'quantile'
+            for rule in self.grouping_rules
+        ):
+            self.logger.info("Quantile buckets require buffered aggregation, incremental mode disabled")
+            self.incremental = False
         
         # Custom aggregation functions
         self.custom_aggregators = {
@@ -222,14 +238,23 @@ class Aggregator(BaseTransformer):
             # Add record to buffer
             self.data_buffer.append(record.copy())
             
+            metadata = {
+                'added_to_buffer': True,
+                'buffer_size': len(self.data_buffer)
+            }
+            
+            # Fold full chunks into the running group state
+            if self.incremental:
+                if len(self.data_buffer) >= self.aggregation_chunk_size:
+                    await self._flush_buffer_to_state()
+                metadata['records_aggregated'] = self.partial_state.record_count
+                metadata['groups'] = len(self.partial_state.groups)
+            
             # Return success but no data yet (aggregation happens in finalize)
             return TransformationResult(
                 status=TransformationStatus.SUCCESS,
                 data=None,  # No individual record output
-                metadata={
-                    'added_to_buffer': True,
-                    'buffer_size': len(self.data_buffer)
-                }
+                metadata=metadata
             )
             
         except Exception as e:
@@ -247,23 +272,33 @@ class Aggregator(BaseTransformer):
             TransformationResult with aggregated data
         """
         try:
-            if not self.data_buffer:
+            if self.incremental:
+                await self._flush_buffer_to_state()
+                source_records = self.partial_state.record_count
+            else:
+                source_records = len(self.data_buffer)
+            
+            if not source_records:
                 return TransformationResult(
                     status=TransformationStatus.SUCCESS,
                     data=[],
                     metadata={'message': 'No data to aggregate'}
                 )
             
-            self.logger.info(f"Starting aggregation of {len(self.data_buffer)} records")
-            
-            # Convert to DataFrame for easier processing
-            df = pd.DataFrame(self.data_buffer)
+            self.logger.info(f"Starting aggregation of {source_records} records")
             
-            # Apply preprocessing
-            df = await self._preprocess_data(df)
-            
-            # Perform main aggregation
-            aggregated_data = await self._perform_aggregation(df)
+            if self.incremental:
+                # Only the group table is materialized
+                aggregated_data = self._materialize_partial_state()
+            else:
+                # Convert to DataFrame for easier processing
+                df = pd.DataFrame(self.data_buffer)
+                
+                # Apply preprocessing
+                df = await self._preprocess_data(df)
+                
+                # Perform main aggregation
+                aggregated_data = await self._perform_aggregation(df)
             
             # Apply rolling aggregations if enabled
             if self.enable_rolling:
@@ -277,7 +312,7 @@ class Aggregator(BaseTransformer):
             formatted_results = await self._format_output(aggregated_data)
             
             # Generate statistics
-            metadata = await self._generate_aggregation_metadata(df, aggregated_data)
+            metadata = await self._generate_aggregation_metadata(source_records, aggregated_data)
             
             self.logger.info(f"Aggregation completed: {len(formatted_results)} result groups")
             
@@ -296,6 +331,8 @@ class Aggregator(BaseTransformer):
     
     async def _preprocess_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Preprocess data before aggregation"""
+        self._coerce_numeric_sources(df)
+        
         # Handle missing values
         if self.handle_nulls == 'zero':
             numeric_columns = df.select_dtypes(include=[np.number]).columns
@@ -335,9 +372,34 @@ class Aggregator(BaseTransformer):
         
         return df
     
-    async def _perform_aggregation(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Perform main aggregation"""
-        # Determine grouping columns
+    def _coerce_numeric_sources(self, df: pd.DataFrame):
+        """
+        Convert source fields of numeric aggregations to numbers
+        
+        Values that are not numbers become null, so string columns aggregate
+        the same way in incremental and buffered mode. A field with values
+        but no numeric one is rejected instead of aggregating to None.
+        """
+        for rule in self.aggregation_rules:
+            aggregation_type = rule.aggregation_type.value
+            if aggregation_type not in NUMERIC_TYPES and aggregation_type not in QUANTILE_TYPES:
+                continue
+            if rule.source_field not in df.columns:
+                continue
+            
+            column = df[rule.source_field]
+            if pd.api.types.is_numeric_dtype(column):
+                continue
+            
+            numeric = pd.to_numeric(column, errors='coerce')
+            if column.notna().any() and numeric.isna().all():
+                raise ValueError(
+                    f"Field '{rule.source_field}' has no numeric values for {aggregation_type} aggregation"
+                )
+            df[rule.source_field] = numeric
+    
+    def _get_group_by_columns(self) -> List[str]:
+        """Determine grouping columns produced by preprocessing"""
         group_by_columns = []
         for grouping_rule in self.grouping_rules:
             if grouping_rule.alias:
@@ -350,6 +412,12 @@ class Aggregator(BaseTransformer):
                 group_by_columns.append(f"{grouping_rule.field_name}_transformed")
             else:
                 group_by_columns.append(grouping_rule.field_name)
+        return group_by_columns
+    
+    async def _perform_aggregation(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Perform main aggregation"""
+        # Determine grouping columns
+        group_by_columns = self._get_group_by_columns()
         
         # Filter columns that actually exist
         existing_group_columns = [col for col in group_by_columns if col in df.columns]
@@ -395,6 +463,122 @@ class Aggregator(BaseTransformer):
         
         return result_df
     
+    def _create_partial_state(self) -> GroupedAggregationState:
+        """Create an empty partial state for the configured aggregation rules"""
+        return GroupedAggregationState(
+            [(rule.aggregation_type.value, rule.parameters) for rule in self.aggregation_rules],
+            sketch_capacity=self.sketch_capacity,
+            distinct_exact_limit=self.distinct_exact_limit
+        )
+    
+    async def _flush_buffer_to_state(self):
+        """Preprocess buffered records and fold them into the partial state"""
+        if not self.data_buffer:
+            return
+        
+        df = pd.DataFrame(self.data_buffer)
+        self.data_buffer = []
+        
+        df = await self._preprocess_data(df)
+        self._update_partial_state(df)
+    
+    def _update_partial_state(self, df: pd.DataFrame):
+        """Update per-group running state from a preprocessed chunk"""
+        group_by_columns = self._get_group_by_columns()
+        self.partial_state.observe(
+            len(df),
+            [col for col in group_by_columns if col in df.columns],
+            [rule.source_field for rule in self.aggregation_rules if rule.source_field in df.columns]
+        )
+        
+        # Register every group, even if conditions leave it without values
+        for key in self._group_indices(df, group_by_columns):
+            self.partial_state.get_group(key)
+        
+        for rule_index, rule in enumerate(self.aggregation_rules):
+            if rule.source_field not in df.columns:
+                continue
+            
+            rule_df = df.query(rule.condition) if rule.condition else df
+            if rule_df.empty:
+                continue
+            
+            values = rule_df[rule.source_field].to_numpy()
+            for key, indices in self._group_indices(rule_df, group_by_columns).items():
+                self.partial_state.update(key, rule_index, values[indices])
+    
+    def _group_indices(self, df: pd.DataFrame, group_by_columns: List[str]) -> Dict[Tuple, np.ndarray]:
+        """Map group key tuples (None for missing values) to row positions"""
+        if not group_by_columns:
+            return {(): np.arange(len(df))}
+        
+        keys_df = df.reindex(columns=group_by_columns)
+        grouped = keys_df.groupby(group_by_columns, dropna=False, sort=False, observed=True)
+        
+        group_indices = {}
+        for key, indices in grouped.indices.items():
+            if not isinstance(key, tuple):
+                key = (key,)
+            key = tuple(None if pd.isna(value) else value for value in key)
+            group_indices[key] = indices
+        return group_indices
+    
+    def _materialize_partial_state(self) -> pd.DataFrame:
+        """Build the aggregated group table from the partial state"""
+        group_by_columns = self._get_group_by_columns()
+        state = self.partial_state
+        
+        # Keep only columns that were present, like the DataFrame aggregation
+        key_positions = [
+            position for position, col in enumerate(group_by_columns)
+            if col in state.seen_group_columns
+        ]
+        existing_group_columns = [group_by_columns[position] for position in key_positions]
+        active_rules = [
+            (rule_index, rule) for rule_index, rule in enumerate(self.aggregation_rules)
+            if rule.source_field in state.seen_source_fields
+        ]
+        
+        rows = []
+        for key, accumulators in state.groups.items():
+            group_values = [key[position] for position in key_positions]
+            if any(value is None for value in group_values):
+                continue  # Null group keys are dropped, as in groupby
+            
+            row = dict(zip(existing_group_columns, group_values))
+            for rule_index, rule in active_rules:
+                target_field = rule.target_field or f"{rule.source_field}_{rule.aggregation_type.value}"
+                row[target_field] = accumulators[rule_index].result()
+            rows.append(row)
+        
+        result_df = pd.DataFrame(rows)
+        if existing_group_columns and not result_df.empty:
+            try:
+                result_df = result_df.sort_values(existing_group_columns, ignore_index=True)
+            except TypeError:
+                pass  # Mixed key types keep insertion order
+        
+        return result_df
+    
+    async def get_partial_state(self) -> GroupedAggregationState:
+        """
+        Flush buffered records and return the partial aggregation state
+        
+        The state is picklable and can be merged into another aggregator,
+        e.g. to combine batches aggregated by different worker processes.
+        """
+        await self._flush_buffer_to_state()
+        return self.partial_state
+    
+    def merge_partial_state(self, state: GroupedAggregationState):
+        """
+        Merge a partial state produced by another aggregator with the same rules
+        
+        Args:
+            state: Partial state from ``get_partial_state``
+        """
+        self.partial_state.merge(state)
+    
     async def _aggregate_entire_dataset(self, df: pd.DataFrame) -> pd.DataFrame:
         """Aggregate entire dataset without grouping"""
         result_data = {}
@@ -692,15 +876,16 @@ class Aggregator(BaseTransformer):
         
         return [summary]
     
-    async def _generate_aggregation_metadata(self, source_df: pd.DataFrame, result_df: pd.DataFrame) -> Dict[str, Any]:
+    async def _generate_aggregation_metadata(self, source_records: int, result_df: pd.DataFrame) -> Dict[str, Any]:
         """Generate metadata about aggregation process"""
         return {
-            'source_records': len(source_df),
+            'source_records': source_records,
             'result_groups': len(result_df),
             'aggregation_rules_applied': len(self.aggregation_rules),
             'grouping_rules_applied': len(self.grouping_rules),
-            'compression_ratio': len(result_df) / len(source_df) if len(source_df) > 0 else 0,
+            'compression_ratio': len(result_df) / source_records if source_records > 0 else 0,
             'processing_mode': {
+                'incremental': self.incremental,
                 'rolling_enabled': self.enable_rolling,
                 'hierarchical_enabled': self.enable_hierarchical,
                 'output_format': self.output_format
@@ -722,3 +907,40 @@ class Aggregator(BaseTransformer):
         values = values[values > 0]  # Remove non-positive values
         return len(values) / (1.0 / values).sum() if len(values) > 0 else 0
     
+    
+    def _geometric_mean(self, values: pd.Series) -> float:
+        """Calculate geometric mean"""
+        values = values[values > 0]  # Remove non-positive values
+        return float(np.exp(np.log(values).mean())) if len(values) > 0 else 0
+    
+    def _calculate_quartiles(self, values: pd.Series) -> Dict[str, float]:
+        """Calculate first, second and third quartiles"""
+        return {
+            'q1': values.quantile(0.25),
+            'q2': values.quantile(0.5),
+            'q3': values.quantile(0.75)
+        }
+    
+    def _count_outliers(self, values: pd.Series) -> int:
+        """Count values outside 1.5 * IQR"""
+        q1, q3 = values.quantile(0.25), values.quantile(0.75)
+        iqr = q3 - q1
+        return int(((values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)).sum())
+    
+    def _calculate_entropy(self, values: pd.Series) -> float:
+        """Calculate Shannon entropy of the value distribution"""
+        probabilities = values.value_counts(normalize=True)
+        return float(-(probabilities * np.log2(probabilities)).sum())
+    
+    def _calculate_correlation(self, values: pd.Series, other: pd.Series) -> float:
+        """Calculate Pearson correlation between two series"""
+        return values.corr(other)
+    
+    def _calculate_skewness(self, values: pd.Series) -> float:
+        """Calculate skewness"""
+        return pd.Series(values).skew()
+    
+    def _calculate_kurtosis(self, values: pd.Series) -> float:
+        """Calculate kurtosis"""
+        return pd.Series(values).kurt()
+
@@ -2,14 +2,14 @@
 # app/transformers/base_transformer.py
 # ==============================================
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 from sqlmodel import Session
-import hashlib
-import json
 from enum import Enum
+import pandas as pd
 
 from app.utils.logger import get_logger
+from app.utils.record_fingerprint import get_fingerprinter
 from app.core.exceptions import DataTransformationException
 from app.infrastructure.db.models.staging.standardized_data import StandardizedData
 from app.infrastructure.db.models.etl_control.job_executions import JobExecution
@@ -96,6 +96,8 @@ class BaseTransformer(ABC):
         self.error_threshold = kwargs.get('error_threshold', 0.05)  # 5% error rate
         self.skip_invalid_records = kwargs.get('skip_invalid_records', True)
         self.preserve_source_data = kwargs.get('preserve_source_data', False)
+        self.columnar = kwargs.get('columnar', False)  # Column-wise batch execution
+        self.fingerprinter = get_fingerprinter(kwargs.get('hash_algorithm'))
         
         # Transformation statistics
         self.records_processed = 0
@@ -139,63 +141,132 @@ class BaseTransformer(ABC):
         """
         Transform a batch of records
         
+        With ``columnar`` enabled the batch is handed to ``transform_columns``
+        as a DataFrame; transformers without a columnar implementation, or
+        batches that can't be represented as one, use the row path. Result
+        statistics and error limits are applied once per batch on both paths.
+        
         Args:
             records: List of records to transform
             
         Returns:
             List of TransformationResult objects
         """
+        if self.columnar and records:
+            columnar_results = await self._transform_batch_columnar(records)
+            if columnar_results is not None:
+                try:
+                    self._update_batch_statistics(columnar_results)
+                except Exception as e:
+                    self._handle_batch_error(e, columnar_results)
+                return columnar_results
+        
         results = []
+        transformed = []
         
         for record in records:
             try:
                 result = await self.transform_record(record)
-                results.append(result)
-                
-                # Update statistics
-                self.records_processed += 1
-                
-                if result.is_success():
-                    self.records_transformed += 1
-                elif result.is_failed():
-                    self.records_failed += 1
-                    self.transformation_errors.extend(result.errors)
-                else:  # SKIPPED
-                    self.records_skipped += 1
-                
-                if result.has_warnings():
-                    self.transformation_warnings.extend(result.warnings)
-                
-                # Check error threshold
-                if self.records_processed > 0:
-                    error_rate = self.records_failed / self.records_processed
-                    if error_rate > self.error_threshold:
-                        raise DataTransformationException(
-                            f"Error rate ({error_rate:.2%}) exceeds threshold ({self.error_threshold:.2%})"
-                        )
-                
-                # Check max errors
-                if len(self.transformation_errors) > self.max_errors:
-                    raise DataTransformationException(
-                        f"Maximum error count ({self.max_errors}) exceeded"
-                    )
-                
             except Exception as e:
-                self.logger.error(f"Error transforming record: {str(e)}")
-                
-                if self.skip_invalid_records:
-                    error_result = TransformationResult(
-                        status=TransformationStatus.FAILED,
-                        errors=[str(e)]
-                    )
-                    results.append(error_result)
-                    self.records_failed += 1
-                    self.transformation_errors.append(str(e))
-                else:
-                    raise DataTransformationException(f"Record transformation failed: {str(e)}")
+                self._handle_batch_error(e, results)
+                continue
+            results.append(result)
+            transformed.append(result)
+        
+        try:
+            self._update_batch_statistics(transformed)
+        except Exception as e:
+            self._handle_batch_error(e, results)
         
         return results
     
+    def _update_batch_statistics(self, results: List[TransformationResult]):
+        """Update statistics for a batch of results and enforce error limits"""
+        transformed = failed = 0
+        
+        for result in results:
+            if result.is_success():
+                transformed += 1
+            elif result.is_failed():
+                failed += 1
+                self.transformation_errors.extend(result.errors)
+            
+            if result.has_warnings():
+                self.transformation_warnings.extend(result.warnings)
+        
+        self.records_processed += len(results)
+        self.records_transformed += transformed
+        self.records_failed += failed
+        self.records_skipped += len(results) - transformed - failed
+        
+        # Check error threshold
+        if self.records_processed > 0:
+            error_rate = self.records_failed / self.records_processed
+            if error_rate > self.error_threshold:
+                raise DataTransformationException(
+                    f"Error rate ({error_rate:.2%}) exceeds threshold ({self.error_threshold:.2%})"
+                )
+        
+        # Check max errors
+        if len(self.transformation_errors) > self.max_errors:
+            raise DataTransformationException(
+                f"Maximum error count ({self.max_errors}) exceeded"
+            )
+    
+    def _handle_batch_error(self, error: Exception, results: List[TransformationResult]):
+        """Record a failed transformation or re-raise when invalid records are not skipped"""
+        self.logger.error(f"Error transforming record: {str(error)}")
+        
+        if self.skip_invalid_records:
+            error_result = TransformationResult(
+                status=TransformationStatus.FAILED,
+                errors=[str(error)]
+            )
+            results.append(error_result)
+            self.records_failed += 1
+            self.transformation_errors.append(str(error))
+        else:
+            raise DataTransformationException(f"Record transformation failed: {str(error)}")
+    
+    async def _transform_batch_columnar(self, records: List[Dict[str, Any]]) -> Optional[List[TransformationResult]]:
+        """
+        Run ``transform_columns`` on a batch
+        
+        Returns:
+            Results in record order, or None to use the row path
+        """
+        # Column-wise execution needs one schema (same fields, same order)
+        fields = tuple(records[0])
+        if any(tuple(record) != fields for record in records):
+            return None
+        
+        # Object dtype keeps the original Python values (no int -> float coercion)
+        columns = pd.DataFrame(records, columns=list(fields), dtype=object)
+        
+        try:
+            return await self.transform_columns(columns, records)
+        except Exception as e:
+            self.logger.warning(f"Columnar transformation failed, using row path: {str(e)}")
+            return None
+    
+    async def transform_columns(self,
+                                columns: pd.DataFrame,
+                                records: List[Dict[str, Any]]) -> Optional[List[TransformationResult]]:
+        """
+        Transform a batch column-wise
+        
+        Override in transformers whose rules can be applied to whole columns.
+        Results must match what ``transform_record`` returns for each record.
+        
+        Args:
+            columns: Batch as an object-dtype DataFrame, one column per field
+            records: The same batch as records
+            
+        Returns:
+            TransformationResult per record, or None if not supported
+        """
+        return None
+    
     async def transform_dataset(self, 
                               input_data: List[Dict[str, Any]], 
                               output_entity_type: str = None) -> Dict[str, Any]:
@@ -248,13 +319,73 @@ class BaseTransformer(ABC):
             return {
                 "statistics": statistics,
                 "results": all_results,
-                "success": self.records_failed == 0 or (self.records_failed / self.records_processed) <= self.error_threshold
+                "success": self._is_successful_run()
             }
             
         except Exception as e:
             self.logger.error(f"Dataset transformation failed: {str(e)}")
             raise DataTransformationException(f"Dataset transformation failed: {str(e)}")
     
+    async def transform_stream(self, 
+                             batches: AsyncIterator[List[Dict[str, Any]]], 
+                             output_entity_type: str = None) -> AsyncIterator[List[TransformationResult]]:
+        """
+        Transform a stream of record batches lazily
+        
+        Streaming counterpart of ``transform_dataset``: each incoming batch is
+        transformed (split by ``batch_size``), saved and committed before the
+        next one is pulled, and results are yielded instead of collected.
+        Statistics cover the whole stream and are available through
+        ``get_transformation_summary`` once the stream is exhausted.
+        
+        Args:
+            batches: Async iterator of record batches
+            output_entity_type: Entity type for output records
+            
+        Yields:
+            List of TransformationResult objects per batch
+        """
+        try:
+            self.start_time = datetime.utcnow()
+            self.end_time = None
+            
+            # Validate configuration
+            is_valid, validation_errors = await self.validate_config()
+            if not is_valid:
+                raise DataTransformationException(f"Invalid configuration: {validation_errors}")
+            
+            # Reset statistics
+            self._reset_statistics()
+            
+            batch_number = 0
+            async for records in batches:
+                for i in range(0, len(records), self.batch_size):
+                    batch = records[i:i + self.batch_size]
+                    batch_number += 1
+                    
+                    self.logger.debug(f"Processing stream batch {batch_number}: {len(batch)} records")
+                    
+                    batch_results = await self.transform_batch(batch)
+                    
+                    # Save results to database as the batch completes
+                    if output_entity_type:
+                        await self._save_batch_results(batch_results, output_entity_type)
+                    
+                    self.db.commit()
+                    
+                    yield batch_results
+            
+            self.end_time = datetime.utcnow()
+            self.logger.info(f"Stream transformation completed: {self._generate_statistics()}")
+            
+        except Exception as e:
+            self.logger.error(f"Stream transformation failed: {str(e)}")
+            raise DataTransformationException(f"Stream transformation failed: {str(e)}")
+    
+    def _is_successful_run(self) -> bool:
+        """Whether the failure rate of the run stays within the error threshold"""
+        return self.records_failed == 0 or (self.records_failed / self.records_processed) <= self.error_threshold
+    
     async def _save_batch_results(self, 
                                  results: List[TransformationResult], 
                                  entity_type: str):
@@ -370,13 +501,7 @@ class BaseTransformer(ABC):
     
     def _generate_record_hash(self, record: Dict[str, Any]) -> str:
         """Generate hash for record deduplication"""
-        try:
-            sorted_record = {k: v for k, v in sorted(record.items())}
-            record_string = json.dumps(sorted_record, sort_keys=True, default=str)
-            return hashlib.sha256(record_string.encode()).hexdigest()
-        except Exception as e:
-            self.logger.warning(f"Error generating record hash: {str(e)}")
-            return hashlib.sha256(str(record).encode()).hexdigest()
+        return self.fingerprinter.fingerprint(record)
     
     def _safe_convert_type(self, value: Any, target_type: type) -> Tuple[Any, bool]:
         """
@@ -14,11 +14,24 @@ Handles fundamental data cleaning operations:
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from .base_transformer import BaseTransformer, TransformationResult, TransformationStatus
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Field rule types that are plain string operations, and the metadata key they report
+STRING_RULE_OPERATIONS = {
+    "trim": "fields_cleaned",
+    "lowercase": "case_normalized",
+    "uppercase": "case_normalized",
+    "titlecase": "case_normalized",
+    "remove_chars": "special_chars_removed",
+    "replace": "fields_cleaned",
+}
+
 
 class DataCleaner(BaseTransformer):
     """
@@ -89,14 +102,7 @@ class DataCleaner(BaseTransformer):
         try:
             cleaned_record = {}
             warnings = []
-            metadata = {
-                "fields_cleaned": [],
-                "null_values_handled": [],
-                "empty_values_handled": [],
-                "case_normalized": [],
-                "special_chars_removed": [],
-                "type_conversions": [],
-            }
+            metadata = self._new_cleaning_metadata()
 
             # Process each field in the record
             for field_name, field_value in record.items():
@@ -129,6 +135,196 @@ class DataCleaner(BaseTransformer):
                 errors=[f"Data cleaning failed: {str(e)}"],
             )
 
+    async def transform_columns(
+        self, columns: pd.DataFrame, records: List[Dict[str, Any]]
+    ) -> Optional[List[TransformationResult]]:
+        """
+        Clean a batch column by column
+
+        String operations run as ``Series.str`` kernels over all string values
+        of a column and null/empty handling as masks; columns with values the
+        kernels can't take fall back to ``_clean_value`` per value.
+
+        Args:
+            columns: Batch as an object-dtype DataFrame
+            records: The same batch as records
+
+        Returns:
+            TransformationResult per record
+        """
+        field_names = list(columns.columns)
+        metadata_rows = [self._new_cleaning_metadata() for _ in records]
+        cleaned_columns = []
+        totals = {operation: np.zeros(len(records), dtype=int) for operation in metadata_rows[0]}
+
+        for field_name in field_names:
+            column = columns[field_name]
+            cleaned = self._clean_column(field_name, column)
+            if cleaned is None:
+                cleaned = self._clean_column_values(field_name, column)
+            values, operation_counts = cleaned
+            cleaned_columns.append(values)
+
+            for operation, counts in operation_counts.items():
+                totals[operation] += counts
+                for row in np.flatnonzero(counts):
+                    metadata_rows[row][operation].extend([field_name] * int(counts[row]))
+
+        cleaned_records = [dict(zip(field_names, values)) for values in zip(*cleaned_columns)]
+        quality_scores = self._cleaning_quality_scores(totals, len(field_names))
+
+        results = []
+        for cleaned_record, metadata, quality_score in zip(cleaned_records, metadata_rows, quality_scores.tolist()):
+            metadata["quality_score"] = quality_score
+            results.append(TransformationResult(
+                status=TransformationStatus.SUCCESS,
+                data=cleaned_record,
+                warnings=[],
+                metadata=metadata,
+            ))
+        return results
+
+    def _clean_column(
+        self, field_name: str, column: pd.Series
+    ) -> Optional[Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+        """
+        Clean a column with vectorized kernels
+
+        Args:
+            field_name: Name of the field
+            column: Object-dtype column values
+
+        Returns:
+            Cleaned values and, per metadata key, how many times each value was
+            changed by it; None when the column needs the per-value path
+        """
+        types = column.map(type)
+        is_none = (types == type(None)).to_numpy()
+        is_str = (types == str).to_numpy()
+
+        # str subclasses pass isinstance() in the row path but not the type masks
+        if any(issubclass(value_type, str) for value_type in types[~(is_none | is_str)].unique()):
+            return None
+
+        values = column.to_numpy(dtype=object, copy=True)
+        counts: Dict[str, np.ndarray] = {}
+
+        if field_name in self.field_cleaning_rules:
+            rule = self.field_cleaning_rules[field_name]
+            rule_type = rule.get("type", "general")
+
+            if rule_type in STRING_RULE_OPERATIONS:
+                text = column[is_str]
+                cleaned = self._string_rule_kernel(text, rule)
+                self._count_changes(counts, STRING_RULE_OPERATIONS[rule_type], is_str, text, cleaned)
+                values[is_str] = cleaned.to_numpy()
+
+            elif rule_type == "default_if_empty":
+                empty = is_none.copy()
+                empty[is_str] = (column[is_str].str.strip() == "").to_numpy()
+                other = ~(is_none | is_str)
+                if other.any():
+                    empty[other] = [not value for value in values[other]]
+                self._fill(values, empty, rule.get("default"))
+                counts["empty_values_handled"] = empty.astype(int)
+
+            elif rule_type == "default_if_null":
+                self._fill(values, is_none, rule.get("default"))
+                counts["null_values_handled"] = is_none.astype(int)
+
+            return values, counts
+
+        if self.handle_null_values:
+            self._fill(values, is_none, self.null_replacement)
+            counts["null_values_handled"] = is_none.astype(int)
+
+        strings = is_str
+        if self.handle_empty_strings:
+            empty = np.zeros(len(values), dtype=bool)
+            empty[is_str] = (column[is_str] == "").to_numpy()
+            self._fill(values, empty, self.empty_string_replacement)
+            counts["empty_values_handled"] = empty.astype(int)
+            strings = is_str & ~empty
+
+        text = column[strings]
+
+        if self.remove_leading_trailing_spaces:
+            cleaned = text.str.strip()
+            self._count_changes(counts, "fields_cleaned", strings, text, cleaned)
+            text = cleaned
+
+        if self.collapse_multiple_spaces:
+            # Same result as " ".join(value.split()): \s and str.split() share isspace()
+            cleaned = text.str.replace(r"\s+", " ", regex=True).str.strip()
+            self._count_changes(counts, "fields_cleaned", strings, text, cleaned)
+            text = cleaned
+
+        if self.remove_special_characters and self.special_chars_to_remove:
+            cleaned = text.str.translate(str.maketrans("", "", self.special_chars_to_remove))
+            self._count_changes(counts, "special_chars_removed", strings, text, cleaned)
+            text = cleaned
+
+        case_type = self.case_normalization.get(field_name)
+        if case_type in ("lower", "upper", "title"):
+            cleaned = getattr(text.str, case_type)()
+            self._count_changes(counts, "case_normalized", strings, text, cleaned)
+            text = cleaned
+
+        values[strings] = text.to_numpy()
+        return values, counts
+
+    def _string_rule_kernel(self, text: pd.Series, rule: Dict[str, Any]) -> pd.Series:
+        """Apply a string field cleaning rule to a column of strings"""
+        rule_type = rule["type"]
+        if rule_type == "trim":
+            return text.str.strip()
+        if rule_type == "lowercase":
+            return text.str.lower()
+        if rule_type == "uppercase":
+            return text.str.upper()
+        if rule_type == "titlecase":
+            return text.str.title()
+        if rule_type == "remove_chars":
+            return text.str.translate(str.maketrans("", "", rule.get("chars", "")))
+        return text.str.replace(rule.get("search", ""), rule.get("replacement", ""), regex=False)
+
+    def _clean_column_values(self, field_name: str, column: pd.Series) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Clean a column value by value with ``_clean_value``"""
+        values = np.empty(len(column), dtype=object)
+        counts: Dict[str, np.ndarray] = {}
+
+        for row, value in enumerate(column):
+            values[row], operations = self._clean_value(field_name, value)
+            for operation in operations:
+                counts.setdefault(operation, np.zeros(len(column), dtype=int))[row] += 1
+
+        return values, counts
+
+    @staticmethod
+    def _count_changes(
+        counts: Dict[str, np.ndarray], operation: str, rows: np.ndarray, before: pd.Series, after: pd.Series
+    ):
+        """Count an operation for the rows whose value it changed"""
+        changed = counts.setdefault(operation, np.zeros(len(rows), dtype=int))
+        changed[rows] += (before != after).to_numpy()
+
+    @staticmethod
+    def _fill(values: np.ndarray, mask: np.ndarray, replacement: Any):
+        """Set masked values to a replacement (which may itself be a container)"""
+        for row in np.flatnonzero(mask):
+            values[row] = replacement
+
+    def _new_cleaning_metadata(self) -> Dict[str, Any]:
+        """Empty per-record cleaning metadata"""
+        return {
+            "fields_cleaned": [],
+            "null_values_handled": [],
+            "empty_values_handled": [],
+            "case_normalized": [],
+            "special_chars_removed": [],
+            "type_conversions": [],
+        }
+
     async def _clean_field(
         self, field_name: str, value: Any, metadata: Dict[str, Any], warnings: List[str]
     ) -> Any:
@@ -144,37 +340,55 @@ class DataCleaner(BaseTransformer):
         Returns:
             Cleaned value
         """
+        cleaned_value, operations = self._clean_value(field_name, value)
+        for operation in operations:
+            metadata[operation].append(field_name)
+        return cleaned_value
+
+    def _clean_value(self, field_name: str, value: Any) -> Tuple[Any, List[str]]:
+        """
+        Clean a single field value
+
+        Args:
+            field_name: Name of the field
+            value: Original value
+
+        Returns:
+            Cleaned value and the metadata keys of the operations that changed it
+        """
+        operations = []
+
         # Check field-specific cleaning rules first
         if field_name in self.field_cleaning_rules:
             rule = self.field_cleaning_rules[field_name]
-            return await self._apply_field_cleaning_rule(field_name, value, rule, metadata)
+            return self._apply_field_cleaning_rule_value(value, rule)
 
         # Handle None/null values
         if value is None:
             if self.handle_null_values:
-                metadata["null_values_handled"].append(field_name)
-                return self.null_replacement
-            return value
+                operations.append("null_values_handled")
+                return self.null_replacement, operations
+            return value, operations
 
         # Handle empty strings
         if isinstance(value, str):
             if not value and self.handle_empty_strings:
-                metadata["empty_values_handled"].append(field_name)
-                return self.empty_string_replacement
+                operations.append("empty_values_handled")
+                return self.empty_string_replacement, operations
 
             # Remove leading/trailing whitespace
             if self.remove_leading_trailing_spaces:
                 original = value
                 value = value.strip()
                 if value != original:
-                    metadata["fields_cleaned"].append(field_name)
+                    operations.append("fields_cleaned")
 
             # Collapse multiple spaces
             if self.collapse_multiple_spaces:
                 original = value
                 value = " ".join(value.split())
                 if value != original:
-                    metadata["fields_cleaned"].append(field_name)
+                    operations.append("fields_cleaned")
 
             # Remove special characters if configured
             if self.remove_special_characters and self.special_chars_to_remove:
@@ -182,7 +396,7 @@ class DataCleaner(BaseTransformer):
                 for char in self.special_chars_to_remove:
                     value = value.replace(char, "")
                 if value != original:
-                    metadata["special_chars_removed"].append(field_name)
+                    operations.append("special_chars_removed")
 
             # Apply case normalization
             if field_name in self.case_normalization:
@@ -196,9 +410,9 @@ class DataCleaner(BaseTransformer):
                     value = value.title()
 
                 if value != original:
-                    metadata["case_normalized"].append(field_name)
+                    operations.append("case_normalized")
 
-        return value
+        return value, operations
 
     async def _apply_field_cleaning_rule(
         self, field_name: str, value: Any, rule: Dict[str, Any], metadata: Dict[str, Any]
@@ -215,6 +429,24 @@ class DataCleaner(BaseTransformer):
         Returns:
             Cleaned value
         """
+        cleaned_value, operations = self._apply_field_cleaning_rule_value(value, rule)
+        for operation in operations:
+            metadata[operation].append(field_name)
+        return cleaned_value
+
+    def _apply_field_cleaning_rule_value(self, value: Any, rule: Dict[str, Any]) -> Tuple[Any, List[str]]:
+        """
+        Apply field-specific cleaning rule
+
+        Args:
+            value: Original value
+            rule: Cleaning rule configuration
+
+        Returns:
+            Cleaned value and the metadata keys of the operations that changed it
+        """
+        operations = []
+
         # Get rule configuration
         rule_type = rule.get("type", "general")
 
@@ -223,28 +455,28 @@ class DataCleaner(BaseTransformer):
                 original = value
                 value = value.strip()
                 if value != original:
-                    metadata["fields_cleaned"].append(field_name)
+                    operations.append("fields_cleaned")
 
         elif rule_type == "lowercase":
             if isinstance(value, str):
                 original = value
                 value = value.lower()
                 if value != original:
-                    metadata["case_normalized"].append(field_name)
+                    operations.append("case_normalized")
 
         elif rule_type == "uppercase":
             if isinstance(value, str):
                 original = value
                 value = value.upper()
                 if value != original:
-                    metadata["case_normalized"].append(field_name)
+                    operations.append("case_normalized")
 
         elif rule_type == "titlecase":
             if isinstance(value, str):
                 original = value
                 value = value.title()
                 if value != original:
-                    metadata["case_normalized"].append(field_name)
+                    operations.append("case_normalized")
 
         elif rule_type == "remove_chars":
             if isinstance(value, str):
@@ -253,7 +485,7 @@ class DataCleaner(BaseTransformer):
                 for char in chars_to_remove:
                     value = value.replace(char, "")
                 if value != original:
-                    metadata["special_chars_removed"].append(field_name)
+                    operations.append("special_chars_removed")
 
         elif rule_type == "replace":
             if isinstance(value, str):
@@ -262,21 +494,40 @@ class DataCleaner(BaseTransformer):
                 replacement = rule.get("replacement", "")
                 value = value.replace(search, replacement)
                 if value != original:
-                    metadata["fields_cleaned"].append(field_name)
+                    operations.append("fields_cleaned")
 
         elif rule_type == "default_if_empty":
             default_value = rule.get("default")
             if not value or (isinstance(value, str) and not value.strip()):
-                metadata["empty_values_handled"].append(field_name)
+                operations.append("empty_values_handled")
                 value = default_value
 
         elif rule_type == "default_if_null":
             default_value = rule.get("default")
             if value is None:
-                metadata["null_values_handled"].append(field_name)
+                operations.append("null_values_handled")
                 value = default_value
 
-        return value
+        return value, operations
+
+    def _cleaning_quality_scores(self, totals: Dict[str, np.ndarray], total_fields: int) -> np.ndarray:
+        """
+        ``_calculate_cleaning_quality_score`` for a whole batch
+
+        Args:
+            totals: Per metadata key, the number of entries of each record
+            total_fields: Number of fields per record
+
+        Returns:
+            Quality score per record
+        """
+        if total_fields == 0:
+            return np.ones(len(totals["fields_cleaned"]))
+
+        score = 1.0 - 0.05 * np.minimum(totals["null_values_handled"], total_fields)
+        score -= 0.02 * np.minimum(totals["empty_values_handled"], total_fields)
+        score += 0.01 * np.minimum(totals["fields_cleaned"], total_fields)
+        return np.clip(score, 0.0, 1.0)
 
     def _calculate_cleaning_quality_score(
         self, original_record: Dict[str, Any], cleaned_record: Dict[str, Any], metadata: Dict[str, Any]
@@ -317,3 +568,4 @@ class DataCleaner(BaseTransformer):
 
         # Ensure score stays between 0.0 and 1.0
         return max(0.0, min(1.0, score))
+
@@ -235,20 +235,9 @@ class DataNormalizer(BaseTransformer):
             TransformationResult with normalized data
         """
         try:
-            normalized_record = record.copy()
+            normalized_record = self._prepare_normalized_record(record)
             warnings = []
-            metadata = {
-                'original_fields': list(record.keys()),
-                'normalization_rules_applied': [],
-                'fields_modified': [],
-                'derived_fields_created': [],
-                'business_rules_applied': []
-            }
-            
-            # Preserve original values if configured
-            if self.preserve_original_values:
-                for field_name, value in record.items():
-                    normalized_record[f"_original_{field_name}"] = value
+            metadata = self._new_normalization_metadata(record)
             
             # Apply field-specific normalization rules
             for rule in self.normalization_rules:
@@ -273,44 +262,71 @@ class DataNormalizer(BaseTransformer):
                         else:
                             warnings.append(f"Failed to normalize field '{rule.field_name}': {str(e)}")
             
-            # Apply business rules
-            if self.apply_business_rules:
-                for rule_name, rule_config in self.business_rules.items():
-                    try:
-                        if await self._evaluate_business_rule_condition(normalized_record, rule_config['condition']):
-                            await self._apply_business_rule_action(normalized_record, rule_config['action'])
-                            metadata['business_rules_applied'].append(rule_name)
-                    except Exception as e:
-                        warnings.append(f"Failed to apply business rule '{rule_name}': {str(e)}")
-            
-            # Create derived fields
-            if self.create_derived_fields:
-                for field_name, field_config in self.derived_fields.items():
-                    try:
-                        derived_value = await self._create_derived_field(normalized_record, field_config)
-                        if derived_value is not None:
-                            normalized_record[field_name] = derived_value
-                            metadata['derived_fields_created'].append(field_name)
-                    except Exception as e:
-                        warnings.append(f"Failed to create derived field '{field_name}': {str(e)}")
-            
-            # Calculate quality score
-            quality_score = self._calculate_quality_score(normalized_record, record)
-            metadata['quality_score'] = quality_score
-            
-            return TransformationResult(
-                status=TransformationStatus.SUCCESS,
-                data=normalized_record,
-                warnings=warnings,
-                metadata=metadata
-            )
+            return await self._finalize_normalization(record, normalized_record, warnings, metadata)
             
         except Exception as e:
-            self.logger.error(f"Error normalizing record: {str(e)}")
-            return TransformationResult(
-                status=TransformationStatus.FAILED,
-                errors=[f"Data normalization failed: {str(e)}"]
-            )
+            return self._normalization_failure(e)
+    
+    def _prepare_normalized_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of the record, with original values preserved if configured"""
+        normalized_record = record.copy()
+        if self.preserve_original_values:
+            for field_name, value in record.items():
+                normalized_record[f"_original_{field_name}"] = value
+        return normalized_record
+    
+    def _new_normalization_metadata(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Empty per-record normalization metadata"""
+        return {
+            'original_fields': list(record.keys()),
+            'normalization_rules_applied': [],
+            'fields_modified': [],
+            'derived_fields_created': [],
+            'business_rules_applied': []
+        }
+    
+    async def _finalize_normalization(self, record: Dict[str, Any], normalized_record: Dict[str, Any],
+                                      warnings: List[str], metadata: Dict[str, Any]) -> TransformationResult:
+        """Apply business rules and derived fields, then build the result"""
+        # Apply business rules
+        if self.apply_business_rules:
+            for rule_name, rule_config in self.business_rules.items():
+                try:
+                    if await self._evaluate_business_rule_condition(normalized_record, rule_config['condition']):
+                        await self._apply_business_rule_action(normalized_record, rule_config['action'])
+                        metadata['business_rules_applied'].append(rule_name)
+                except Exception as e:
+                    warnings.append(f"Failed to apply business rule '{rule_name}': {str(e)}")
+        
+        # Create derived fields
+        if self.create_derived_fields:
+            for field_name, field_config in self.derived_fields.items():
+                try:
+                    derived_value = await self._create_derived_field(normalized_record, field_config)
+                    if derived_value is not None:
+                        normalized_record[field_name] = derived_value
+                        metadata['derived_fields_created'].append(field_name)
+                except Exception as e:
+                    warnings.append(f"Failed to create derived field '{field_name}': {str(e)}")
+        
+        # Calculate quality score
+        quality_score = self._calculate_quality_score(normalized_record, record)
+        metadata['quality_score'] = quality_score
+        
+        return TransformationResult(
+            status=TransformationStatus.SUCCESS,
+            data=normalized_record,
+            warnings=warnings,
+            metadata=metadata
+        )
+    
+    def _normalization_failure(self, error: Exception) -> TransformationResult:
+        """Result for a record whose normalization raised"""
+        self.logger.error(f"Error normalizing record: {str(error)}")
+        return TransformationResult(
+            status=TransformationStatus.FAILED,
+            errors=[f"Data normalization failed: {str(error)}"]
+        )
     
     async def _apply_normalization_rule(self, value: Any, rule: FieldNormalizationRule) -> Tuple[Any, List[str]]:
         """Apply a single normalization rule"""
@@ -9,6 +9,9 @@ from enum import Enum
 import json
 from decimal import Decimal, InvalidOperation
 
+import numpy as np
+import pandas as pd
+
 from .base_transformer import BaseTransformer, TransformationResult, TransformationStatus
 from app.utils.logger import get_logger
 
@@ -70,6 +73,9 @@ class DataValidator(BaseTransformer):
     - Cross-field validation
     """
     
+    # Value types the column kernels convert to float like float(value) does
+    NUMERIC_VALUE_TYPES = (int, float, bool)
+    
     def __init__(self, db_session, job_execution_id: Optional[str] = None, **kwargs):
         """
         Initialize data validator
@@ -202,17 +208,7 @@ class DataValidator(BaseTransformer):
             errors = []
             warnings = []
             
-            metadata = {
-                'validation_rules_applied': [],
-                'fields_validated': [],
-                'auto_fixes_applied': [],
-                'validation_summary': {
-                    'total_rules': 0,
-                    'passed_rules': 0,
-                    'failed_rules': 0,
-                    'warning_rules': 0
-                }
-            }
+            metadata = self._new_validation_metadata()
             
             # Apply field-level validation rules
             for rule in self.validation_rules:
@@ -222,85 +218,389 @@ class DataValidator(BaseTransformer):
                 field_value = validated_record.get(rule.field_name)
                 validation_result = await self._apply_validation_rule(field_value, rule, validated_record)
                 
-                validation_results.append(validation_result)
-                metadata['validation_rules_applied'].append(f"{rule.field_name}:{rule.validation_type.value}")
-                metadata['validation_summary']['total_rules'] += 1
-                
-                if validation_result.is_valid:
-                    metadata['validation_summary']['passed_rules'] += 1
-                    
-                    # Update field value if auto-fix was applied
-                    if validation_result.validated_value is not None:
-                        validated_record[rule.field_name] = validation_result.validated_value
-                        metadata['auto_fixes_applied'].append(rule.field_name)
-                else:
-                    if rule.severity == ValidationSeverity.CRITICAL or rule.severity == ValidationSeverity.ERROR:
-                        metadata['validation_summary']['failed_rules'] += 1
-                        error_msg = validation_result.error_message or rule.error_message or f"Validation failed for field '{rule.field_name}'"
-                        errors.append(error_msg)
-                        
-                        # Stop on first error if configured
-                        if self.stop_on_first_error:
-                            break
-                    else:
-                        metadata['validation_summary']['warning_rules'] += 1
-                        warning_msg = validation_result.warning_message or f"Validation warning for field '{rule.field_name}'"
-                        warnings.append(warning_msg)
-                
-                if rule.field_name not in metadata['fields_validated']:
-                    metadata['fields_validated'].append(rule.field_name)
-                
-                # Check max errors per record
-                if len(errors) >= self.max_errors_per_record:
-                    errors.append(f"Maximum error limit ({self.max_errors_per_record}) reached for record")
+                if not self._record_rule_outcome(rule, validation_result, validated_record,
+                                                 validation_results, errors, warnings, metadata):
                     break
             
-            # Apply cross-field validation if enabled
-            if self.validate_cross_fields and not errors:
-                cross_field_errors = await self._validate_cross_fields(validated_record)
-                errors.extend(cross_field_errors)
-            
-            # Apply business rule validation
-            if self.business_rules and not errors:
-                business_rule_errors = await self._validate_business_rules(validated_record)
-                errors.extend(business_rule_errors)
-            
-            # Calculate quality score
-            quality_score = self._calculate_validation_quality_score(validation_results, metadata)
-            metadata['quality_score'] = quality_score
-            
-            # Determine final status
-            if errors:
-                # Check if we should fail on critical errors
-                critical_errors = [r for r in validation_results if not r.is_valid and r.rule.severity == ValidationSeverity.CRITICAL]
-                if critical_errors and self.fail_on_critical_errors:
-                    return TransformationResult(
-                        status=TransformationStatus.FAILED,
-                        errors=errors,
-                        warnings=warnings,
-                        metadata=metadata
-                    )
-                else:
-                    return TransformationResult(
-                        status=TransformationStatus.WARNING,
-                        data=validated_record,
-                        errors=errors,
-                        warnings=warnings,
-                        metadata=metadata
-                    )
+            return await self._finalize_validation(validated_record, validation_results, errors, warnings, metadata)
+                
+        except Exception as e:
+            return self._validation_failure(e)
+    
+    async def transform_columns(self, columns: pd.DataFrame, records: List[Dict[str, Any]]) -> Optional[List[TransformationResult]]:
+        """
+        Validate a batch rule by rule
+        
+        Required, range, length, pattern and referential rules are evaluated
+        for the whole column with vectorized kernels; other rules, and values
+        a kernel can't take, use ``_apply_validation_rule`` per value. Rule
+        order, auto-fixes and early stops are applied per record exactly as in
+        ``transform_record``.
+        
+        Args:
+            columns: Batch as an object-dtype DataFrame
+            records: The same batch as records
+            
+        Returns:
+            TransformationResult per record
+        """
+        validated_records = [record.copy() for record in records]
+        validation_results = [[] for _ in records]
+        errors = [[] for _ in records]
+        warnings = [[] for _ in records]
+        metadata = [self._new_validation_metadata() for _ in records]
+        
+        # Records that raised keep their failure result, like in transform_record
+        failed: Dict[int, TransformationResult] = {}
+        
+        # Fields whose values were replaced by an auto-fix no longer match the batch columns
+        fixed_fields = set()
+        
+        active_rows = list(range(len(records)))
+        for rule in self.validation_rules:
+            if not rule.is_enabled:
+                continue
+            if not active_rows:
+                break
+            
+            if rule.field_name in columns.columns and rule.field_name not in fixed_fields:
+                values = columns[rule.field_name].iloc[active_rows].reset_index(drop=True)
+            else:
+                values = pd.Series([validated_records[row].get(rule.field_name) for row in active_rows], dtype=object)
+            
+            rule_results = self._validate_column(values, rule)
+            if rule_results is None:
+                rule_results = [
+                    await self._apply_validation_rule(value, rule, validated_records[row])
+                    for row, value in zip(active_rows, values)
+                ]
+            else:
+                # Values the kernel left to the row path
+                for position, validation_result in enumerate(rule_results):
+                    if validation_result is None:
+                        row = active_rows[position]
+                        rule_results[position] = await self._apply_validation_rule(
+                            values.iat[position], rule, validated_records[row])
+            
+            still_active = []
+            for row, validation_result in zip(active_rows, rule_results):
+                try:
+                    if self._record_rule_outcome(rule, validation_result, validated_records[row],
+                                                 validation_results[row], errors[row], warnings[row], metadata[row]):
+                        still_active.append(row)
+                except Exception as e:
+                    failed[row] = self._validation_failure(e)
+                if validation_result.is_valid and validation_result.validated_value is not None:
+                    fixed_fields.add(rule.field_name)
+            active_rows = still_active
+        
+        results = []
+        for row in range(len(records)):
+            if row in failed:
+                results.append(failed[row])
+                continue
+            try:
+                results.append(await self._finalize_validation(validated_records[row], validation_results[row],
+                                                               errors[row], warnings[row], metadata[row]))
+            except Exception as e:
+                results.append(self._validation_failure(e))
+        return results
+    
+    def _validate_column(self, values: pd.Series, rule: ValidationRule) -> Optional[List[Optional[ValidationResult]]]:
+        """
+        Apply a rule to column values with a vectorized kernel
+        
+        Args:
+            values: Object-dtype field values
+            rule: Validation rule
+            
+        Returns:
+            ValidationResult per value (None for values left to the row path),
+            or None when the rule has no kernel
+        """
+        kernels = {
+            ValidationType.REQUIRED: self._validate_required_column,
+            ValidationType.RANGE: self._validate_range_column,
+            ValidationType.LENGTH: self._validate_length_column,
+            ValidationType.PATTERN: self._validate_pattern_column,
+            ValidationType.REFERENTIAL: self._validate_referential_column,
+        }
+        kernel = kernels.get(rule.validation_type)
+        if kernel is None:
+            return None
+        
+        types = values.map(type)
+        
+        # str/list subclasses pass isinstance() in the row path but not the type masks
+        if any(issubclass(value_type, (str, list)) and value_type not in (str, list) for value_type in types.unique()):
+            return None
+        
+        try:
+            return kernel(values, rule, types)
+        except Exception as e:
+            self.logger.debug(f"Column kernel for {rule.field_name}:{rule.validation_type.value} failed, using row path: {str(e)}")
+            return None
+    
+    def _validate_required_column(self, values: pd.Series, rule: ValidationRule, types: pd.Series) -> List[ValidationResult]:
+        """Vectorized ``_validate_required``"""
+        is_str = (types == str).to_numpy()
+        is_list = (types == list).to_numpy()
+        
+        missing = (types == type(None)).to_numpy()
+        missing[is_str] = (values[is_str] == "").to_numpy()
+        missing[is_list] = (values[is_list].str.len() == 0).to_numpy()
+        
+        default_value = rule.parameters.get('default')
+        if self.auto_fix_errors and default_value is not None:
+            missing_result = ValidationResult(
+                rule=rule,
+                is_valid=True,
+                validated_value=default_value,
+                metadata={'auto_fix': 'default_value_applied'}
+            )
+        else:
+            missing_result = ValidationResult(
+                rule=rule,
+                is_valid=False,
+                error_message=f"Field '{rule.field_name}' is required but missing or empty"
+            )
+        
+        valid_result = ValidationResult(rule=rule, is_valid=True)
+        return [missing_result if is_missing else valid_result for is_missing in missing]
+    
+    def _validate_range_column(self, values: pd.Series, rule: ValidationRule, types: pd.Series) -> List[Optional[ValidationResult]]:
+        """Vectorized ``_validate_range`` for int/float/bool values"""
+        min_val = rule.parameters.get('min')
+        max_val = rule.parameters.get('max')
+        
+        numeric = types.isin(self.NUMERIC_VALUE_TYPES).to_numpy()
+        numbers = values[numeric].astype(float)
+        below = (numbers < min_val).to_numpy() if min_val is not None else np.zeros(len(numbers), dtype=bool)
+        above = (numbers > max_val).to_numpy() if max_val is not None else np.zeros(len(numbers), dtype=bool)
+        
+        valid_result = ValidationResult(rule=rule, is_valid=True)
+        results: List[Optional[ValidationResult]] = [
+            valid_result if value_type is type(None) else None for value_type in types
+        ]
+        
+        clamp = self.auto_fix_errors and rule.parameters.get('clamp', False)
+        for position, is_below, is_above in zip(np.flatnonzero(numeric), below, above):
+            if not (is_below or is_above):
+                results[position] = valid_result
+            elif clamp:
+                results[position] = ValidationResult(
+                    rule=rule,
+                    is_valid=True,
+                    validated_value=max_val if is_above else min_val,
+                    metadata={'auto_fix': 'range_clamping_applied'}
+                )
+            else:
+                error_parts = ([f"minimum {min_val}"] if is_below else []) + ([f"maximum {max_val}"] if is_above else [])
+                results[position] = ValidationResult(
+                    rule=rule,
+                    is_valid=False,
+                    error_message=f"Field '{rule.field_name}' must be between {' and '.join(error_parts)}"
+                )
+        return results
+    
+    def _validate_length_column(self, values: pd.Series, rule: ValidationRule, types: pd.Series) -> List[Optional[ValidationResult]]:
+        """Vectorized ``_validate_length`` for string values"""
+        min_length = rule.parameters.get('min')
+        max_length = rule.parameters.get('max')
+        
+        is_str = (types == str).to_numpy()
+        lengths = values[is_str].str.len()
+        too_short = (lengths < min_length).to_numpy() if min_length is not None else np.zeros(len(lengths), dtype=bool)
+        too_long = (lengths > max_length).to_numpy() if max_length is not None else np.zeros(len(lengths), dtype=bool)
+        
+        valid_result = ValidationResult(rule=rule, is_valid=True)
+        results: List[Optional[ValidationResult]] = [
+            valid_result if value_type is type(None) else None for value_type in types
+        ]
+        
+        for position, is_short, is_long in zip(np.flatnonzero(is_str), too_short, too_long):
+            if not (is_short or is_long):
+                results[position] = valid_result
+            elif self.auto_fix_errors and is_long:
+                results[position] = ValidationResult(
+                    rule=rule,
+                    is_valid=True,
+                    validated_value=values.iat[position][:max_length],
+                    metadata={'auto_fix': 'string_truncation_applied'}
+                )
+            else:
+                error_parts = ([f"minimum {min_length}"] if is_short else []) + ([f"maximum {max_length}"] if is_long else [])
+                results[position] = ValidationResult(
+                    rule=rule,
+                    is_valid=False,
+                    error_message=f"Field '{rule.field_name}' length must be between {' and '.join(error_parts)}"
+                )
+        return results
+    
+    def _validate_pattern_column(self, values: pd.Series, rule: ValidationRule, types: pd.Series) -> Optional[List[ValidationResult]]:
+        """Vectorized ``_validate_pattern``"""
+        pattern = rule.parameters.get('pattern')
+        if not pattern:
+            return None
+        re.compile(pattern)  # Invalid patterns get their error result from the row path
+        
+        is_str = (types == str).to_numpy()
+        checked = ~(types == type(None)).to_numpy()
+        checked[is_str] = (values[is_str] != "").to_numpy()
+        
+        text = values[checked]
+        if not is_str[checked].all():
+            text = pd.Series([str(value) for value in text], dtype=object)
+        matched = text.str.match(pattern).to_numpy(dtype=bool)
+        
+        valid_result = ValidationResult(rule=rule, is_valid=True)
+        invalid_result = ValidationResult(
+            rule=rule,
+            is_valid=False,
+            error_message=f"Field '{rule.field_name}' does not match required pattern"
+        )
+        results = [valid_result] * len(values)
+        for position in np.flatnonzero(checked)[~matched]:
+            results[position] = invalid_result
+        return results
+    
+    def _validate_referential_column(self, values: pd.Series, rule: ValidationRule, types: pd.Series) -> Optional[List[ValidationResult]]:
+        """Vectorized ``_validate_referential`` (hash lookups with ``isin``)"""
+        reference_table = rule.parameters.get('reference_table')
+        reference_field = rule.parameters.get('reference_field', 'id')
+        
+        reference_values = self.reference_data.get(reference_table) if reference_table else None
+        if isinstance(reference_values, dict):
+            reference_values = reference_values.get(reference_field, [])
+            if not isinstance(reference_values, (list, tuple, set, frozenset)):
+                return None
+        elif not isinstance(reference_values, list):
+            return None
+        
+        # isin hashes the values; unhashable ones need the row path's ``in``
+        if any(value_type.__hash__ is None for value_type in types.unique()):
+            return None
+        
+        found = (values.isin(list(reference_values)) | (types == type(None))).to_numpy()
+        
+        valid_result = ValidationResult(rule=rule, is_valid=True)
+        results = [valid_result] * len(values)
+        for position in np.flatnonzero(~found):
+            results[position] = ValidationResult(
+                rule=rule,
+                is_valid=False,
+                error_message=f"Field '{rule.field_name}' value '{values.iat[position]}' not found in reference table '{reference_table}'"
+            )
+        return results
+    
+    def _validation_failure(self, error: Exception) -> TransformationResult:
+        """Result for a record whose validation raised"""
+        self.logger.error(f"Error validating record: {str(error)}")
+        return TransformationResult(
+            status=TransformationStatus.FAILED,
+            errors=[f"Data validation failed: {str(error)}"]
+        )
+    
+    def _new_validation_metadata(self) -> Dict[str, Any]:
+        """Empty per-record validation metadata"""
+        return {
+            'validation_rules_applied': [],
+            'fields_validated': [],
+            'auto_fixes_applied': [],
+            'validation_summary': {
+                'total_rules': 0,
+                'passed_rules': 0,
+                'failed_rules': 0,
+                'warning_rules': 0
+            }
+        }
+    
+    def _record_rule_outcome(self, rule: ValidationRule, validation_result: ValidationResult,
+                             validated_record: Dict[str, Any], validation_results: List[ValidationResult],
+                             errors: List[str], warnings: List[str], metadata: Dict[str, Any]) -> bool:
+        """
+        Record the result of one rule for a record
+        
+        Returns:
+            False when no further rules should be applied to the record
+        """
+        validation_results.append(validation_result)
+        metadata['validation_rules_applied'].append(f"{rule.field_name}:{rule.validation_type.value}")
+        metadata['validation_summary']['total_rules'] += 1
+        
+        if validation_result.is_valid:
+            metadata['validation_summary']['passed_rules'] += 1
+            
+            # Update field value if auto-fix was applied
+            if validation_result.validated_value is not None:
+                validated_record[rule.field_name] = validation_result.validated_value
+                metadata['auto_fixes_applied'].append(rule.field_name)
+        else:
+            if rule.severity == ValidationSeverity.CRITICAL or rule.severity == ValidationSeverity.ERROR:
+                metadata['validation_summary']['failed_rules'] += 1
+                error_msg = validation_result.error_message or rule.error_message or f"Validation failed for field '{rule.field_name}'"
+                errors.append(error_msg)
+                
+                # Stop on first error if configured
+                if self.stop_on_first_error:
+                    return False
             else:
+                metadata['validation_summary']['warning_rules'] += 1
+                warning_msg = validation_result.warning_message or f"Validation warning for field '{rule.field_name}'"
+                warnings.append(warning_msg)
+        
+        if rule.field_name not in metadata['fields_validated']:
+            metadata['fields_validated'].append(rule.field_name)
+        
+        # Check max errors per record
+        if len(errors) >= self.max_errors_per_record:
+            errors.append(f"Maximum error limit ({self.max_errors_per_record}) reached for record")
+            return False
+        
+        return True
+    
+    async def _finalize_validation(self, validated_record: Dict[str, Any], validation_results: List[ValidationResult],
+                                   errors: List[str], warnings: List[str], metadata: Dict[str, Any]) -> TransformationResult:
+        """Run record-level checks and build the result for a validated record"""
+        # Apply cross-field validation if enabled
+        if self.validate_cross_fields and not errors:
+            cross_field_errors = await self._validate_cross_fields(validated_record)
+            errors.extend(cross_field_errors)
+        
+        # Apply business rule validation
+        if self.business_rules and not errors:
+            business_rule_errors = await self._validate_business_rules(validated_record)
+            errors.extend(business_rule_errors)
+        
+        # Calculate quality score
+        quality_score = self._calculate_validation_quality_score(validation_results, metadata)
+        metadata['quality_score'] = quality_score
+        
+        # Determine final status
+        if errors:
+            # Check if we should fail on critical errors
+            critical_errors = [r for r in validation_results if not r.is_valid and r.rule.severity == ValidationSeverity.CRITICAL]
+            if critical_errors and self.fail_on_critical_errors:
                 return TransformationResult(
-                    status=TransformationStatus.SUCCESS,
+                    status=TransformationStatus.FAILED,
+                    errors=errors,
+                    warnings=warnings,
+                    metadata=metadata
+                )
+            else:
+                return TransformationResult(
+                    status=TransformationStatus.WARNING,
                     data=validated_record,
+                    errors=errors,
                     warnings=warnings,
                     metadata=metadata
                 )
-                
-        except Exception as e:
-            self.logger.error(f"Error validating record: {str(e)}")
+        else:
             return TransformationResult(
-                status=TransformationStatus.FAILED,
-                errors=[f"Data validation failed: {str(e)}"]
+                status=TransformationStatus.SUCCESS,
+                data=validated_record,
+                warnings=warnings,
+                metadata=metadata
             )
     
     async def _apply_validation_rule(self, value: Any, rule: ValidationRule, record: Dict[str, Any]) -> ValidationResult:
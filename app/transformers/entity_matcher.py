@@ -2,6 +2,7 @@
 # app/transformers/entity_matcher.py
 # ==============================================
 import re
+from collections import Counter, defaultdict
 from typing import Dict, List, Any, Optional, Tuple, Union, Set
 from datetime import datetime
 from dataclasses import dataclass
@@ -9,14 +10,27 @@ from enum import Enum
 import json
 import hashlib
 from difflib import SequenceMatcher
+from functools import lru_cache
 import Levenshtein
+import numpy as np
 from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz as rapid_fuzz
+from rapidfuzz import process as rapid_process
+from rapidfuzz.distance import JaroWinkler as RapidJaroWinkler
+from rapidfuzz.distance import Levenshtein as RapidLevenshtein
 
 from .base_transformer import BaseTransformer, TransformationResult, TransformationStatus
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+@lru_cache(maxsize=65536)
+def _character_ngrams(text: str, n: int) -> frozenset:
+    """Cached character n-grams of a lowercased string"""
+    text = text.lower()
+    return frozenset(text[i:i+n] for i in range(len(text) - n + 1))
+
 class MatchingStrategy(Enum):
     """Entity matching strategies"""
     EXACT = "exact"
@@ -102,12 +116,19 @@ class EntityMatcher(BaseTransformer):
         self.use_indexing = kwargs.get('use_indexing', True)
         self.index_fields = kwargs.get('index_fields', [])
         self.parallel_processing = kwargs.get('parallel_processing', False)
+        self.batch_scoring = kwargs.get('batch_scoring', True)
+        self.scoring_workers = kwargs.get('scoring_workers', 1)  # -1 uses all cores
         
         # Entity storage for comparison
         self.entity_index = {}
         self.processed_entities = []
         self.duplicate_groups = []
         
+        # Inverted blocking index: blocking key -> slots in processed_entities.
+        # Entity ids are kept per slot so they are hashed once, not per lookup.
+        self.blocking_index: Dict[str, Set[int]] = defaultdict(set)
+        self.entity_ids: List[str] = []
+        
         # Preprocessing functions
         self.preprocessing_functions = {
             'lowercase': lambda x: str(x).lower(),
@@ -225,11 +246,14 @@ class EntityMatcher(BaseTransformer):
             metadata['comparisons_made'] = len(candidates)
             
             # Perform matching against candidates
-            matches = []
-            for candidate in candidates:
-                match_result = await self._compare_entities(preprocessed_record, candidate)
-                if match_result.match_score >= self.global_threshold:
-                    matches.append(match_result)
+            if self.batch_scoring:
+                matches = await self._score_candidates(preprocessed_record, candidates, self.global_threshold)
+            else:
+                matches = []
+                for candidate in candidates:
+                    match_result = await self._compare_entities(preprocessed_record, candidate)
+                    if match_result.match_score >= self.global_threshold:
+                        matches.append(match_result)
             
             # Sort matches by score (highest first)
             matches.sort(key=lambda x: x.match_score, reverse=True)
@@ -323,38 +347,57 @@ class EntityMatcher(BaseTransformer):
         return preprocessed
     
     async def _find_blocking_candidates(self, record: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Find candidate entities using blocking strategy"""
-        candidates = []
+        """
+        Find candidate entities using the inverted blocking index
         
+        Candidates are the union of the index slots of every blocking key of the
+        record, returned in insertion order with one entity per entity id. When
+        blocking finds more than ``max_comparisons`` candidates, the ones sharing
+        the most blocking keys with the record are kept. Without blocking fields
+        every entity is a candidate; the cap only applies to blocked candidates.
+        """
         if not self.blocking_fields:
             # Use all entities if no blocking fields specified
             return self.processed_entities.copy()
         
-        # Generate blocking keys
-        blocking_keys = []
-        for field in self.blocking_fields:
-            value = record.get(field)
-            if value:
-                # Create multiple blocking keys for fuzzy blocking
-                blocking_keys.extend(self._generate_blocking_keys(str(value)))
+        # Count shared keys per slot while taking the union
+        shared_keys = Counter()
+        for key in self._get_record_blocking_keys(record):
+            slots = self.blocking_index.get(key)
+            if slots:
+                shared_keys.update(slots)
+        
+        if not shared_keys:
+            return []
         
-        # Find entities with matching blocking keys
+        # Keep only the first slot of each entity id, like a linear scan would
+        slots = []
         seen_entities = set()
-        for entity in self.processed_entities:
-            entity_id = self._generate_entity_id(entity)
-            if entity_id in seen_entities:
-                continue
-            
-            for field in self.blocking_fields:
-                entity_value = entity.get(field)
-                if entity_value:
-                    entity_keys = self._generate_blocking_keys(str(entity_value))
-                    if any(key in blocking_keys for key in entity_keys):
-                        candidates.append(entity)
-                        seen_entities.add(entity_id)
-                        break
+        for slot in sorted(shared_keys):
+            entity_id = self.entity_ids[slot]
+            if entity_id not in seen_entities:
+                seen_entities.add(entity_id)
+                slots.append(slot)
+        
+        if len(slots) > self.max_comparisons:
+            self.logger.warning(
+                f"Blocking found {len(slots)} candidates, limiting to max_comparisons={self.max_comparisons}"
+            )
+            slots = sorted(
+                sorted(slots, key=lambda slot: -shared_keys[slot])[:self.max_comparisons]
+            )
         
-        return candidates
+        return [self.processed_entities[slot] for slot in slots]
+    
+    def _get_record_blocking_keys(self, record: Dict[str, Any]) -> Set[str]:
+        """Collect blocking keys of all blocking fields of a record"""
+        keys = set()
+        for field in self.blocking_fields:
+            value = record.get(field)
+            if value:
+                # Multiple keys per value for fuzzy blocking
+                keys.update(self._generate_blocking_keys(str(value)))
+        return keys
     
     def _generate_blocking_keys(self, value: str) -> List[str]:
         """Generate blocking keys for a value"""
@@ -439,6 +482,169 @@ class EntityMatcher(BaseTransformer):
             match_reasons=match_reasons
         )
     
+    async def _score_candidates(self,
+                                record: Dict[str, Any],
+                                candidates: List[Dict[str, Any]],
+                                min_score: float = 0.0) -> List[EntityMatch]:
+        """
+        Score a record against all candidates at once
+        
+        Each matching rule is scored for every candidate in a single vectorized
+        call and the weighted field scores are combined with NumPy. Results are
+        identical to calling ``_compare_entities`` per candidate.
+        
+        Args:
+            record: Preprocessed record to match
+            candidates: Candidate entities
+            min_score: Only candidates scoring at least this are returned
+            
+        Returns:
+            EntityMatch per qualifying candidate, in candidate order
+        """
+        count = len(candidates)
+        if count == 0:
+            return []
+        
+        total_weighted_scores = np.zeros(count)
+        total_weights = np.zeros(count)
+        rule_scores = []
+        
+        for rule in self.matching_rules:
+            value1 = record.get(rule.field_name)
+            if value1 is None:
+                continue
+            
+            values2 = [candidate.get(rule.field_name) for candidate in candidates]
+            present = np.fromiter((value is not None for value in values2), dtype=bool, count=count)
+            if not present.any():
+                continue
+            
+            scores = self._calculate_field_similarity_batch(value1, values2, rule)
+            total_weighted_scores[present] += scores[present] * rule.weight
+            total_weights[present] += rule.weight
+            rule_scores.append((rule, present, scores))
+        
+        match_scores = np.divide(
+            total_weighted_scores, total_weights,
+            out=np.zeros(count), where=total_weights > 0
+        )
+        
+        matches = []
+        for index in np.flatnonzero(match_scores >= min_score):
+            field_scores = {}
+            match_reasons = []
+            for rule, present, scores in rule_scores:
+                if not present[index]:
+                    continue
+                field_score = float(scores[index])
+                field_scores[rule.field_name] = field_score
+                if field_score >= rule.threshold:
+                    match_reasons.append(f"{rule.field_name}: {field_score:.2f}")
+            
+            match_score = float(match_scores[index])
+            if match_score >= 0.9:
+                confidence = 'high'
+            elif match_score >= 0.7:
+                confidence = 'medium'
+            else:
+                confidence = 'low'
+            
+            matches.append(EntityMatch(
+                source_entity=record,
+                target_entity=candidates[index],
+                match_score=match_score,
+                field_scores=field_scores,
+                is_duplicate=match_score >= self.global_threshold,
+                confidence_level=confidence,
+                match_reasons=match_reasons
+            ))
+        
+        return matches
+    
+    def _calculate_field_similarity_batch(self, value1: Any, values2: List[Any], rule: MatchingRule) -> np.ndarray:
+        """Score one field value against many values (0.0 where a value is empty)"""
+        scores = np.zeros(len(values2))
+        if not value1:
+            return scores
+        
+        indices = [i for i, value in enumerate(values2) if value]
+        if not indices:
+            return scores
+        
+        value1_str = str(value1)
+        choices = [str(values2[i]) for i in indices]
+        
+        if rule.strategy == MatchingStrategy.EXACT:
+            scores[indices] = [1.0 if choice == value1_str else 0.0 for choice in choices]
+        
+        elif rule.strategy == MatchingStrategy.FUZZY:
+            scores[indices] = self._calculate_fuzzy_similarity_batch(value1_str, choices, rule.algorithm)
+        
+        elif rule.strategy == MatchingStrategy.PHONETIC:
+            if rule.algorithm == MatchingAlgorithm.METAPHONE:
+                encode = self._metaphone
+            else:
+                encode = self._soundex
+            code = encode(value1_str)
+            scores[indices] = [1.0 if encode(choice) == code else 0.0 for choice in choices]
+        
+        elif rule.strategy == MatchingStrategy.SEMANTIC:
+            scores[indices] = [self._word_overlap_similarity(value1_str, choice) for choice in choices]
+        
+        elif rule.strategy == MatchingStrategy.COMPOSITE:
+            scores[indices] = self._calculate_composite_similarity_batch(value1_str, choices, rule.parameters)
+        
+        else:
+            scores[indices] = self._calculate_fuzzy_similarity_batch(value1_str, choices, MatchingAlgorithm.LEVENSHTEIN)
+        
+        return scores
+    
+    def _calculate_fuzzy_similarity_batch(self, value1: str, choices: List[str], algorithm: MatchingAlgorithm) -> np.ndarray:
+        """Fuzzy similarity of one value against many using RapidFuzz cdist"""
+        if algorithm == MatchingAlgorithm.COSINE:
+            return np.array([self._cosine_similarity(value1, choice) for choice in choices])
+        
+        if algorithm == MatchingAlgorithm.JACCARD:
+            return np.array([self._jaccard_similarity(value1, choice) for choice in choices])
+        
+        if algorithm == MatchingAlgorithm.JARO_WINKLER:
+            scorer = RapidJaroWinkler.similarity
+        elif algorithm == MatchingAlgorithm.FUZZY_WUZZY:
+            scorer = rapid_fuzz.ratio
+        else:
+            # Levenshtein, also the default for unknown algorithms
+            scorer = RapidLevenshtein.normalized_similarity
+        
+        scores = rapid_process.cdist(
+            [value1], choices, scorer=scorer, dtype=np.float64, workers=self.scoring_workers
+        )[0]
+        
+        if algorithm == MatchingAlgorithm.FUZZY_WUZZY:
+            # fuzzywuzzy rounds the ratio to an integer percentage
+            scores = np.rint(scores) / 100.0
+        
+        return scores
+    
+    def _calculate_composite_similarity_batch(self, value1: str, choices: List[str], parameters: Dict[str, Any]) -> np.ndarray:
+        """Composite similarity of one value against many"""
+        algorithms = parameters.get('algorithms', ['levenshtein', 'jaro_winkler'])
+        weights = parameters.get('weights', [1.0] * len(algorithms))
+        
+        total_score = np.zeros(len(choices))
+        total_weight = 0.0
+        
+        for i, algorithm_name in enumerate(algorithms):
+            try:
+                algorithm = MatchingAlgorithm(algorithm_name)
+            except ValueError:
+                continue
+            weight = weights[i] if i < len(weights) else 1.0
+            
+            total_score += self._calculate_fuzzy_similarity_batch(value1, choices, algorithm) * weight
+            total_weight += weight
+        
+        return total_score / total_weight if total_weight > 0 else np.zeros(len(choices))
+    
     async def _calculate_field_similarity(self, value1: str, value2: str, rule: MatchingRule) -> float:
         """Calculate similarity between two field values"""
         if not value1 or not value2:
@@ -509,8 +715,10 @@ class EntityMatcher(BaseTransformer):
         """Calculate semantic similarity (placeholder for advanced NLP)"""
         # This is a placeholder for semantic similarity
         # In production, you might use word embeddings, BERT, or other NLP models
-        
-        # Simple word overlap similarity for now
+        return self._word_overlap_similarity(value1, value2)
+    
+    def _word_overlap_similarity(self, value1: str, value2: str) -> float:
+        """Simple word overlap similarity"""
         words1 = set(value1.lower().split())
         words2 = set(value2.lower().split())
         
@@ -573,8 +781,7 @@ class EntityMatcher(BaseTransformer):
     
     def _get_character_ngrams(self, text: str, n: int) -> Set[str]:
         """Get character n-grams from text"""
-        text = text.lower()
-        return set(text[i:i+n] for i in range(len(text) - n + 1))
+        return _character_ngrams(text, n)
     
     # Phonetic algorithms
     def _soundex(self, name: str) -> str:
@@ -730,7 +937,14 @@ class EntityMatcher(BaseTransformer):
         entity_id = self._generate_entity_id(entity)
         
         # Add to main storage
+        slot = len(self.processed_entities)
         self.processed_entities.append(entity)
+        self.entity_ids.append(entity_id)
+        
+        # Blocking keys are computed once here and looked up by key afterwards
+        if self.enable_blocking and self.blocking_fields:
+            for key in self._get_record_blocking_keys(entity):
+                self.blocking_index[key].add(slot)
         
         # Add to index for blocking
         if self.use_indexing:
@@ -813,7 +1027,8 @@ class EntityMatcher(BaseTransformer):
             'deduplication_rate': (duplicate_count / total_entities * 100) if total_entities > 0 else 0.0,
             'matching_rules_count': len(self.matching_rules),
             'blocking_enabled': self.enable_blocking,
-            'index_size': len(self.entity_index)
+            'index_size': len(self.entity_index),
+            'blocking_index_size': len(self.blocking_index)
         }
     
     async def export_matching_results(self) -> Dict[str, Any]:
@@ -846,6 +1061,8 @@ class EntityMatcher(BaseTransformer):
             # Clear large data structures
             self.entity_index.clear()
             self.processed_entities.clear()
+            self.blocking_index.clear()
+            self.entity_ids.clear()
             self.duplicate_groups.clear()
             self.uniqueness_cache.clear()
             
@@ -33,6 +33,11 @@ from .validation_utils import (
     validate_csv_headers,
     sanitize_input
 )
+from .record_fingerprint import (
+    RecordFingerprinter,
+    get_fingerprinter,
+    fingerprint_algorithm
+)
 # from .hash_utils import (
 #     generate_hash,
 #     verify_hash,
@@ -69,6 +74,9 @@ __all__ = [
     "validate_json",
     "validate_csv_headers",
     "sanitize_input",
+    "RecordFingerprinter",
+    "get_fingerprinter",
+    "fingerprint_algorithm",
     # "generate_hash",
     # "verify_hash",
     # "generate_uuid",
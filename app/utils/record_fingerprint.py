@@ -0,0 +1,279 @@
+"""
+Record fingerprints for duplicate detection.
+Serializes records canonically and hashes them with a pluggable algorithm.
+
+Fingerprint format:
+    <algorithm>$<hex digest>   e.g. ``blake2b$9f86d081884c7d659a2feaa0c55ad015``
+
+The ``legacy`` scheme reproduces the original ``data_hash`` values (SHA-256
+over ``json.dumps(record, sort_keys=True, default=str)``, 64 hex chars, no
+prefix) and is the default, so new rows stay comparable with stored ones.
+Switching ``hash_algorithm`` is a migration: ``manage.py rehash-records``
+rewrites existing rows to the new scheme and ``fingerprint_algorithm``
+tells which scheme produced a stored value.
+"""
+
+import hashlib
+import json
+from json.encoder import c_make_encoder, encode_basestring_ascii
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import xxhash
+except ImportError:  # Optional: enables the xxh3_128 algorithm
+    xxhash = None
+
+LEGACY_ALGORITHM = "legacy"
+DEFAULT_ALGORITHM = "legacy"
+SEPARATOR = "$"
+
+# Digest functions of the prefixed schemes (128-bit, 32 hex chars)
+HASH_ALGORITHMS: Dict[str, Callable[[bytes], str]] = {
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=16).hexdigest(),
+    "sha256": lambda data: hashlib.sha256(data).digest()[:16].hex(),
+    "md5": lambda data: hashlib.md5(data).hexdigest(),
+}
+if xxhash is not None:
+    HASH_ALGORITHMS["xxh3_128"] = xxhash.xxh3_128_hexdigest
+
+# Byte-for-byte the serializer behind the original data_hash values
+_LEGACY_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+_MAX_CACHED_KEY_SETS = 1024
+
+
+def _make_encoder() -> Callable[[Any], str]:
+    """
+    Compact ASCII JSON encoder with sorted nested keys
+
+    ``JSONEncoder.encode`` builds a new C encoder on every call, which costs
+    more than encoding a typical row; the C encoder is built once here.
+    """
+    if c_make_encoder is None:
+        return json.JSONEncoder(sort_keys=True, default=str, separators=(",", ":")).encode
+    # No circular-reference markers: records are plain JSON-like data
+    encoder = c_make_encoder(None, str, encode_basestring_ascii, None, ":", ",", True, False, True)
+    return lambda value: "".join(encoder(value, 0))
+
+
+_encode = _make_encoder()
+
+
+def _missing_to_none(value: Any) -> Any:
+    """None for NaN, NaT and pd.NA, so missing values hash like None"""
+    if value is pd.NaT or value is pd.NA or (isinstance(value, float) and value != value):
+        return None
+    return value
+
+
+# Serializers of exact value types, shared by both JSON encoders (ensure_ascii, no NaN here)
+_TYPE_SERIALIZERS: Dict[type, Callable[[Any], str]] = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    bool: {True: "true", False: "false"}.__getitem__,
+    type(None): lambda value: "null",
+}
+
+
+def _serialize_column(values: np.ndarray, legacy: bool) -> np.ndarray:
+    """
+    JSON text of every value of a column
+
+    Values are grouped by type and each group is serialized in one pass by
+    its (C) serializer; other types use the record encoder value by value.
+
+    Args:
+        values: Object array of the column values
+        legacy: Serialize like the legacy encoder (NaN kept as ``NaN``)
+
+    Returns:
+        Object array of JSON strings
+    """
+    if pd.api.types.infer_dtype(values, skipna=False) == "string":
+        # The common case of text columns (CSV/Excel cells): one C pass
+        return np.fromiter(map(encode_basestring_ascii, values), dtype=object, count=len(values))
+
+    types = pd.Series(values, dtype=object).map(type).to_numpy()
+    serialized = np.empty(len(values), dtype=object)
+
+    for value_type in pd.unique(types):
+        mask = types == value_type
+        group = values[mask]
+
+        if value_type is float:
+            serialized[mask] = _serialize_floats(group, legacy)
+            continue
+
+        serializer = _TYPE_SERIALIZERS.get(value_type)
+        if serializer is None:
+            if legacy:
+                serializer = _LEGACY_ENCODER.encode
+            else:
+                serializer = lambda value: _encode(_missing_to_none(value))
+        serialized[mask] = np.fromiter(map(serializer, group), dtype=object, count=len(group))
+
+    return serialized
+
+
+def _serialize_floats(values: np.ndarray, legacy: bool) -> np.ndarray:
+    """JSON text of Python floats (NaN as null, or ``NaN`` for legacy)"""
+    serialized = np.fromiter(map(float.__repr__, values), dtype=object, count=len(values))
+    numbers = values.astype(float)
+    serialized[np.isnan(numbers)] = "NaN" if legacy else "null"
+    serialized[numbers == np.inf] = "Infinity"
+    serialized[numbers == -np.inf] = "-Infinity"
+    return serialized
+
+
+def register_hash_algorithm(name: str, digest: Callable[[bytes], str]):
+    """
+    Register a digest function for use as ``<name>$<digest>`` fingerprints
+
+    Args:
+        name: Algorithm name (must not contain ``$``)
+        digest: Function returning a hex digest of at most 55 chars for bytes
+    """
+    if not name or SEPARATOR in name or name == LEGACY_ALGORITHM:
+        raise ValueError(f"Invalid hash algorithm name: {name!r}")
+    HASH_ALGORITHMS[name] = digest
+
+
+def available_algorithms() -> List[str]:
+    """Names accepted by ``RecordFingerprinter``"""
+    return [LEGACY_ALGORITHM, *HASH_ALGORITHMS]
+
+
+def fingerprint_algorithm(fingerprint: Optional[str]) -> Optional[str]:
+    """
+    Algorithm that produced a stored fingerprint
+
+    Returns:
+        Algorithm name, ``legacy`` for unprefixed values or None for no value
+    """
+    if not fingerprint:
+        return None
+    algorithm, separator, _ = fingerprint.partition(SEPARATOR)
+    return algorithm if separator else LEGACY_ALGORITHM
+
+
+class RecordFingerprinter:
+    """
+    Canonical record serializer plus hash algorithm.
+
+    A record is serialized as ``[sorted keys, values in key order]`` in
+    compact JSON. Sorted keys and their encoding are cached per key order, so
+    rows of the same file only pay for encoding their values. Missing values
+    (NaN, NaT, pd.NA) are serialized as None, so a record read through pandas
+    hashes like the same record cleaned to None. ``fingerprint_frame``
+    hashes a whole DataFrame chunk column-wise with the same result.
+    """
+
+    def __init__(self, algorithm: str = DEFAULT_ALGORITHM):
+        """
+        Initialize fingerprinter
+
+        Args:
+            algorithm: ``legacy`` or a name from ``HASH_ALGORITHMS``
+        """
+        if algorithm != LEGACY_ALGORITHM and algorithm not in HASH_ALGORITHMS:
+            raise ValueError(
+                f"Unknown hash algorithm: {algorithm}. Available: {available_algorithms()}"
+            )
+        self.algorithm = algorithm
+        self._digest = HASH_ALGORITHMS.get(algorithm)
+        self._prefix = f"{algorithm}{SEPARATOR}"
+        self._key_prefixes: Dict[Tuple[Any, ...], Tuple[Tuple[Any, ...], str]] = {}
+
+    def fingerprint(self, record: Dict[str, Any]) -> str:
+        """Fingerprint of one record"""
+        if self._digest is None:
+            return self._legacy_fingerprint(record)
+
+        try:
+            keys, keys_prefix = self._keys_prefix(tuple(record))
+            payload = keys_prefix + _encode([_missing_to_none(record[key]) for key in keys]) + "]"
+        except (TypeError, ValueError, RecursionError):
+            # Unsortable keys or values the encoder rejects
+            payload = repr(record)
+        return self._prefix + self._digest(payload.encode())
+
+    def fingerprint_many(self, records: Iterable[Dict[str, Any]]) -> List[str]:
+        """Fingerprints of a sequence of records, in order"""
+        fingerprint = self.fingerprint
+        return [fingerprint(record) for record in records]
+
+    def fingerprint_frame(self, df: pd.DataFrame) -> List[str]:
+        """
+        Fingerprints of all rows of a DataFrame chunk
+
+        Each column is serialized for the whole chunk in one pass per value
+        type; per row only the serialized values are joined and digested.
+        Yields the same fingerprints as ``fingerprint`` on
+        ``df.to_dict("records")``.
+
+        Args:
+            df: Records as rows, column labels as keys
+
+        Returns:
+            One fingerprint per row, in row order
+        """
+        columns = list(df.columns)
+        if df.empty or not all(type(column) is str for column in columns) or len(set(columns)) != len(columns):
+            return self.fingerprint_many(df.to_dict("records"))
+
+        legacy = self._digest is None
+        try:
+            serialized = {
+                column: _serialize_column(df[column].astype(object).to_numpy(), legacy)
+                for column in columns
+            }
+        except (TypeError, ValueError, RecursionError):
+            # Values the encoder rejects fall back to the per-record repr
+            return self.fingerprint_many(df.to_dict("records"))
+
+        keys = sorted(columns)
+        if legacy:
+            # {"key": value, ...} with the default ", " / ": " separators
+            items = [encode_basestring_ascii(key) + ": " + serialized[key] for key in keys]
+            payloads = ["{" + ", ".join(row) + "}" for row in zip(*items)]
+        else:
+            # [sorted keys, values in key order]
+            head = self._keys_prefix(tuple(columns))[1] + "["
+            payloads = [head + ",".join(row) + "]]" for row in zip(*(serialized[key] for key in keys))]
+
+        if legacy:
+            return [hashlib.sha256(payload.encode()).hexdigest() for payload in payloads]
+        prefix = self._prefix
+        digest = self._digest
+        return [prefix + digest(payload.encode()) for payload in payloads]
+
+    def matches_scheme(self, fingerprint: Optional[str]) -> bool:
+        """Whether a stored fingerprint was produced with this algorithm"""
+        return fingerprint_algorithm(fingerprint) == self.algorithm
+
+    def _keys_prefix(self, key_order: Tuple[Any, ...]) -> Tuple[Tuple[Any, ...], str]:
+        """Sorted keys and their encoded prefix for keys in record order"""
+        cached = self._key_prefixes.get(key_order)
+        if cached is None:
+            if len(self._key_prefixes) >= _MAX_CACHED_KEY_SETS:
+                self._key_prefixes.clear()
+            keys = tuple(sorted(key_order))
+            cached = (keys, "[" + _encode(keys) + ",")
+            self._key_prefixes[key_order] = cached
+        return cached
+
+    @staticmethod
+    def _legacy_fingerprint(record: Dict[str, Any]) -> str:
+        try:
+            record_string = _LEGACY_ENCODER.encode(record)
+        except (TypeError, ValueError):
+            record_string = str(record)
+        return hashlib.sha256(record_string.encode()).hexdigest()
+
+
+def get_fingerprinter(algorithm: Optional[str] = None) -> RecordFingerprinter:
+    """Fingerprinter for an algorithm name (default when None)"""
+    return RecordFingerprinter(algorithm or DEFAULT_ALGORITHM)
@@ -0,0 +1,83 @@
+"""
+Command untuk mengisi entity_hash pada processed.entities yang dibuat sebelum kolom itu ada
+"""
+
+from commands.base import BaseCommand
+import time
+import typer
+
+
+class Command(BaseCommand):
+    help = "Backfill processed.entities.entity_hash (required before enabling bulk_load)"
+
+    def add_arguments(self):
+        return {
+            'entity_type': typer.Option(
+                ..., '--entity-type', '-t',
+                help='Entity type to backfill (same as the load entity_type)'
+            ),
+            'key_fields': typer.Option(
+                'id,name', '--key-fields', '-k',
+                help='Comma-separated key fields, same as the load key_fields'
+            ),
+            'batch_size': typer.Option(
+                5000, '--batch-size', '-b',
+                help='Rows read and updated per transaction'
+            ),
+            'dry_run': typer.Option(
+                False, '--dry-run',
+                help='Count entities without entity_hash without updating them'
+            ),
+        }
+
+    def handle(self, entity_type: str, key_fields: str, batch_size: int, dry_run: bool, **options):
+        self.print_header("Backfill Entity Hash")
+
+        from sqlalchemy import bindparam, func, select, update
+        from app.infrastructure.db.entity_loader import BulkEntityLoader
+        from app.infrastructure.db.keyset import KeysetPaginator
+        from app.infrastructure.db.manager import get_session
+        from app.infrastructure.db.models.processed.entities import Entity
+
+        fields = [field.strip() for field in key_fields.split(",") if field.strip()]
+        if not fields:
+            self.error("--key-fields must contain at least one field")
+            raise typer.Exit(1)
+
+        condition = (Entity.entity_type == entity_type) & Entity.entity_hash.is_(None)
+
+        with get_session() as db:
+            if dry_run:
+                count = db.execute(select(func.count()).select_from(Entity).where(condition)).scalar_one()
+                self.warning(f"DRY RUN MODE — {count} {entity_type} entities have no entity_hash")
+                return
+
+            table = Entity.__table__
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("entity_id"))
+                .values(entity_hash=bindparam("new_hash"))
+            )
+            paginator = KeysetPaginator(
+                db,
+                select(Entity.id, Entity.entity_data).where(condition),
+                [Entity.id],
+                batch_size=batch_size
+            )
+
+            started = time.perf_counter()
+            for batch in paginator:
+                db.execute(statement, [
+                    {
+                        "entity_id": row.id,
+                        "new_hash": BulkEntityLoader.compute_entity_hash(row.entity_data or {}, fields),
+                    }
+                    for row in batch
+                ])
+                db.commit()
+                self.print(f"  {paginator.rows_read} entities hashed")
+
+            elapsed = time.perf_counter() - started
+            self.success(
+                f"Backfilled entity_hash of {paginator.rows_read} {entity_type} entities in {elapsed:.1f}s"
+            )
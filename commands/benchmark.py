@@ -0,0 +1,708 @@
+"""
+Benchmark commands — measure throughput of ETL hot paths against synthetic data.
+"""
+
+from commands.base import BaseCommand
+import asyncio
+import time
+import typer
+
+
+def _synthetic_records(count: int):
+    """Generate flat CSV-like records for ingestion benchmarks"""
+    for i in range(count):
+        yield {
+            "customer_id": str(i),
+            "name": f"Customer {i}",
+            "email": f"customer{i}@example.com",
+            "city": ("Jakarta", "Bandung", "Surabaya", "Medan")[i % 4],
+            "amount": f"{(i * 7919) % 100000 / 100:.2f}",
+            "created": f"2024-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}",
+        }
+
+
+class BenchmarkBulkInsertCommand(BaseCommand):
+    """Compare per-object ORM inserts with the bulk COPY/INSERT writer"""
+
+    help = "Benchmark raw record ingestion (ORM per-object vs bulk writer)"
+
+    def add_arguments(self):
+        return {
+            'rows': typer.Option(
+                20000, '--rows', '-r',
+                help='Number of synthetic records to ingest per run'
+            ),
+            'batch_size': typer.Option(
+                5000, '--batch-size', '-b',
+                help='Rows per flush/commit'
+            ),
+            'method': typer.Option(
+                'auto', '--method', '-m',
+                help='Bulk write method: auto, copy or insert'
+            ),
+        }
+
+    def handle(self, rows: int, batch_size: int, method: str, **options):
+        self.print_header("Benchmark: Raw Record Ingestion")
+
+        from sqlmodel import delete
+        from app.core.enums import FileTypeEnum
+        from app.infrastructure.db.manager import get_session
+        from app.infrastructure.db.models.raw_data.file_registry import FileRegistry
+        from app.infrastructure.db.models.raw_data.raw_records import RawRecords
+        from app.processors.csv_processor import CSVProcessor
+
+        runs = [
+            ("orm", {"bulk_insert": False}),
+            (f"bulk ({method})", {"bulk_insert": True, "bulk_method": method}),
+        ]
+
+        with get_session() as db:
+            file_record = FileRegistry(file_name="benchmark_bulk_insert.csv", file_type=FileTypeEnum.CSV)
+            db.add(file_record)
+            db.commit()
+            db.refresh(file_record)
+
+            try:
+                self.print("")
+                self.print(f"{'Path':<16} {'Rows':>10} {'Seconds':>10} {'Rows/sec':>12}")
+                self.print("─" * 52)
+
+                for label, config in runs:
+                    processor = CSVProcessor(db, write_batch_size=batch_size, **config)
+                    started = time.perf_counter()
+                    stats = asyncio.run(processor.process_records(_synthetic_records(rows), file_record))
+                    elapsed = time.perf_counter() - started
+
+                    self.print(
+                        f"{label:<16} {stats['total_records']:>10} {elapsed:>10.2f} "
+                        f"{stats['total_records'] / elapsed:>12.0f}"
+                    )
+                    db.exec(delete(RawRecords).where(RawRecords.file_id == file_record.id))
+                    db.commit()
+            finally:
+                db.delete(file_record)
+                db.commit()
+
+        self.print("")
+        self.success("Benchmark completed")
+
+
+def _synthetic_entities(count: int):
+    """Generate person-like entities with a share of near-duplicate names"""
+    syllables = ("ba", "di", "ko", "sa", "ri", "nu", "ta", "wi", "ja", "lo", "me", "pu")
+    for i in range(count):
+        base = i if i % 10 else i // 2  # every tenth entity repeats an earlier name
+        first = "".join(syllables[(base // 12 ** n) % 12] for n in range(3)).title()
+        last = "".join(syllables[(base // 12 ** n) % 12] for n in range(3, 6)).title()
+        yield {
+            "name": f"{first} {last}",
+            "city": ("Jakarta", "Bandung", "Surabaya", "Medan")[base % 4],
+        }
+
+
+class BenchmarkEntityMatchingCommand(BaseCommand):
+    """Measure how EntityMatcher throughput scales with the number of indexed entities"""
+
+    help = "Benchmark entity matching throughput as the entity set grows"
+
+    def add_arguments(self):
+        return {
+            'sizes': typer.Option(
+                '1000,5000,10000,25000', '--sizes', '-s',
+                help='Comma-separated entity counts to run'
+            ),
+            'max_comparisons': typer.Option(
+                10000, '--max-comparisons', '-c',
+                help='Candidate cap per record'
+            ),
+        }
+
+    def handle(self, sizes: str, max_comparisons: int, **options):
+        self.print_header("Benchmark: Entity Matching Scaling")
+
+        from app.transformers.entity_matcher import EntityMatcher
+
+        matching_rules = {
+            "name": {
+                "strategy": "fuzzy",
+                "algorithm": "levenshtein",
+                "threshold": 0.85,
+                "preprocessing": ["lowercase", "normalize_whitespace"],
+            },
+        }
+
+        async def run(count: int):
+            matcher = EntityMatcher(
+                None,
+                matching_rules=matching_rules,
+                blocking_fields=["name"],
+                max_comparisons=max_comparisons,
+            )
+            comparisons = 0
+            duplicates = 0
+            for record in _synthetic_entities(count):
+                result = await matcher.transform_record(record)
+                comparisons += result.metadata.get('comparisons_made', 0)
+                duplicates += bool(result.metadata.get('is_duplicate'))
+            return comparisons, duplicates
+
+        self.print("")
+        self.print(f"{'Entities':>10} {'Seconds':>10} {'Records/sec':>12} {'Avg cmp':>10} {'Duplicates':>11}")
+        self.print("─" * 57)
+
+        for count in [int(size) for size in sizes.split(',') if size.strip()]:
+            started = time.perf_counter()
+            comparisons, duplicates = asyncio.run(run(count))
+            elapsed = time.perf_counter() - started
+
+            self.print(
+                f"{count:>10} {elapsed:>10.2f} {count / elapsed:>12.0f} "
+                f"{comparisons / count:>10.1f} {duplicates:>11}"
+            )
+
+        self.print("")
+        self.success("Benchmark completed")
+
+
+class BenchmarkEntityScoringCommand(BaseCommand):
+    """Compare pairwise and vectorized EntityMatcher candidate scoring"""
+
+    help = "Benchmark entity similarity scoring (pairwise vs batch cdist)"
+
+    def add_arguments(self):
+        return {
+            'candidates': typer.Option(
+                5000, '--candidates', '-n',
+                help='Number of candidate entities per record'
+            ),
+            'records': typer.Option(
+                20, '--records', '-r',
+                help='Number of records scored against the candidates'
+            ),
+            'workers': typer.Option(
+                1, '--workers', '-w',
+                help='RapidFuzz cdist workers (-1 for all cores)'
+            ),
+        }
+
+    def handle(self, candidates: int, records: int, workers: int, **options):
+        self.print_header("Benchmark: Entity Similarity Scoring")
+
+        from app.transformers.entity_matcher import EntityMatcher
+
+        matching_rules = {
+            "name": [
+                {"strategy": "fuzzy", "algorithm": "levenshtein", "threshold": 0.85, "weight": 2.0},
+                {"strategy": "fuzzy", "algorithm": "jaro_winkler", "threshold": 0.9},
+            ],
+            "city": {"strategy": "exact", "algorithm": "levenshtein", "threshold": 1.0},
+        }
+        matcher = EntityMatcher(
+            None,
+            matching_rules=matching_rules,
+            global_threshold=0.8,
+            scoring_workers=workers,
+        )
+        entities = list(_synthetic_entities(candidates + records))
+        pool, queries = entities[:candidates], entities[candidates:]
+
+        async def pairwise():
+            matches = []
+            for query in queries:
+                for candidate in pool:
+                    match = await matcher._compare_entities(query, candidate)
+                    if match.match_score >= matcher.global_threshold:
+                        matches.append(match)
+            return matches
+
+        async def batch():
+            matches = []
+            for query in queries:
+                matches.extend(await matcher._score_candidates(query, pool, matcher.global_threshold))
+            return matches
+
+        comparisons = len(pool) * len(queries)
+        results = {}
+
+        self.print("")
+        self.print(f"{'Mode':<10} {'Comparisons':>12} {'Seconds':>10} {'Cmp/sec':>12} {'Matches':>9}")
+        self.print("─" * 57)
+
+        for label, scorer in (("pairwise", pairwise), ("batch", batch)):
+            started = time.perf_counter()
+            results[label] = asyncio.run(scorer())
+            elapsed = time.perf_counter() - started
+
+            self.print(
+                f"{label:<10} {comparisons:>12} {elapsed:>10.2f} "
+                f"{comparisons / elapsed:>12.0f} {len(results[label]):>9}"
+            )
+
+        self.print("")
+        if results["pairwise"] != results["batch"]:
+            self.error("Batch scoring results differ from pairwise scoring")
+            raise typer.Exit(1)
+        self.success("Benchmark completed, results identical")
+
+
+class BenchmarkRecordHashCommand(BaseCommand):
+    """Compare per-row cost of the record fingerprint algorithms"""
+
+    help = "Benchmark record fingerprinting (legacy SHA-256 vs fast algorithms, per record vs per chunk)"
+
+    def add_arguments(self):
+        return {
+            'rows': typer.Option(
+                100000, '--rows', '-r',
+                help='Number of synthetic records to hash per run'
+            ),
+            'algorithms': typer.Option(
+                None, '--algorithms', '-a',
+                help='Comma-separated algorithms (default: all available)'
+            ),
+        }
+
+    def handle(self, rows: int, algorithms: str, **options):
+        self.print_header("Benchmark: Record Fingerprinting")
+
+        import pandas as pd
+        from app.utils.record_fingerprint import RecordFingerprinter, available_algorithms
+
+        rows = int(rows)
+        names = [name.strip() for name in algorithms.split(",")] if algorithms else available_algorithms()
+        records = list(_synthetic_records(rows))
+        frame = pd.DataFrame(records)
+
+        self.print("")
+        self.print(f"{'Algorithm':<12} {'Mode':<8} {'Rows':>10} {'Seconds':>10} {'µs/row':>10} {'Rows/sec':>12}")
+        self.print("─" * 67)
+
+        for name in names:
+            fingerprinter = RecordFingerprinter(name)
+            modes = [
+                ("record", lambda: fingerprinter.fingerprint_many(records)),
+                ("frame", lambda: fingerprinter.fingerprint_frame(frame)),
+            ]
+
+            results = {}
+            for mode, run in modes:
+                started = time.perf_counter()
+                results[mode] = run()
+                elapsed = time.perf_counter() - started
+                self.print(
+                    f"{name:<12} {mode:<8} {rows:>10} {elapsed:>10.2f} "
+                    f"{elapsed / rows * 1e6:>10.2f} {rows / elapsed:>12.0f}"
+                )
+
+            if results["frame"] != results["record"]:
+                self.error(f"{name}: frame fingerprints differ from record fingerprints")
+                raise typer.Exit(1)
+
+        self.print("")
+        self.success("Benchmark completed, results identical")
+
+
+class BenchmarkApiPaginationCommand(BaseCommand):
+    """Compare sequential and prefetching APIProcessor pagination against a local stub API"""
+
+    help = "Benchmark API pagination (sequential vs concurrent prefetch) against a local aiohttp stub"
+
+    def add_arguments(self):
+        return {
+            'pages': typer.Option(
+                50, '--pages', '-p',
+                help='Number of pages served by the stub API'
+            ),
+            'page_size': typer.Option(
+                100, '--page-size', '-s',
+                help='Records per page'
+            ),
+            'latency': typer.Option(
+                50, '--latency', '-l',
+                help='Simulated server latency per request in milliseconds'
+            ),
+            'window': typer.Option(
+                8, '--window', '-w',
+                help='Page requests kept in flight by the prefetching paginator'
+            ),
+        }
+
+    def handle(self, pages: int, page_size: int, latency: int, window: int, **options):
+        self.print_header("Benchmark: API Pagination")
+
+        from aiohttp import web
+        from app.processors.api_processor import APIProcessor
+
+        pages, page_size, latency, window = int(pages), int(page_size), int(latency), int(window)
+        total = pages * page_size
+
+        def page_of(start: int):
+            records = [
+                {"id": i, **record}
+                for i, record in zip(range(start, min(start + page_size, total)), _synthetic_records(page_size))
+            ]
+            return web.json_response({"data": records, "has_more": start + page_size < total})
+
+        async def handler(request):
+            await asyncio.sleep(latency / 1000)
+            query = request.query
+            if "offset" in query:
+                return page_of(int(query["offset"]))
+            if "page" in query:
+                return page_of((int(query["page"]) - 1) * page_size)
+            return page_of(int(query["cursor"]) + 1 if "cursor" in query else 0)
+
+        async def fetch(base_url: str, pagination_type: str, prefetch: int):
+            processor = APIProcessor(
+                None,
+                base_url=base_url,
+                endpoint="/items",
+                pagination_type=pagination_type,
+                prefetch_pages=prefetch,
+                chunk_size=page_size,
+                rate_limit=1000000,
+                include_metadata=False,
+            )
+            try:
+                return [record async for record in processor._fetch_all_data()], processor.requests_made
+            finally:
+                await processor._close_session()
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/items", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            base_url = f"http://127.0.0.1:{port}"
+
+            results = []
+            try:
+                for pagination_type, prefetch in (
+                    ("offset", 1), ("offset", window), ("page", 1), ("page", window), ("cursor", 1)
+                ):
+                    started = time.perf_counter()
+                    records, requests = await fetch(base_url, pagination_type, prefetch)
+                    results.append((pagination_type, prefetch, records, requests, time.perf_counter() - started))
+            finally:
+                await runner.cleanup()
+            return results
+
+        results = asyncio.run(run())
+
+        self.print("")
+        self.print(f"{'Mode':<8} {'Window':>7} {'Records':>10} {'Requests':>9} {'Seconds':>9} {'Pages/sec':>10}")
+        self.print("─" * 58)
+        for pagination_type, prefetch, records, requests, elapsed in results:
+            self.print(
+                f"{pagination_type:<8} {prefetch:>7} {len(records):>10} {requests:>9} "
+                f"{elapsed:>9.2f} {pages / elapsed:>10.1f}"
+            )
+
+        self.print("")
+        expected = [record["id"] for record in results[0][2]]
+        if len(expected) != total or any([record["id"] for record in records] != expected for _, _, records, _, _ in results):
+            self.error("Paginated results are incomplete or out of order")
+            raise typer.Exit(1)
+        self.success("Benchmark completed, all modes returned every record in order")
+
+
+class BenchmarkJsonlParseCommand(BaseCommand):
+    """Compare line-by-line JSONL parsing with byte-block parsing, inline and in a process pool"""
+
+    help = "Benchmark JSONL parsing (text lines vs byte blocks vs process pool)"
+
+    def add_arguments(self):
+        return {
+            'rows': typer.Option(
+                500000, '--rows', '-r',
+                help='Number of synthetic JSONL records'
+            ),
+            'workers': typer.Option(
+                0, '--workers', '-w',
+                help='Parse processes for the pool run (0 = CPU count)'
+            ),
+        }
+
+    def handle(self, rows: int, workers: int, **options):
+        self.print_header("Benchmark: JSONL Parsing")
+
+        import json
+        import multiprocessing
+        import os
+        import tempfile
+        from functools import partial
+        from app.core.executors import ManagedExecutor
+        from app.processors.json_processor import handle_json_array
+        from app.processors.jsonl_reader import iter_jsonl_blocks
+        from app.processors.record_flattener import RecordFlattener
+
+        rows = int(rows)
+        workers = int(workers) or multiprocessing.cpu_count()
+        flattener = RecordFlattener(partial(handle_json_array, array_handling='json_string'))
+
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                for i, record in enumerate(_synthetic_records(rows)):
+                    record["address"] = {"city": record.pop("city"), "geo": {"lat": i % 90, "lon": i % 180}}
+                    record["tags"] = ["a", "b"] if i % 2 else []
+                    file.write(json.dumps(record) + "\n")
+            size_mb = os.path.getsize(path) / 1024 / 1024
+
+            def text_lines():
+                records = []
+                with open(path, 'r', encoding='utf-8') as file:
+                    for line in file:
+                        line = line.strip()
+                        if line:
+                            records.append(flattener.flatten(json.loads(line)))
+                return records
+
+            async def blocks(run):
+                records = []
+                async for _, (block_records, _, _) in iter_jsonl_blocks(
+                    path, flattener=flattener, run=run, max_pending=workers * 2
+                ):
+                    records.extend(block_records)
+                return records
+
+            results = []
+            started = time.perf_counter()
+            results.append(("text lines", text_lines(), time.perf_counter() - started))
+            started = time.perf_counter()
+            results.append(("byte blocks", asyncio.run(blocks(None)), time.perf_counter() - started))
+            pool = ManagedExecutor("benchmark", "process", workers)
+            try:
+                started = time.perf_counter()
+                results.append((f"pool x{workers}", asyncio.run(blocks(pool.run)), time.perf_counter() - started))
+                pool_metrics = pool.get_metrics()
+            finally:
+                pool.shutdown()
+        finally:
+            os.unlink(path)
+
+        self.print("")
+        self.print(f"{'Mode':<12} {'Records':>10} {'Seconds':>9} {'Rows/sec':>12} {'MB/sec':>9}")
+        self.print("─" * 56)
+        for mode, records, elapsed in results:
+            self.print(
+                f"{mode:<12} {len(records):>10} {elapsed:>9.2f} "
+                f"{len(records) / elapsed:>12.0f} {size_mb / elapsed:>9.1f}"
+            )
+
+        self.print(
+            f"Pool: {pool_metrics['completed']} blocks, queue wait avg {pool_metrics['wait_avg_ms']} ms, "
+            f"run avg {pool_metrics['run_avg_ms']} ms"
+        )
+
+        self.print("")
+        if any(records != results[0][1] for _, records, _ in results[1:]):
+            self.error("Parsed records differ between modes")
+            raise typer.Exit(1)
+        self.success("Benchmark completed, results identical")
+
+
+class BenchmarkCacheEvictionCommand(BaseCommand):
+    """Compare MemoryCache eviction and admission policies on a Zipfian key trace"""
+
+    help = "Benchmark MemoryCache eviction policies (ops/sec and hit rate on a Zipfian trace)"
+
+    def add_arguments(self):
+        return {
+            'operations': typer.Option(
+                200000, '--operations', '-n',
+                help='Number of cache lookups in the trace'
+            ),
+            'keys': typer.Option(
+                100000, '--keys', '-k',
+                help='Number of distinct keys'
+            ),
+            'capacity': typer.Option(
+                5000, '--capacity', '-c',
+                help='Cache max_size'
+            ),
+            'skew': typer.Option(
+                0.99, '--skew', '-s',
+                help='Zipf exponent (higher = hotter head)'
+            ),
+            'max_memory_mb': typer.Option(
+                0, '--max-memory-mb', '-m',
+                help='Cache memory bound in MB (0 = entry count only)'
+            ),
+            'policies': typer.Option(
+                'lru,lfu,random,lru+tinylfu,lfu+tinylfu', '--policies', '-p',
+                help='Comma-separated policies; "+tinylfu" adds W-TinyLFU admission'
+            ),
+        }
+
+    def handle(
+        self, operations: int, keys: int, capacity: int, skew: float,
+        max_memory_mb: int, policies: str, **options
+    ):
+        self.print_header("Benchmark: MemoryCache Eviction")
+
+        import itertools
+        import random
+        from app.infrastructure.cache.memory_cache import MemoryCache
+
+        operations, keys, capacity = int(operations), int(keys), int(capacity)
+        rng = random.Random(42)
+        cum_weights = list(itertools.accumulate(1.0 / rank ** skew for rank in range(1, keys + 1)))
+        trace = [f"key:{rank}" for rank in rng.choices(range(keys), cum_weights=cum_weights, k=operations)]
+        value = {"id": 1, "name": "cached row", "tags": ["a", "b"], "payload": "x" * 200}
+
+        async def replay(cache: MemoryCache):
+            hits = 0
+            for key in trace:
+                if await cache.get(key) is not None:
+                    hits += 1
+                else:
+                    await cache.set(key, value)
+            return hits
+
+        self.print(f"Trace: {operations} lookups over {keys} keys (zipf s={skew}), capacity {capacity}")
+        self.print("")
+        self.print(f"{'Policy':<14} {'Seconds':>9} {'Ops/sec':>12} {'Hit rate':>9} {'Evictions':>10}")
+        self.print("─" * 58)
+
+        for spec in (name.strip() for name in policies.split(",")):
+            eviction, _, admission = spec.partition("+")
+            cache = MemoryCache(
+                max_size=capacity,
+                max_memory_mb=int(max_memory_mb) or None,
+                eviction_policy=eviction,
+                admission_policy=admission or None,
+            )
+            started = time.perf_counter()
+            hits = asyncio.run(replay(cache))
+            elapsed = time.perf_counter() - started
+            ops = operations + (operations - hits)  # every miss also sets
+
+            self.print(
+                f"{spec:<14} {elapsed:>9.2f} {ops / elapsed:>12.0f} "
+                f"{hits / operations * 100:>8.2f}% {cache.get_metrics()['evictions']:>10}"
+            )
+
+        self.print("")
+        self.success("Benchmark completed")
+
+
+def _synthetic_cached_rows(count: int):
+    """Rows shaped like a cached query result (timestamps, UUIDs, decimals)"""
+    import uuid
+    from datetime import datetime, timedelta
+    from decimal import Decimal
+
+    started = datetime(2024, 1, 1, 8, 0, 0)
+    return [
+        {
+            "id": uuid.UUID(int=i * 7919 + 1),
+            "customer_id": str(i),
+            "name": f"Customer {i}",
+            "email": f"customer{i}@example.com",
+            "city": ("Jakarta", "Bandung", "Surabaya", "Medan")[i % 4],
+            "amount": Decimal(f"{(i * 7919) % 100000 / 100:.2f}"),
+            "created_at": started + timedelta(minutes=i),
+            "is_active": i % 3 != 0,
+            "tags": ["etl", "import", f"batch-{i % 10}"],
+        }
+        for i in range(count)
+    ]
+
+
+class BenchmarkCacheCodecCommand(BaseCommand):
+    """Compare Redis value codecs and compression on a cached query result"""
+
+    help = "Benchmark cache value codecs (payload bytes, encode/decode µs, Redis memory per key)"
+
+    def add_arguments(self):
+        return {
+            'rows': typer.Option(
+                200, '--rows', '-r',
+                help='Rows in the cached payload'
+            ),
+            'iterations': typer.Option(
+                2000, '--iterations', '-n',
+                help='Encode/decode rounds per codec'
+            ),
+            'codecs': typer.Option(
+                'legacy,json,json+zlib,msgpack,msgpack+zlib,msgpack+lz4', '--codecs', '-c',
+                help='Comma-separated codecs; "+zlib"/"+lz4" adds compression'
+            ),
+            'threshold': typer.Option(
+                1024, '--threshold', '-t',
+                help='Minimum encoded size in bytes to compress'
+            ),
+            'redis_keys': typer.Option(
+                0, '--redis-keys', '-k',
+                help='Also write this many keys per codec to Redis and report MEMORY USAGE (0 = skip)'
+            ),
+        }
+
+    def handle(self, rows: int, iterations: int, codecs: str, threshold: int, redis_keys: int, **options):
+        self.print_header("Benchmark: Cache Value Codecs")
+
+        from app.core.codecs import ValueCodec
+
+        rows, iterations, redis_keys = int(rows), int(iterations), int(redis_keys)
+        payload = _synthetic_cached_rows(rows)
+
+        self.print(f"Payload: {rows} rows, {iterations} rounds per codec")
+        self.print("")
+        self.print(
+            f"{'Codec':<14} {'Bytes':>9} {'Ratio':>7} {'Encode µs':>10} {'Decode µs':>10} "
+            f"{'Ops/sec':>10} {'Types':>6} {'Redis B/key':>12}"
+        )
+        self.print("─" * 85)
+
+        baseline = None
+        for spec in (name.strip() for name in codecs.split(",")):
+            codec_name, _, compression = spec.partition("+")
+            codec = ValueCodec(codec_name, compression or None, int(threshold))
+            if codec.name != spec:
+                self.warning(f"{spec}: not installed, running as {codec.name}")
+
+            encoded = codec.encode(payload)
+            baseline = baseline or len(encoded)
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                codec.encode(payload)
+            encode_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                decoded = codec.decode(encoded)
+            decode_seconds = time.perf_counter() - started
+
+            redis_bytes = asyncio.run(self._redis_memory(codec, payload, redis_keys)) if redis_keys else None
+            self.print(
+                f"{spec:<14} {len(encoded):>9} {len(encoded) / baseline:>7.2f} "
+                f"{encode_seconds / iterations * 1e6:>10.1f} {decode_seconds / iterations * 1e6:>10.1f} "
+                f"{iterations / (encode_seconds + decode_seconds):>10.0f} "
+                f"{'yes' if decoded == payload else 'no':>6} "
+                f"{redis_bytes if redis_bytes is not None else '-':>12}"
+            )
+
+        self.print("")
+        self.print("Types: datetime/UUID/Decimal survive the round trip (legacy JSON turns them into strings)")
+        self.success("Benchmark completed")
+
+    async def _redis_memory(self, codec, payload, count: int):
+        """Average Redis MEMORY USAGE of ``count`` keys written with ``codec``"""
+        from app.infrastructure.cache.redis_cache import RedisCache
+
+        cache = RedisCache(codec=codec)
+        await cache.connect()
+        keys = [f"benchmark:codec:{codec.name}:{i}" for i in range(count)]
+        try:
+            await cache.set_many({key: payload for key in keys}, ttl=300)
+            usages = [await cache._client.memory_usage(key) or 0 for key in keys]
+            return sum(usages) // max(len(usages), 1)
+        finally:
+            await cache.delete(*keys)
+            await cache.disconnect()
@@ -0,0 +1,90 @@
+"""
+Command untuk menghitung ulang data_hash raw_records ke algoritma fingerprint lain
+"""
+
+from commands.base import BaseCommand
+import time
+import typer
+from typing import Optional
+
+
+class Command(BaseCommand):
+    help = "Recompute raw record data_hash values with another fingerprint algorithm"
+
+    def add_arguments(self):
+        return {
+            'algorithm': typer.Option(
+                'blake2b', '--algorithm', '-a',
+                help='Target fingerprint algorithm (legacy, blake2b, sha256, md5, xxh3_128)'
+            ),
+            'batch_size': typer.Option(
+                5000, '--batch-size', '-b',
+                help='Rows read and updated per transaction'
+            ),
+            'file_id': typer.Option(
+                None, '--file-id', '-f',
+                help='Only rehash records of this file'
+            ),
+            'dry_run': typer.Option(
+                False, '--dry-run',
+                help='Count records that would be rehashed without updating them'
+            ),
+        }
+
+    def handle(self, algorithm: str, batch_size: int, file_id: Optional[str], dry_run: bool, **options):
+        self.print_header("Rehash Raw Records")
+
+        from sqlalchemy import bindparam, func, not_, or_, select, update
+        from app.infrastructure.db.keyset import KeysetPaginator
+        from app.infrastructure.db.manager import get_session
+        from app.infrastructure.db.models.raw_data.raw_records import RawRecords
+        from app.utils.record_fingerprint import LEGACY_ALGORITHM, SEPARATOR, RecordFingerprinter
+
+        try:
+            fingerprinter = RecordFingerprinter(algorithm)
+        except ValueError as e:
+            self.error(str(e))
+            raise typer.Exit(1)
+
+        # Records whose stored hash comes from another scheme
+        if algorithm == LEGACY_ALGORITHM:
+            stale = RawRecords.data_hash.contains(SEPARATOR, autoescape=True)
+        else:
+            stale = not_(RawRecords.data_hash.startswith(f"{algorithm}{SEPARATOR}", autoescape=True))
+        condition = or_(RawRecords.data_hash.is_(None), stale)
+        if file_id:
+            condition = condition & (RawRecords.file_id == file_id)
+
+        with get_session() as db:
+            if dry_run:
+                count = db.execute(select(func.count()).select_from(RawRecords).where(condition)).scalar_one()
+                self.warning(f"DRY RUN MODE — {count} records would be rehashed to '{algorithm}'")
+                return
+
+            table = RawRecords.__table__
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("record_id"))
+                .values(data_hash=bindparam("new_hash"))
+            )
+            paginator = KeysetPaginator(
+                db,
+                select(RawRecords.id, RawRecords.created_at, RawRecords.raw_data).where(condition),
+                [RawRecords.created_at, RawRecords.id],
+                batch_size=batch_size
+            )
+
+            started = time.perf_counter()
+            for batch in paginator:
+                hashes = fingerprinter.fingerprint_many(row.raw_data or {} for row in batch)
+                db.execute(statement, [
+                    {"record_id": row.id, "new_hash": new_hash}
+                    for row, new_hash in zip(batch, hashes)
+                ])
+                db.commit()
+                self.print(f"  {paginator.rows_read} records rehashed")
+
+            elapsed = time.perf_counter() - started
+            self.success(
+                f"Rehashed {paginator.rows_read} records to '{algorithm}' in {elapsed:.1f}s"
+            )
@@ -37,7 +37,7 @@ def discover_commands():
         return
 
     # Multi-command files that should be registered as Typer groups
-    group_commands = {'worker', 'task'}
+    group_commands = {'worker', 'task', 'benchmark'}
 
     for file_path in sorted(commands_dir.glob("*.py")):
         if file_path.name in ["__init__.py", "base.py"]:
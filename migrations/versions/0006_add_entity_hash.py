@@ -0,0 +1,35 @@
+"""add entity_hash to processed.entities
+
+Revision ID: 0006_add_entity_hash
+Revises: 0005_add_job_id_to_rules
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_add_entity_hash'
+down_revision: Union[str, None] = '0005_add_job_id_to_rules'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Hash of the entity key fields, used to resolve existing entities in bulk
+    op.add_column(
+        'entities',
+        sa.Column('entity_hash', sa.String(length=64), nullable=True),
+        schema='processed'
+    )
+    op.create_index(
+        'ix_processed_entities_entity_hash',
+        'entities', ['entity_hash'], schema='processed'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_processed_entities_entity_hash', schema='processed')
+    op.drop_column('entities', 'entity_hash', schema='processed')
@@ -0,0 +1,51 @@
+"""add keyset pagination indexes and job execution checkpoints
+
+Revision ID: 0007_add_keyset_checkpoints
+Revises: 0006_add_entity_hash
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_add_keyset_checkpoints'
+down_revision: Union[str, None] = '0006_add_entity_hash'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Ingestion timestamp; ids are random UUIDs and can't serve as a watermark alone
+    op.add_column(
+        'raw_records',
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        schema='raw_data'
+    )
+
+    # Last processed (created_at, id) per phase, for resuming after a crash
+    op.add_column(
+        'job_executions',
+        sa.Column('checkpoint', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        schema='etl_control'
+    )
+
+    # Keyset pagination: WHERE validation_status ... AND (created_at, id) > (...) ORDER BY created_at, id
+    op.create_index(
+        'ix_raw_data_raw_records_status_created_id',
+        'raw_records', ['validation_status', 'created_at', 'id'], schema='raw_data'
+    )
+    op.create_index(
+        'ix_staging_standardized_data_status_created_id',
+        'standardized_data', ['validation_status', 'created_at', 'id'], schema='staging'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_staging_standardized_data_status_created_id', schema='staging')
+    op.drop_index('ix_raw_data_raw_records_status_created_id', schema='raw_data')
+    op.drop_column('job_executions', 'checkpoint', schema='etl_control')
+    op.drop_column('raw_records', 'created_at', schema='raw_data')
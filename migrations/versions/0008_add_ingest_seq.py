@@ -0,0 +1,58 @@
+"""key keyset pagination on an insertion sequence instead of created_at
+
+Revision ID: 0008_add_ingest_seq
+Revises: 0007_add_keyset_checkpoints
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_add_ingest_seq'
+down_revision: Union[str, None] = '0007_add_keyset_checkpoints'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # created_at is the transaction start (COPY) or the client clock (ORM), so
+    # rows can commit behind a created_at watermark. Adding an identity column
+    # numbers the existing rows in place.
+    for table, schema in (('raw_records', 'raw_data'), ('standardized_data', 'staging')):
+        op.add_column(
+            table,
+            sa.Column('ingest_seq', sa.BigInteger(), sa.Identity(), nullable=False),
+            schema=schema
+        )
+        op.create_unique_constraint(f'uq_{schema}_{table}_ingest_seq', table, ['ingest_seq'], schema=schema)
+
+    # Keyset pagination: WHERE validation_status ... AND ingest_seq > (...) ORDER BY ingest_seq
+    op.drop_index('ix_raw_data_raw_records_status_created_id', schema='raw_data')
+    op.drop_index('ix_staging_standardized_data_status_created_id', schema='staging')
+    op.create_index(
+        'ix_raw_data_raw_records_status_ingest_seq',
+        'raw_records', ['validation_status', 'ingest_seq'], schema='raw_data'
+    )
+    op.create_index(
+        'ix_staging_standardized_data_status_ingest_seq',
+        'standardized_data', ['validation_status', 'ingest_seq'], schema='staging'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_staging_standardized_data_status_ingest_seq', schema='staging')
+    op.drop_index('ix_raw_data_raw_records_status_ingest_seq', schema='raw_data')
+    op.create_index(
+        'ix_raw_data_raw_records_status_created_id',
+        'raw_records', ['validation_status', 'created_at', 'id'], schema='raw_data'
+    )
+    op.create_index(
+        'ix_staging_standardized_data_status_created_id',
+        'standardized_data', ['validation_status', 'created_at', 'id'], schema='staging'
+    )
+    for table, schema in (('raw_records', 'raw_data'), ('standardized_data', 'staging')):
+        op.drop_constraint(f'uq_{schema}_{table}_ingest_seq', table, schema=schema)
+        op.drop_column(table, 'ingest_seq', schema=schema)
@@ -0,0 +1,62 @@
+"""mark raw and standardized records finished by the transform and load phases
+
+Revision ID: 0009_add_processed_markers
+Revises: 0008_add_ingest_seq
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_add_processed_markers'
+down_revision: Union[str, None] = '0008_add_ingest_seq'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The status filters alone never exclude finished rows (transform keeps
+    # VALID, load keeps 'passed'), so every run re-read the whole table.
+    op.add_column('raw_records', sa.Column('transformed_at', sa.DateTime(), nullable=True), schema='raw_data')
+    op.add_column('standardized_data', sa.Column('loaded_at', sa.DateTime(), nullable=True), schema='staging')
+
+    # Raw records that already produced a standardized or rejected record are
+    # transformed. Lineage does not record which standardized rows were
+    # loaded, so those stay pending and are loaded once more by the next run.
+    op.execute(
+        "UPDATE raw_data.raw_records r SET transformed_at = now() "
+        "WHERE EXISTS (SELECT 1 FROM staging.standardized_data s WHERE s.source_record_id = r.id) "
+        "OR EXISTS (SELECT 1 FROM raw_data.rejected_records j WHERE j.source_record_id = r.id)"
+    )
+
+    # Keyset pagination over pending rows only
+    op.drop_index('ix_raw_data_raw_records_status_ingest_seq', schema='raw_data')
+    op.drop_index('ix_staging_standardized_data_status_ingest_seq', schema='staging')
+    op.create_index(
+        'ix_raw_data_raw_records_pending_ingest_seq',
+        'raw_records', ['validation_status', 'ingest_seq'], schema='raw_data',
+        postgresql_where=sa.text('transformed_at IS NULL')
+    )
+    op.create_index(
+        'ix_staging_standardized_data_pending_ingest_seq',
+        'standardized_data', ['validation_status', 'ingest_seq'], schema='staging',
+        postgresql_where=sa.text('loaded_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_staging_standardized_data_pending_ingest_seq', schema='staging')
+    op.drop_index('ix_raw_data_raw_records_pending_ingest_seq', schema='raw_data')
+    op.create_index(
+        'ix_raw_data_raw_records_status_ingest_seq',
+        'raw_records', ['validation_status', 'ingest_seq'], schema='raw_data'
+    )
+    op.create_index(
+        'ix_staging_standardized_data_status_ingest_seq',
+        'standardized_data', ['validation_status', 'ingest_seq'], schema='staging'
+    )
+    op.drop_column('standardized_data', 'loaded_at', schema='staging')
+    op.drop_column('raw_records', 'transformed_at', schema='raw_data')
@@ -0,0 +1,4 @@
+import os
+
+# Settings requires a secret key; tests never sign tokens with it
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from app.transformers.aggregator import Aggregator
+from app.transformers.base_transformer import TransformationStatus
+
+
+def _aggregate(values, incremental):
+    aggregator = Aggregator(
+        None,
+        incremental=incremental,
+        aggregation_rules=[{'type': 'sum', 'source_field': 'amount'}, {'type': 'avg', 'source_field': 'amount'}],
+    )
+
+    async def scenario():
+        for value in values:
+            await aggregator.transform_record({'amount': value})
+        return await aggregator.finalize_aggregation()
+
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_numeric_aggregations_coerce_string_values(incremental):
+    result = _aggregate(["1", "2.5", "n/a"], incremental)
+
+    assert result.status == TransformationStatus.SUCCESS
+    assert result.data == [{'amount_sum': 3.5, 'amount_avg': 1.75}]
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_numeric_aggregation_rejects_non_numeric_field(incremental):
+    result = _aggregate(["x", "y"], incremental)
+
+    assert result.status == TransformationStatus.FAILED
+    assert "no numeric values" in result.errors[0]
+
+
+@pytest.mark.parametrize("aggregation_type", ['sum', 'count'])
+def test_incremental_groups_without_numeric_values_match_dataframe_path(aggregation_type):
+    records = [
+        {'group': 'a', 'amount': 1}, {'group': 'a', 'amount': 2},
+        {'group': 'b', 'amount': None}, {'group': 'c', 'amount': 'n/a'},
+    ]
+
+    def aggregate(incremental):
+        aggregator = Aggregator(
+            None,
+            incremental=incremental,
+            grouping_rules=[{'field': 'group'}],
+            aggregation_rules=[{'type': aggregation_type, 'source_field': 'amount'}],
+        )
+
+        async def scenario():
+            for record in records:
+                await aggregator.transform_record(dict(record))
+            return await aggregator.finalize_aggregation()
+
+        result = asyncio.run(scenario())
+        assert result.status == TransformationStatus.SUCCESS
+        # The DataFrame path keeps the source column name for a single rule
+        column = f'amount_{aggregation_type}' if incremental else 'amount'
+        return {row['group']: row[column] for row in result.data}
+
+    assert aggregate(incremental=True) == aggregate(incremental=False)
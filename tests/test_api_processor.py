@@ -0,0 +1,51 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from app.processors import api_processor
+from app.processors.api_processor import APIProcessor
+
+
+class _Stream:
+    """aiohttp-like byte stream over a fixed body, read in small chunks"""
+
+    def __init__(self, body: bytes, chunk: int = 7):
+        self._body = io.BytesIO(body)
+        self._chunk = chunk
+
+    async def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            return self._body.read()
+        return self._body.read(min(size, self._chunk))
+
+
+BODIES = [
+    {"items": [{"id": 1}], "data": [{"id": 2}, {"id": 3}]},
+    {"data": [], "items": [{"id": 1}], "results": [{"id": 2}]},
+    {"records": [{"id": 1}], "meta": {"total": 1}},
+    {"data": "none", "content": [1, 2]},
+    {"data": [], "items": []},
+    {"items": [{"id": 1}], "data": []},
+    {"total": 2},
+    [],
+    [{"id": 1}, {"id": 2}],
+]
+
+
+@pytest.mark.parametrize("peek", [api_processor.STREAM_PEEK_BYTES, 4])
+@pytest.mark.parametrize("collect_metadata", [True, False])
+@pytest.mark.parametrize("body", BODIES)
+def test_streamed_records_follow_record_key_priority(monkeypatch, body, collect_metadata, peek):
+    monkeypatch.setattr(api_processor, "STREAM_PEEK_BYTES", peek)
+    processor = APIProcessor(None, base_url="http://api.test", endpoint="/items")
+
+    async def scenario():
+        page = {"metadata": None, "count": 0, "last_record": None}
+        stream = _Stream(json.dumps(body).encode())
+        return [record async for record in processor._iter_json_records(stream, page, collect_metadata)], page
+
+    records, page = asyncio.run(scenario())
+    assert records == processor._locate_records(body)
+    assert page["count"] == len(records)
@@ -0,0 +1,47 @@
+from app.processors import csv_processor
+from app.processors.csv_partitioner import scan_sample
+from app.tasks import etl_tasks
+from app.tasks.celery_app import celery_app
+
+
+def test_partitions_run_as_chord_with_merging_callback(monkeypatch):
+    finished = {}
+
+    def fake_partition(file_path, file_id, batch_id, partition, columns, options):
+        return {"total_records": partition["row_count"], "successful_records": partition["row_count"]}
+
+    def fake_finish(partition_stats, file_id, batch_id, columns_detected, options, dispatched_at):
+        finished.update(stats=partition_stats, file_id=file_id, columns=columns_detected)
+        return {"total_records": sum(stats["total_records"] for stats in partition_stats)}
+
+    monkeypatch.setattr(etl_tasks, "process_csv_partition", fake_partition)
+    monkeypatch.setattr(etl_tasks, "finish_partitioned_file", fake_finish)
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+
+    partition_args = [
+        ("data.csv", "file-1", "batch-1", {"index": index, "row_count": 10 + index}, ["a", "b"], {})
+        for index in range(3)
+    ]
+    csv_processor._dispatch_partition_chord(partition_args, "file-1", "batch-1", 2, {})
+
+    assert finished == {
+        "stats": [
+            {"total_records": 10, "successful_records": 10},
+            {"total_records": 11, "successful_records": 11},
+            {"total_records": 12, "successful_records": 12},
+        ],
+        "file_id": "file-1",
+        "columns": 2,
+    }
+
+
+def test_crlf_terminators_count_the_same_records_as_lf():
+    lf_sample = b"a,b\n1,2\n\n \t\n3,4\nx\n \n5, \n"
+    crlf_sample = lf_sample.replace(b"\n", b"\r\n")
+
+    lf_header_end, _, lf_rows = scan_sample(lf_sample, at_eof=True)
+    crlf_header_end, _, crlf_rows = scan_sample(crlf_sample, at_eof=True)
+
+    assert lf_rows == crlf_rows == 4
+    assert crlf_sample[:crlf_header_end] == b"a,b\r\n"
+    assert lf_sample[:lf_header_end] == b"a,b\n"
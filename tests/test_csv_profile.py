@@ -0,0 +1,21 @@
+import asyncio
+
+from app.processors.csv_processor import CSVProcessor
+
+
+def test_explicit_delimiter_overrides_cached_profile(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a;b,c\n1;2,3\n4;5,6\n")
+
+    async def scenario():
+        cached = await CSVProcessor(None, delimiter=";").get_file_profile(str(path))
+        assert cached["header"] == ["a", "b,c"]
+
+        reused = await CSVProcessor(None, file_profile=cached, delimiter=";").get_file_profile(str(path))
+        assert reused is cached
+
+        explicit = await CSVProcessor(None, file_profile=cached, delimiter=",").get_file_profile(str(path))
+        assert explicit["delimiter"] == ","
+        assert explicit["header"] == ["a;b", "c"]
+
+    asyncio.run(scenario())
@@ -0,0 +1,13 @@
+import asyncio
+
+from app.transformers.entity_matcher import EntityMatcher
+
+
+def test_max_comparisons_does_not_truncate_unblocked_candidates():
+    async def scenario():
+        matcher = EntityMatcher(None, max_comparisons=2, enable_blocking=False)
+        for i in range(5):
+            result = await matcher.transform_record({"id": i, "name": f"person {i}"})
+        assert result.metadata["comparisons_made"] == 4
+
+    asyncio.run(scenario())
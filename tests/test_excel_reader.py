@@ -0,0 +1,39 @@
+import threading
+
+import openpyxl
+
+from app.processors.excel_reader import ParallelSheetReader
+
+
+def _write_workbook(path, sheets, rows):
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    for sheet_name in sheets:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(["id", "sheet"])
+        for row in range(rows):
+            worksheet.append([row, sheet_name])
+    workbook.save(path)
+
+
+def test_discarded_sheet_does_not_block_the_next_one(tmp_path):
+    path = tmp_path / "book.xlsx"
+    sheets = ["first", "second", "third"]
+    _write_workbook(path, sheets, rows=50)
+    read = {}
+
+    def consume():
+        # One worker and tiny queues: "second" only starts once "first" has finished
+        with ParallelSheetReader(str(path), sheets, chunk_size=1, max_workers=1, queue_size=1) as reader:
+            records = reader.iter_records("first")
+            read["first"] = [next(records) for _ in range(3)]
+            reader.discard("first")
+            read["second"] = list(reader.iter_records("second"))
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    thread.join(timeout=60)
+
+    assert not thread.is_alive()
+    assert [record["id"] for record in read["first"]] == [0, 1, 2]
+    assert [record["id"] for record in read["second"]] == list(range(50))
@@ -0,0 +1,26 @@
+import asyncio
+import threading
+
+from app.processors.json_processor import JSONProcessor
+
+
+def test_utf16_jsonl_is_read_off_the_event_loop(tmp_path, monkeypatch):
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"id": 1}\n\n{"id": 2}\nnot json\n{"id": 3}\n', encoding="utf-16")
+    processor = JSONProcessor(None, encoding="utf-16", chunk_size=2)
+
+    reader_threads = set()
+    read_text = processor._read_jsonl_text
+
+    def tracked_read_text(file_path):
+        for record in read_text(file_path):
+            reader_threads.add(threading.get_ident())
+            yield record
+
+    monkeypatch.setattr(processor, "_read_jsonl_text", tracked_read_text)
+
+    async def scenario():
+        return [record async for record in processor._read_jsonl_chunks(str(path))]
+
+    assert asyncio.run(scenario()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert reader_threads and threading.get_ident() not in reader_threads
@@ -0,0 +1,72 @@
+from typing import Optional
+
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+from app.infrastructure.db.keyset import KeysetPaginator
+
+
+class KeysetRow(SQLModel, table=True):
+    __tablename__ = "keyset_rows"
+
+    ingest_seq: Optional[int] = Field(default=None, primary_key=True)
+    status: str = "pending"
+
+
+def _session(rows: int) -> Session:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[KeysetRow.__table__])
+    session = Session(engine)
+    session.add_all(KeysetRow() for _ in range(rows))
+    session.commit()
+    return session
+
+
+def test_resumes_after_checkpoint():
+    session = _session(25)
+    statement = select(KeysetRow)
+
+    paginator = KeysetPaginator(session, statement, [KeysetRow.ingest_seq], batch_size=10)
+    first = paginator.fetch_batch()
+    assert [row.ingest_seq for row in first] == list(range(1, 11))
+    assert paginator.checkpoint == {"ingest_seq": 10}
+
+    resumed = KeysetPaginator(
+        session, statement, [KeysetRow.ingest_seq], batch_size=10, checkpoint=paginator.checkpoint
+    )
+    assert [row.ingest_seq for batch in resumed for row in batch] == list(range(11, 26))
+
+
+def test_skip_locked_keeps_no_checkpoint():
+    session = _session(5)
+    paginator = KeysetPaginator(
+        session, select(KeysetRow), [KeysetRow.ingest_seq], batch_size=2,
+        checkpoint={"ingest_seq": 3}, skip_locked=True,
+    )
+    assert [row.ingest_seq for row in paginator.fetch_batch()] == [1, 2]
+    assert paginator.checkpoint is None
+
+
+def test_checkpoint_of_other_key_columns_is_ignored():
+    session = _session(3)
+    paginator = KeysetPaginator(
+        session, select(KeysetRow), [KeysetRow.ingest_seq], batch_size=10,
+        checkpoint={"created_at": "2026-01-01T00:00:00", "id": "x"},
+    )
+    assert len(paginator.fetch_batch()) == 3
+
+
+def test_marked_rows_are_not_read_by_a_new_run():
+    session = _session(5)
+    statement = select(KeysetRow).where(KeysetRow.status == "pending")
+
+    first_run = KeysetPaginator(session, statement, [KeysetRow.ingest_seq], batch_size=3)
+    for row in first_run.fetch_batch():
+        row.status = "done"
+    session.commit()
+
+    # Stands in for a row that committed late, behind the first run's checkpoint
+    session.get(KeysetRow, 2).status = "pending"
+    session.commit()
+
+    second_run = KeysetPaginator(session, statement, [KeysetRow.ingest_seq], batch_size=10)
+    assert [row.ingest_seq for row in second_run.fetch_batch()] == [2, 4, 5]
@@ -0,0 +1,45 @@
+import asyncio
+
+from app.infrastructure.cache.memory_cache import MemoryCache
+
+
+def test_lock_is_async_context_manager():
+    async def scenario():
+        cache = MemoryCache()
+        async with cache.lock("job:1", timeout=1) as acquired:
+            assert acquired is True
+            async with cache.lock("job:1", timeout=1, blocking=False) as second:
+                assert second is False
+        async with cache.lock("job:1", timeout=1, blocking=False) as again:
+            assert again is True
+
+    asyncio.run(scenario())
+
+
+def test_delete_by_tags_removes_tagged_keys_only():
+    async def scenario():
+        cache = MemoryCache()
+        await cache.set("jobs:1", {"id": 1}, tags=["jobs"])
+        await cache.set("jobs:2", {"id": 2}, tags=["jobs"])
+        await cache.set("other", 1)
+        assert await cache.delete_by_tags("jobs") == 2
+        assert await cache.get("jobs:1") is None
+        assert await cache.get("other") == 1
+
+    asyncio.run(scenario())
+
+
+def test_invalidate_prefix_pattern_removes_untagged_keys():
+    from app.infrastructure.cache import decorators
+
+    async def scenario():
+        cache = MemoryCache()
+        await cache.set("report:1", 1, tags=["report"])
+        await cache.set("report:2", 2)
+        await cache.set_many({"report:3": 3})
+        await cache.set("other:1", 1)
+        await decorators._invalidate_pattern(cache, "report:*")
+        assert await cache.keys("report:*") == []
+        assert await cache.get("other:1") == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,54 @@
+import asyncio
+
+from app.infrastructure.cache.near_cache import NearCache
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.messaging.redis_messaging import RedisMessaging
+
+
+class FlakyPubSub:
+    """PubSub whose first read fails, like a dropped subscriber connection."""
+
+    def __init__(self):
+        self.failures = 1
+        self.subscribed = []
+
+    async def subscribe(self, *topics):
+        self.subscribed.append(topics)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("connection closed")
+        await asyncio.sleep(0.01)
+        return None
+
+
+def test_l1_disabled_on_channel_loss_and_enabled_after_resubscribe():
+    async def scenario():
+        near = NearCache(RedisCache())
+        states = []
+
+        async def lost():
+            await near._on_channel_lost()
+            states.append(("lost", near._l1_enabled, await near.l1.get("job:1")))
+
+        async def restored():
+            await near._on_channel_restored()
+            states.append(("restored", near._l1_enabled))
+
+        messaging = RedisMessaging(
+            enable_persistence=False, on_connection_lost=lost, on_connection_restored=restored
+        )
+        messaging._pubsub = FlakyPubSub()
+        await messaging.subscribe(near.channel, near._on_invalidation)
+
+        near._l1_enabled = True
+        await near.l1.set("job:1", {"id": 1})
+        await messaging.start_consuming()
+        await asyncio.sleep(1.2)
+        await messaging.stop_consuming()
+
+        assert states == [("lost", False, None), ("restored", True)]
+        assert messaging._pubsub.subscribed[-1] == (near.channel,)
+
+    asyncio.run(scenario())
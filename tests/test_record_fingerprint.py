@@ -0,0 +1,64 @@
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.processors.csv_processor import CSVProcessor
+from app.utils.record_fingerprint import RecordFingerprinter, available_algorithms, get_fingerprinter
+
+
+def test_missing_values_hash_like_none():
+    frame = pd.DataFrame({
+        "name": ["a", None, "c"],
+        "score": [1.5, np.nan, 3.0],
+        "seen": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+        "count": pd.array([1, None, 3], dtype="Int64"),
+    })
+    fingerprinter = RecordFingerprinter("blake2b")
+    with_missing = fingerprinter.fingerprint_many(frame.to_dict("records"))
+    cleaned = fingerprinter.fingerprint_many(
+        {key: None if pd.isna(value) else value for key, value in record.items()}
+        for record in frame.to_dict("records")
+    )
+    assert with_missing == cleaned
+    assert with_missing[1] == fingerprinter.fingerprint({"name": None, "score": None, "seen": None, "count": None})
+
+
+def test_default_algorithm_keeps_legacy_data_hash():
+    record = {"b": 2, "a": "x"}
+    expected = hashlib.sha256(json.dumps(record, sort_keys=True, default=str).encode()).hexdigest()
+    assert get_fingerprinter().fingerprint(record) == expected
+
+
+@pytest.mark.parametrize("algorithm", available_algorithms())
+def test_frame_fingerprints_match_record_fingerprints(algorithm):
+    frame = pd.DataFrame({
+        "name": ["a", None, "é\"x", "tab\t"],
+        "text": ["x", "y", "z", "ü"],
+        "score": [1.5, np.nan, np.inf, 1e20],
+        "count": [1, 2, 3, 10**30],
+        "flag": [True, False, True, False],
+        "seen": pd.to_datetime(["2024-01-01", None, "2024-01-03", "2024-01-04"]),
+        "nullable": pd.array([1, None, 3, 4], dtype="Int64"),
+        "mixed": [{"b": 1, "a": [1, 2.5]}, 3, "x", None],
+    })
+    fingerprinter = RecordFingerprinter(algorithm)
+    assert fingerprinter.fingerprint_frame(frame) == fingerprinter.fingerprint_many(frame.to_dict("records"))
+
+
+def test_csv_chunks_are_fingerprinted_like_their_records():
+    processor = CSVProcessor(None, hash_algorithm="blake2b")
+    chunk = pd.DataFrame({" id ": ["1", " 2 ", None], "name": ["  Ada ", "", "   "]}, dtype=object)
+
+    fingerprinted = list(processor._clean_records((chunk,)))
+
+    assert [item.record for item in fingerprinted] == [
+        {"id": "1", "name": "Ada"},
+        {"id": "2", "name": None},
+        {"id": None, "name": ""},
+    ]
+    assert [item.data_hash for item in fingerprinted] == [
+        processor._generate_record_hash(item.record) for item in fingerprinted
+    ]
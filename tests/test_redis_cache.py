@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from app.infrastructure.cache.redis_cache import POP_TAG_SCRIPT, SET_WITH_TAGS_SCRIPT, RedisCache
+
+
+def _cache() -> RedisCache:
+    cache = RedisCache()
+    cache._client = fakeredis.aioredis.FakeRedis()
+    cache._set_with_tags = cache._client.register_script(SET_WITH_TAGS_SCRIPT)
+    cache._pop_tag = cache._client.register_script(POP_TAG_SCRIPT)
+    cache._is_connected = True
+    return cache
+
+
+def test_delete_by_tags_deletes_members_and_tag_sets():
+    async def scenario():
+        cache = _cache()
+        await cache.set("jobs:1", {"id": 1}, ttl=60, tags=["jobs"])
+        await cache.set("jobs:2", {"id": 2}, ttl=60, tags=["jobs", "recent"])
+        await cache.set("recent:3", 3, tags=["recent"])
+        await cache.set("other", 1)
+        assert await cache.delete_by_tags("jobs", "recent") == 3
+        assert await cache.get_many("jobs:1", "jobs:2", "recent:3") == {}
+        assert await cache.keys_by_tags("jobs", "recent") == []
+        assert await cache.get("other") == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,102 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from app.transformers.data_cleaner import DataCleaner
+from app.transformers.data_validator import DataValidator
+
+
+RECORDS = [
+    {'name': '  Ada   Lovelace ', 'email': 'ada@example.com', 'code': 'ab-1', 'age': 36, 'country': 'UK', 'notes': ''},
+    {'name': None, 'email': 'not an email', 'code': 'AB-2', 'age': 150, 'country': 'FR', 'notes': 'x' * 40},
+    {'name': 'grace\thopper', 'email': '', 'code': 'zz', 'age': -1, 'country': None, 'notes': None},
+    {'name': '', 'email': None, 'code': 12, 'age': 'forty', 'country': 'XX', 'notes': ['a']},
+    {'name': 'Linus', 'email': 'linus@example.org', 'code': None, 'age': 2.5, 'country': 'FI', 'notes': 'ok'},
+]
+
+CLEANER_CONFIGS = [
+    {'case_normalization': {'name': 'title', 'code': 'upper'}},
+    {'remove_special_characters': True, 'special_chars_to_remove': '-@', 'null_replacement': 'n/a'},
+    {'collapse_multiple_spaces': False, 'handle_empty_strings': False, 'empty_string_replacement': 'blank'},
+    {'field_cleaning_rules': {
+        'name': {'type': 'trim'},
+        'code': {'type': 'replace', 'search': '-', 'replacement': '_'},
+        'notes': {'type': 'default_if_empty', 'default': 'none'},
+        'country': {'type': 'default_if_null', 'default': 'ZZ'},
+    }},
+]
+
+VALIDATION_RULES = {
+    'name': [{'type': 'required'}, {'type': 'length', 'parameters': {'min': 3, 'max': 12}, 'severity': 'warning'}],
+    'email': [{'type': 'pattern', 'parameters': {'pattern': r'[^@\s]+@[^@\s]+\.\w+'}}],
+    'code': [{'type': 'pattern', 'parameters': {'pattern': r'[A-Z]{2}-\d'}, 'severity': 'warning'}],
+    'age': [{'type': 'range', 'parameters': {'min': 0, 'max': 120}}],
+    'country': [{'type': 'referential', 'parameters': {'reference_table': 'countries'}}],
+    'notes': [{'type': 'type', 'parameters': {'type': 'string'}, 'severity': 'warning'}],
+}
+
+VALIDATOR_CONFIGS = [
+    {},
+    {'auto_fix_errors': True},
+    {'stop_on_first_error': True},
+]
+
+
+def _run(transformer_class, config, columnar):
+    transformer = transformer_class(
+        None, columnar=columnar, error_threshold=1.0, max_errors=1000, **config
+    )
+    if columnar:
+        # The batch must not fall back to the row path
+        transformer.transform_record = None
+
+    async def scenario():
+        return await transformer.transform_batch([dict(record) for record in RECORDS])
+
+    results = asyncio.run(scenario())
+    statistics = transformer._generate_statistics()
+    for key in ('processing_time_seconds', 'throughput_records_per_second', 'start_time', 'end_time'):
+        statistics.pop(key)
+    return results, statistics, transformer
+
+
+def _assert_parity(transformer_class, config):
+    row_results, row_statistics, row_transformer = _run(transformer_class, config, columnar=False)
+    columnar_results, columnar_statistics, columnar_transformer = _run(transformer_class, config, columnar=True)
+
+    assert [result.to_dict() | {'timestamp': None} for result in columnar_results] == \
+        [result.to_dict() | {'timestamp': None} for result in row_results]
+    assert columnar_statistics == row_statistics
+    assert columnar_transformer.transformation_errors == row_transformer.transformation_errors
+    assert columnar_transformer.transformation_warnings == row_transformer.transformation_warnings
+
+
+@pytest.mark.parametrize("config", CLEANER_CONFIGS)
+def test_columnar_cleaning_matches_row_path(config):
+    _assert_parity(DataCleaner, config)
+
+
+@pytest.mark.parametrize("config", VALIDATOR_CONFIGS)
+def test_columnar_validation_matches_row_path(config):
+    config = {
+        'validation_rules': VALIDATION_RULES,
+        'reference_data': {'countries': ['UK', 'FR', 'FI']},
+        **config,
+    }
+    _assert_parity(DataValidator, config)
+
+
+def test_columnar_batch_uses_column_kernels():
+    cleaner = DataCleaner(None, columnar=True)
+    assert cleaner._clean_column('name', _column('name')) is not None
+
+    validator = DataValidator(None, columnar=True, validation_rules=VALIDATION_RULES,
+                              reference_data={'countries': ['UK']})
+    for rule in validator.validation_rules:
+        if rule.field_name != 'notes':
+            assert validator._validate_column(_column(rule.field_name), rule) is not None
+
+
+def _column(field_name):
+    return pd.DataFrame(RECORDS, dtype=object)[field_name]
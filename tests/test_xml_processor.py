@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from app.processors.xml_processor import XMLProcessor
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:catalog" xmlns:p="urn:price" xmlns:meta="urn:meta">
+  <meta:source>feed</meta:source>
+  <item id="1" p:currency="EUR">
+    <name>First</name>
+    <p:amount>10</p:amount>
+  </item>
+  <item id="2" p:currency="USD">
+    <name>Second</name>
+    <p:amount>20</p:amount>
+  </item>
+</catalog>
+"""
+
+
+@pytest.mark.parametrize("record_xpath", [None, "item", ".//item", "{urn:catalog}item", ".//p:amount/..", "item[@id]"])
+def test_streaming_and_tree_parsing_produce_the_same_records(tmp_path, record_xpath):
+    path = tmp_path / "catalog.xml"
+    path.write_text(DOCUMENT, encoding="utf-8")
+
+    async def read(streaming):
+        processor = XMLProcessor(None, streaming=streaming, record_xpath=record_xpath)
+        structure_info = await processor._analyze_xml_structure(str(path))
+        records = list(processor._read_xml_records(str(path), structure_info))
+        return structure_info, records
+
+    streamed_info, streamed = asyncio.run(read(True))
+    tree_info, parsed = asyncio.run(read(False))
+
+    assert streamed_info["namespaces"] == tree_info["namespaces"]
+    assert streamed_info["record_count"] == tree_info["record_count"] == 2
+    assert streamed == parsed
+    assert len(streamed) == 2